@@ -3,19 +3,15 @@ RPG Game Package
 
 This package contains the implementation of a simple RPG game
 demonstrating object-oriented programming principles.
+
+Public names are loaded on first access, so ``import rpg_game`` (and
+importing a single submodule such as ``rpg_game.weapon``) does not pull in
+the game loop, asyncio or the save machinery.
 """
-from typing import List, Any, TypeVar, Type
-
-# Import key classes to make them available at package level
-from .character import Character
-from .boss import Boss
-from .weapon import Weapon
-from .game import Game
-from .game_logger import GameLogger
-from .console_utils import clear_screen, press_enter, print_border, get_user_choice
-from . import save_game as save_game_module
-from .save_game import save_game, load_game, delete_save
-from . import constants
+import importlib
+import sys
+import types
+from typing import Dict, List, Any, Optional, Tuple, TypeVar, Type
 
 # Version of the package
 __version__ = "1.0.0"
@@ -23,6 +19,29 @@ __version__ = "1.0.0"
 # Type variable for generic type hints
 T = TypeVar('T')
 
+# Public name -> (submodule, attribute); None imports the submodule itself
+_LAZY: Dict[str, Tuple[str, Optional[str]]] = {
+    # Core classes
+    'Character': ('.character', 'Character'),
+    'Boss': ('.boss', 'Boss'),
+    'Weapon': ('.weapon', 'Weapon'),
+    'Game': ('.game', 'Game'),
+    'GameLogger': ('.game_logger', 'GameLogger'),
+
+    # Utility functions
+    'clear_screen': ('.console_utils', 'clear_screen'),
+    'press_enter': ('.console_utils', 'press_enter'),
+    'print_border': ('.console_utils', 'print_border'),
+    'get_user_choice': ('.console_utils', 'get_user_choice'),
+    'save_game': ('.save_game', 'save_game'),
+    'load_game': ('.save_game', 'load_game'),
+    'delete_save': ('.save_game', 'delete_save'),
+    'save_game_module': ('.save_game', None),
+
+    # Constants
+    'constants': ('.constants', None),
+}
+
 # Define public API
 __all__: List[str] = [
     # Core classes
@@ -31,7 +50,7 @@ __all__: List[str] = [
     'Weapon',
     'Game',
     'GameLogger',
-    
+
     # Utility functions
     'clear_screen',
     'press_enter',
@@ -40,10 +59,10 @@ __all__: List[str] = [
     'save_game',
     'load_game',
     'delete_save',
-    
+
     # Constants
     'constants',
-    
+
     # Version
     '__version__',
 ]
@@ -53,8 +72,26 @@ def __dir__() -> List[str]:
     return __all__
 
 def __getattr__(name: str) -> Any:
-    """Allow lazy loading of modules to improve import time."""
-    if name == 'constants':
-        from . import constants as _constants
-        return _constants
-    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    """Import a public name's module on first access and cache the result."""
+    try:
+        module_name, attribute = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'") from None
+    module = importlib.import_module(module_name, __name__)
+    value = module if attribute is None else getattr(module, attribute)
+    globals()[name] = value
+    return value
+
+
+class _Package(types.ModuleType):
+    """Package module type that keeps ``save_game`` bound to the function."""
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Importing the save_game submodule binds it on the package; the
+        # public name has always been the save_game() function instead
+        if name == 'save_game' and isinstance(value, types.ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
@@ -3,13 +3,39 @@
 Main entry point for the RPG game package.
 
 This module allows the package to be run directly with `python -m rpg_game`.
+Set RPG_METRICS_DIR to write phase timings there at exit.
+Tools are available as subcommands, e.g. `python -m rpg_game replay LOG` or
+`python -m rpg_game bench`.
+`python -m rpg_game serve` hosts games for many players over sockets.
+`python -m rpg_game arena` fights a battle between many heroes and bosses.
 """
 
-from rpg_game.game import Game
+import importlib
+import sys
+from typing import Dict, List, Optional, Tuple
 
-def main() -> None:
-    """Initialize and run the game."""
-    game = Game()
+# Subcommand name -> (module, function taking the remaining arguments)
+COMMANDS: Dict[str, Tuple[str, str]] = {
+    "replay": ("rpg_game.combat_log", "replay_main"),
+    "bench": ("rpg_game.benchmarks.suite", "bench_main"),
+    "serve": ("rpg_game.server", "serve_main"),
+    "script": ("rpg_game.scripted", "script_main"),
+    "arena": ("rpg_game.arena", "arena_main"),
+}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Initialize and run the game, or the tool named by the first argument."""
+    args = sys.argv[1:] if argv is None else argv
+    if args and args[0] in COMMANDS:
+        module_name, function_name = COMMANDS[args[0]]
+        command = getattr(importlib.import_module(module_name), function_name)
+        command(args[1:])
+        return
+    # Imported here so subcommands only load what they use
+    from rpg_game.game import Game
+    from rpg_game.metrics import from_environment
+    game = Game(metrics=from_environment())
     game.run()
 
 if __name__ == "__main__":
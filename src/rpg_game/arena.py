@@ -0,0 +1,336 @@
+"""
+Arena battles between many characters and bosses.
+
+``Game.combat`` alternates strictly between one player and one boss. An
+``Arena`` instead lets any number of teams fight at once, with turn order
+driven by each entity's ``speed``: an entity with speed ``s`` acts ``s``
+times per round of ``INITIATIVE_SCALE`` ticks.
+
+Turn order comes from an event scheduler: a binary heap of
+``(next_action_tick, sequence, slot)`` entries. Each action pops the
+earliest entry and pushes the actor back with its next tick, so an action
+costs O(log n) and no round is ever sorted. Defeated entities are not
+removed from the heap; their entries are dropped when they surface.
+Targets are drawn uniformly from a living enemy team, whose members are
+kept in a swap-remove list so picking and removing are O(1).
+
+Given an ``effects.StatusEffects``, the arena advances its clock by one
+tick per player turn (``EFFECT_TICK``) before each action, and poisoned
+entities are defeated when their poison is settled.
+
+Run a battle with ``python -m rpg_game arena --heroes 500 --bosses 50``.
+"""
+
+import argparse
+import heapq
+import json
+import random
+from typing import Any, Dict, Hashable, Iterable, List, NamedTuple, Optional, Sequence
+
+from rpg_game.boss import Boss
+from rpg_game.catalog import default_catalog
+from rpg_game.character import Character
+from rpg_game.constants import (
+    PLAYER_INITIAL_DAMAGE,
+    PLAYER_INITIAL_HEALTH,
+    PLAYER_SPEED,
+)
+from rpg_game.rng import make_rng
+
+# Ticks per round; divisible by every speed from 1 to 16
+INITIATIVE_SCALE = 720720
+
+# Arena ticks per status-effect tick: one turn of an entity with PLAYER_SPEED
+EFFECT_TICK = INITIATIVE_SCALE // PLAYER_SPEED
+
+
+class Action(NamedTuple):
+    """One attack in an arena battle."""
+
+    tick: int
+    attacker: Any
+    target: Any
+    damage: int
+    defeated: bool
+
+
+class ArenaResult(NamedTuple):
+    """Outcome of an arena battle."""
+
+    winner: Optional[Hashable]
+    actions: int
+    rounds: float
+    survivors: Dict[Hashable, int]
+
+
+class Arena:
+    """
+    A battle between teams of characters and bosses.
+
+    Attributes:
+        tick: Tick of the most recent action
+        actions: Number of actions taken so far
+    """
+
+    def __init__(
+        self,
+        rng: Optional[Any] = None,
+        logger: Optional[Any] = None,
+        effects: Optional[Any] = None,
+    ) -> None:
+        """
+        Initialize an empty arena.
+
+        Args:
+            rng: Random source for picking targets; defaults to the global
+                ``random`` module (attacks roll with each entity's own rng)
+            logger: Optional ``GameLogger`` that records every attack
+            effects: Optional ``effects.StatusEffects`` whose clock the
+                battle drives
+        """
+        self.rng = rng if rng is not None else random
+        self.logger = logger
+        self.effects = effects
+        self.tick = 0
+        self.actions = 0
+        self._entities: List[Any] = []
+        self._delays: List[int] = []
+        self._teams: List[Hashable] = []
+        # Living slots per team, and each slot's position in its team's list
+        self._alive: Dict[Hashable, List[int]] = {}
+        self._positions: List[int] = []
+        self._defeated = bytearray()
+        self._queue: List[tuple] = []
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        """Return the number of entities that joined the arena."""
+        return len(self._entities)
+
+    def add(self, entity: Any, team: Hashable, speed: Optional[int] = None) -> int:
+        """
+        Add an entity to a team.
+
+        Args:
+            entity: A ``Character`` or ``Boss`` (anything with ``attack``,
+                ``health`` and ``speed``)
+            team: Label of the entity's team
+            speed: Actions per round; defaults to ``entity.speed``
+
+        Returns:
+            int: The entity's slot in the arena
+
+        Raises:
+            ValueError: If the speed is not positive
+        """
+        speed = entity.speed if speed is None else speed
+        if speed <= 0:
+            raise ValueError(f"Speed of {entity.name} must be positive, got {speed}")
+        slot = len(self._entities)
+        delay = max(1, INITIATIVE_SCALE // speed)
+        self._entities.append(entity)
+        self._delays.append(delay)
+        self._teams.append(team)
+        members = self._alive.setdefault(team, [])
+        self._positions.append(len(members))
+        if entity.health > 0:
+            members.append(slot)
+            self._defeated.append(0)
+            self._push(self.tick + delay, slot)
+        else:
+            self._defeated.append(1)
+        return slot
+
+    def add_many(self, entities: Iterable[Any], team: Hashable) -> None:
+        """Add several entities to one team with their own speeds."""
+        for entity in entities:
+            self.add(entity, team)
+
+    def _push(self, tick: int, slot: int) -> None:
+        # The sequence number breaks ties in the order entities were queued
+        heapq.heappush(self._queue, (tick, self._sequence, slot))
+        self._sequence += 1
+
+    def _remove(self, slot: int) -> None:
+        """Take a defeated entity out of its team's living members."""
+        self._defeated[slot] = 1
+        members = self._alive[self._teams[slot]]
+        position = self._positions[slot]
+        last = members.pop()
+        if last != slot:
+            members[position] = last
+            self._positions[last] = position
+
+    def alive(self, team: Hashable) -> int:
+        """Return the number of living members of ``team``."""
+        return len(self._alive.get(team, ()))
+
+    @property
+    def teams_standing(self) -> List[Hashable]:
+        """Teams that still have living members."""
+        return [team for team, members in self._alive.items() if members]
+
+    @property
+    def over(self) -> bool:
+        """Whether at most one team is left standing."""
+        return len(self.teams_standing) <= 1
+
+    def _pick_target(self, team: Hashable) -> Optional[int]:
+        """Return a random living enemy of ``team``, or None if there is none."""
+        alive = self._alive
+        if len(alive) == 2:
+            # Common case: one opposing team, no list to build
+            for other, members in alive.items():
+                if other != team:
+                    break
+            if not members:
+                return None
+        else:
+            enemies = [
+                members for other, members in alive.items() if other != team and members
+            ]
+            if not enemies:
+                return None
+            members = enemies[int(self.rng.random() * len(enemies))]
+        return members[int(self.rng.random() * len(members))]
+
+    def step(self) -> Optional[Action]:
+        """
+        Let the next entity in initiative order act.
+
+        Returns:
+            Optional[Action]: The attack, or None if the battle is over
+        """
+        queue = self._queue
+        entities = self._entities
+        defeated = self._defeated
+        while queue:
+            tick, _, slot = heapq.heappop(queue)
+            if defeated[slot]:
+                continue
+            attacker = entities[slot]
+            if self.effects is not None:
+                self.effects.advance(tick // EFFECT_TICK)
+                if attacker.effects is not None:
+                    attacker.effects.settle(attacker.effect_slot)
+            if attacker.health <= 0:
+                # Defeated outside of the arena's attacks, e.g. by poison
+                self._remove(slot)
+                continue
+            target_slot = self._pick_target(self._teams[slot])
+            if target_slot is None:
+                # Nobody left to fight; keep the entry for a later battle
+                self._push(tick, slot)
+                return None
+            target = entities[target_slot]
+            self.tick = tick
+            self.actions += 1
+            damage = attacker.attack(target, self.logger)
+            target_defeated = target.health <= 0
+            if target_defeated:
+                self._remove(target_slot)
+            self._push(tick + self._delays[slot], slot)
+            return Action(tick, attacker, target, damage, target_defeated)
+        return None
+
+    def run(self, max_actions: Optional[int] = None) -> ArenaResult:
+        """
+        Fight until one team is left or ``max_actions`` actions were taken.
+
+        Args:
+            max_actions: Optional limit on the number of actions
+
+        Returns:
+            ArenaResult: The winning team (None if undecided), actions taken,
+            rounds elapsed and surviving members per team
+        """
+        remaining = max_actions
+        while remaining is None or remaining > 0:
+            if self.step() is None:
+                break
+            if remaining is not None:
+                remaining -= 1
+        standing = self.teams_standing
+        winner = standing[0] if len(standing) == 1 else None
+        return ArenaResult(
+            winner,
+            self.actions,
+            self.tick / INITIATIVE_SCALE,
+            {team: len(members) for team, members in self._alive.items()},
+        )
+
+
+def build_arena(
+    heroes: int, bosses: int, seed: Optional[int] = None, io: Optional[Any] = None
+) -> Arena:
+    """
+    Build a heroes-versus-bosses arena from the campaign's stats.
+
+    Heroes use the player's starting stats and cycle through the default
+    catalog's starting weapons; bosses cycle through its campaign. Targets
+    and damage rolls all draw from one stream.
+
+    Args:
+        heroes: Number of heroes (team ``"heroes"``)
+        bosses: Number of bosses (team ``"bosses"``)
+        seed: Optional seed making the battle reproducible
+        io: Optional I/O port for the entities' messages (e.g. ``NullIO()``)
+
+    Returns:
+        Arena: The arena, ready to run
+    """
+    catalog = default_catalog()
+    weapons = catalog.starting_weapons()
+    roster = catalog.campaign()
+    rng = make_rng(seed)
+    arena = Arena(rng=rng)
+    for number in range(heroes):
+        weapon = weapons[number % len(weapons)]
+        arena.add(
+            Character(
+                f"Hero {number + 1}",
+                PLAYER_INITIAL_HEALTH,
+                PLAYER_INITIAL_DAMAGE,
+                weapon.name,
+                weapon.damage,
+                rng=rng,
+                io=io,
+            ),
+            "heroes",
+        )
+    for number in range(bosses):
+        boss = roster[number % len(roster)]
+        arena.add(
+            Boss(f"{boss.name} {number + 1}", boss.health, boss.damage, rng=rng, io=io),
+            "bosses",
+        )
+    return arena
+
+
+def arena_main(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Run an arena battle from the command line and print the result as JSON.
+
+    Args:
+        argv: Command-line arguments (defaults to ``sys.argv[1:]``)
+    """
+    from rpg_game.game_io import NullIO
+
+    parser = argparse.ArgumentParser(
+        prog="rpg_game arena",
+        description="Fight a battle between many heroes and bosses.",
+    )
+    parser.add_argument("--heroes", type=int, default=100, help="number of heroes")
+    parser.add_argument("--bosses", type=int, default=20, help="number of bosses")
+    parser.add_argument(
+        "--seed", type=int, default=None, help="seed for a reproducible battle"
+    )
+    parser.add_argument(
+        "--max-actions", type=int, default=None, help="stop after this many actions"
+    )
+    args = parser.parse_args(argv)
+
+    result = build_arena(args.heroes, args.bosses, args.seed, io=NullIO()).run(
+        args.max_actions
+    )
+    print(json.dumps(result._asdict(), indent=2))
@@ -0,0 +1,6 @@
+"""
+Benchmarks for the RPG game.
+
+Each module in this package measures one aspect of the game's performance
+and can be run on its own with ``python -m rpg_game.benchmarks.<name>``.
+"""
@@ -0,0 +1,114 @@
+"""
+Scaling benchmark for the arena's initiative scheduler.
+
+Fills an ``arena.Arena`` with ``size`` entities split between heroes and
+bosses, with speeds spread over 1 to 16, and times a fixed number of
+actions. Entities cannot die, so the arena stays at full size for the
+whole run. With a heap-based scheduler the time per action should grow
+only logarithmically with the number of entities.
+
+Run with ``python -m rpg_game.benchmarks.arena --sizes 1000 10000 100000``.
+"""
+
+import argparse
+import json
+import random
+import time
+from typing import Any, Dict, List, Sequence
+
+from rpg_game.arena import Arena
+from rpg_game.boss import Boss
+from rpg_game.character import Character
+from rpg_game.game_io import NullIO
+
+# Health large enough that benchmark entities never die
+_UNKILLABLE = 10**15
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+
+
+def build(size: int, seed: int = 0) -> Arena:
+    """
+    Build an arena of ``size`` unkillable entities, one boss per four heroes.
+
+    Args:
+        size: Number of entities
+        seed: Seed for speeds, targets and damage rolls
+
+    Returns:
+        Arena: The arena, ready to step
+    """
+    rng = random.Random(seed)
+    io = NullIO()
+    arena = Arena(rng=rng)
+    for number in range(size):
+        speed = 1 + int(rng.random() * 16)
+        if number % 5:
+            entity = Character(f"Hero {number}", _UNKILLABLE, 10, rng=rng, io=io)
+            arena.add(entity, "heroes", speed)
+        else:
+            entity = Boss(f"Boss {number}", _UNKILLABLE, 8, rng=rng, io=io)
+            arena.add(entity, "bosses", speed)
+    return arena
+
+
+def measure(
+    sizes: Sequence[int] = DEFAULT_SIZES, actions: int = 100_000, repeat: int = 3
+) -> List[Dict[str, Any]]:
+    """
+    Time arena actions at several arena sizes.
+
+    Args:
+        sizes: Numbers of entities to try
+        actions: Actions timed per run
+        repeat: Runs per size; the fastest is reported
+
+    Returns:
+        List[Dict[str, Any]]: Per size, the setup time in milliseconds and
+        the time per action in nanoseconds
+    """
+    results = []
+    for size in sizes:
+        best = float("inf")
+        setup = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            arena = build(size)
+            setup = min(setup, time.perf_counter() - start)
+            step = arena.step
+            start = time.perf_counter()
+            for _ in range(actions):
+                step()
+            best = min(best, time.perf_counter() - start)
+        results.append(
+            {
+                "entities": size,
+                "setup_ms": round(setup * 1000, 1),
+                "action_ns": round(best / actions * 1e9, 1),
+            }
+        )
+    return results
+
+
+def main() -> None:
+    """Run the arena benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SIZES),
+        help="numbers of entities to try",
+    )
+    parser.add_argument(
+        "--actions", type=int, default=100_000, help="actions timed per run"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="runs per size; the fastest is reported"
+    )
+    args = parser.parse_args()
+    print(json.dumps(measure(args.sizes, args.actions, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Load-time benchmark for the content catalog.
+
+Writes a synthetic content file with many weapons and bosses, then times
+parsing and compiling it with a cold cache, reloading it from the compiled
+cache, reloading after the file is touched but not changed (the hash check),
+and looking entries up by name.
+
+Run with ``python -m rpg_game.benchmarks.catalog --entries 100000``.
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Union
+
+from rpg_game.catalog import load_catalog
+
+
+def synthetic_content(entries: int) -> Dict[str, Any]:
+    """
+    Build content with ``entries`` weapons and ``entries`` bosses.
+
+    Args:
+        entries: Number of weapons and of bosses
+
+    Returns:
+        Dict[str, Any]: Content in the ``catalog.compile_catalog`` format
+    """
+    return {
+        "weapons": [
+            {
+                "name": f"Weapon {i}",
+                "damage": i % 20 + 1,
+                "description": f"Weapon number {i}.",
+                "starter": i < 3,
+            }
+            for i in range(entries)
+        ],
+        "bosses": [
+            {
+                "name": f"Boss {i}",
+                "health": 40 + i % 60,
+                "damage": 5 + i % 10,
+                "level": i + 1,
+                "intro": f"Level {i + 1} - Boss {i} awaits, {{player}}!",
+            }
+            for i in range(entries)
+        ],
+        "campaign": [f"Boss {i}" for i in range(min(entries, 10))],
+    }
+
+
+def _best_ms(function: Any, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def measure(
+    entries: int = 100_000, repeat: int = 5, directory: Union[str, Path, None] = None
+) -> Dict[str, Any]:
+    """
+    Time loading a synthetic catalog.
+
+    Args:
+        entries: Number of weapons and of bosses
+        repeat: Runs per timing; the fastest is reported
+        directory: Where to write the content and cache (default: a
+            temporary directory)
+
+    Returns:
+        Dict[str, Any]: Times in milliseconds for a cold compile, a cached
+        load, a load after touching the source, and nanoseconds per lookup
+    """
+    with tempfile.TemporaryDirectory() as temporary:
+        root = Path(directory if directory is not None else temporary)
+        source = root / "content.json"
+        cache_dir = root / "cache"
+        source.write_text(json.dumps(synthetic_content(entries)))
+
+        def cold() -> None:
+            load_catalog(source, cache_dir=cache_dir, use_cache=False)
+
+        def cached() -> None:
+            load_catalog(source, cache_dir=cache_dir)
+
+        def touched() -> None:
+            stat = os.stat(source)
+            os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+            load_catalog(source, cache_dir=cache_dir)
+
+        cold_ms = _best_ms(cold, repeat)
+        cached()
+        cached_ms = _best_ms(cached, repeat)
+        touched_ms = _best_ms(touched, repeat)
+
+        catalog = load_catalog(source, cache_dir=cache_dir)
+        names = catalog.boss_names
+        start = time.perf_counter()
+        for name in names:
+            catalog.boss(catalog.boss_id(name))
+        lookup_ns = (time.perf_counter() - start) / len(names) * 1e9 if names else 0.0
+
+    return {
+        "entries": entries,
+        "compile_ms": round(cold_ms, 2),
+        "cached_load_ms": round(cached_ms, 2),
+        "touched_load_ms": round(touched_ms, 2),
+        "speedup": round(cold_ms / cached_ms, 1) if cached_ms else None,
+        "lookup_ns": round(lookup_ns, 1),
+    }
+
+
+def main() -> None:
+    """Run the catalog benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--entries",
+        type=int,
+        default=100_000,
+        help="weapons and bosses in the synthetic catalog",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="runs per timing; the fastest is reported"
+    )
+    args = parser.parse_args()
+    print(json.dumps(measure(args.entries, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+Compression benchmark for saves and combat logs.
+
+Reports the compressed size, ratio and streaming throughput of every codec
+and level on two representative payloads: a ``get_game_state`` save with a
+long boss list and a stream of formatted ``log_combat`` records.
+
+Run with ``python -m rpg_game.benchmarks.compression --bosses 10000``.
+"""
+
+import argparse
+import json
+import lzma
+import random
+import time
+import zlib
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from rpg_game.catalog import default_catalog
+from rpg_game.compression import LZMA, ZLIB
+from rpg_game.log_sinks import CRITICAL, LogRecord, format_records
+
+# Chunk size used to feed the compressors, like a streaming writer would
+_CHUNK = 64 * 1024
+
+
+def save_payload(bosses: int = 10_000, seed: int = 0) -> bytes:
+    """
+    Build a save document shaped like ``Game.get_game_state`` output.
+
+    Args:
+        bosses: Number of bosses in the state
+        seed: Seed for the boss health values
+
+    Returns:
+        bytes: The pretty-printed JSON save
+    """
+    rng = random.Random(seed)
+    roster = default_catalog().campaign()
+    state = {
+        "player": {
+            "name": "Hero",
+            "health": 110,
+            "damage": 10,
+            "weapon": {"name": "Scissors", "damage_bonus": 4},
+        },
+        "bosses": [
+            {
+                "name": boss.name,
+                "health": rng.randint(1, boss.health),
+                "damage": boss.damage,
+            }
+            for boss in (roster[i % len(roster)] for i in range(bosses))
+        ],
+    }
+    return json.dumps(state, indent=2).encode("utf-8")
+
+
+def log_payload(records: int = 100_000, seed: int = 0) -> bytes:
+    """
+    Build a combat log as ``RotatingFileSink`` would write it.
+
+    Args:
+        records: Number of combat records
+        seed: Seed for damage values and critical hits
+
+    Returns:
+        bytes: The formatted log text
+    """
+    rng = random.Random(seed)
+    start = 1_700_000_000.0
+    batch: List[LogRecord] = []
+    for index in range(records):
+        player_turn = index % 2 == 0
+        attacker, defender = (
+            ("Hero", "Goblin King") if player_turn else ("Goblin King", "Hero")
+        )
+        critical = rng.random() < 0.1
+        damage = rng.randint(5, 20) * (2 if critical else 1)
+        batch.append(
+            (
+                start + index * 0.01,
+                attacker,
+                defender,
+                damage,
+                CRITICAL if critical else 0,
+            )
+        )
+    return format_records(batch).encode("utf-8")
+
+
+def _chunks(data: bytes) -> Iterable[bytes]:
+    for offset in range(0, len(data), _CHUNK):
+        yield data[offset : offset + _CHUNK]
+
+
+def _stream(compressor: Any, data: bytes) -> bytes:
+    """Feed ``data`` through a compressor or decompressor chunk by chunk."""
+    process = (
+        compressor.compress
+        if hasattr(compressor, "compress")
+        else compressor.decompress
+    )
+    parts = [process(chunk) for chunk in _chunks(data)]
+    if hasattr(compressor, "flush"):
+        parts.append(compressor.flush())
+    return b"".join(parts)
+
+
+_COMPRESSORS: Dict[str, Callable[[int], Any]] = {
+    ZLIB: lambda level: zlib.compressobj(level, zlib.DEFLATED, 31),
+    LZMA: lambda level: lzma.LZMACompressor(preset=level),
+}
+_DECOMPRESSORS: Dict[str, Callable[[], Any]] = {
+    ZLIB: lambda: zlib.decompressobj(31),
+    LZMA: lambda: lzma.LZMADecompressor(),
+}
+
+
+def measure_codec(data: bytes, codec: str, level: int) -> Dict[str, Any]:
+    """
+    Measure one codec and level on a payload.
+
+    Args:
+        data: The uncompressed payload
+        codec: ``"zlib"`` or ``"lzma"``
+        level: Compression level (0-9)
+
+    Returns:
+        Dict[str, Any]: Size, ratio and throughput in MB/s
+    """
+    start = time.perf_counter()
+    compressed = _stream(_COMPRESSORS[codec](level), data)
+    compress_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    restored = _stream(_DECOMPRESSORS[codec](), compressed)
+    decompress_time = time.perf_counter() - start
+    if restored != data:
+        raise AssertionError(f"{codec} level {level} did not round-trip")
+
+    megabytes = len(data) / 1e6
+    return {
+        "codec": codec,
+        "level": level,
+        "bytes": len(compressed),
+        "ratio": round(len(data) / max(len(compressed), 1), 2),
+        "compress_mb_s": round(megabytes / max(compress_time, 1e-9), 1),
+        "decompress_mb_s": round(megabytes / max(decompress_time, 1e-9), 1),
+    }
+
+
+def measure(
+    bosses: int = 10_000, records: int = 100_000, levels: Optional[Sequence[int]] = None
+) -> Dict[str, Any]:
+    """
+    Measure every codec and level on the save and log payloads.
+
+    Args:
+        bosses: Number of bosses in the save payload
+        records: Number of records in the log payload
+        levels: Levels to try (default 1, 6 and 9)
+
+    Returns:
+        Dict[str, Any]: Raw sizes and one result row per codec and level
+    """
+    levels = list(levels) if levels is not None else [1, 6, 9]
+    payloads = {"save": save_payload(bosses), "log": log_payload(records)}
+    return {
+        name: {
+            "raw_bytes": len(data),
+            "results": [
+                measure_codec(data, codec, level)
+                for codec in (ZLIB, LZMA)
+                for level in levels
+            ],
+        }
+        for name, data in payloads.items()
+    }
+
+
+def main() -> None:
+    """Run the compression benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--bosses", type=int, default=10_000, help="bosses in the save payload"
+    )
+    parser.add_argument(
+        "--records", type=int, default=100_000, help="records in the combat log payload"
+    )
+    parser.add_argument(
+        "--levels",
+        type=int,
+        nargs="+",
+        default=[1, 6, 9],
+        help="compression levels to try",
+    )
+    args = parser.parse_args()
+    print(json.dumps(measure(args.bosses, args.records, args.levels), indent=2))
+
+
+if __name__ == "__main__":
+    main()
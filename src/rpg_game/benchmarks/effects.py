@@ -0,0 +1,170 @@
+"""
+Per-turn cost benchmark for status effects.
+
+Spreads a given number of active effects (poison, stuns and buffs with
+random durations) over a population of entities, then times turns. Each turn
+advances the clock one tick, applies a few new effects and plays a few
+attacks between affected entities. Effect durations grow with the effect
+count so the number of active effects stays roughly constant and every turn
+does the same amount of real work.
+
+For comparison, the same turns are timed with a scan that visits every
+active effect each tick to count down its duration, which is what
+``effects.StatusEffects`` avoids.
+
+Run with ``python -m rpg_game.benchmarks.effects --counts 1000 100000 1000000``.
+"""
+
+import argparse
+import json
+import random
+import time
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from rpg_game.character import Character
+from rpg_game.effects import ARMOR_UP, ATTACK_UP, POISON, STUN, StatusEffects
+from rpg_game.game_io import NullIO
+
+# Health large enough that benchmark entities never die
+_UNKILLABLE = 10**15
+
+DEFAULT_COUNTS = (1_000, 10_000, 100_000, 1_000_000)
+
+# Effects applied and attacks played per turn
+CHURN = 10
+
+_KINDS = ((POISON, 1), (STUN, 0), (ATTACK_UP, 3), (ARMOR_UP, 2))
+
+
+def _setup(
+    count: int, entities: int, seed: int
+) -> Tuple[random.Random, List[Character], StatusEffects, Callable[[], None]]:
+    rng = random.Random(seed)
+    io = NullIO()
+    population = [
+        Character(f"Entity {i}", _UNKILLABLE, 10, rng=rng, io=io)
+        for i in range(entities)
+    ]
+    effects = StatusEffects()
+    longest = max(2, 2 * count // CHURN)
+
+    def apply_random() -> None:
+        kind, value = _KINDS[int(rng.random() * len(_KINDS))]
+        entity = population[int(rng.random() * entities)]
+        effects.apply(entity, kind, 1 + int(rng.random() * longest), value)
+
+    for _ in range(count):
+        apply_random()
+    return rng, population, effects, apply_random
+
+
+def _time_turns(count: int, entities: int, turns: int, seed: int) -> float:
+    rng, population, effects, apply_random = _setup(count, entities, seed)
+    start = time.perf_counter()
+    for _ in range(turns):
+        effects.advance(effects.now + 1)
+        for _ in range(CHURN):
+            apply_random()
+            attacker = population[int(rng.random() * entities)]
+            attacker.attack(population[int(rng.random() * entities)])
+    return (time.perf_counter() - start) / turns
+
+
+def _time_scan(count: int, turns: int, seed: int) -> float:
+    """Time the same number of effects kept as lists that are scanned every tick."""
+    rng = random.Random(seed)
+    longest = max(2, 2 * count // CHURN)
+    active: List[List[int]] = [
+        [int(rng.random() * 4), 1 + int(rng.random() * longest)] for _ in range(count)
+    ]
+    start = time.perf_counter()
+    for _ in range(turns):
+        remaining: List[List[int]] = []
+        for effect in active:
+            effect[1] -= 1
+            if effect[1] > 0:
+                remaining.append(effect)
+        active = remaining
+        for _ in range(CHURN):
+            active.append([int(rng.random() * 4), 1 + int(rng.random() * longest)])
+    return (time.perf_counter() - start) / turns
+
+
+def measure(
+    counts: Sequence[int] = DEFAULT_COUNTS,
+    entities: int = 10_000,
+    turns: int = 2_000,
+    scan_limit: int = 100_000,
+    repeat: int = 3,
+) -> List[Dict[str, Any]]:
+    """
+    Time turns with increasing numbers of active effects.
+
+    Args:
+        counts: Numbers of active effects to try
+        entities: Number of entities the effects are spread over
+        turns: Turns timed per run
+        scan_limit: Largest count the scanning baseline is timed for
+        repeat: Runs per count; the fastest is reported
+
+    Returns:
+        List[Dict[str, Any]]: Per count, microseconds per turn with the
+        timing wheel and with the scan (None above ``scan_limit``)
+    """
+    results = []
+    for count in counts:
+        wheel = min(_time_turns(count, entities, turns, seed) for seed in range(repeat))
+        scan = None
+        if count <= scan_limit:
+            scan = min(
+                _time_scan(count, max(1, turns // 10), seed) for seed in range(repeat)
+            )
+        results.append(
+            {
+                "effects": count,
+                "wheel_turn_us": round(wheel * 1e6, 2),
+                "scan_turn_us": round(scan * 1e6, 2) if scan is not None else None,
+            }
+        )
+    return results
+
+
+def main() -> None:
+    """Run the status-effect benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--counts",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_COUNTS),
+        help="numbers of active effects to try",
+    )
+    parser.add_argument(
+        "--entities",
+        type=int,
+        default=10_000,
+        help="entities the effects are spread over",
+    )
+    parser.add_argument("--turns", type=int, default=2_000, help="turns timed per run")
+    parser.add_argument(
+        "--scan-limit",
+        type=int,
+        default=100_000,
+        help="largest count the scanning baseline is timed for",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="runs per count; the fastest is reported"
+    )
+    args = parser.parse_args()
+    print(
+        json.dumps(
+            measure(
+                args.counts, args.entities, args.turns, args.scan_limit, args.repeat
+            ),
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Memory benchmark for entity storage.
+
+Compares the bytes per entity of regular ``Boss`` objects with rows of an
+``EntityTable``. Object memory is measured with ``tracemalloc`` on a sample
+and reported per entity; the table is measured at full size.
+
+Run with ``python -m rpg_game.benchmarks.memory --entities 10000000``.
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+from typing import Any, Callable, Dict
+
+from rpg_game.boss import Boss
+from rpg_game.constants import BOSS_WEAPON_DAMAGE, BOSS_WEAPON_NAME
+from rpg_game.entity_store import KIND_BOSS, EntityTable
+
+
+def _traced_bytes(build: Callable[[], Any]) -> int:
+    """Return the bytes still allocated by ``build()`` while its result is alive."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return current
+
+
+def measure(entities: int = 10_000_000, object_sample: int = 100_000) -> Dict[str, Any]:
+    """
+    Measure bytes per entity for objects and for the entity table.
+
+    Args:
+        entities: Number of rows to store in the table
+        object_sample: Number of Boss objects to allocate for the comparison
+
+    Returns:
+        Dict[str, Any]: Bytes per entity for each representation and the ratio
+    """
+    object_sample = min(object_sample, entities)
+    object_bytes = _traced_bytes(
+        lambda: [Boss("Goblin King", 50, 8) for _ in range(object_sample)]
+    )
+
+    def build_table() -> EntityTable:
+        table = EntityTable()
+        table.add_many(
+            entities,
+            "Goblin King",
+            50,
+            8,
+            BOSS_WEAPON_NAME,
+            BOSS_WEAPON_DAMAGE,
+            KIND_BOSS,
+        )
+        return table
+
+    table_bytes = _traced_bytes(build_table)
+
+    per_object = object_bytes / object_sample
+    per_row = table_bytes / entities
+    return {
+        "entities": entities,
+        "object_sample": object_sample,
+        "object_bytes_per_entity": round(per_object, 2),
+        "table_bytes_per_entity": round(per_row, 2),
+        "reduction": round(per_object / per_row, 2),
+    }
+
+
+def main() -> None:
+    """Run the memory benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--entities",
+        type=int,
+        default=10_000_000,
+        help="rows to store in the entity table",
+    )
+    parser.add_argument(
+        "--object-sample",
+        type=int,
+        default=100_000,
+        help="Boss objects to allocate for the comparison",
+    )
+    args = parser.parse_args()
+    print(json.dumps(measure(args.entities, args.object_sample), indent=2))
+
+
+if __name__ == "__main__":
+    main()
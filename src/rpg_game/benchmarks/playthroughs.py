@@ -0,0 +1,96 @@
+"""
+Throughput benchmark for scripted playthroughs.
+
+Plays a full menu-to-end-screen transcript (new game, pick a weapon, fight
+both bosses, decline to play again) through the real interactive game loop
+with ``scripted.run_transcripts``, and reports playthroughs per second for
+each output sink.
+
+Run with ``python -m rpg_game.benchmarks.playthroughs --playthroughs 100000``.
+"""
+
+import argparse
+import json
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence
+
+from rpg_game.catalog import default_catalog
+from rpg_game.scripted import HASH, NULL, run_transcripts
+
+# Enter presses queued per boss; enough for any fight, extras re-show the
+# battle menu or decline the replay
+PAUSES_PER_BOSS = 30
+
+
+def campaign_transcript(weapon: int = 3) -> List[str]:
+    """
+    Build a transcript that plays a new game through every boss.
+
+    Args:
+        weapon: Number of the starting weapon to pick
+
+    Returns:
+        List[str]: The input lines
+    """
+    lines = ["1", "Scripted", str(weapon), ""]
+    for _ in default_catalog().campaign():
+        lines += ["1"] + [""] * PAUSES_PER_BOSS
+    return lines + ["n"]
+
+
+def measure(
+    playthroughs: int = 100_000,
+    workers: Optional[int] = None,
+    sinks: Sequence[str] = (NULL, HASH),
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """
+    Time the campaign transcript with each sink.
+
+    Args:
+        playthroughs: Number of playthroughs per sink
+        workers: Worker processes (None uses all cores, 1 runs inline)
+        sinks: Output sinks to measure
+        seed: Master seed
+
+    Returns:
+        Dict[str, Any]: Per sink, playthroughs per second, how the games ended
+        and the number of distinct output fingerprints
+    """
+    transcript = campaign_transcript()
+    results: Dict[str, Any] = {"playthroughs": playthroughs, "workers": workers}
+    for sink in sinks:
+        report = run_transcripts(
+            [transcript] * playthroughs, seed=seed, workers=workers, sink=sink
+        )
+        results[sink] = {
+            "seconds": round(report.seconds, 3),
+            "per_second": round(report.per_second, 1),
+            "final_states": dict(Counter(p.state for p in report.playthroughs)),
+            "distinct_fingerprints": len(set(report.fingerprints) - {None}),
+        }
+    return results
+
+
+def main() -> None:
+    """Run the playthrough benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--playthroughs", type=int, default=100_000, help="playthroughs per sink"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=0, help="worker processes (0 uses all cores)"
+    )
+    parser.add_argument(
+        "--sinks", nargs="+", default=[NULL, HASH], help="output sinks to measure"
+    )
+    args = parser.parse_args()
+    print(
+        json.dumps(
+            measure(args.playthroughs, args.workers or None, args.sinks), indent=2
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
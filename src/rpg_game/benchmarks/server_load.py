@@ -0,0 +1,229 @@
+"""
+Load generator for the multi-session game server.
+
+Opens many connections to a ``GameServer``, gives each its own player name,
+holds them all idle at the main menu, then plays each one through a short scripted game (new game, pick a
+weapon, save and quit). Reports connection and play throughput and, when the
+server runs in a child process on Linux, its resident memory per idle session.
+
+Run with ``python -m rpg_game.benchmarks.server_load --sessions 10000``.
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import subprocess
+import sys
+import time
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+# Input for one session after the main menu: new game, name, weapon,
+# continue, save and quit
+SCRIPT = b"1\nLoadbot\n1\n\n3\n"
+NAME_PROMPT = b"player name: "
+MENU_PROMPT = b"(1-3): "
+GOODBYE = b"Game saved. Goodbye!"
+
+
+async def _connect(
+    host: str, port: int, number: int, limit: asyncio.Semaphore
+) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """Open session ``number`` and wait until it idles at the main menu."""
+    async with limit:
+        reader, writer = await asyncio.open_connection(host, port)
+        await reader.readuntil(NAME_PROMPT)
+        writer.write(f"loadbot-{number}\n".encode())
+        await reader.readuntil(MENU_PROMPT)
+        return reader, writer
+
+
+async def _play(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> bool:
+    """Play the scripted game on an idle session; return whether it ended cleanly."""
+    writer.write(SCRIPT)
+    await writer.drain()
+    output = await reader.read()
+    writer.close()
+    return GOODBYE in output
+
+
+async def run_load(
+    host: str,
+    port: int,
+    sessions: int = 1000,
+    concurrency: int = 256,
+    on_idle: Optional[Any] = None,
+) -> Dict[str, Any]:
+    """
+    Drive ``sessions`` concurrent sessions against a running server.
+
+    Args:
+        host: Server host
+        port: Server port
+        sessions: Number of sessions to hold open at once
+        concurrency: Maximum connection attempts in flight
+        on_idle: Optional callable run once every session idles at the menu;
+            its result is reported as ``"idle"``
+
+    Returns:
+        Dict[str, Any]: Session counts, timings and throughput
+    """
+    limit = asyncio.Semaphore(concurrency)
+    start = time.perf_counter()
+    connections = await asyncio.gather(
+        *(_connect(host, port, number, limit) for number in range(sessions)),
+        return_exceptions=True,
+    )
+    connect_seconds = time.perf_counter() - start
+    open_sessions = [c for c in connections if not isinstance(c, BaseException)]
+    idle = on_idle() if on_idle is not None else None
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(_play(reader, writer) for reader, writer in open_sessions),
+        return_exceptions=True,
+    )
+    play_seconds = time.perf_counter() - start
+    completed = sum(1 for result in results if result is True)
+
+    return {
+        "sessions": sessions,
+        "connected": len(open_sessions),
+        "completed": completed,
+        "failed": sessions - completed,
+        "connect_seconds": round(connect_seconds, 3),
+        "play_seconds": round(play_seconds, 3),
+        "sessions_per_sec": round(completed / max(play_seconds, 1e-9), 1),
+        "idle": idle,
+    }
+
+
+def _raise_fd_limit() -> None:
+    """Raise the open-file limit to its maximum (inherited by the server)."""
+    if resource is None:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if hard == resource.RLIM_INFINITY or soft < hard:
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+        except (ValueError, OSError):
+            pass
+
+
+def _rss_kb(pid: int) -> Optional[int]:
+    """Return a process's resident memory in KiB, or None if unknown."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def _free_port(host: str) -> int:
+    """Return a TCP port that is currently free."""
+    with socket.socket() as sock:
+        sock.bind((host, 0))
+        return int(sock.getsockname()[1])
+
+
+def _wait_for_server(host: str, port: int, timeout: float = 10.0) -> None:
+    """Block until the server accepts connections."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with socket.create_connection((host, port), timeout=1.0) as sock:
+                # Wait for the first prompt so the probe session ends quietly
+                # on EOF
+                data = b""
+                while NAME_PROMPT not in data:
+                    chunk = sock.recv(4096)
+                    if not chunk:
+                        break
+                    data += chunk
+                return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+
+
+def measure(
+    sessions: int = 10_000, concurrency: int = 256, host: str = "127.0.0.1"
+) -> Dict[str, Any]:
+    """
+    Start a server in a child process and load it with ``sessions`` sessions.
+
+    The server gets its own process, so it runs on a single core, and its
+    memory is measured without the load generator's.
+
+    Args:
+        sessions: Number of concurrent sessions
+        concurrency: Maximum connection attempts in flight
+        host: Interface for the server to listen on
+
+    Returns:
+        Dict[str, Any]: The ``run_load`` results plus memory per idle session
+    """
+    _raise_fd_limit()
+    port = _free_port(host)
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "rpg_game",
+            "serve",
+            "--host",
+            host,
+            "--port",
+            str(port),
+            "--saves",
+            ":memory:",
+        ],
+        stdout=subprocess.DEVNULL,
+    )
+    try:
+        _wait_for_server(host, port)
+        # Let the probe connection's session end before the baseline
+        time.sleep(0.2)
+        baseline = _rss_kb(server.pid)
+        results = asyncio.run(
+            run_load(
+                host, port, sessions, concurrency, on_idle=lambda: _rss_kb(server.pid)
+            )
+        )
+    finally:
+        server.terminate()
+        server.wait()
+
+    loaded = results.pop("idle")
+    if baseline is not None and loaded is not None and results["connected"]:
+        results["server_rss_kb"] = loaded
+        results["kb_per_idle_session"] = round(
+            (loaded - baseline) / results["connected"], 2
+        )
+    return results
+
+
+def main() -> None:
+    """Run the server load generator from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sessions", type=int, default=10_000, help="concurrent sessions to open"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=256, help="connection attempts in flight"
+    )
+    args = parser.parse_args()
+    print(json.dumps(measure(args.sessions, args.concurrency), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Soak test for the game loop.
+
+Plays the real interactive loop (menu, intro, boss battles, end screen)
+over and over, answering "play again" each time, with output discarded.
+Records resident memory and the interpreter stack depth at every end screen,
+so growth across replays shows up as a rising trend.
+
+Run with ``python -m rpg_game.benchmarks.soak --replays 100000``.
+"""
+
+import argparse
+import json
+import sys
+import time
+from types import FrameType
+from typing import Any, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+from rpg_game.game import Game
+from rpg_game.game_io import GameIO
+from rpg_game.renderer import ScreenRenderer
+from rpg_game.save_sqlite import SQLiteSaveBackend, SQLiteSaveStore
+
+
+def _rss_kb() -> int:
+    """Return this process's resident memory in KiB."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    # Peak RSS; still flat if the loop does not grow
+    return (
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if resource is not None
+        else 0
+    )
+
+
+def _stack_depth() -> int:
+    """Return the number of frames on the current stack."""
+    depth = 0
+    frame: Optional[FrameType] = sys._getframe()
+    while frame is not None:
+        depth += 1
+        frame = frame.f_back
+    return depth
+
+
+class ReplayIO(GameIO):
+    """
+    Answers every prompt so the game is replayed ``replays`` times.
+
+    Output is discarded unformatted. The menu, weapon and battle prompts get ``1``,
+    the name prompt a name and "play again" ``y`` until the last replay.
+    """
+
+    def __init__(self, replays: int, samples: int = 100) -> None:
+        """
+        Initialize the script.
+
+        Args:
+            replays: Number of times to play the game
+            samples: Number of memory samples to take over the run
+        """
+        self.renderer = ScreenRenderer(stream=self)
+        self.quiet = True
+        self.replays = replays
+        self.played = 0
+        self.every = max(1, replays // samples)
+        self.rss: List[int] = []
+        self.depths: List[int] = []
+
+    def write(self, text: str) -> None:
+        """Discard renderer output."""
+
+    def flush(self) -> None:
+        """Nothing to flush."""
+
+    def print(self, *values: Any, sep: str = " ", end: str = "\n") -> None:
+        """Discard output."""
+
+    async def read_line(self, prompt: str = "") -> str:
+        """Answer ``prompt``."""
+        if "play again" in prompt:
+            self.played += 1
+            if self.played % self.every == 0 or self.played == 1:
+                self.rss.append(_rss_kb())
+                self.depths.append(_stack_depth())
+            return "y" if self.played < self.replays else "n"
+        if "name" in prompt:
+            return "Soak"
+        if "choice" in prompt:
+            return "1"
+        return ""
+
+
+def measure(replays: int = 100_000, samples: int = 100) -> Dict[str, Any]:
+    """
+    Replay the game ``replays`` times and report memory and stack depth.
+
+    Args:
+        replays: Number of full playthroughs
+        samples: Number of memory samples to take
+
+    Returns:
+        Dict[str, Any]: Throughput, RSS at the start and end, its growth,
+        and the range of stack depths seen at the end screen
+    """
+    script = ReplayIO(replays, samples)
+    game = Game(save_backend=SQLiteSaveBackend(SQLiteSaveStore(":memory:")), io=script)
+    start = time.perf_counter()
+    game.run()
+    elapsed = time.perf_counter() - start
+
+    # Compare after the first sample, once caches and the allocator have warmed up
+    settled = script.rss[1:] or script.rss
+    return {
+        "replays": script.played,
+        "seconds": round(elapsed, 3),
+        "replays_per_sec": round(script.played / max(elapsed, 1e-9), 1),
+        "rss_start_kb": settled[0],
+        "rss_end_kb": settled[-1],
+        "rss_growth_kb": settled[-1] - settled[0],
+        "stack_depth_min": min(script.depths),
+        "stack_depth_max": max(script.depths),
+    }
+
+
+def main() -> None:
+    """Run the soak test from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--replays", type=int, default=100_000, help="number of full playthroughs"
+    )
+    parser.add_argument(
+        "--samples", type=int, default=100, help="memory samples to take over the run"
+    )
+    args = parser.parse_args()
+    print(json.dumps(measure(args.replays, args.samples), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Startup-time benchmark for the RPG game.
+
+Measures, in fresh interpreters, the cumulative import time of
+``rpg_game`` (via ``python -X importtime``), the modules that dominate it,
+and the wall time of ``python -m rpg_game`` quitting from the main menu.
+Also checks what a spawned worker process loads when it imports the package.
+
+Run with ``python -m rpg_game.benchmarks.startup``.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Tuple
+
+# Cold-start budgets the measurements are reported against
+IMPORT_BUDGET_MS = 50.0
+MAIN_BUDGET_MS = 750.0
+
+
+def import_breakdown(module: str = "rpg_game") -> List[Tuple[str, float, float]]:
+    """
+    Import ``module`` in a fresh interpreter with ``-X importtime``.
+
+    Args:
+        module: Module to import
+
+    Returns:
+        List of ``(module, self_ms, cumulative_ms)`` in import order; the last
+        entry is ``module`` itself
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        entries.append((name.strip(), int(self_us) / 1000, int(cumulative_us) / 1000))
+    return entries
+
+
+def import_ms(module: str = "rpg_game") -> float:
+    """Return the cumulative import time of ``module`` in milliseconds."""
+    return import_breakdown(module)[-1][2]
+
+
+def main_quit_ms(repeat: int = 3) -> float:
+    """
+    Time ``python -m rpg_game`` starting and quitting from the main menu.
+
+    Args:
+        repeat: Number of runs; the fastest is reported
+
+    Returns:
+        float: Wall time in milliseconds
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "rpg_game"],
+            input="3\n",
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def worker_modules() -> List[str]:
+    """
+    Return the ``rpg_game`` and ``asyncio`` modules loaded in this process.
+
+    Run in a spawned worker, this shows what ``import rpg_game`` costs there.
+    """
+    return sorted(
+        name for name in sys.modules if name.split(".")[0] in ("rpg_game", "asyncio")
+    )
+
+
+def measure(repeat: int = 3, top: int = 10) -> Dict[str, Any]:
+    """
+    Measure cold-start times and the heaviest imports.
+
+    Args:
+        repeat: Runs of ``python -m rpg_game`` to take the fastest of
+        top: Number of modules to list in the breakdown
+
+    Returns:
+        Dict[str, Any]: Import and startup times, budgets and the breakdown
+        of ``import rpg_game`` and ``import rpg_game.game`` by self time
+    """
+    results: Dict[str, Any] = {
+        "import_rpg_game_ms": round(import_ms("rpg_game"), 2),
+        "import_budget_ms": IMPORT_BUDGET_MS,
+        "main_quit_ms": round(main_quit_ms(repeat), 2),
+        "main_budget_ms": MAIN_BUDGET_MS,
+    }
+    for module in ("rpg_game", "rpg_game.game"):
+        entries = sorted(import_breakdown(module), key=lambda entry: -entry[1])[:top]
+        results[f"breakdown[{module}]"] = [
+            {
+                "module": name,
+                "self_ms": round(self_ms, 2),
+                "cumulative_ms": round(total, 2),
+            }
+            for name, self_ms, total in entries
+        ]
+    return results
+
+
+def main() -> None:
+    """Run the startup benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="runs of python -m rpg_game to take the fastest of",
+    )
+    parser.add_argument(
+        "--top", type=int, default=10, help="modules to list per breakdown"
+    )
+    args = parser.parse_args()
+    print(json.dumps(measure(args.repeat, args.top), indent=2))
+
+
+if __name__ == "__main__":
+    main()
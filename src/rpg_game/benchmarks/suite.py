@@ -0,0 +1,435 @@
+"""
+Speed benchmarks for the game's hot paths.
+
+Micro benchmarks time single calls (``Character.attack``, ``Boss.attack``,
+a combat turn with and without damage variance, the ``health`` setter,
+``GameLogger.log_combat`` with logging disabled and with a buffered
+writer feeding a log file, ``Game.get_game_state`` and a
+``save_game``/``load_game`` round-trip); the macro benchmark plays
+full headless campaigns. ``combat_turn_legacy`` replays the turn with the
+attacks as they were before ``damage`` tables (fixed damage, the boss's
+special attack as its own roll), so ``combat_turn_fixed`` shows what the
+tables cost where they add no randomness. Every benchmark is warmed up,
+calibrated so one repeat takes at least ``min_time`` seconds, and timed
+``repeat`` times.
+
+Results are printed as JSON. Given a baseline (an earlier ``--output``
+file), the run fails when a benchmark's median slows down by more than
+``--threshold``.
+
+Run with ``python -m rpg_game bench [--baseline FILE] [--output FILE]``.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
+
+from rpg_game.boss import Boss
+from rpg_game.catalog import default_catalog
+from rpg_game.character import Character
+from rpg_game.constants import (
+    BOSS_SPECIAL_ATTACK_CHANCE,
+    BOSS_SPECIAL_ATTACK_MULTIPLIER,
+    PLAYER_INITIAL_DAMAGE,
+    PLAYER_INITIAL_HEALTH,
+)
+from rpg_game.damage import DEFAULT_RULES, FIXED_RULES, CombatRules
+from rpg_game.game import Game
+from rpg_game.game_logger import GameLogger
+from rpg_game.log_sinks import BufferedLogWriter, RotatingFileSink
+from rpg_game.save_game import JsonFileBackend, load_game, save_game, set_save_backend
+
+# Health large enough that benchmark targets never die
+_UNKILLABLE = 10**15
+
+DEFAULT_THRESHOLD = 0.10
+
+
+class Benchmark(NamedTuple):
+    """A named benchmark whose setup yields the function to time."""
+
+    name: str
+    setup: Callable[[], ContextManager[Callable[[], Any]]]
+
+
+@contextlib.contextmanager
+def _character_attack() -> Iterator[Callable[[], Any]]:
+    player = Character("Hero", PLAYER_INITIAL_HEALTH, PLAYER_INITIAL_DAMAGE, "Rock", 2)
+    boss = Boss("Goblin King", _UNKILLABLE, 8, rng=random.Random(0))
+    yield lambda: player.attack(boss)
+
+
+@contextlib.contextmanager
+def _boss_attack() -> Iterator[Callable[[], Any]]:
+    boss = Boss("Goblin King", 50, 8, rng=random.Random(0))
+    player = Character("Hero", _UNKILLABLE, PLAYER_INITIAL_DAMAGE)
+    yield lambda: boss.attack(player)
+
+
+def _combat_turn(rules: CombatRules) -> Callable[[], ContextManager[Callable[[], Any]]]:
+    """Return the setup of a benchmark playing one turn under ``rules``."""
+
+    @contextlib.contextmanager
+    def setup() -> Iterator[Callable[[], Any]]:
+        rng = random.Random(0)
+        player = Character(
+            "Hero", _UNKILLABLE, PLAYER_INITIAL_DAMAGE, "Rock", 2, rng=rng, rules=rules
+        )
+        boss = Boss("Goblin King", _UNKILLABLE, 8, rng=rng, rules=rules)
+
+        def turn() -> None:
+            player.attack(boss)
+            boss.attack(player)
+
+        yield turn
+
+    return setup
+
+
+@contextlib.contextmanager
+def _combat_turn_legacy() -> Iterator[Callable[[], Any]]:
+    """Play one turn with the attacks as they were before damage tables."""
+    rng = random.Random(0)
+    player = Character("Hero", _UNKILLABLE, PLAYER_INITIAL_DAMAGE, "Rock", 2, rng=rng)
+    boss = Boss("Goblin King", _UNKILLABLE, 8, rng=rng)
+
+    def attack(attacker: Character, enemy: Character, special_chance: float) -> int:
+        special = special_chance > 0 and attacker.rng.random() < special_chance
+        damage = attacker.damage
+        if attacker.weapon:
+            damage += attacker.weapon.damage_bonus
+        if special:
+            damage = int(damage * BOSS_SPECIAL_ATTACK_MULTIPLIER)
+        initial_health = enemy.health
+        enemy.take_damage(damage)
+        return initial_health - enemy.health
+
+    def turn() -> None:
+        attack(player, boss, 0.0)
+        attack(boss, player, BOSS_SPECIAL_ATTACK_CHANCE)
+
+    yield turn
+
+
+@contextlib.contextmanager
+def _health_setter() -> Iterator[Callable[[], Any]]:
+    player = Character("Hero", PLAYER_INITIAL_HEALTH, PLAYER_INITIAL_DAMAGE)
+
+    def set_health() -> None:
+        player.health = 50
+
+    yield set_health
+
+
+@contextlib.contextmanager
+def _log_combat() -> Iterator[Callable[[], Any]]:
+    logger = GameLogger(log_to_console=False)
+    yield lambda: logger.log_combat("Hero", "Goblin King", 12, is_critical=True)
+
+
+@contextlib.contextmanager
+def _log_combat_file() -> Iterator[Callable[[], Any]]:
+    with tempfile.TemporaryDirectory() as directory:
+        writer = BufferedLogWriter(
+            RotatingFileSink(os.path.join(directory, "combat.log"), max_bytes=0)
+        )
+        logger = GameLogger(writer=writer)
+        try:
+            yield lambda: logger.log_combat("Hero", "Goblin King", 12, is_critical=True)
+        finally:
+            writer.close()
+
+
+def _game_with_bosses(bosses: int) -> Game:
+    """Return a headless game with a player and ``bosses`` bosses."""
+    catalog = default_catalog()
+    weapon = catalog.starting_weapons()[0]
+    roster = catalog.campaign()
+    game = Game(rng=random.Random(0))
+    game.player = Character(
+        "Hero",
+        PLAYER_INITIAL_HEALTH,
+        PLAYER_INITIAL_DAMAGE,
+        weapon.name,
+        weapon.damage,
+        rng=game.rng,
+    )
+    game.bosses = [
+        Boss(entry.name, entry.health, entry.damage, rng=game.rng)
+        for entry in (roster[i % len(roster)] for i in range(bosses))
+    ]
+    return game
+
+
+@contextlib.contextmanager
+def _get_game_state() -> Iterator[Callable[[], Any]]:
+    game = _game_with_bosses(100)
+    yield game.get_game_state
+
+
+@contextlib.contextmanager
+def _save_round_trip() -> Iterator[Callable[[], Any]]:
+    state = _game_with_bosses(100).get_game_state()
+    with tempfile.TemporaryDirectory() as directory:
+        previous = set_save_backend(
+            JsonFileBackend(os.path.join(directory, "save.json"))
+        )
+        try:
+            yield lambda: (save_game(state), load_game())
+        finally:
+            set_save_backend(previous)
+
+
+@contextlib.contextmanager
+def _campaign() -> Iterator[Callable[[], Any]]:
+    catalog = default_catalog()
+    weapon = catalog.starting_weapons()[0]
+    roster = catalog.campaign()
+    rng = random.Random(0)
+    logger = GameLogger(log_to_console=False)
+
+    def play() -> bool:
+        """Fight the whole roster with the first weapon; True if the player won."""
+        player = Character(
+            "Hero",
+            PLAYER_INITIAL_HEALTH,
+            PLAYER_INITIAL_DAMAGE,
+            weapon.name,
+            weapon.damage,
+            rng=rng,
+        )
+        for entry in roster:
+            boss = Boss(entry.name, entry.health, entry.damage, rng=rng)
+            while True:
+                player.attack(boss, logger)
+                if boss.health <= 0:
+                    break
+                boss.attack(player, logger)
+                if player.health <= 0:
+                    return False
+        return True
+
+    # Boss.take_damage announces defeats; keep that out of the report
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield play
+
+
+BENCHMARKS: List[Benchmark] = [
+    Benchmark("character_attack", _character_attack),
+    Benchmark("boss_attack", _boss_attack),
+    Benchmark("combat_turn", _combat_turn(DEFAULT_RULES)),
+    Benchmark("combat_turn_fixed", _combat_turn(FIXED_RULES)),
+    Benchmark("combat_turn_legacy", _combat_turn_legacy),
+    Benchmark("health_setter", _health_setter),
+    Benchmark("log_combat", _log_combat),
+    Benchmark("log_combat_file", _log_combat_file),
+    Benchmark("get_game_state", _get_game_state),
+    Benchmark("save_load_round_trip", _save_round_trip),
+    Benchmark("campaign", _campaign),
+]
+
+
+def _time_loop(func: Callable[[], Any], number: int) -> float:
+    """Return the seconds taken by ``number`` calls of ``func``."""
+    loop = range(number)
+    start = time.perf_counter()
+    for _ in loop:
+        func()
+    return time.perf_counter() - start
+
+
+def _calibrate(func: Callable[[], Any], min_time: float) -> int:
+    """Return a call count whose loop takes at least ``min_time`` seconds."""
+    number = 1
+    while True:
+        if _time_loop(func, number) >= min_time or number >= 1 << 24:
+            return number
+        number *= 2
+
+
+def time_function(
+    func: Callable[[], Any], repeat: int = 7, warmup: int = 1, min_time: float = 0.05
+) -> Dict[str, float]:
+    """
+    Time a function and summarize the per-call times.
+
+    Args:
+        func: The function to time
+        repeat: Number of timed repeats
+        warmup: Number of untimed repeats run first
+        min_time: Minimum duration of one repeat in seconds
+
+    Returns:
+        Dict[str, float]: Calls per repeat and min/median/mean/stdev seconds
+        per call, plus calls per second at the median
+    """
+    number = _calibrate(func, min_time)
+    for _ in range(warmup):
+        _time_loop(func, number)
+    times = [_time_loop(func, number) / number for _ in range(repeat)]
+    median = statistics.median(times)
+    return {
+        "number": number,
+        "repeat": repeat,
+        "min": min(times),
+        "median": median,
+        "mean": statistics.mean(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "ops_per_sec": 1.0 / median if median > 0 else float("inf"),
+    }
+
+
+def run_suite(
+    names: Optional[Sequence[str]] = None,
+    repeat: int = 7,
+    warmup: int = 1,
+    min_time: float = 0.05,
+) -> Dict[str, Any]:
+    """
+    Run the benchmarks.
+
+    Args:
+        names: Benchmarks to run (default: all)
+        repeat: Number of timed repeats per benchmark
+        warmup: Number of untimed repeats per benchmark
+        min_time: Minimum duration of one repeat in seconds
+
+    Returns:
+        Dict[str, Any]: Environment details and the results by benchmark name
+
+    Raises:
+        ValueError: If a name is not a known benchmark
+    """
+    known = {benchmark.name: benchmark for benchmark in BENCHMARKS}
+    selected = list(known) if names is None else list(names)
+    unknown = [name for name in selected if name not in known]
+    if unknown:
+        raise ValueError(
+            f"Unknown benchmarks {unknown}; expected some of {sorted(known)}"
+        )
+    results = {}
+    for name in selected:
+        with known[name].setup() as func:
+            results[name] = time_function(func, repeat, warmup, min_time)
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "benchmarks": results,
+    }
+
+
+def compare(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Compare median times with a baseline run.
+
+    Args:
+        results: Output of ``run_suite``
+        baseline: An earlier output of ``run_suite``
+        threshold: Allowed slowdown as a fraction (0.10 is 10% slower)
+
+    Returns:
+        Dict[str, Dict[str, float]]: For each benchmark present in both runs,
+        its baseline and current median and the relative change;
+        ``regressed`` is 1.0 when the change exceeds the threshold
+    """
+    comparison = {}
+    for name, current in results["benchmarks"].items():
+        previous = baseline.get("benchmarks", {}).get(name)
+        if previous is None or previous["median"] <= 0:
+            continue
+        change = current["median"] / previous["median"] - 1.0
+        comparison[name] = {
+            "baseline": previous["median"],
+            "current": current["median"],
+            "change": change,
+            "regressed": float(change > threshold),
+        }
+    return comparison
+
+
+def bench_main(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Command-line entry point for ``python -m rpg_game bench``.
+
+    Exits with status 1 if any benchmark regressed against the baseline.
+
+    Args:
+        argv: Command-line arguments (defaults to ``sys.argv[1:]``)
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m rpg_game bench",
+        description="Benchmark the game's hot paths and check for regressions.",
+    )
+    parser.add_argument(
+        "names",
+        nargs="*",
+        help="benchmarks to run (default: all of "
+        + ", ".join(b.name for b in BENCHMARKS)
+        + ")",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=7, help="timed repeats per benchmark"
+    )
+    parser.add_argument("--warmup", type=int, default=1, help="untimed warmup repeats")
+    parser.add_argument(
+        "--min-time", type=float, default=0.05, help="minimum seconds per repeat"
+    )
+    parser.add_argument("--output", help="also write the JSON results to this file")
+    parser.add_argument(
+        "--baseline", help="JSON results of an earlier run to compare with"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="allowed median slowdown before failing (default 0.10)",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        results = run_suite(args.names or None, args.repeat, args.warmup, args.min_time)
+    except ValueError as e:
+        parser.error(str(e))
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            results["comparison"] = compare(results, json.load(f), args.threshold)
+        regressions = [
+            name for name, row in results["comparison"].items() if row["regressed"]
+        ]
+        results["regressions"] = regressions
+
+    report = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report + "\n")
+    print(report)
+    if regressions:
+        print(
+            f"Regressions over {args.threshold:.0%}: {', '.join(regressions)}",
+            file=sys.stderr,
+        )
+        sys.exit(1)
@@ -5,16 +5,24 @@ This module defines the Boss class which represents boss enemies in the game.
 Bosses are special types of characters with enhanced abilities.
 """
 
-import random
 from typing import Any, Optional
 from rpg_game.character import Character
 from rpg_game.weapon import Weapon
+from rpg_game.damage import CombatRules, DamageTable, boss_table
+from rpg_game.constants import (
+    BOSS_WEAPON_NAME,
+    BOSS_WEAPON_DAMAGE,
+    BOSS_SPEED,
+)
 
 
 class Boss(Character):
     """A boss enemy in the game."""
     
-    def __init__(self, name: str, health: int, damage: int):
+    speed: int = BOSS_SPEED
+    
+    def __init__(self, name: str, health: int, damage: int, rng: Optional[Any] = None,
+                 io: Optional[Any] = None, rules: Optional[CombatRules] = None):
         """
         Initialize a new boss.
         
@@ -22,44 +30,23 @@ class Boss(Character):
             name: The name of the boss
             health: The boss's health points
             damage: The boss's base damage
+            rng: Optional random source for damage rolls; defaults
+                to the global ``random`` module
+            io: Optional ``game_io.GameIO`` for messages; defaults to the console
+            rules: Optional ``damage.CombatRules`` for damage rolls
         """
-        super().__init__(name, health, damage)
-        self.weapon = Weapon("Boss Weapon", 5)  # Bosses always have a weapon
+        super().__init__(name, health, damage, rng=rng, io=io, rules=rules)
+        # Bosses always have a weapon
+        self.weapon = Weapon(BOSS_WEAPON_NAME, BOSS_WEAPON_DAMAGE)
     
-    def attack(self, enemy: Any, logger: Optional[Any] = None) -> int:
+    def _build_damage_table(self, attack_value: int) -> DamageTable:
         """
-        Attack an enemy character with a chance for a special attack.
+        Return the table for ``attack_value``.
         
-        Args:
-            enemy: The enemy character to attack
-            logger: Optional logger for combat messages
-            
-        Returns:
-            int: The amount of damage dealt
+        Bosses have a 25% chance of a special attack doing 1.5x damage; the
+        roll is part of the table, so ``attack`` needs no override.
         """
-        # Bosses have a 25% chance to do a special attack
-        special_attack = random.random() < 0.25
-        
-        damage = self.damage
-        if self.weapon:
-            damage += self.weapon.damage_bonus
-        
-        if special_attack:
-            # Special attack does 1.5x damage
-            damage = int(damage * 1.5)
-        
-        # Store initial health for damage calculation
-        initial_health = enemy.health
-        enemy.take_damage(damage)
-        actual_damage = initial_health - enemy.health
-        
-        if logger:
-            logger.log_combat(attacker=self.name,
-                           defender=enemy.name,
-                           damage=actual_damage,
-                           is_critical=special_attack)
-            
-        return actual_damage
+        return boss_table(attack_value, self.rules)
     
     def take_damage(self, amount: int) -> None:
         """
@@ -68,8 +55,12 @@ class Boss(Character):
         Args:
             amount: Amount of damage to take
         """
-        self.health -= amount
+        effects = self.effects
+        if effects is not None and effects.mask[self.effect_slot]:
+            amount = effects.damage_taken(self.effect_slot, amount)
+        health = self.health - amount
+        self.health = health
         
         # Check if boss is defeated
-        if self.health <= 0:
-            print(f"{self.name} has been defeated!")
+        if health <= 0:
+            self.output().say("{} has been defeated!", self.name)
@@ -0,0 +1,535 @@
+"""
+Data-driven content catalog for the RPG game.
+
+Weapons and bosses are described in a JSON file (the bundled default is
+``data/content.json``) and compiled into a ``Catalog``: parallel arrays
+indexed by a dense integer id plus a name-to-id dict, so every lookup is
+O(1). Each name is stored once; the name columns and the index share the
+same string objects.
+
+Parsing a large catalog is slow, so ``load_catalog`` also writes the
+compiled form to a binary cache file and reuses it while the source is
+unchanged. The cache records the source's size, modification time and
+SHA-256; a matching size and mtime is trusted, otherwise the hash decides.
+
+Cache layout::
+
+    header          88 bytes   magic, version, source size, mtime and hash, counts
+    int arrays      weapon damage; boss health, damage and level;
+                    starter weapon ids; campaign boss ids
+    weapon names    u32 length, NUL-separated UTF-8
+    boss names      u32 length, NUL-separated UTF-8
+    descriptions    u32 offsets (one per weapon plus one), u32 length, UTF-8
+    intros          u32 offsets (one per boss plus one), u32 length, UTF-8
+
+Descriptions and intros are decoded only when an entry is looked up, and
+the name indexes are built on the first lookup by name.
+
+The simulators, the arena and the benchmarks read their weapons and bosses
+from ``default_catalog()`` too, so the bundled content is the one roster.
+"""
+
+import hashlib
+import json
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+MAGIC = b"RPGCAT\0\0"
+CACHE_VERSION = 1
+
+HEADER = struct.Struct("<8sHxxQQ32sIIII")
+_LENGTH = struct.Struct("<I")
+
+# Environment variable naming a content file to use instead of the bundled one
+CATALOG_ENV = "RPG_CATALOG"
+# Environment variable overriding where compiled catalogs are cached
+CACHE_DIR_ENV = "RPG_CACHE_DIR"
+
+DEFAULT_CONTENT = Path(__file__).parent / "data" / "content.json"
+
+_SEPARATOR = "\0"
+
+
+class WeaponEntry(NamedTuple):
+    """A weapon in the catalog."""
+
+    id: int
+    name: str
+    damage: int
+    description: str
+
+
+class BossEntry(NamedTuple):
+    """A boss in the catalog."""
+
+    id: int
+    name: str
+    health: int
+    damage: int
+    level: int
+    intro: str
+
+
+class _Texts:
+    """UTF-8 strings stored back to back, decoded one at a time on access."""
+
+    __slots__ = ("offsets", "blob")
+
+    def __init__(self, offsets: array, blob: bytes) -> None:
+        self.offsets = offsets
+        self.blob = blob
+
+    @classmethod
+    def build(cls, texts: Sequence[str]) -> "_Texts":
+        """Encode ``texts``."""
+        offsets = array("I", [0])
+        parts = []
+        position = 0
+        for text in texts:
+            encoded = text.encode("utf-8")
+            parts.append(encoded)
+            position += len(encoded)
+            offsets.append(position)
+        return cls(offsets, b"".join(parts))
+
+    def __getitem__(self, index: int) -> str:
+        return self.blob[self.offsets[index] : self.offsets[index + 1]].decode("utf-8")
+
+
+class Catalog:
+    """
+    Compiled weapons and bosses.
+
+    Attributes:
+        weapon_names: Weapon names, indexed by weapon id
+        boss_names: Boss names, indexed by boss id
+        starter_ids: Ids of the weapons offered at the start of a game
+        campaign_ids: Ids of the bosses fought in a campaign, in order
+    """
+
+    def __init__(
+        self,
+        weapon_names: List[str],
+        weapon_damage: array,
+        descriptions: _Texts,
+        boss_names: List[str],
+        boss_health: array,
+        boss_damage: array,
+        boss_level: array,
+        intros: _Texts,
+        starter_ids: array,
+        campaign_ids: array,
+    ) -> None:
+        """Initialize a catalog from compiled columns (see ``compile_catalog``)."""
+        self.weapon_names = weapon_names
+        self.weapon_damage = weapon_damage
+        self._descriptions = descriptions
+        self.boss_names = boss_names
+        self.boss_health = boss_health
+        self.boss_damage = boss_damage
+        self.boss_level = boss_level
+        self._intros = intros
+        self.starter_ids = starter_ids
+        self.campaign_ids = campaign_ids
+        self._weapon_index: Optional[Dict[str, int]] = None
+        self._boss_index: Optional[Dict[str, int]] = None
+
+    @property
+    def _weapon_ids(self) -> Dict[str, int]:
+        if self._weapon_index is None:
+            self._weapon_index = dict(zip(self.weapon_names, range(self.weapon_count)))
+        return self._weapon_index
+
+    @property
+    def _boss_ids(self) -> Dict[str, int]:
+        if self._boss_index is None:
+            self._boss_index = dict(zip(self.boss_names, range(self.boss_count)))
+        return self._boss_index
+
+    @property
+    def weapon_count(self) -> int:
+        """Number of weapons."""
+        return len(self.weapon_names)
+
+    @property
+    def boss_count(self) -> int:
+        """Number of bosses."""
+        return len(self.boss_names)
+
+    def weapon_id(self, name: str) -> int:
+        """
+        Return the id of the weapon called ``name``.
+
+        Raises:
+            KeyError: If there is no such weapon
+        """
+        return self._weapon_ids[name]
+
+    def boss_id(self, name: str) -> int:
+        """
+        Return the id of the boss called ``name``.
+
+        Raises:
+            KeyError: If there is no such boss
+        """
+        return self._boss_ids[name]
+
+    def weapon(self, weapon_id: int) -> WeaponEntry:
+        """Return the weapon with id ``weapon_id``."""
+        return WeaponEntry(
+            weapon_id,
+            self.weapon_names[weapon_id],
+            self.weapon_damage[weapon_id],
+            self._descriptions[weapon_id],
+        )
+
+    def boss(self, boss_id: int) -> BossEntry:
+        """Return the boss with id ``boss_id``."""
+        return BossEntry(
+            boss_id,
+            self.boss_names[boss_id],
+            self.boss_health[boss_id],
+            self.boss_damage[boss_id],
+            self.boss_level[boss_id],
+            self._intros[boss_id],
+        )
+
+    def find_boss(self, name: str) -> Optional[BossEntry]:
+        """Return the boss called ``name``, or None if it is not in the catalog."""
+        boss_id = self._boss_ids.get(name)
+        return self.boss(boss_id) if boss_id is not None else None
+
+    def starting_weapons(self) -> List[WeaponEntry]:
+        """Return the weapons offered at the start of a game, in order."""
+        return [self.weapon(weapon_id) for weapon_id in self.starter_ids]
+
+    def campaign(self) -> List[BossEntry]:
+        """Return the bosses of a campaign, in the order they are fought."""
+        return [self.boss(boss_id) for boss_id in self.campaign_ids]
+
+
+def _ints(values: Any, typecode: str = "i") -> array:
+    return array(typecode, values)
+
+
+def compile_catalog(content: Dict[str, Any]) -> Catalog:
+    """
+    Compile parsed content into a catalog.
+
+    Args:
+        content: Dict with ``weapons`` (name, damage, optional description
+            and starter flag), ``bosses`` (name, health, damage, optional
+            level and optional intro; ``{player}`` in an intro is replaced by
+            the player's name) and optional ``campaign`` (boss names in
+            order; defaults to all bosses by level)
+
+    Returns:
+        Catalog: The compiled catalog
+
+    Raises:
+        ValueError: If names are duplicated or the campaign names an unknown boss
+    """
+    weapons = content.get("weapons", [])
+    bosses = content.get("bosses", [])
+    weapon_names = [weapon["name"] for weapon in weapons]
+    boss_names = [boss["name"] for boss in bosses]
+    for kind, names in (("weapon", weapon_names), ("boss", boss_names)):
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicate {kind} names in catalog")
+
+    boss_ids = {name: index for index, name in enumerate(boss_names)}
+    campaign = content.get("campaign")
+    if campaign is None:
+        campaign_ids = sorted(
+            range(len(bosses)), key=lambda index: bosses[index].get("level", 0)
+        )
+    else:
+        unknown = [name for name in campaign if name not in boss_ids]
+        if unknown:
+            raise ValueError(f"Campaign names unknown bosses: {', '.join(unknown)}")
+        campaign_ids = [boss_ids[name] for name in campaign]
+
+    return Catalog(
+        weapon_names,
+        _ints(weapon["damage"] for weapon in weapons),
+        _Texts.build([weapon.get("description", "") for weapon in weapons]),
+        boss_names,
+        _ints(boss["health"] for boss in bosses),
+        _ints(boss["damage"] for boss in bosses),
+        _ints(boss.get("level", 0) for boss in bosses),
+        _Texts.build([boss.get("intro", "") for boss in bosses]),
+        _ints(
+            (index for index, weapon in enumerate(weapons) if weapon.get("starter")),
+            "I",
+        ),
+        _ints(campaign_ids, "I"),
+    )
+
+
+def _array_bytes(values: array) -> bytes:
+    """Return an array's items as little-endian bytes."""
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _sized(data: bytes) -> List[bytes]:
+    return [_LENGTH.pack(len(data)), data]
+
+
+def encode_catalog(
+    catalog: Catalog,
+    source_size: int = 0,
+    source_mtime_ns: int = 0,
+    source_hash: bytes = b"",
+) -> bytes:
+    """
+    Encode a catalog in the cache format.
+
+    Args:
+        catalog: The catalog
+        source_size: Size of the content file it was compiled from
+        source_mtime_ns: Modification time of that file
+        source_hash: SHA-256 digest of that file
+
+    Returns:
+        bytes: The encoded cache
+    """
+    parts = [
+        HEADER.pack(
+            MAGIC,
+            CACHE_VERSION,
+            source_size,
+            source_mtime_ns,
+            source_hash.ljust(32, b"\0"),
+            catalog.weapon_count,
+            catalog.boss_count,
+            len(catalog.starter_ids),
+            len(catalog.campaign_ids),
+        )
+    ]
+    for column in (
+        catalog.weapon_damage,
+        catalog.boss_health,
+        catalog.boss_damage,
+        catalog.boss_level,
+        catalog.starter_ids,
+        catalog.campaign_ids,
+    ):
+        parts.append(_array_bytes(column))
+    for names in (catalog.weapon_names, catalog.boss_names):
+        parts += _sized(_SEPARATOR.join(names).encode("utf-8"))
+    for texts in (catalog._descriptions, catalog._intros):
+        parts.append(_array_bytes(texts.offsets))
+        parts += _sized(texts.blob)
+    return b"".join(parts)
+
+
+class _Reader:
+    """Sequential reader over an encoded cache."""
+
+    def __init__(self, data: bytes, offset: int) -> None:
+        self.data = memoryview(data)
+        self.offset = offset
+
+    def array(self, typecode: str, count: int) -> array:
+        values = array(typecode)
+        end = self.offset + count * values.itemsize
+        if end > len(self.data):
+            raise ValueError("Catalog cache is truncated")
+        values.frombytes(self.data[self.offset : end])
+        if sys.byteorder == "big":
+            values.byteswap()
+        self.offset = end
+        return values
+
+    def blob(self) -> bytes:
+        start = self.offset + _LENGTH.size
+        if start > len(self.data):
+            raise ValueError("Catalog cache is truncated")
+        (length,) = _LENGTH.unpack_from(self.data, self.offset)
+        end = start + length
+        if end > len(self.data):
+            raise ValueError("Catalog cache is truncated")
+        self.offset = end
+        return bytes(self.data[start:end])
+
+    def names(self, count: int) -> List[str]:
+        text = self.blob().decode("utf-8")
+        names = text.split(_SEPARATOR) if count else []
+        if len(names) != count:
+            raise ValueError("Catalog cache names are corrupt")
+        return names
+
+
+def read_header(data: bytes) -> Tuple[int, int, bytes]:
+    """
+    Read the source fingerprint from an encoded cache.
+
+    Returns:
+        Tuple[int, int, bytes]: Source size, mtime in nanoseconds and SHA-256
+
+    Raises:
+        ValueError: If the data is not a catalog cache of this version
+    """
+    if len(data) < HEADER.size:
+        raise ValueError("Catalog cache is truncated")
+    magic, version, size, mtime_ns, digest, *_ = HEADER.unpack_from(data)
+    if magic != MAGIC or version != CACHE_VERSION:
+        raise ValueError("Not a catalog cache of this version")
+    return size, mtime_ns, digest
+
+
+def decode_catalog(data: bytes) -> Catalog:
+    """
+    Decode a catalog from the cache format.
+
+    Raises:
+        ValueError: If the data is not a valid catalog cache
+    """
+    read_header(data)
+    _, _, _, _, _, weapons, bosses, starters, campaign = HEADER.unpack_from(data)
+    reader = _Reader(data, HEADER.size)
+    weapon_damage = reader.array("i", weapons)
+    boss_health = reader.array("i", bosses)
+    boss_damage = reader.array("i", bosses)
+    boss_level = reader.array("i", bosses)
+    starter_ids = reader.array("I", starters)
+    campaign_ids = reader.array("I", campaign)
+    weapon_names = reader.names(weapons)
+    boss_names = reader.names(bosses)
+    descriptions = _Texts(reader.array("I", weapons + 1), reader.blob())
+    intros = _Texts(reader.array("I", bosses + 1), reader.blob())
+    # Lookups index with these, so a damaged cache must fail here instead
+    if (
+        any(i >= weapons for i in starter_ids)
+        or any(i >= bosses for i in campaign_ids)
+        or descriptions.offsets[-1] != len(descriptions.blob)
+        or intros.offsets[-1] != len(intros.blob)
+    ):
+        raise ValueError("Catalog cache is corrupt")
+    return Catalog(
+        weapon_names,
+        weapon_damage,
+        descriptions,
+        boss_names,
+        boss_health,
+        boss_damage,
+        boss_level,
+        intros,
+        starter_ids,
+        campaign_ids,
+    )
+
+
+def cache_path(
+    source: Union[str, Path], cache_dir: Optional[Union[str, Path]] = None
+) -> Path:
+    """
+    Return where the compiled form of ``source`` is cached.
+
+    Args:
+        source: Path of the content file
+        cache_dir: Cache directory (default ``$RPG_CACHE_DIR`` or
+            ``~/.cache/rpg_game``)
+
+    Returns:
+        Path: The cache file path
+    """
+    if cache_dir is None:
+        cache_dir = os.environ.get(CACHE_DIR_ENV) or Path.home() / ".cache" / "rpg_game"
+    source = Path(source).resolve()
+    key = hashlib.sha1(str(source).encode("utf-8")).hexdigest()[:16]
+    return Path(cache_dir) / f"{source.stem}-{key}.rpgcat"
+
+
+def load_catalog(
+    source: Union[str, Path] = DEFAULT_CONTENT,
+    cache_dir: Optional[Union[str, Path]] = None,
+    use_cache: bool = True,
+) -> Catalog:
+    """
+    Load a catalog, from its compiled cache when the source is unchanged.
+
+    The cache is trusted when the source's size and mtime match; otherwise
+    the source is hashed, and only a changed hash causes a recompile. A
+    cache that cannot be written is skipped silently.
+
+    Args:
+        source: Path of the JSON content file
+        cache_dir: Cache directory (see ``cache_path``)
+        use_cache: Set to False to always parse and compile the source
+
+    Returns:
+        Catalog: The catalog
+
+    Raises:
+        OSError: If the source cannot be read
+        ValueError: If the source is not valid content
+    """
+    stat = os.stat(source)
+    cached = cache_path(source, cache_dir) if use_cache else None
+    cached_data = None
+    if cached is not None:
+        try:
+            cached_data = cached.read_bytes()
+            size, mtime_ns, digest = read_header(cached_data)
+            if size == stat.st_size and mtime_ns == stat.st_mtime_ns:
+                return decode_catalog(cached_data)
+        except (OSError, ValueError):
+            cached_data = None
+
+    raw = Path(source).read_bytes()
+    source_hash = hashlib.sha256(raw).digest()
+    catalog = None
+    if cached_data is not None and digest == source_hash:
+        # Touched but not changed: reuse the compiled form
+        try:
+            catalog = decode_catalog(cached_data)
+        except ValueError:
+            pass
+    if catalog is None:
+        catalog = compile_catalog(json.loads(raw))
+    if cached is not None:
+        _write_cache(
+            cached, encode_catalog(catalog, stat.st_size, stat.st_mtime_ns, source_hash)
+        )
+    return catalog
+
+
+def _write_cache(path: Path, data: bytes) -> None:
+    """Write a cache file atomically, ignoring failures."""
+    temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary.write_bytes(data)
+        os.replace(temporary, path)
+    except OSError:
+        try:
+            temporary.unlink()
+        except OSError:
+            pass
+
+
+# Catalog used by Game when none is given
+_default: Optional[Catalog] = None
+
+
+def default_catalog() -> Catalog:
+    """
+    Return the shared catalog, loading it on first use.
+
+    It comes from ``$RPG_CATALOG`` if set (cached as by ``load_catalog``),
+    otherwise from the bundled content, which is small enough to parse
+    directly.
+    """
+    global _default
+    if _default is None:
+        custom = os.environ.get(CATALOG_ENV)
+        _default = load_catalog(custom) if custom else load_catalog(use_cache=False)
+    return _default
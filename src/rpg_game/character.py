@@ -5,8 +5,12 @@ This module defines the base Character class that represents playable
 and non-playable characters in the game.
 """
 
-from typing import Optional, Any
+import random
+from typing import List, Optional, Any
 from rpg_game.weapon import Weapon
+from rpg_game.damage import DEFAULT_RULES, CombatRules, DamageTable, player_table
+from rpg_game.effects import STUN
+from rpg_game.constants import PLAYER_SPEED
 
 
 class Character:
@@ -16,8 +20,22 @@ class Character:
     This is the base class for all character types in the game.
     """
     
+    # Rules attacks are rolled with (class default for views that skip __init__)
+    rules: CombatRules = DEFAULT_RULES
+    # Actions per round in the arena (see arena.Arena); set per instance to vary
+    speed: int = PLAYER_SPEED
+    # Damage table of the current attack value, replaced when it changes
+    _damage_table: Optional[DamageTable] = None
+    # Status effects (effects.StatusEffects) and this entity's slot there
+    effects: Optional[Any] = None
+    effect_slot: int = -1
+    # I/O port for messages (game_io.GameIO); None means the console
+    io: Optional[Any] = None
+    
     def __init__(self, name: str, health: int, damage: int, 
-                 weapon_name: Optional[str] = None, weapon_damage: int = 0) -> None:
+                 weapon_name: Optional[str] = None, weapon_damage: int = 0,
+                 rng: Optional[Any] = None, io: Optional[Any] = None,
+                 rules: Optional[CombatRules] = None) -> None:
         """
         Initialize a new character.
         
@@ -27,12 +45,21 @@ class Character:
             damage: The character's base damage
             weapon_name: Optional name of the character's weapon
             weapon_damage: Damage bonus from the weapon
+            rng: Optional random source (e.g. from ``rng.make_rng``); defaults
+                to the global ``random`` module
+            io: Optional ``game_io.GameIO`` for messages; defaults to the console
+            rules: Optional ``damage.CombatRules`` for damage rolls; defaults
+                to ``CombatConstants`` (``damage.FIXED_RULES`` disables them)
         """
         self.name = name
         self._health = health  # Private attribute (by convention)
         self.damage = damage
         # Create the weapon inside the Character constructor (strong composition)
         self.weapon = Weapon(weapon_name, weapon_damage) if weapon_name else None
+        self.rng = rng if rng is not None else random
+        self.io = io
+        if rules is not None:
+            self.rules = rules
     
     @property
     def health(self) -> int:
@@ -70,13 +97,50 @@ class Character:
         Args:
             amount: Amount of damage to take (negative values will be treated as 0)
         """
+        effects = self.effects
+        if effects is not None and effects.mask[self.effect_slot]:
+            amount = effects.damage_taken(self.effect_slot, amount)
         if amount > 0:
             self.health -= amount
     
+    @property
+    def attack_value(self) -> int:
+        """Base damage plus weapon bonus and status-effect buffs, before any roll."""
+        weapon = self.weapon
+        attack_value = self.damage + weapon.damage_bonus if weapon else self.damage
+        effects = self.effects
+        if effects is not None and effects.mask[self.effect_slot]:
+            attack_value = max(0, attack_value + effects.attack_bonus[self.effect_slot])
+        return attack_value
+    
+    def damage_table(self) -> DamageTable:
+        """
+        Return the table attacks are rolled from.
+        
+        The table is looked up again only when the attack value changes;
+        ``rules`` are expected to stay fixed after construction.
+        
+        Returns:
+            DamageTable: The cached table for the current attack value
+        """
+        table = self._damage_table
+        attack_value = self.attack_value
+        if table is None or table.base != attack_value:
+            table = self._damage_table = self._build_damage_table(attack_value)
+        return table
+    
+    def _build_damage_table(self, attack_value: int) -> DamageTable:
+        """Return the table for ``attack_value``."""
+        return player_table(attack_value, self.rules)
+    
     def attack(self, enemy: Any, logger: Optional[Any] = None) -> int:
         """
         Attack an enemy character.
 
+        The damage is rolled from ``damage_table()``: the enemy may dodge, the
+        damage varies around the attack value and may be a critical hit.
+        Stunned characters, and those poison has defeated, deal no damage.
+
         Args:
             enemy: The enemy character to attack
             logger: Optional logger for combat messages
@@ -84,10 +148,33 @@ class Character:
         Returns:
             int: The amount of damage dealt
         """
-        damage = self.damage
-        if self.weapon:
-            damage += self.weapon.damage_bonus
+        # damage_table() and DamageTable.sample, inlined: this runs every turn
+        table = self._damage_table
+        weapon = self.weapon
+        attack_value = self.damage + weapon.damage_bonus if weapon else self.damage
+        effects = self.effects
+        if effects is not None and effects.mask[self.effect_slot]:
+            slot = self.effect_slot
+            effects.settle(slot)
+            if effects.mask[slot] & STUN or self.health <= 0:
+                return 0
+            attack_value = max(0, attack_value + effects.attack_bonus[slot])
+        if table is None or table.base != attack_value:
+            table = self._damage_table = self._build_damage_table(attack_value)
+        size = table.size
+        if size == 1:
+            # Nothing to roll, e.g. under FIXED_RULES: skip the draw
+            damage, critical = table.outcomes[0]
+        else:
+            u = self.rng.random() * size
+            index = int(u)
+            damage, critical = (table.outcomes[index] if u < table.cutoff[index]
+                                else table.alias[index])
 
+        # Settle the enemy's poison so only this hit counts as damage dealt
+        effects = enemy.effects
+        if effects is not None and effects.mask[enemy.effect_slot]:
+            effects.settle(enemy.effect_slot)
         # Store initial health for damage calculation
         initial_health = enemy.health
         enemy.take_damage(damage)
@@ -97,15 +184,41 @@ class Character:
             logger.log_combat(attacker=self.name, 
                            defender=enemy.name, 
                            damage=actual_damage,
-                           is_critical=False)
+                           is_critical=critical)
 
         return actual_damage
     
-    def display(self) -> None:
-        """Display the character's information."""
+    def display_lines(self, health: Optional[int] = None) -> List[str]:
+        """
+        Return the lines shown by ``display``.
+        
+        Args:
+            health: Health to show instead of the current health (for animations)
+            
+        Returns:
+            List[str]: The name, health, damage and weapon lines
+        """
         weapon_name = self.weapon.name if self.weapon else 'No Weapon'
         weapon_damage = self.weapon.damage_bonus if self.weapon else 0
-        print(f"Name: {self.name}")
-        print(f"Health: {self.health}")
-        print(f"Damage: {self.damage}")
-        print(f"Weapon: {weapon_name} (+{weapon_damage} Damage)")
+        return [
+            f"Name: {self.name}",
+            f"Health: {self.health if health is None else health}",
+            f"Damage: {self.damage}",
+            f"Weapon: {weapon_name} (+{weapon_damage} Damage)",
+        ]
+    
+    def output(self) -> Any:
+        """Return the I/O port messages go to."""
+        if self.io is not None:
+            return self.io
+        # Imported here so entities load without asyncio and the renderer
+        from rpg_game.game_io import get_console_io
+        return get_console_io()
+    
+    def display(self) -> None:
+        """Display the character's information."""
+        io = self.output()
+        if io.quiet:
+            return
+        for line in self.display_lines():
+            io.print(line)
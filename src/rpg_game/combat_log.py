@@ -0,0 +1,383 @@
+"""
+Binary combat-log format for the RPG game.
+
+Combat records are stored as fixed-width 32-byte little-endian rows so that
+billions of events can be scanned without parsing text. Names are replaced
+by ids into a string table stored at the end of the file.
+
+File layout::
+
+    header        32 bytes  magic, version, record size, record count,
+                            string table offset
+    records       32 bytes each
+    string table  u32 count, then (u16 length, UTF-8 bytes) per name
+
+``BinaryLogSink`` writes this format from a ``BufferedLogWriter``.
+``CombatLogReader`` memory-maps a log for zero-copy random access and can
+expose the records as a NumPy structured array. ``replay_main`` implements
+``python -m rpg_game replay``, which rebuilds the health timeline of a fight.
+"""
+
+import argparse
+import mmap
+import os
+import struct
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from rpg_game.log_sinks import CRITICAL, FIGHT_START, LogRecord, LogSink
+
+MAGIC = b"RPGCLOG\0"
+VERSION = 1
+HEADER = struct.Struct("<8sIIQQ")
+RECORD = struct.Struct("<dIIIiB7x")
+_COUNT = struct.Struct("<I")
+_LENGTH = struct.Struct("<H")
+
+# NumPy dtype matching RECORD, for structured-array views
+RECORD_FIELDS = [
+    ("timestamp", "<f8"),
+    ("fight", "<u4"),
+    ("attacker", "<u4"),
+    ("defender", "<u4"),
+    ("damage", "<i4"),
+    ("flags", "u1"),
+    ("_pad", "V7"),
+]
+
+
+class BinaryRecord(NamedTuple):
+    """One decoded combat record. Names are string-table ids."""
+
+    timestamp: float
+    fight: int
+    attacker: int
+    defender: int
+    damage: int
+    flags: int
+
+    @property
+    def is_critical(self) -> bool:
+        """Whether the hit was critical."""
+        return bool(self.flags & CRITICAL)
+
+    @property
+    def is_fight_start(self) -> bool:
+        """Whether this record marks the start of a fight."""
+        return bool(self.flags & FIGHT_START)
+
+
+class TimelineEntry(NamedTuple):
+    """Health of every combatant after one event of a fight."""
+
+    timestamp: float
+    attacker: str
+    defender: str
+    damage: int
+    is_critical: bool
+    health: Dict[str, int]
+
+
+class BinaryLogSink(LogSink):
+    """
+    Writes combat records in the binary log format.
+
+    A new fight id is assigned whenever a run of ``FIGHT_START`` records
+    follows ordinary hits. The string table and final header are written
+    when the sink is closed.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Initialize the sink, truncating any existing file.
+
+        Args:
+            path: Path of the log file
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION, RECORD.size, 0, 0))
+        self._name_ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._count = 0
+        self._fight = 0
+        self._in_start = False
+
+    def _name_id(self, name: str) -> int:
+        """Return the string-table id of ``name``."""
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._name_ids[name] = len(self._names)
+            self._names.append(name)
+        return name_id
+
+    def write_batch(self, records: Sequence[LogRecord]) -> None:
+        """Pack and append a batch of records."""
+        size = RECORD.size
+        buffer = bytearray(size * len(records))
+        pack_into = RECORD.pack_into
+        name_id = self._name_id
+        for index, (timestamp, attacker, defender, damage, flags) in enumerate(records):
+            flags = int(flags)
+            starting = bool(flags & FIGHT_START)
+            if starting and not self._in_start and (self._count or index):
+                self._fight += 1
+            self._in_start = starting
+            pack_into(
+                buffer,
+                index * size,
+                timestamp,
+                self._fight,
+                name_id(attacker),
+                name_id(defender),
+                damage,
+                flags,
+            )
+        self._file.write(buffer)
+        self._count += len(records)
+
+    def flush(self) -> None:
+        """Flush written records to the file."""
+        self._file.flush()
+
+    def close(self) -> None:
+        """Write the string table and header, then close the file."""
+        if self._file.closed:
+            return
+        table_offset = self._file.tell()
+        parts = [_COUNT.pack(len(self._names))]
+        for name in self._names:
+            encoded = name.encode("utf-8")
+            parts.append(_LENGTH.pack(len(encoded)))
+            parts.append(encoded)
+        self._file.write(b"".join(parts))
+        self._file.seek(0)
+        self._file.write(
+            HEADER.pack(MAGIC, VERSION, RECORD.size, self._count, table_offset)
+        )
+        self._file.close()
+
+
+class CombatLogReader:
+    """
+    Memory-mapped reader for binary combat logs.
+
+    Records are decoded straight from the mapping on access. Logs whose
+    writer never closed (for example after a crash) can still be read: the
+    record count is inferred from the file size and names show as ``#id``.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Open and map a log file.
+
+        Args:
+            path: Path of the log file
+
+        Raises:
+            ValueError: If the file is not a binary combat log
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        if size < HEADER.size:
+            self._file.close()
+            raise ValueError(f"{path} is too short to be a combat log")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, record_size, count, table_offset = HEADER.unpack_from(self._map)
+        if magic != MAGIC or record_size != RECORD.size:
+            self.close()
+            raise ValueError(f"{path} is not a binary combat log")
+        if version > VERSION:
+            self.close()
+            raise ValueError(f"{path} uses unsupported log version {version}")
+        self.names: List[str] = []
+        self._count: int
+        if table_offset:
+            self._count = count
+            self._read_names(table_offset)
+        else:
+            self._count = (size - HEADER.size) // RECORD.size
+        self._fight_ranges: Optional[List[Tuple[int, int]]] = None
+
+    def _read_names(self, offset: int) -> None:
+        """Decode the string table at ``offset``."""
+        (count,) = _COUNT.unpack_from(self._map, offset)
+        offset += _COUNT.size
+        for _ in range(count):
+            (length,) = _LENGTH.unpack_from(self._map, offset)
+            offset += _LENGTH.size
+            self.names.append(self._map[offset : offset + length].decode("utf-8"))
+            offset += length
+
+    def __len__(self) -> int:
+        """Return the number of records."""
+        return self._count
+
+    def __getitem__(self, index: int) -> BinaryRecord:
+        """Decode the record at ``index`` (negative indices allowed)."""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("combat log record index out of range")
+        return BinaryRecord(
+            *RECORD.unpack_from(self._map, HEADER.size + index * RECORD.size)
+        )
+
+    def __iter__(self) -> Iterator[BinaryRecord]:
+        """Iterate over all records in order."""
+        end = HEADER.size + self._count * RECORD.size
+        for fields in RECORD.iter_unpack(memoryview(self._map)[HEADER.size : end]):
+            yield BinaryRecord(*fields)
+
+    def name(self, name_id: int) -> str:
+        """
+        Return the name for a string-table id.
+
+        Args:
+            name_id: The id stored in a record
+
+        Returns:
+            str: The name, or ``#<id>`` if the string table is missing
+        """
+        return self.names[name_id] if name_id < len(self.names) else f"#{name_id}"
+
+    def as_array(self) -> Any:
+        """
+        Return every record as a zero-copy NumPy structured array.
+
+        The array shares memory with the mapping; drop it before closing
+        the reader.
+
+        Returns:
+            numpy.ndarray: Array with the fields of RECORD_FIELDS
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        import numpy as np
+
+        return np.frombuffer(
+            self._map,
+            dtype=np.dtype(RECORD_FIELDS),
+            count=self._count,
+            offset=HEADER.size,
+        )
+
+    def fight_ranges(self) -> List[Tuple[int, int]]:
+        """
+        Return the ``[start, end)`` record range of every fight.
+
+        Returns:
+            List[Tuple[int, int]]: One range per fight id, in order
+        """
+        if self._fight_ranges is None:
+            try:
+                import numpy as np
+            except ImportError:
+                np = None  # type: ignore[assignment]
+            if np is not None and self._count:
+                fights = self.as_array()["fight"]
+                starts = np.flatnonzero(np.diff(fights)) + 1
+                bounds = [0] + starts.tolist() + [self._count]
+                del fights
+            else:
+                bounds = [0]
+                previous = None
+                for index, record in enumerate(self):
+                    if previous is not None and record.fight != previous:
+                        bounds.append(index)
+                    previous = record.fight
+                bounds.append(self._count)
+            self._fight_ranges = [
+                (bounds[i], bounds[i + 1])
+                for i in range(len(bounds) - 1)
+                if bounds[i] < bounds[i + 1]
+            ]
+        return self._fight_ranges
+
+    def timeline(self, fight: int) -> List[TimelineEntry]:
+        """
+        Rebuild the health of each combatant after every hit of a fight.
+
+        Args:
+            fight: Index into ``fight_ranges()``
+
+        Returns:
+            List[TimelineEntry]: One entry per hit, in order
+        """
+        start, end = self.fight_ranges()[fight]
+        health: Dict[str, int] = {}
+        entries = []
+        for index in range(start, end):
+            record = self[index]
+            attacker = self.name(record.attacker)
+            defender = self.name(record.defender)
+            if record.is_fight_start:
+                health[attacker] = record.damage
+                continue
+            health[defender] = max(0, health.get(defender, 0) - record.damage)
+            entries.append(
+                TimelineEntry(
+                    record.timestamp,
+                    attacker,
+                    defender,
+                    record.damage,
+                    record.is_critical,
+                    dict(health),
+                )
+            )
+        return entries
+
+    def close(self) -> None:
+        """Unmap and close the file."""
+        if not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "CombatLogReader":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def replay_main(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Command-line entry point for ``python -m rpg_game replay``.
+
+    Args:
+        argv: Command-line arguments (defaults to ``sys.argv[1:]``)
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m rpg_game replay",
+        description="Replay the health timeline of a fight from a binary combat log.",
+    )
+    parser.add_argument("log", help="path to a binary combat log")
+    parser.add_argument(
+        "--fight",
+        type=int,
+        default=None,
+        help="fight index to replay (default: list fights)",
+    )
+    args = parser.parse_args(argv)
+
+    with CombatLogReader(args.log) as reader:
+        if args.fight is None:
+            print(f"{len(reader)} records, {len(reader.fight_ranges())} fights")
+            for index, (start, end) in enumerate(reader.fight_ranges()):
+                first = reader[start]
+                print(
+                    f"  fight {index}: {reader.name(first.attacker)} vs "
+                    f"{reader.name(first.defender)} ({end - start} records)"
+                )
+            return
+        for turn, entry in enumerate(reader.timeline(args.fight), 1):
+            crit = " CRITICAL" if entry.is_critical else ""
+            status = "  ".join(f"{name}: {hp}" for name, hp in entry.health.items())
+            print(
+                f"{turn:>4}  {entry.attacker} -> {entry.defender} "
+                f"{entry.damage}{crit}  | {status}"
+            )
@@ -0,0 +1,159 @@
+"""
+Streaming compression for save files and combat logs.
+
+Files are written through ``gzip`` (zlib/DEFLATE) or ``lzma`` (xz) streams,
+so data is compressed as it is written instead of being built up in memory.
+Readers detect the codec from the file's magic bytes and decompress
+incrementally.
+
+Codecs are named ``"none"``, ``"zlib"`` and ``"lzma"``. Levels run from
+0 (fastest) to 9 (smallest) for both compressing codecs.
+"""
+
+import gzip
+import io
+import lzma
+from typing import IO, Any, Iterator, Optional, Union, cast
+
+NONE = "none"
+ZLIB = "zlib"
+LZMA = "lzma"
+CODECS = (NONE, ZLIB, LZMA)
+
+DEFAULT_LEVEL = 6
+
+# Leading bytes of each compressed container
+_MAGIC = {
+    ZLIB: b"\x1f\x8b",
+    LZMA: b"\xfd7zXZ\x00",
+}
+
+# Size of the chunks read by iter_chunks
+CHUNK_SIZE = 64 * 1024
+
+
+def check_codec(codec: Optional[str], level: Optional[int] = None) -> str:
+    """
+    Validate a codec name and level.
+
+    Args:
+        codec: Codec name, or None for no compression
+        level: Compression level, or None for the default
+
+    Returns:
+        str: The codec name
+
+    Raises:
+        ValueError: If the codec or level is not supported
+    """
+    codec = codec or NONE
+    if codec not in CODECS:
+        raise ValueError(f"Unknown compression {codec!r}; expected one of {CODECS}")
+    if level is not None and not 0 <= level <= 9:
+        raise ValueError(f"Compression level must be between 0 and 9, got {level}")
+    return codec
+
+
+def detect_codec(path: str) -> str:
+    """
+    Return the codec a file was written with, judged by its magic bytes.
+
+    Args:
+        path: Path of the file
+
+    Returns:
+        str: ``"zlib"``, ``"lzma"`` or ``"none"``
+    """
+    with open(path, "rb") as f:
+        head = f.read(6)
+    for codec, magic in _MAGIC.items():
+        if head.startswith(magic):
+            return codec
+    return NONE
+
+
+def open_compressed(
+    path: Union[str, IO[bytes]],
+    mode: str = "rb",
+    codec: Optional[str] = None,
+    level: Optional[int] = None,
+    encoding: str = "utf-8",
+) -> IO[Any]:
+    """
+    Open a file through a streaming compressor or decompressor.
+
+    Args:
+        path: Path of the file, or for ``"zlib"`` and ``"lzma"`` an open
+            binary file to wrap (closing the result leaves it open)
+        mode: ``"r"``, ``"w"`` or ``"a"``, optionally with ``"b"`` or ``"t"``
+        codec: Codec for writing; when reading, None detects the codec
+        level: Compression level (0-9) for writing
+        encoding: Text encoding for text modes
+
+    Returns:
+        A file object; text modes return a text wrapper
+
+    Raises:
+        ValueError: If ``path`` is an open file and the codec is ``"none"`` or
+            left to detection
+    """
+    if codec is None and mode.startswith("r"):
+        if not isinstance(path, str):
+            raise ValueError("Reading an open file needs an explicit codec")
+        codec = detect_codec(path)
+    codec = check_codec(codec, level)
+    level = DEFAULT_LEVEL if level is None else level
+    binary_mode = mode.replace("t", "").replace("b", "") + "b"
+
+    raw: IO[bytes]
+    if codec == ZLIB:
+        filename, fileobj = (path, None) if isinstance(path, str) else (None, path)
+        # GzipFile is a binary file object, though typeshed does not say so
+        raw = cast(IO[bytes], gzip.GzipFile(filename, binary_mode, level, fileobj))
+    elif codec == LZMA:
+        raw = lzma.LZMAFile(
+            path, binary_mode, preset=level if not mode.startswith("r") else None
+        )
+    elif isinstance(path, str):
+        raw = open(path, binary_mode)
+    else:
+        raise ValueError("Uncompressed files must be opened by path")
+
+    if "b" in mode:
+        return raw
+    return io.TextIOWrapper(raw, encoding=encoding)
+
+
+def iter_chunks(path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Yield the decompressed contents of a file in chunks.
+
+    Args:
+        path: Path of a plain or compressed file
+        chunk_size: Maximum number of bytes per chunk
+
+    Yields:
+        bytes: Decompressed data
+    """
+    with open_compressed(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def iter_lines(path: str, encoding: str = "utf-8") -> Iterator[str]:
+    """
+    Yield the lines of a plain or compressed text file, decompressing as it goes.
+
+    Args:
+        path: Path of the file
+        encoding: Text encoding
+
+    Yields:
+        str: Each line, without its trailing newline
+    """
+    with open_compressed(path, "rt", encoding=encoding) as f:
+        for line in f:
+            yield line.rstrip("\n")
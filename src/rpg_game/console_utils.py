@@ -5,10 +5,11 @@ This module provides simple but effective console utilities with colors
 and better user feedback.
 """
 
-import os
 import sys
 from typing import List, Any
 
+from rpg_game.renderer import get_renderer
+
 # Simple ANSI color codes
 class Colors:
     HEADER = '\033[95m'
@@ -22,8 +23,8 @@ class Colors:
     END = '\033[0m'
 
 def clear_screen() -> None:
-    """Clear the console screen with a simple animation."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    """Clear the console screen with ANSI escapes (no shell is spawned)."""
+    get_renderer().clear()
     print(f"{Colors.BLUE}{'=' * 60}{Colors.END}\n")
 
 def press_enter(prompt: str = "Press Enter to continue...") -> None:
@@ -17,43 +17,15 @@ PLAYER_INITIAL_HEALTH: Final[int] = 110
 PLAYER_INITIAL_DAMAGE: Final[int] = 10
 PLAYER_STARTING_WEAPON: Final[str] = "Rock"
 
-# Boss constants
-class BossConfig:
-    GOBLIN_KING = {
-        "name": "Goblin King",
-        "health": 50,
-        "damage": 8,
-        "special_attack_chance": 0.3,
-        "special_attack_multiplier": 1.5,
-    }
-    
-    DARK_SORCERER = {
-        "name": "Dark Sorcerer",
-        "health": 60,
-        "damage": 9,
-        "special_attack_chance": 0.4,
-        "special_attack_multiplier": 1.7,
-    }
+# Arena initiative: an entity with speed s acts s times per round
+PLAYER_SPEED: Final[int] = 10
+BOSS_SPEED: Final[int] = 8
 
-# Weapon constants
-class WeaponConfig:
-    ROCK = {
-        "name": "Rock",
-        "damage": 2,
-        "description": "A simple rock. Basic but reliable.",
-    }
-    
-    PAPER = {
-        "name": "Paper",
-        "damage": 3,
-        "description": "A sheet of paper. Surprisingly effective.",
-    }
-    
-    SCISSORS = {
-        "name": "Scissors",
-        "damage": 4,
-        "description": "Sharp scissors. Handle with care!",
-    }
+# Boss combat constants
+BOSS_WEAPON_NAME: Final[str] = "Boss Weapon"
+BOSS_WEAPON_DAMAGE: Final[int] = 5
+BOSS_SPECIAL_ATTACK_CHANCE: Final[float] = 0.25
+BOSS_SPECIAL_ATTACK_MULTIPLIER: Final[float] = 1.5
 
 # Game messages
 class Messages:
@@ -0,0 +1,280 @@
+"""
+Damage-roll tables for the RPG game.
+
+An attack's damage depends only on the attacker's attack value (base damage
+plus weapon bonus) and on ``constants.CombatConstants``: the defender may
+dodge, the damage varies uniformly between the minimum and maximum
+multipliers (rounded to whole points), and a critical hit multiplies it.
+Bosses also roll for their special attack first.
+
+Instead of rolling each of those per attack, ``DamageTable`` holds the exact
+discrete distribution of the outcome together with a Walker/Vose alias
+table, so an attack takes a single uniform draw and O(1) work however many
+outcomes there are. Tables are cached per attack value and kind of
+attacker; ``Character`` keeps a reference to its table and only asks for
+another one when its attack value changes. The same tables drive
+``sim``, ``batch_sim`` (through ``DamageTable.arrays``) and ``solver``.
+"""
+
+import math
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+from rpg_game.constants import (
+    BOSS_SPECIAL_ATTACK_CHANCE,
+    BOSS_SPECIAL_ATTACK_MULTIPLIER,
+    CombatConstants,
+)
+
+
+class CombatRules(NamedTuple):
+    """Chances and multipliers that turn an attack value into damage."""
+
+    critical_chance: float = CombatConstants.CRITICAL_HIT_CHANCE
+    critical_multiplier: float = CombatConstants.CRITICAL_HIT_MULTIPLIER
+    dodge_chance: float = CombatConstants.DODGE_CHANCE
+    min_multiplier: float = CombatConstants.MIN_DAMAGE_MULTIPLIER
+    max_multiplier: float = CombatConstants.MAX_DAMAGE_MULTIPLIER
+
+
+# Rules used by the game and the simulators
+DEFAULT_RULES = CombatRules()
+
+# Rules without any randomness: every attack deals exactly its attack value
+FIXED_RULES = CombatRules(0.0, 1.0, 0.0, 1.0, 1.0)
+
+# An attack outcome: (damage, whether it was a critical or special hit)
+Outcome = Tuple[int, bool]
+
+
+class DamageTable:
+    """
+    Discrete damage distribution of one attack value, with O(1) sampling.
+
+    Attributes:
+        base: The attack value the table was built for
+        outcomes: Distinct ``(damage, critical)`` outcomes
+        probabilities: Probability of each outcome
+        size: Number of outcomes
+        threshold: Alias-table acceptance threshold of each slot
+        cutoff: Slot index plus threshold, so ``u < cutoff[int(u)]`` accepts
+        alias: Outcome drawn when a slot's threshold is not met
+        damages: Damage of each slot's own outcome
+        alias_damages: Damage of each slot's alias
+    """
+
+    __slots__ = (
+        "base",
+        "outcomes",
+        "probabilities",
+        "size",
+        "threshold",
+        "cutoff",
+        "alias",
+        "damages",
+        "alias_damages",
+    )
+
+    def __init__(self, base: int, distribution: Dict[Outcome, float]) -> None:
+        """
+        Initialize a table and build its alias table.
+
+        Args:
+            base: The attack value
+            distribution: Probability of each ``(damage, critical)`` outcome
+        """
+        self.base = base
+        items = sorted((outcome, p) for outcome, p in distribution.items() if p > 0)
+        self.outcomes: List[Outcome] = [outcome for outcome, _ in items]
+        total = sum(p for _, p in items)
+        self.probabilities = [p / total for _, p in items]
+        self.size = len(items)
+        self.threshold, alias = _alias_table(self.probabilities)
+        self.cutoff = [
+            index + threshold for index, threshold in enumerate(self.threshold)
+        ]
+        # Aliases point straight at outcomes so sampling is a single lookup
+        self.alias = [self.outcomes[index] for index in alias]
+        self.damages = [damage for damage, _ in self.outcomes]
+        self.alias_damages = [damage for damage, _ in self.alias]
+
+    def sample(self, rng_random: Any) -> Outcome:
+        """
+        Draw one outcome; tables with a single outcome return it without drawing.
+
+        Args:
+            rng_random: Function returning uniform floats in [0, 1)
+
+        Returns:
+            Outcome: The damage and whether the hit was critical
+        """
+        if self.size == 1:
+            return self.outcomes[0]
+        u = rng_random() * self.size
+        index = int(u)
+        if u < self.cutoff[index]:
+            return self.outcomes[index]
+        return self.alias[index]
+
+    def distribution(self) -> Dict[int, float]:
+        """Return the probability of each damage value."""
+        result: Dict[int, float] = {}
+        for (damage, _), p in zip(self.outcomes, self.probabilities):
+            result[damage] = result.get(damage, 0.0) + p
+        return result
+
+    @property
+    def mean(self) -> float:
+        """Expected damage."""
+        return sum(
+            damage * p for (damage, _), p in zip(self.outcomes, self.probabilities)
+        )
+
+    @property
+    def max_damage(self) -> int:
+        """Largest damage the attack can deal."""
+        return max(damage for damage, _ in self.outcomes)
+
+    def arrays(self) -> Tuple[List[float], List[int], List[int]]:
+        """
+        Return the alias table as plain columns, e.g. for vectorized sampling.
+
+        Draw ``u`` uniform in [0, size), take ``i = floor(u)`` and use
+        ``damages[i]`` if ``u - i < threshold[i]``, else ``alias_damages[i]``.
+        The lists are shared with the table and must not be modified.
+
+        Returns:
+            Tuple: ``(threshold, damages, alias_damages)``
+        """
+        return self.threshold, self.damages, self.alias_damages
+
+
+def _alias_table(probabilities: List[float]) -> Tuple[List[float], List[int]]:
+    """Build Vose's alias table for ``probabilities`` (which sum to 1)."""
+    size = len(probabilities)
+    scaled = [p * size for p in probabilities]
+    threshold = [1.0] * size
+    alias = list(range(size))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        low = small.pop()
+        high = large.pop()
+        threshold[low] = scaled[low]
+        alias[low] = high
+        scaled[high] -= 1.0 - scaled[low]
+        (small if scaled[high] < 1.0 else large).append(high)
+    # Whatever is left is 1 up to rounding error
+    return threshold, alias
+
+
+def _variance(base: int, rules: CombatRules) -> Dict[int, float]:
+    """
+    Return the distribution of ``base`` times a uniform multiplier, rounded.
+
+    The probability of each whole value is the share of the multiplier range
+    that rounds to it.
+    """
+    low = base * rules.min_multiplier
+    high = base * rules.max_multiplier
+    if low > high:
+        low, high = high, low
+    if high - low < 1e-12:
+        return {int(math.floor(low + 0.5)): 1.0}
+    result = {}
+    for value in range(int(math.floor(low + 0.5)), int(math.floor(high + 0.5)) + 1):
+        overlap = min(high, value + 0.5) - max(low, value - 0.5)
+        if overlap > 0:
+            result[value] = overlap / (high - low)
+    return result
+
+
+def build_table(
+    base: int,
+    special_chance: float = 0.0,
+    special_multiplier: float = 1.0,
+    rules: CombatRules = DEFAULT_RULES,
+) -> DamageTable:
+    """
+    Build the damage table of an attack.
+
+    The attack is dodged with ``rules.dodge_chance`` (0 damage). Otherwise a
+    special attack (``int(base * special_multiplier)``) happens with
+    ``special_chance``, the result is scaled by a uniform multiplier and
+    rounded, and a critical hit multiplies that with ``rules.critical_chance``.
+
+    Args:
+        base: The attack value (base damage plus weapon bonus)
+        special_chance: Chance of a special attack
+        special_multiplier: Damage multiplier of a special attack
+        rules: Chances and multipliers of the other mechanics
+
+    Returns:
+        DamageTable: The attack's outcome distribution
+    """
+    distribution: Dict[Outcome, float] = {}
+
+    def add(outcome: Outcome, p: float) -> None:
+        if p > 0:
+            distribution[outcome] = distribution.get(outcome, 0.0) + p
+
+    add((0, False), rules.dodge_chance)
+    hit = 1.0 - rules.dodge_chance
+    for special, p_special in ((True, special_chance), (False, 1.0 - special_chance)):
+        if p_special <= 0:
+            continue
+        damage = int(base * special_multiplier) if special else base
+        for value, p_value in _variance(damage, rules).items():
+            p = hit * p_special * p_value
+            add(
+                (int(value * rules.critical_multiplier), True),
+                p * rules.critical_chance,
+            )
+            add((value, special), p * (1.0 - rules.critical_chance))
+    return DamageTable(base, distribution)
+
+
+_TABLES: Dict[Tuple[int, float, float, CombatRules], DamageTable] = {}
+
+
+def damage_table(
+    base: int,
+    special_chance: float = 0.0,
+    special_multiplier: float = 1.0,
+    rules: CombatRules = DEFAULT_RULES,
+) -> DamageTable:
+    """
+    Return the cached table for an attack, building it on first use.
+
+    Args:
+        base: The attack value (base damage plus weapon bonus)
+        special_chance: Chance of a special attack
+        special_multiplier: Damage multiplier of a special attack
+        rules: Chances and multipliers of the other mechanics
+
+    Returns:
+        DamageTable: The shared table
+    """
+    key = (base, special_chance, special_multiplier, rules)
+    table = _TABLES.get(key)
+    if table is None:
+        table = _TABLES[key] = build_table(
+            base, special_chance, special_multiplier, rules
+        )
+    return table
+
+
+def player_table(base: int, rules: CombatRules = DEFAULT_RULES) -> DamageTable:
+    """Return the table of a character's attack with attack value ``base``."""
+    return damage_table(base, rules=rules)
+
+
+def boss_table(base: int, rules: CombatRules = DEFAULT_RULES) -> DamageTable:
+    """Return the table of a boss's attack, special attack included."""
+    return damage_table(
+        base, BOSS_SPECIAL_ATTACK_CHANCE, BOSS_SPECIAL_ATTACK_MULTIPLIER, rules
+    )
+
+
+def clear_cache() -> None:
+    """Forget every cached table."""
+    _TABLES.clear()
@@ -0,0 +1,405 @@
+"""
+Status effects for the RPG game: poison, stuns and temporary buffs.
+
+``StatusEffects`` tracks the active effects of any number of entities
+without visiting them every turn:
+
+- Each entity has a slot with an active-effect bitmask and running totals
+  (poison per tick, attack bonus, armor) in parallel arrays. Applying or
+  expiring an effect updates them in O(1), so ``Character.attack`` and
+  ``take_damage`` read effective stats with a couple of array lookups.
+- Expiries live in a hierarchical ``TimingWheel``. Advancing the clock only
+  touches slots that hold due or cascading entries, so each effect costs
+  amortized O(1) however many ticks pass or how many effects are active.
+- Poison is not applied tick by tick. Its damage accrues at the slot's
+  poison rate and is settled when the entity acts or is hit, and when the
+  rate changes.
+
+Ticks are whatever unit the caller advances the clock in; ``arena.Arena``
+uses one player turn.
+"""
+
+from array import array
+from typing import Any, Dict, List, Tuple
+
+# Effect kinds; each is one bit of an entity's active-effect mask
+POISON = 1
+STUN = 2
+ATTACK_UP = 4
+ARMOR_UP = 8
+
+KIND_NAMES: Dict[int, str] = {
+    POISON: "poison",
+    STUN: "stun",
+    ATTACK_UP: "attack_up",
+    ARMOR_UP: "armor_up",
+}
+
+
+class TimingWheel:
+    """
+    Hierarchical timing wheel of items due at integer ticks.
+
+    Level ``k`` has ``SLOTS`` slots of ``SLOTS ** k`` ticks each. An item is
+    stored on the lowest level whose span covers the distance to its due
+    tick and moves down a level each time the clock enters its slot, so it
+    is handled at most ``LEVELS`` times. Items further away than the top
+    level wait in an overflow list. A bitmask per level marks its occupied
+    slots, so empty stretches of time are skipped without visiting them.
+
+    Attributes:
+        now: The current tick
+    """
+
+    BITS = 6
+    SLOTS = 1 << BITS
+    LEVELS = 4
+
+    def __init__(self, now: int = 0) -> None:
+        """
+        Initialize an empty wheel.
+
+        Args:
+            now: The starting tick
+        """
+        self.now = now
+        self._slots: List[List[List[Tuple[int, Any]]]] = [
+            [[] for _ in range(self.SLOTS)] for _ in range(self.LEVELS)
+        ]
+        self._occupied = [0] * self.LEVELS
+        self._overflow: List[Tuple[int, Any]] = []
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return the number of scheduled items."""
+        return self._count
+
+    def schedule(self, when: int, item: Any) -> None:
+        """
+        Schedule ``item`` to be due at tick ``when``.
+
+        Args:
+            when: The due tick
+            item: Anything; returned by ``advance``
+
+        Raises:
+            ValueError: If ``when`` is not after the current tick
+        """
+        if when <= self.now:
+            raise ValueError(f"Tick {when} is not after the current tick {self.now}")
+        self._place(when, item)
+        self._count += 1
+
+    def _place(self, when: int, item: Any) -> None:
+        # The highest bit where ``when`` and ``now`` differ picks the level
+        distance = when ^ self.now
+        level = 0 if distance < self.SLOTS else (distance.bit_length() - 1) // self.BITS
+        if level >= self.LEVELS:
+            self._overflow.append((when, item))
+            return
+        index = (when >> (self.BITS * level)) & (self.SLOTS - 1)
+        self._slots[level][index].append((when, item))
+        self._occupied[level] |= 1 << index
+
+    def _refill(self, to: int) -> bool:
+        """Move overflow items into the empty wheel if the first is due by ``to``."""
+        first = min(when for when, _ in self._overflow)
+        if first > to:
+            return False
+        self._move_to(first)
+        return True
+
+    def _move_to(self, tick: int) -> None:
+        """
+        Set the clock, keeping overflow items outside its top-level span.
+
+        Levels only hold items in the clock's top-level span, so when the
+        clock enters a new span the overflow items in it move onto the levels.
+        """
+        top = self.BITS * self.LEVELS
+        entered = (tick ^ self.now) >> top
+        self.now = tick
+        if entered and self._overflow:
+            waiting = self._overflow
+            self._overflow = []
+            for when, item in waiting:
+                self._place(when, item)
+
+    def advance(self, to: int) -> List[Tuple[int, Any]]:
+        """
+        Move the clock to tick ``to`` and return the items that came due.
+
+        Args:
+            to: The new current tick
+
+        Returns:
+            List[Tuple[int, Any]]: ``(due tick, item)`` pairs in due order,
+            items due at the same tick in the order they were scheduled
+
+        Raises:
+            ValueError: If ``to`` is before the current tick
+        """
+        if to < self.now:
+            raise ValueError(f"Cannot go back from tick {self.now} to {to}")
+        due: List[Tuple[int, Any]] = []
+        slots = self._slots
+        occupied = self._occupied
+        while True:
+            # Lower levels always come due first
+            for level in range(self.LEVELS):
+                if occupied[level]:
+                    break
+            else:
+                if self._overflow and self._refill(to):
+                    continue
+                break
+            mask = occupied[level]
+            index = (mask & -mask).bit_length() - 1
+            shift = self.BITS * level
+            start = (self.now >> (shift + self.BITS) << (shift + self.BITS)) | (
+                index << shift
+            )
+            if start > to:
+                break
+            self.now = start
+            entries = slots[level][index]
+            slots[level][index] = []
+            occupied[level] &= ~(1 << index)
+            if level == 0:
+                due.extend(entries)
+                self._count -= len(entries)
+            else:
+                for when, item in entries:
+                    self._place(when, item)
+        self._move_to(to)
+        return due
+
+
+class StatusEffects:
+    """
+    Active status effects of many entities.
+
+    Entities join on their first effect: ``apply`` sets their ``effects``
+    to this tracker and their ``effect_slot`` to their index in the arrays.
+
+    Attributes:
+        mask: Per slot, the kinds of the active effects
+        poison: Per slot, poison damage per tick
+        attack_bonus: Per slot, attack value added by buffs
+        armor: Per slot, damage absorbed from every hit
+    """
+
+    def __init__(self, now: int = 0) -> None:
+        """
+        Initialize a tracker without entities.
+
+        Args:
+            now: The starting tick
+        """
+        self.wheel = TimingWheel(now)
+        self._entities: List[Any] = []
+        self.mask = array("B")
+        self.poison = array("q")
+        self.attack_bonus = array("q")
+        self.armor = array("q")
+        # Active effects per slot and kind, at slot * len(KIND_NAMES) + kind index
+        self._stacks = array("q")
+        # Tick up to which each slot's poison has been applied
+        self._settled = array("q")
+        # Per effect id; ids of ended effects are reused
+        self._effect_slot = array("q")
+        self._effect_kind = array("B")
+        self._effect_value = array("q")
+        self._effect_expires = array("q")
+        self._free: List[int] = []
+        self._active = 0
+
+    @property
+    def now(self) -> int:
+        """The current tick."""
+        return self.wheel.now
+
+    def __len__(self) -> int:
+        """Return the number of active effects."""
+        return self._active
+
+    def register(self, entity: Any) -> int:
+        """
+        Give an entity a slot, if it has none yet.
+
+        Args:
+            entity: A ``Character`` or ``Boss``
+
+        Returns:
+            int: The entity's slot
+
+        Raises:
+            ValueError: If another tracker already holds the entity
+        """
+        if entity.effects is self:
+            slot: int = entity.effect_slot
+            return slot
+        if entity.effects is not None:
+            raise ValueError(f"{entity.name} already has status effects elsewhere")
+        slot = len(self._entities)
+        self._entities.append(entity)
+        self.mask.append(0)
+        self.poison.append(0)
+        self.attack_bonus.append(0)
+        self.armor.append(0)
+        self._stacks.extend([0] * len(KIND_NAMES))
+        self._settled.append(self.now)
+        entity.effects = self
+        entity.effect_slot = slot
+        return slot
+
+    def apply(self, entity: Any, kind: int, duration: int, value: int = 0) -> int:
+        """
+        Give an entity an effect for ``duration`` ticks.
+
+        Effects stack: poison rates, attack bonuses and armor add up, and a
+        stun lasts until the last one ends. Negative values weaken instead.
+
+        Args:
+            entity: A ``Character`` or ``Boss``
+            kind: ``POISON``, ``STUN``, ``ATTACK_UP`` or ``ARMOR_UP``
+            duration: Number of ticks the effect lasts
+            value: Poison damage per tick, attack bonus or armor
+
+        Returns:
+            int: The effect's id, for ``remove``
+
+        Raises:
+            ValueError: If the kind is unknown or the duration is not positive
+        """
+        if kind not in KIND_NAMES:
+            raise ValueError(f"Unknown effect kind: {kind}")
+        if duration < 1:
+            raise ValueError(f"Duration must be positive, got {duration}")
+        slot = entity.effect_slot if entity.effects is self else self.register(entity)
+        expires = self.now + duration
+        if self._free:
+            effect = self._free.pop()
+            self._effect_slot[effect] = slot
+            self._effect_kind[effect] = kind
+            self._effect_value[effect] = value
+            self._effect_expires[effect] = expires
+        else:
+            effect = len(self._effect_slot)
+            self._effect_slot.append(slot)
+            self._effect_kind.append(kind)
+            self._effect_value.append(value)
+            self._effect_expires.append(expires)
+        self._change(slot, kind, value, 1)
+        self.wheel.schedule(expires, effect)
+        self._active += 1
+        return effect
+
+    def remove(self, effect: int) -> bool:
+        """
+        End an effect before it expires.
+
+        Args:
+            effect: An id returned by ``apply``
+
+        Returns:
+            bool: Whether the effect was still active
+        """
+        if (
+            not 0 <= effect < len(self._effect_expires)
+            or self._effect_expires[effect] < 0
+        ):
+            return False
+        # Its wheel entry stays behind and is ignored when it comes due
+        self._end(effect, self.now)
+        return True
+
+    def _end(self, effect: int, tick: int) -> None:
+        self._change(
+            self._effect_slot[effect],
+            self._effect_kind[effect],
+            self._effect_value[effect],
+            -1,
+            tick,
+        )
+        self._effect_expires[effect] = -1
+        self._free.append(effect)
+        self._active -= 1
+
+    def _change(
+        self, slot: int, kind: int, value: int, sign: int, tick: int = -1
+    ) -> None:
+        """Add (``sign`` 1) or take away (-1) one effect of a slot's totals."""
+        if kind == POISON:
+            # Damage so far accrued at the old rate
+            self._settle(slot, self.now if tick < 0 else tick)
+            self.poison[slot] += sign * value
+        elif kind == ATTACK_UP:
+            self.attack_bonus[slot] += sign * value
+        elif kind == ARMOR_UP:
+            self.armor[slot] += sign * value
+        index = slot * len(KIND_NAMES) + kind.bit_length() - 1
+        stacks = self._stacks[index] + sign
+        self._stacks[index] = stacks
+        if stacks:
+            self.mask[slot] |= kind
+        else:
+            self.mask[slot] &= ~kind
+
+    def advance(self, to: int) -> None:
+        """
+        Move the clock to tick ``to``, ending the effects that expire.
+
+        Args:
+            to: The new current tick
+
+        Raises:
+            ValueError: If ``to`` is before the current tick
+        """
+        expires = self._effect_expires
+        for tick, effect in self.wheel.advance(to):
+            # Removed effects (and ids reused since) no longer match
+            if expires[effect] == tick:
+                self._end(effect, tick)
+
+    def _settle(self, slot: int, tick: int) -> None:
+        rate = self.poison[slot]
+        if rate:
+            damage = rate * (tick - self._settled[slot])
+            if damage:
+                entity = self._entities[slot]
+                entity.health = entity.health - damage
+        self._settled[slot] = tick
+
+    def settle(self, slot: int) -> None:
+        """
+        Apply the poison damage a slot accrued since it was last settled.
+
+        Args:
+            slot: The entity's ``effect_slot``
+        """
+        self._settle(slot, self.wheel.now)
+
+    def damage_taken(self, slot: int, amount: int) -> int:
+        """
+        Settle a slot's poison and return the damage a hit of ``amount`` deals.
+
+        Args:
+            slot: The entity's ``effect_slot``
+            amount: Damage of the hit
+
+        Returns:
+            int: The damage left after armor (never below 0 for a hit)
+        """
+        self._settle(slot, self.wheel.now)
+        armor = self.armor[slot]
+        if armor and amount > 0:
+            return max(0, amount - armor)
+        return amount
+
+    def active(self, entity: Any) -> int:
+        """Return the mask of an entity's active effect kinds (0 if it has none)."""
+        if entity.effects is not self:
+            return 0
+        mask: int = self.mask[entity.effect_slot]
+        return mask
@@ -0,0 +1,332 @@
+"""
+Compact array-backed storage for large numbers of game entities.
+
+``Character`` and ``Boss`` objects each carry an instance dictionary and a
+``Weapon`` of their own, which is fine for a single campaign but dominates
+memory when simulating millions of combatants. ``EntityTable`` stores the
+same stats as typed columns (struct of arrays) and shares one ``Weapon`` per
+distinct weapon. Rows can be wrapped in ``CharacterRow`` or ``BossRow``
+views, which behave like the regular classes but read and write the table.
+"""
+
+import random
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+from rpg_game.boss import Boss
+from rpg_game.character import Character
+from rpg_game.constants import BOSS_WEAPON_DAMAGE, BOSS_WEAPON_NAME
+from rpg_game.damage import DEFAULT_RULES, CombatRules
+from rpg_game.weapon import Weapon
+
+# Values of the ``kind`` column
+KIND_CHARACTER = 0
+KIND_BOSS = 1
+
+# Weapon id used for entities without a weapon
+NO_WEAPON = -1
+
+
+class EntityTable:
+    """
+    Struct-of-arrays table of entity stats.
+
+    Each entity is a row index into parallel typed columns. Names and weapons
+    are interned, so rows only store small integer ids.
+    """
+
+    __slots__ = (
+        "name_id",
+        "health",
+        "damage",
+        "weapon_id",
+        "kind",
+        "names",
+        "weapons",
+        "_name_ids",
+        "_weapon_ids",
+        "rng",
+        "rules",
+    )
+
+    def __init__(
+        self, rng: Optional[Any] = None, rules: CombatRules = DEFAULT_RULES
+    ) -> None:
+        """
+        Initialize an empty table.
+
+        Args:
+            rng: Optional random source used by views; defaults to the
+                global ``random`` module
+            rules: Damage rules used by views
+        """
+        self.name_id = array("i")
+        self.health = array("i")
+        self.damage = array("i")
+        self.weapon_id = array("i")
+        self.kind = array("b")
+        self.names: List[str] = []
+        self.weapons: List[Weapon] = []
+        self._name_ids: Dict[str, int] = {}
+        self._weapon_ids: Dict[Tuple[str, int], int] = {}
+        self.rng = rng if rng is not None else random
+        self.rules = rules
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.health)
+
+    def intern_name(self, name: str) -> int:
+        """
+        Return the id of ``name``, adding it to the name table if needed.
+
+        Args:
+            name: The entity name
+
+        Returns:
+            int: The interned name id
+        """
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._name_ids[name] = len(self.names)
+            self.names.append(name)
+        return name_id
+
+    def intern_weapon(self, name: Optional[str], damage_bonus: int = 0) -> int:
+        """
+        Return the id of a weapon, adding a shared Weapon if needed.
+
+        Args:
+            name: The weapon name, or None for no weapon
+            damage_bonus: The weapon's damage bonus
+
+        Returns:
+            int: The interned weapon id, or NO_WEAPON
+        """
+        if not name:
+            return NO_WEAPON
+        key = (name, damage_bonus)
+        weapon_id = self._weapon_ids.get(key)
+        if weapon_id is None:
+            weapon_id = self._weapon_ids[key] = len(self.weapons)
+            self.weapons.append(Weapon(name, damage_bonus))
+        return weapon_id
+
+    def add(
+        self,
+        name: str,
+        health: int,
+        damage: int,
+        weapon_name: Optional[str] = None,
+        weapon_damage: int = 0,
+        kind: int = KIND_CHARACTER,
+    ) -> int:
+        """
+        Append one entity.
+
+        Args:
+            name: The entity's name
+            health: The entity's health points
+            damage: The entity's base damage
+            weapon_name: Optional weapon name
+            weapon_damage: Damage bonus from the weapon
+            kind: KIND_CHARACTER or KIND_BOSS
+
+        Returns:
+            int: The new row index
+        """
+        return self.add_many(1, name, health, damage, weapon_name, weapon_damage, kind)
+
+    def add_boss(self, name: str, health: int, damage: int) -> int:
+        """
+        Append one boss, armed with the standard boss weapon.
+
+        Args:
+            name: The boss's name
+            health: The boss's health points
+            damage: The boss's base damage
+
+        Returns:
+            int: The new row index
+        """
+        return self.add(
+            name, health, damage, BOSS_WEAPON_NAME, BOSS_WEAPON_DAMAGE, KIND_BOSS
+        )
+
+    def add_many(
+        self,
+        count: int,
+        name: str,
+        health: int,
+        damage: int,
+        weapon_name: Optional[str] = None,
+        weapon_damage: int = 0,
+        kind: int = KIND_CHARACTER,
+    ) -> int:
+        """
+        Append ``count`` identical entities in one step.
+
+        Args:
+            count: Number of rows to add
+            name: The entities' name
+            health: The entities' health points
+            damage: The entities' base damage
+            weapon_name: Optional weapon name
+            weapon_damage: Damage bonus from the weapon
+            kind: KIND_CHARACTER or KIND_BOSS
+
+        Returns:
+            int: The row index of the first new entity
+        """
+        first = len(self)
+        self.name_id.extend(array("i", [self.intern_name(name)]) * count)
+        self.health.extend(array("i", [max(0, health)]) * count)
+        self.damage.extend(array("i", [damage]) * count)
+        self.weapon_id.extend(
+            array("i", [self.intern_weapon(weapon_name, weapon_damage)]) * count
+        )
+        self.kind.extend(array("b", [kind]) * count)
+        return first
+
+    def add_entity(self, entity: Character) -> int:
+        """
+        Copy an existing Character or Boss into the table.
+
+        Args:
+            entity: The entity to copy
+
+        Returns:
+            int: The new row index
+        """
+        weapon = entity.weapon
+        return self.add(
+            entity.name,
+            entity.health,
+            entity.damage,
+            weapon.name if weapon else None,
+            weapon.damage_bonus if weapon else 0,
+            KIND_BOSS if isinstance(entity, Boss) else KIND_CHARACTER,
+        )
+
+    def view(self, row: int) -> "CharacterRow":
+        """
+        Return a Character-compatible view of a row.
+
+        Args:
+            row: The row index
+
+        Returns:
+            CharacterRow: A BossRow for bosses, otherwise a CharacterRow
+        """
+        if self.kind[row] == KIND_BOSS:
+            return BossRow(self, row)
+        return CharacterRow(self, row)
+
+    def nbytes(self) -> int:
+        """
+        Return the bytes held by the typed columns.
+
+        Returns:
+            int: Total column buffer size
+        """
+        columns = (self.name_id, self.health, self.damage, self.weapon_id, self.kind)
+        return sum(column.itemsize * len(column) for column in columns)
+
+
+class CharacterRow(Character):
+    """
+    A lightweight Character backed by a row of an EntityTable.
+
+    Views hold only a table reference and a row index; every stat is read
+    from and written to the table's columns.
+    """
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: EntityTable, row: int) -> None:
+        """
+        Initialize a view.
+
+        Args:
+            table: The table holding the entity
+            row: The entity's row index
+        """
+        self._table = table
+        self._row = row
+
+    @property
+    def row(self) -> int:
+        """The row index this view refers to."""
+        return self._row
+
+    @property
+    def name(self) -> str:
+        """Get the entity's name."""
+        return self._table.names[self._table.name_id[self._row]]
+
+    @name.setter
+    def name(self, value: str) -> None:
+        """Point the row at the interned ``value``."""
+        self._table.name_id[self._row] = self._table.intern_name(value)
+
+    @property
+    def health(self) -> int:
+        """Get the entity's current health."""
+        return self._table.health[self._row]
+
+    @health.setter
+    def health(self, value: int) -> None:
+        """Set the entity's health, ensuring it doesn't go below 0."""
+        self._table.health[self._row] = max(0, value)
+
+    @property
+    def damage(self) -> int:
+        """Get the entity's base damage."""
+        return self._table.damage[self._row]
+
+    @damage.setter
+    def damage(self, value: int) -> None:
+        """Set the entity's base damage."""
+        self._table.damage[self._row] = value
+
+    @property
+    def weapon(self) -> Optional[Weapon]:
+        """Get the entity's shared weapon, if any."""
+        weapon_id = self._table.weapon_id[self._row]
+        return self._table.weapons[weapon_id] if weapon_id != NO_WEAPON else None
+
+    @weapon.setter
+    def weapon(self, value: Optional[Weapon]) -> None:
+        """Point the row at an interned copy of ``value``."""
+        if value is None:
+            self._table.weapon_id[self._row] = NO_WEAPON
+        else:
+            self._table.weapon_id[self._row] = self._table.intern_weapon(
+                value.name, value.damage_bonus
+            )
+
+    @property
+    def rng(self) -> Any:
+        """The random source shared by the table."""
+        return self._table.rng
+
+    @rng.setter
+    def rng(self, value: Any) -> None:
+        """Replace the table's random source, for every row."""
+        self._table.rng = value
+
+    @property
+    def rules(self) -> CombatRules:
+        """The damage rules shared by the table."""
+        return self._table.rules
+
+    @rules.setter
+    def rules(self, value: CombatRules) -> None:
+        """Replace the table's damage rules, for every row."""
+        self._table.rules = value
+
+
+class BossRow(CharacterRow, Boss):
+    """A lightweight Boss backed by a row of an EntityTable."""
+
+    __slots__ = ()
@@ -2,18 +2,65 @@
 Game class for the RPG game.
 
 This module defines the main Game class that manages the game flow and state.
+
+The game loop is written with asyncio: every wait for the player is an
+awaitable on the game's ``GameIO``, so timers and background tasks such as
+autosave run while the player thinks. The synchronous methods (``run``,
+``combat``, ...) are thin wrappers that drive their ``*_async`` counterparts
+with ``asyncio.run`` and must not be called from a running event loop.
 """
 
-from typing import List, Optional, Dict, Any, Tuple, Union
+from typing import (
+    Coroutine, List, MutableSequence, Optional, Dict, Any, Tuple, TypeVar, Union
+)
+import asyncio
 import random
-import json
+import threading
+from contextlib import nullcontext
 from pathlib import Path
-from rpg_game.console_utils import clear_screen, press_enter, print_border
 from rpg_game.character import Character
 from rpg_game.boss import Boss
 from rpg_game.game_logger import GameLogger
+from rpg_game.game_io import GameIO, get_console_io
 from rpg_game.weapon import Weapon
-from rpg_game.save_game import save_game, load_game, delete_save
+from rpg_game.save_game import (
+    SaveBackend, JsonFileBackend, _get_save_dir, _get_save_file
+)
+from rpg_game.save_codec import BossRecordList
+from rpg_game.renderer import BLUE, Frame, ScreenRenderer, health_bar
+from rpg_game.metrics import (
+    Metrics, MENU, INTRO, COMBAT_TURN, SAVE, LOAD, RENDER, INPUT
+)
+from rpg_game.constants import (
+    PLAYER_INITIAL_HEALTH,
+    PLAYER_INITIAL_DAMAGE,
+)
+from rpg_game.catalog import Catalog, default_catalog
+
+# Size of the combat status screen
+COMBAT_FRAME_WIDTH = 60
+COMBAT_FRAME_HEIGHT = 13
+
+# States of the game loop
+STATE_MENU = "menu"
+STATE_INTRO = "intro"
+STATE_BATTLES = "battles"
+STATE_WON = "won"
+STATE_LOST = "lost"
+
+# Shared no-op context used for phases when metrics are disabled
+_NO_PHASE = nullcontext()
+
+T = TypeVar('T')
+
+
+class SessionEnded(Exception):
+    """
+    Raised when the player quits.
+
+    It unwinds the player's game loop only; ``Game.run`` returns normally, so
+    a server hosting many games keeps running.
+    """
 
 
 class Game:
@@ -23,103 +70,251 @@ class Game:
     This class coordinates all game components and handles the game flow.
     """
     
-    def __init__(self) -> None:
-        """Initialize a new game instance."""
+    def __init__(self, rng: Optional[Any] = None,
+                 save_backend: Optional[SaveBackend] = None,
+                 metrics: Optional[Metrics] = None,
+                 renderer: Optional[ScreenRenderer] = None,
+                 io: Optional[GameIO] = None,
+                 catalog: Optional[Catalog] = None) -> None:
+        """
+        Initialize a new game instance.
+        
+        Args:
+            rng: Optional random source shared by the game's combatants
+                (e.g. ``rng.make_rng(seed)`` for a replayable game)
+            save_backend: Optional save storage; defaults to a JSON file in
+                ``~/rpg_saves``
+            metrics: Optional ``metrics.Metrics`` that times the game phases
+            renderer: Frame renderer for the combat screen; defaults to the
+                renderer of ``io``
+            io: Channel to the player; defaults to the terminal (``ConsoleIO``)
+            catalog: Weapons and bosses to play with; defaults to
+                ``catalog.default_catalog()``
+        """
+        self.rng = rng if rng is not None else random
         self.player: Optional[Character] = None
-        self.bosses: List[Boss] = []
-        self.logger: GameLogger = GameLogger()
-        self.save_dir = Path.home() / "rpg_saves"
-        self.save_dir.mkdir(exist_ok=True)
-        self.save_file = self.save_dir / "save.json"
+        self.bosses: MutableSequence[Boss] = []
+        # The default save backend is created on first use; nothing touches
+        # the filesystem until a game is saved or loaded
+        self._save_backend = save_backend
+        self._catalog = catalog
+        self.metrics = metrics
+        self.io = io if io is not None else get_console_io()
+        self.logger: GameLogger = GameLogger(io=self.io)
+        self.renderer = renderer if renderer is not None else self.io.renderer
+        # Health bar state of the current fight
+        self._full_health: Dict[str, int] = {}
+        self._shown_health: Dict[str, int] = {}
+        # Current state of the game loop
+        self.state: Optional[str] = None
+        # Serializes saves and deletes from the loop and the autosave thread
+        self._save_lock = threading.Lock()
+        # Running autosave task and the write it has in flight
+        self._autosave_task: Optional[asyncio.Future] = None
+        self._autosave_write: Optional[asyncio.Future] = None
+    
+    @property
+    def save_dir(self) -> Path:
+        """Directory of the default save file (created when a game is saved)."""
+        return Path(_get_save_dir())
+    
+    @property
+    def save_file(self) -> Path:
+        """Path of the default save file, shared with ``save_game.save_game``."""
+        return Path(_get_save_file())
+    
+    @property
+    def save_backend(self) -> SaveBackend:
+        """Storage for saves; defaults to a JSON file in ``save_dir``."""
+        if self._save_backend is None:
+            self._save_backend = JsonFileBackend(str(self.save_file))
+        return self._save_backend
+    
+    @save_backend.setter
+    def save_backend(self, backend: SaveBackend) -> None:
+        self._save_backend = backend
+    
+    @property
+    def catalog(self) -> Catalog:
+        """Weapons and bosses to play with; defaults to the shared catalog."""
+        if self._catalog is None:
+            self._catalog = default_catalog()
+        return self._catalog
+    
+    def _phase(self, name: str) -> Any:
+        """Return a context manager timing phase ``name`` if metrics are enabled."""
+        return self.metrics.phase(name) if self.metrics is not None else _NO_PHASE
+    
+    def _count(self, name: str) -> None:
+        """Increase counter ``name`` if metrics are enabled."""
+        if self.metrics is not None:
+            self.metrics.inc(name)
+    
+    def _run_sync(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine to completion for the synchronous API."""
+        return asyncio.run(coroutine)
+    
+    async def _prompt(self, prompt: str) -> str:
+        """Read a line of input, timed as the input phase."""
+        with self._phase(INPUT):
+            return await self.io.read_line(prompt)
+    
+    async def _pause(self) -> None:
+        """Wait for Enter, timed as the input phase."""
+        with self._phase(INPUT):
+            await self.io.pause()
+    
+    async def show_intro_async(self) -> None:
+        """Display the game introduction and setup the game."""
+        with self._phase(INTRO):
+            with self._phase(RENDER):
+                self.io.clear()
+                self.io.print("Welcome to the RPG Adventure!")
+                self.io.print("In a world where darkness looms, you are the chosen "
+                              "hero destined to defeat the evil bosses and restore "
+                              "peace.")
+            name = await self._prompt("Enter your character's name: ")
+            player_name = name.capitalize()
+            await self.setup_game_async(player_name)
     
     def show_intro(self) -> None:
         """Display the game introduction and setup the game."""
-        clear_screen()
-        print("Welcome to the RPG Adventure!")
-        print("In a world where darkness looms, you are the chosen hero "
-              "destined to defeat the evil bosses and restore peace.")
-        player_name = input("Enter your character's name: ").capitalize()
-        self.setup_game(player_name)
+        self._run_sync(self.show_intro_async())
     
-    def setup_game(self, name: str) -> None:
+    async def setup_game_async(self, name: str) -> None:
         """
         Set up the game with the player character and bosses.
         
         Args:
             name: The player's character name
         """
-        weapon_name, weapon_damage = self.choose_weapon()
-        self.player = Character(name, 110, 10, weapon_name, weapon_damage)
-        self.player.display()
-        press_enter()
+        weapon_name, weapon_damage = await self.choose_weapon_async()
+        self.player = Character(name, PLAYER_INITIAL_HEALTH, PLAYER_INITIAL_DAMAGE,
+                                weapon_name, weapon_damage, rng=self.rng, io=self.io)
+        for line in self.player.display_lines():
+            self.io.print(line)
+        await self._pause()
         
         # Create boss enemies
         self.bosses = [
-            Boss("Goblin King", 50, 8),
-            Boss("Dark Sorcerer", 60, 9)
+            Boss(boss.name, boss.health, boss.damage, rng=self.rng, io=self.io)
+            for boss in self.catalog.campaign()
         ]
     
-    def choose_weapon(self) -> Tuple[str, int]:
+    def setup_game(self, name: str) -> None:
+        """
+        Set up the game with the player character and bosses.
+        
+        Args:
+            name: The player's character name
+        """
+        self._run_sync(self.setup_game_async(name))
+    
+    async def choose_weapon_async(self) -> Tuple[str, int]:
         """
         Let the player choose a weapon.
         
         Returns:
             A tuple of (weapon_name, weapon_damage)
         """
-        weapons = [
-            {"name": "Rock", "damage_bonus": 2},
-            {"name": "Paper", "damage_bonus": 3},
-            {"name": "Scissors", "damage_bonus": 4}
-        ]
+        weapons = self.catalog.starting_weapons()
         
-        print("\nChoose your weapon:")
+        self.io.print("\nChoose your weapon:")
         for i, weapon in enumerate(weapons, 1):
-            print(f"{i}. {weapon['name']} (+{weapon['damage_bonus']} damage)")
+            self.io.say("{}. {} (+{} damage)", i, weapon.name, weapon.damage)
         
         while True:
             try:
-                choice = int(input("\nEnter your choice (1-3): "))
+                prompt = f"\nEnter your choice (1-{len(weapons)}): "
+                choice = int(await self._prompt(prompt))
                 if 1 <= choice <= len(weapons):
                     weapon = weapons[choice - 1]
-                    return weapon["name"], weapon["damage_bonus"]
-                print(f"Please enter a number between 1 and {len(weapons)}")
+                    return weapon.name, weapon.damage
+                self.io.say("Please enter a number between 1 and {}", len(weapons))
             except ValueError:
-                print("Please enter a valid number.")
+                self.io.print("Please enter a valid number.")
     
-    def combat(self, player: Character, enemy: Boss) -> bool:
+    def choose_weapon(self) -> Tuple[str, int]:
+        """
+        Let the player choose a weapon.
+        
+        Returns:
+            A tuple of (weapon_name, weapon_damage)
+        """
+        return self._run_sync(self.choose_weapon_async())
+    
+    async def combat_async(self, player: Character, enemy: Boss) -> bool:
         """
         Handle combat between the player and an enemy.
         
         Args:
             player: The player character
             enemy: The enemy to fight
-            
+        
         Returns:
             bool: True if player wins, False if player loses
         """
+        self.logger.begin_fight(player, enemy)
+        self._full_health = {player.name: player.health, enemy.name: enemy.health}
+        self._shown_health = dict(self._full_health)
         while player.health > 0 and enemy.health > 0:
-            self.display_combat_status(player, enemy)
-            
-            # Player's turn
-            damage_dealt = player.attack(enemy, self.logger)
-            print(f"You dealt {damage_dealt} damage to {enemy.name}.")
-            
-            if enemy.health <= 0:
-                self.print_victory_message(enemy)
-                return True
-            
-            # Enemy's turn
-            damage_received = enemy.attack(player, self.logger)
-            print(f"{enemy.name} dealt {damage_received} damage to you.")
-            
-            if player.health <= 0:
-                self.print_defeat_message(enemy)
-                return False
+            with self._phase(COMBAT_TURN):
+                self._count("combat_turns")
+                await self.display_combat_status_async(player, enemy)
+                
+                # Player's turn
+                damage_dealt = player.attack(enemy, self.logger)
+                self.io.say("You dealt {} damage to {}.", damage_dealt, enemy.name)
+                
+                if enemy.health <= 0:
+                    self._count("fights_won")
+                    await self.print_victory_message_async(enemy)
+                    return True
                 
-            press_enter()
+                # Enemy's turn
+                damage_received = enemy.attack(player, self.logger)
+                self.io.say("{} dealt {} damage to you.", enemy.name, damage_received)
+                
+                if player.health <= 0:
+                    self._count("fights_lost")
+                    await self.print_defeat_message_async(enemy)
+                    return False
+                
+                await self._pause()
         
         return False  # Shouldn't reach here
     
+    def combat(self, player: Character, enemy: Boss) -> bool:
+        """
+        Handle combat between the player and an enemy.
+        
+        Args:
+            player: The player character
+            enemy: The enemy to fight
+        
+        Returns:
+            bool: True if player wins, False if player loses
+        """
+        return self._run_sync(self.combat_async(player, enemy))
+    
+    def _combat_status(self, player: Character, enemy: Boss) -> Tuple[Any, bool]:
+        """
+        Prepare the combat status screen.
+        
+        Returns:
+            The frame composer and whether health changes should be animated
+        """
+        shown = {name: self._shown_health.get(name, fighter.health)
+                 for name, fighter in ((player.name, player), (enemy.name, enemy))}
+        
+        def compose(progress: float) -> Frame:
+            return self._combat_frame(player, enemy, shown, progress)
+        
+        animate = self.renderer.animation > 0 and any(
+            shown[fighter.name] != fighter.health for fighter in (player, enemy))
+        self._shown_health = {player.name: player.health, enemy.name: enemy.health}
+        return compose, animate
+    
     def display_combat_status(self, player: Character, enemy: Boss) -> None:
         """
         Display the current status of combat.
@@ -128,55 +323,142 @@ class Game:
             player: The player character
             enemy: The current enemy
         """
-        clear_screen()
-        level = "LEVEL 1" if enemy.name == "Goblin King" else "LEVEL 2"
-        print(f"\n{'='*15}> {level}: {enemy.name} <{'='*15}")
-        player.display()
-        print("-" * 30)
-        enemy.display()
-        print("-" * 30)
+        with self._phase(RENDER):
+            compose, animate = self._combat_status(player, enemy)
+            if self.renderer.headless:
+                return
+            if animate:
+                self.renderer.animate(compose)
+            else:
+                self.renderer.present(compose(1.0))
     
-    def handle_boss_battles(self) -> None:
-        """Handle the sequence of boss battles with save option."""
+    async def display_combat_status_async(self, player: Character, enemy: Boss) -> None:
+        """
+        Display the current status of combat, animating without blocking the loop.
+        
+        Args:
+            player: The player character
+            enemy: The current enemy
+        """
+        with self._phase(RENDER):
+            compose, animate = self._combat_status(player, enemy)
+            if self.renderer.headless:
+                return
+            if animate:
+                await self.renderer.animate_async(compose)
+            else:
+                self.renderer.present(compose(1.0))
+    
+    def _combat_frame(self, player: Character, enemy: Boss, shown: Dict[str, int],
+                      progress: float) -> Frame:
+        """
+        Compose the combat status screen.
+        
+        Args:
+            player: The player character
+            enemy: The current enemy
+            shown: Health each combatant was last drawn with
+            progress: Animation progress from ``shown`` to current health (0-1)
+        
+        Returns:
+            Frame: The screen
+        """
+        frame = Frame(COMBAT_FRAME_WIDTH, COMBAT_FRAME_HEIGHT)
+        frame.text(0, 0, "=" * 60, BLUE)
+        entry = self.catalog.find_boss(enemy.name)
+        title = enemy.name
+        if entry is not None:
+            title = f"LEVEL {entry.level}: {title}"
+        frame.text(2, 0, f"{'='*15}> {title} <{'='*15}")
+        row = 3
+        for fighter in (player, enemy):
+            start = shown[fighter.name]
+            health = int(round(start + (fighter.health - start) * progress))
+            maximum = self._full_health.setdefault(fighter.name,
+                                                   max(start, fighter.health))
+            for index, line in enumerate(fighter.display_lines(health)):
+                end = frame.text(row + index, 0, line)
+                if index == 1:
+                    frame.text(row + index, max(end, 14) + 1,
+                               *health_bar(health, maximum))
+            frame.text(row + 4, 0, "-" * 30)
+            row += 5
+        return frame
+    
+    async def handle_boss_battles_async(self) -> bool:
+        """
+        Handle the sequence of boss battles with save option.
+        
+        Returns:
+            bool: True if all bosses were defeated, False if the player lost
+        
+        Raises:
+            SessionEnded: If the player saves and quits
+        """
         while self.bosses:  # Continue while there are bosses left
             boss = self.bosses[0]  # Get the next boss
             
             # Show battle options
-            clear_screen()
-            print(f"You are about to face {boss.name}!\n")
-            print("1. Fight the boss")
-            print("2. Save game and continue")
-            print("3. Save and quit")
+            with self._phase(RENDER):
+                self.io.clear()
+                self.io.say("You are about to face {}!\n", boss.name)
+                self.io.print("1. Fight the boss")
+                self.io.print("2. Save game and continue")
+                self.io.print("3. Save and quit")
             
-            choice = input("\nEnter your choice (1-3): ")
+            choice = await self._prompt("\nEnter your choice (1-3): ")
             
             if choice == '1':
                 # Fight the boss
-                self.introduce_boss(boss)
-                if not self.combat(self.player, boss):
-                    self.end_game(False)
-                    return
+                await self.introduce_boss_async(boss)
+                if not await self.combat_async(self.player, boss):
+                    return False
                 # Remove defeated boss
                 self.bosses.pop(0)
                 
                 # Only show victory message if there are more bosses
                 if self.bosses:
-                    print(f"\nYou defeated {boss.name}!")
-                    print(f"Prepare to face {self.bosses[0].name} next!")
-                    press_enter()
-                
+                    self.io.say("\nYou defeated {}!", boss.name)
+                    self.io.say("Prepare to face {} next!", self.bosses[0].name)
+                    await self._pause()
+            
             elif choice == '2':
                 # Save and continue
-                self.save_current_game()
-                
+                await self.save_current_game_async()
+            
             elif choice == '3':
                 # Save and quit
-                self.save_current_game()
-                print("\nGame saved. Goodbye!")
-                exit()
-            
+                await self.save_current_game_async()
+                self.io.print("\nGame saved. Goodbye!")
+                raise SessionEnded("saved and quit")
+        
         # If we get here, all bosses are defeated
-        self.end_game(True)
+        return True
+    
+    def handle_boss_battles(self) -> bool:
+        """
+        Handle the sequence of boss battles with save option.
+        
+        Returns:
+            bool: True if all bosses were defeated, False if the player lost
+        """
+        return self._run_sync(self.handle_boss_battles_async())
+    
+    async def introduce_boss_async(self, boss: Boss) -> None:
+        """
+        Display the boss introduction.
+        
+        Args:
+            boss: The boss being introduced
+        """
+        with self._phase(RENDER):
+            self.io.clear()
+        entry = self.catalog.find_boss(boss.name)
+        if entry is not None and entry.intro:
+            self.io.print(entry.intro.replace("{player}", self.player.name))
+        else:
+            self.io.print("A new boss appears!")
+        await self._pause()
     
     def introduce_boss(self, boss: Boss) -> None:
         """
@@ -185,19 +467,18 @@ class Game:
         Args:
             boss: The boss being introduced
         """
-        clear_screen()
-        intro_messages = {
-            "Goblin King": (
-                f"Level 1 - You have entered the lair of the Goblin King. "
-                f"He is known for his strength and brutality. Prepare for battle, {self.player.name}!"
-            ),
-            "Dark Sorcerer": (
-                f"Level 2 - You have defeated the Goblin King! Now, you face the Dark Sorcerer, "
-                f"a master of dark magic. Good luck, {self.player.name}!"
-            )
-        }
-        print(intro_messages.get(boss.name, "A new boss appears!"))
-        press_enter()
+        self._run_sync(self.introduce_boss_async(boss))
+    
+    async def print_victory_message_async(self, enemy: Boss) -> None:
+        """
+        Print the victory message after defeating an enemy.
+        
+        Args:
+            enemy: The defeated enemy
+        """
+        self.io.print_border()
+        self.io.say("Victory! You defeated {}.", enemy.name)
+        await self._pause()
     
     def print_victory_message(self, enemy: Boss) -> None:
         """
@@ -206,9 +487,18 @@ class Game:
         Args:
             enemy: The defeated enemy
         """
-        print_border()
-        print(f"Victory! You defeated {enemy.name}.")
-        press_enter()
+        self._run_sync(self.print_victory_message_async(enemy))
+    
+    async def print_defeat_message_async(self, enemy: Boss) -> None:
+        """
+        Print the defeat message after losing to an enemy.
+        
+        Args:
+            enemy: The enemy that defeated the player
+        """
+        self.io.print_border()
+        self.io.say("Defeat! You were defeated by {}.", enemy.name)
+        await self._pause()
     
     def print_defeat_message(self, enemy: Boss) -> None:
         """
@@ -217,9 +507,39 @@ class Game:
         Args:
             enemy: The enemy that defeated the player
         """
-        print_border()
-        print(f"Defeat! You were defeated by {enemy.name}.")
-        press_enter()
+        self._run_sync(self.print_defeat_message_async(enemy))
+    
+    async def show_main_menu_async(self) -> str:
+        """
+        Display the main menu and handle user selection.
+        
+        Returns:
+            str: The selected menu option ('new' or 'load')
+        
+        Raises:
+            SessionEnded: If the player quits
+        """
+        with self._phase(MENU):
+            while True:
+                with self._phase(RENDER):
+                    self.io.clear()
+                    self.io.print("RPG Adventure")
+                    self.io.print("=" * 40)
+                    self.io.print("1. New Game")
+                    self.io.print("2. Load Game")
+                    self.io.print("3. Quit")
+                
+                choice = await self._prompt("\nEnter your choice (1-3): ")
+                
+                if choice == '1':
+                    return "new"
+                elif choice == '2':
+                    if await self.load_game_async():
+                        return "load"
+                    await self._pause()
+                elif choice == '3':
+                    self.io.print("\nThank you for playing!")
+                    raise SessionEnded("quit from the main menu")
     
     def show_main_menu(self) -> str:
         """
@@ -228,25 +548,7 @@ class Game:
         Returns:
             str: The selected menu option ('new' or 'load')
         """
-        while True:
-            clear_screen()
-            print("RPG Adventure")
-            print("=" * 40)
-            print("1. New Game")
-            print("2. Load Game")
-            print("3. Quit")
-            
-            choice = input("\nEnter your choice (1-3): ")
-            
-            if choice == '1':
-                return "new"
-            elif choice == '2':
-                if self.load_game():
-                    return "load"
-                press_enter()
-            elif choice == '3':
-                print("\nThank you for playing!")
-                exit()
+        return self._run_sync(self.show_main_menu_async())
     
     def get_game_state(self) -> Dict[str, Any]:
         """
@@ -257,7 +559,7 @@ class Game:
         """
         if not self.player:
             return {}
-            
+        
         return {
             'player': {
                 'name': self.player.name,
@@ -285,34 +587,96 @@ class Game:
         Returns:
             bool: True if load was successful, False otherwise
         """
-        if not self.save_file.exists():
-            return False
-            
-        try:
-            with open(self.save_file, 'r') as f:
-                game_state = json.load(f)
-                
-            # Restore player state
-            player_data = game_state['player']
-            self.player = Character(
-                player_data['name'],
-                player_data['health'],
-                player_data['damage'],
-                player_data['weapon']['name'],
-                player_data['weapon']['damage_bonus']
-            )
-            
-            # Restore bosses state
-            self.bosses = []
-            for boss_data in game_state['bosses']:
-                boss = Boss(boss_data['name'], boss_data['health'], boss_data['damage'])
-                self.bosses.append(boss)
-                
+        with self._phase(LOAD):
+            try:
+                return self._restore_save(*self._read_save())
+            except Exception as e:
+                self._count("load_failures")
+                self.io.say("Error loading game: {}", e)
+                return False
+    
+    async def load_game_async(self) -> bool:
+        """
+        Load a saved game state, reading it on the default executor.
+        
+        Returns:
+            bool: True if load was successful, False otherwise
+        """
+        loop = asyncio.get_running_loop()
+        with self._phase(LOAD):
+            try:
+                save = await loop.run_in_executor(None, self._read_save)
+                return self._restore_save(*save)
+            except Exception as e:
+                self._count("load_failures")
+                self.io.say("Error loading game: {}", e)
+                return False
+    
+    def _read_save(self) -> Tuple[bool, Any]:
+        """
+        Read the save from the backend, one save, load or delete at a time.
+        
+        Returns:
+            Tuple[bool, Any]: Whether the save is a lazily decoded ``SaveFile``
+            (backends with ``load_lazy``) or a state dictionary, and the save
+            (None if there is none)
+        """
+        with self._save_lock:
+            load_lazy = getattr(self.save_backend, 'load_lazy', None)
+            if load_lazy is not None:
+                return True, load_lazy()
+            return False, self.save_backend.load()
+    
+    def _restore_save(self, lazy: bool, save: Any) -> bool:
+        """
+        Restore the player and bosses from a save read by ``_read_save``.
+        
+        Returns:
+            bool: False if there was nothing to restore
+        """
+        if lazy:
+            # Decode only the player now; bosses are built as they are reached
+            player_data = save.player() if save is not None else None
+            if not player_data:
+                return False
+            self.player = self._restore_player(player_data)
+            self.bosses = BossRecordList(save, rng=self.rng, io=self.io)
             return True
-            
-        except Exception as e:
-            print(f"Error loading game: {e}")
+        
+        if not save:
             return False
+        
+        # Restore player state
+        self.player = self._restore_player(save['player'])
+        
+        # Restore bosses state
+        self.bosses = []
+        for boss_data in save['bosses']:
+            boss = Boss(boss_data['name'], boss_data['health'], boss_data['damage'],
+                        rng=self.rng, io=self.io)
+            self.bosses.append(boss)
+        
+        return True
+    
+    def _restore_player(self, player_data: Dict[str, Any]) -> Character:
+        """
+        Rebuild the player character from saved data.
+        
+        Args:
+            player_data: The saved player dictionary
+        
+        Returns:
+            Character: The restored player
+        """
+        return Character(
+            player_data['name'],
+            player_data['health'],
+            player_data['damage'],
+            player_data['weapon']['name'],
+            player_data['weapon']['damage_bonus'],
+            rng=self.rng,
+            io=self.io
+        )
     
     def save_current_game(self) -> bool:
         """
@@ -321,41 +685,188 @@ class Game:
         Returns:
             bool: True if save was successful, False otherwise
         """
-        try:
-            game_state = self.get_game_state()
-            with open(self.save_file, 'w') as f:
-                json.dump(game_state, f, indent=2)
-            return True
-        except Exception as e:
-            print(f"Error saving game: {e}")
-            return False
+        with self._phase(SAVE):
+            try:
+                self._write_save(self.get_game_state())
+                return True
+            except Exception as e:
+                self._count("save_failures")
+                self.io.say("Error saving game: {}", e)
+                return False
     
-    def end_game(self, player_won: bool) -> None:
+    async def save_current_game_async(self) -> bool:
+        """
+        Save the current game state, writing it on the default executor.
+        
+        The state is captured on the event loop; only the backend's write
+        runs in the executor, so a slow backend never stalls other sessions.
+        
+        Returns:
+            bool: True if save was successful, False otherwise
+        """
+        loop = asyncio.get_running_loop()
+        with self._phase(SAVE):
+            try:
+                state = self.get_game_state()
+                await loop.run_in_executor(None, self._write_save, state)
+                return True
+            except Exception as e:
+                self._count("save_failures")
+                self.io.say("Error saving game: {}", e)
+                return False
+    
+    def _write_save(self, state: Dict[str, Any]) -> None:
+        """Save ``state``, one save, load or delete at a time."""
+        with self._save_lock:
+            self.save_backend.save(state)
+    
+    def _delete_save(self) -> None:
+        """Delete the save, one save, load or delete at a time."""
+        with self._save_lock:
+            self.save_backend.delete()
+    
+    async def _autosave(self, interval: float) -> None:
+        """
+        Save the game every ``interval`` seconds while it runs.
+        
+        The state is captured on the event loop and written on the default
+        executor, so a slow backend never stalls the game. The write is
+        shielded: cancelling the task leaves it in ``_autosave_write`` for
+        ``_finish_autosave`` to wait for.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(interval)
+            if self.player is None:
+                continue
+            state = self.get_game_state()
+            try:
+                self._autosave_write = loop.run_in_executor(
+                    None, self._write_save, state)
+                await asyncio.shield(self._autosave_write)
+                self._count("autosaves")
+            except Exception as e:
+                self._count("save_failures")
+                self.io.say("Error autosaving game: {}", e)
+    
+    async def end_game_async(self, player_won: bool) -> None:
         """
         Display the end game message and prompt to play again.
         
+        Returns when the player plays again, with the save deleted and the
+        game reset for a new start from the main menu.
+        
         Args:
             player_won: Whether the player won the game
+        
+        Raises:
+            SessionEnded: If the player does not play again
         """
-        clear_screen()
+        self.io.clear()
         if player_won:
-            print("Congratulations! You've defeated all the bosses and saved the kingdom!")
+            self.io.print("Congratulations! You've defeated all the bosses "
+                          "and saved the kingdom!")
         else:
-            print("Game Over! The forces of darkness have prevailed...")
-            
-        play_again = input("\nWould you like to play again? (y/n): ").lower()
+            self.io.print("Game Over! The forces of darkness have prevailed...")
+        
+        answer = await self._prompt("\nWould you like to play again? (y/n): ")
+        play_again = answer.lower()
         if play_again == 'y':
-            # Clear the save when starting a new game after ending
-            delete_save()
+            # Clear the save when starting a new game after ending; an
+            # autosave still being written would bring it back
+            await self._finish_autosave()
+            try:
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(None, self._delete_save)
+            except OSError as e:
+                self.io.say("Error deleting save file: {}", e)
             self.player = None
             self.bosses = []
-            self.run()
         else:
-            print("\nThank you for playing!")
-            exit()
-    
-    def run(self) -> None:
-        """Run the main game loop."""
-        if self.show_main_menu() == "new":
-            self.show_intro()
-        self.handle_boss_battles()
+            self.io.print("\nThank you for playing!")
+            raise SessionEnded("declined to play again")
+    
+    def end_game(self, player_won: bool) -> None:
+        """
+        Display the end game message and prompt to play again.
+        
+        Args:
+            player_won: Whether the player won the game
+        """
+        self._run_sync(self.end_game_async(player_won))
+    
+    async def _step(self, state: str) -> str:
+        """
+        Run one state of the game loop.
+        
+        Args:
+            state: The current state (one of the ``STATE_*`` constants)
+        
+        Returns:
+            str: The next state
+        """
+        if state == STATE_MENU:
+            choice = await self.show_main_menu_async()
+            return STATE_INTRO if choice == "new" else STATE_BATTLES
+        if state == STATE_INTRO:
+            await self.show_intro_async()
+            return STATE_BATTLES
+        if state == STATE_BATTLES:
+            return STATE_WON if await self.handle_boss_battles_async() else STATE_LOST
+        await self.end_game_async(state == STATE_WON)
+        return STATE_MENU
+    
+    async def run_async(self, autosave_interval: Optional[float] = None) -> None:
+        """
+        Run the main game loop.
+        
+        The loop is a state machine: each step returns the next state, so
+        replays run in constant stack depth however often the player plays
+        again. Combat logging does not need a task of its own: ``GameLogger``
+        hands records to its writer thread without blocking.
+        
+        The loop returns when the player quits; input errors such as
+        ``EOFError`` propagate to the caller.
+        
+        Args:
+            autosave_interval: Save the game in the background every this many
+                seconds (None disables autosave)
+        """
+        if autosave_interval:
+            self._autosave_task = asyncio.ensure_future(
+                self._autosave(autosave_interval))
+        self.state = STATE_MENU
+        try:
+            while True:
+                self.state = await self._step(self.state)
+        except SessionEnded:
+            pass
+        finally:
+            await self._stop_autosave()
+            await self.io.drain()
+    
+    async def _finish_autosave(self) -> None:
+        """Wait for the autosave write in flight, if any."""
+        write = self._autosave_write
+        if write is not None and not write.done():
+            # Its outcome is reported by _autosave
+            await asyncio.wait([write])
+    
+    async def _stop_autosave(self) -> None:
+        """Cancel the autosave task and wait until its last write is done."""
+        task = self._autosave_task
+        self._autosave_task = None
+        if task is not None:
+            task.cancel()
+            await asyncio.wait([task])
+        await self._finish_autosave()
+    
+    def run(self, autosave_interval: Optional[float] = None) -> None:
+        """
+        Run the main game loop.
+        
+        Args:
+            autosave_interval: Save the game in the background every this many
+                seconds (None disables autosave)
+        """
+        self._run_sync(self.run_async(autosave_interval))
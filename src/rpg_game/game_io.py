@@ -0,0 +1,316 @@
+"""
+Player I/O for the RPG game.
+
+``Game`` never calls ``print`` or ``input`` itself. It writes through a
+``GameIO`` and awaits lines from it, so the same game loop can run on a
+terminal (``ConsoleIO``) or on any asyncio stream pair (``StreamIO``), such
+as a socket. Characters and the combat logger write through the same port.
+
+Messages are passed as a template and arguments to ``say``, so ``NullIO``
+(and other ports with ``quiet`` set) can drop them without formatting.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+from typing import Any, Callable, Optional, Tuple, Union
+
+from rpg_game.console_utils import Colors, clear_screen
+from rpg_game.renderer import NullRenderer, ScreenRenderer, get_renderer
+
+
+class GameIO:
+    """
+    Base class for the channel between a game and its player.
+
+    Attributes:
+        renderer: Frame renderer drawing to this channel
+        quiet: True if output is discarded, so callers can skip building it
+    """
+
+    renderer: ScreenRenderer
+    quiet = False
+
+    def print(self, *values: Any, sep: str = " ", end: str = "\n") -> None:
+        """Write values like the built-in ``print``."""
+        raise NotImplementedError
+
+    def say(self, template: str, *args: Any) -> None:
+        """
+        Write a line built with ``template.format(*args)``.
+
+        Args:
+            template: Message template (written as is when there are no args)
+            *args: Values for the template's fields
+        """
+        self.print(template.format(*args) if args else template)
+
+    async def read_line(self, prompt: str = "") -> str:
+        """
+        Show ``prompt`` and wait for a line of input.
+
+        Returns:
+            str: The line without its newline
+
+        Raises:
+            EOFError: If the input has ended
+        """
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Clear the screen and draw the top border."""
+        self.renderer.clear()
+        self.print(f"{Colors.BLUE}{'=' * 60}{Colors.END}\n")
+
+    def print_border(self, char: str = "-", length: int = 80) -> None:
+        """Print a border line for visual separation."""
+        self.print(f"{Colors.BLUE}{char * length}{Colors.END}")
+
+    async def pause(self, prompt: str = "Press Enter to continue...") -> None:
+        """Wait for the player to press Enter."""
+        await self.read_line(f"\n{Colors.CYAN}{prompt}{Colors.END} ")
+
+    async def drain(self) -> None:
+        """Wait until buffered output has been sent."""
+
+    def close(self) -> None:
+        """Release the channel."""
+
+
+class ConsoleIO(GameIO):
+    """
+    Terminal I/O through ``print`` and standard input.
+
+    Lines are read on a daemon thread, so other tasks (autosave, animations)
+    keep running while the player thinks. The loop's default executor is not
+    used: ``asyncio.run`` joins it on exit, so Ctrl-C at a prompt would wait
+    for Enter. When standard input has a file descriptor the thread reads it
+    with ``os.read``, which holds no lock a blocked ``input`` call would keep
+    at interpreter shutdown; replaced ``sys.stdin`` objects go through
+    ``input``.
+    """
+
+    def __init__(self) -> None:
+        """Initialize console I/O using the shared renderer."""
+        self.renderer = get_renderer()
+        # Read still waiting for a line, reused if its caller was cancelled
+        self._pending: Optional[asyncio.Future] = None
+        # Bytes read past the last line, and whether the input has ended
+        self._buffer = b""
+        self._ended = False
+
+    def print(self, *values: Any, sep: str = " ", end: str = "\n") -> None:
+        """Print to standard output."""
+        print(*values, sep=sep, end=end)
+
+    def clear(self) -> None:
+        """Clear the terminal."""
+        clear_screen()
+
+    async def read_line(self, prompt: str = "") -> str:
+        """
+        Read a line from standard input without blocking the event loop.
+
+        Raises:
+            EOFError: If standard input has ended
+        """
+        loop = asyncio.get_running_loop()
+        future = self._pending
+        if future is None or future.get_loop() is not loop:
+            future = self._pending = self._start_read(loop, prompt)
+        elif prompt:
+            # An earlier read, whose caller was cancelled, is still waiting
+            print(prompt, end="", flush=True)
+        try:
+            # Shielded so a cancelled caller leaves the line to the next read
+            line: Union[str, bytes] = await asyncio.shield(future)
+        finally:
+            if future.done():
+                self._pending = None
+        if isinstance(line, bytes):
+            encoding = getattr(sys.stdin, "encoding", None) or "utf-8"
+            return line.decode(encoding, errors="replace")
+        return line
+
+    def _start_read(
+        self, loop: asyncio.AbstractEventLoop, prompt: str
+    ) -> asyncio.Future:
+        """Start reading a line and return the future it will be set on."""
+        future = loop.create_future()
+        try:
+            fd = sys.stdin.fileno()
+        except (AttributeError, OSError, ValueError):
+            fd = None
+        target: Callable[..., None]
+        args: Tuple[Any, ...]
+        if fd is None:
+            target, args = _read_input, (loop, future, prompt)
+        else:
+            print(prompt, end="", flush=True)
+            target, args = self._read_fd, (loop, future, fd)
+        threading.Thread(
+            target=target, args=args, name="console-input", daemon=True
+        ).start()
+        return future
+
+    def _read_fd(
+        self, loop: asyncio.AbstractEventLoop, future: asyncio.Future, fd: int
+    ) -> None:
+        """Read up to the next newline from ``fd`` (runs on the input thread)."""
+        result: Optional[bytes] = None
+        error: Optional[BaseException] = None
+        try:
+            while b"\n" not in self._buffer and not self._ended:
+                chunk = os.read(fd, 4096)
+                if chunk:
+                    self._buffer += chunk
+                else:
+                    self._ended = True
+            result, newline, self._buffer = self._buffer.partition(b"\n")
+            if not (newline or result):
+                # Like input(): a last line without a newline is still returned
+                result, error = None, EOFError("standard input ended")
+        except OSError as e:
+            error = EOFError(str(e))
+        _call_soon(loop, future, result, error)
+
+
+def _settle(
+    future: asyncio.Future, result: Any, error: Optional[BaseException]
+) -> None:
+    """Set a read's line or exception unless it was already settled."""
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+def _call_soon(
+    loop: asyncio.AbstractEventLoop,
+    future: asyncio.Future,
+    result: Any,
+    error: Optional[BaseException],
+) -> None:
+    """Hand a read's outcome from the input thread to the loop."""
+    try:
+        loop.call_soon_threadsafe(_settle, future, result, error)
+    except RuntimeError:
+        pass  # The loop has closed; nobody is waiting for the line
+
+
+def _read_input(
+    loop: asyncio.AbstractEventLoop, future: asyncio.Future, prompt: str
+) -> None:
+    """Call ``input`` on the input thread; hand its line or error to ``future``."""
+    try:
+        result, error = input(prompt), None
+    except Exception as e:
+        result, error = None, e
+    _call_soon(loop, future, result, error)
+
+
+class NullIO(GameIO):
+    """
+    Headless I/O: output is dropped unformatted and every prompt is answered
+    with an empty line.
+
+    Pauses pass straight through, so fights and other flows driven directly
+    run at full speed. Menus that need a real answer would loop forever; use
+    ``scripted.ScriptedIO`` to play those.
+    """
+
+    quiet = True
+
+    def __init__(self) -> None:
+        """Initialize headless I/O with a renderer that draws nothing."""
+        self.renderer = NullRenderer()
+
+    def print(self, *values: Any, sep: str = " ", end: str = "\n") -> None:
+        """Discard output."""
+
+    def say(self, template: str, *args: Any) -> None:
+        """Discard the message without formatting it."""
+
+    def clear(self) -> None:
+        """Do nothing."""
+
+    def print_border(self, char: str = "-", length: int = 80) -> None:
+        """Do nothing."""
+
+    async def read_line(self, prompt: str = "") -> str:
+        """Answer with an empty line."""
+        return ""
+
+
+class StreamIO(GameIO):
+    """I/O over an asyncio ``StreamReader``/``StreamWriter`` pair."""
+
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: Any, encoding: str = "utf-8"
+    ) -> None:
+        """
+        Initialize stream I/O.
+
+        Args:
+            reader: Source of input lines
+            writer: Destination of output (anything with ``write(bytes)``)
+            encoding: Text encoding on the wire
+        """
+        self.reader = reader
+        self.writer = writer
+        self.encoding = encoding
+        self.renderer = ScreenRenderer(stream=self)
+
+    def write(self, text: str) -> None:
+        """Queue text for sending (used by the renderer as its stream)."""
+        self.writer.write(text.encode(self.encoding))
+
+    def flush(self) -> None:
+        """Nothing to do; output is sent by ``drain``."""
+
+    def print(self, *values: Any, sep: str = " ", end: str = "\n") -> None:
+        """Queue values for sending, formatted like ``print``."""
+        self.write(sep.join(str(value) for value in values) + end)
+
+    async def drain(self) -> None:
+        """Wait until the writer's buffer has been flushed."""
+        drain = getattr(self.writer, "drain", None)
+        if drain is not None:
+            await drain()
+
+    async def read_line(self, prompt: str = "") -> str:
+        """
+        Send ``prompt`` and wait for the next line from the reader.
+
+        Raises:
+            EOFError: If the input has ended or a line exceeds the reader's limit
+        """
+        if prompt:
+            self.write(prompt)
+        await self.drain()
+        try:
+            line = await self.reader.readline()
+        except ValueError as e:
+            raise EOFError("input line too long") from e
+        if not line:
+            raise EOFError("input stream closed")
+        return line.decode(self.encoding, errors="replace").rstrip("\r\n")
+
+    def close(self) -> None:
+        """Close the writer."""
+        self.writer.close()
+
+
+# Console port shared by entities created without one
+_console: Optional[ConsoleIO] = None
+
+
+def get_console_io() -> ConsoleIO:
+    """Return the shared console I/O, creating it on first use."""
+    global _console
+    if _console is None:
+        _console = ConsoleIO()
+    return _console
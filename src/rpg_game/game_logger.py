@@ -6,7 +6,9 @@ such as combat actions.
 """
 
 import datetime
-from typing import Any
+import time
+from typing import Any, Optional
+from rpg_game.log_sinks import FIGHT_START
 
 
 class GameLogger:
@@ -16,14 +18,21 @@ class GameLogger:
     This class demonstrates association relationship with the Game class.
     """
     
-    def __init__(self, log_to_console: bool = True) -> None:
+    def __init__(self, log_to_console: bool = True, writer: Optional[Any] = None,
+                 io: Optional[Any] = None) -> None:
         """
         Initialize the GameLogger.
         
         Args:
             log_to_console: Whether to output logs to the console
+            writer: Optional ``log_sinks.BufferedLogWriter``. When given, raw
+                records are queued on it instead of being formatted and printed.
+            io: Optional ``game_io.GameIO`` for console logging; defaults to
+                the console
         """
         self.log_to_console = log_to_console
+        self.writer = writer
+        self.io = io
         
     def log_combat(self, attacker: str, defender: str, damage: int, is_critical: bool = False) -> None:
         """
@@ -35,9 +44,40 @@ class GameLogger:
             damage: Amount of damage dealt
             is_critical: Whether the attack was a critical hit
         """
+        if self.writer is not None:
+            self.writer.submit((time.time(), attacker, defender, damage, is_critical))
+            return
+        if not self.log_to_console:
+            return
+        io = self.io
+        if io is None:
+            from rpg_game.game_io import get_console_io
+            io = get_console_io()
+        if io.quiet:
+            return
         timestamp = datetime.datetime.now().strftime("%H:%M:%S")
         crit_msg = " (CRITICAL!)" if is_critical else ""
-        log_message = f"[{timestamp}] COMBAT LOG: {attacker} attacks {defender} for {damage} damage{crit_msg}"
-        if self.log_to_console:
-            print(log_message)
-        # Future enhancement: could log to file, database, etc.
+        io.say("[{}] COMBAT LOG: {} attacks {} for {} damage{}",
+               timestamp, attacker, defender, damage, crit_msg)
+
+    def begin_fight(self, player: Any, enemy: Any) -> None:
+        """
+        Mark the start of a fight and record both combatants' health.
+
+        Only buffered writers receive fight markers; console output is
+        unchanged.
+
+        Args:
+            player: The player character
+            enemy: The enemy being fought
+        """
+        if self.writer is not None:
+            now = time.time()
+            submit = self.writer.submit
+            submit((now, player.name, enemy.name, player.health, FIGHT_START))
+            submit((now, enemy.name, player.name, enemy.health, FIGHT_START))
+
+    def close(self) -> None:
+        """Flush and close the writer, if any."""
+        if self.writer is not None:
+            self.writer.close()
@@ -0,0 +1,403 @@
+"""
+Buffered combat-log output for the RPG game.
+
+``GameLogger`` can hand combat records to a ``BufferedLogWriter`` instead of
+printing them. The writer appends the raw record to a bounded in-memory
+queue, which is cheap, and a background thread drains it in batches into a
+pluggable ``LogSink``. All formatting and I/O happens on that thread.
+
+A record is the tuple ``(timestamp, attacker, defender, damage, flags)``.
+``flags`` is a bit set of ``CRITICAL`` and ``FIGHT_START``; plain booleans
+work for ordinary hits. ``FIGHT_START`` records mark the start of a fight
+and carry a combatant's starting health in the ``damage`` field.
+"""
+
+import os
+import sys
+import threading
+import time
+import zlib
+from collections import deque
+from typing import Any, List, Optional, Sequence, TextIO, Tuple
+
+from rpg_game.compression import NONE, ZLIB, check_codec, open_compressed
+
+LogRecord = Tuple[float, str, str, int, int]
+
+# Record flags
+CRITICAL = 1
+FIGHT_START = 2
+
+# Backpressure policies for a full queue
+BLOCK = "block"
+DROP_OLDEST = "drop-oldest"
+SAMPLE = "sample"
+POLICIES = (BLOCK, DROP_OLDEST, SAMPLE)
+
+
+def _format_line(clock: str, record: LogRecord) -> str:
+    """Format ``record`` using a precomputed clock string."""
+    _, attacker, defender, damage, flags = record
+    if flags & FIGHT_START:
+        return f"[{clock}] FIGHT: {attacker} ({damage} HP) faces {defender}"
+    crit_msg = " (CRITICAL!)" if flags & CRITICAL else ""
+    return (
+        f"[{clock}] COMBAT LOG: {attacker} attacks {defender} "
+        f"for {damage} damage{crit_msg}"
+    )
+
+
+def format_record(record: LogRecord) -> str:
+    """
+    Format a record the same way GameLogger prints it.
+
+    Args:
+        record: The combat record
+
+    Returns:
+        str: The log line without a trailing newline
+    """
+    return _format_line(time.strftime("%H:%M:%S", time.localtime(record[0])), record)
+
+
+def format_records(records: Sequence[LogRecord]) -> str:
+    """
+    Format a batch of records as newline-terminated log lines.
+
+    The clock string is computed once per distinct second rather than once
+    per record, which matters when thousands of events share a second.
+
+    Args:
+        records: The combat records
+
+    Returns:
+        str: The formatted lines
+    """
+    lines = []
+    last_second = None
+    clock = ""
+    for record in records:
+        second = int(record[0])
+        if second != last_second:
+            last_second = second
+            clock = time.strftime("%H:%M:%S", time.localtime(second))
+        lines.append(_format_line(clock, record) + "\n")
+    return "".join(lines)
+
+
+class LogSink:
+    """Base class for destinations of combat records."""
+
+    def write_batch(self, records: Sequence[LogRecord]) -> None:
+        """
+        Write a batch of records.
+
+        Args:
+            records: The records, oldest first
+        """
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        """Flush buffered output to its destination."""
+
+    def close(self) -> None:
+        """Flush and release any resources."""
+        self.flush()
+
+
+class ConsoleSink(LogSink):
+    """Writes formatted records to a text stream (stdout by default)."""
+
+    def __init__(self, stream: Optional[TextIO] = None) -> None:
+        """
+        Initialize the sink.
+
+        Args:
+            stream: Text stream to write to; defaults to ``sys.stdout``
+        """
+        self.stream = stream
+
+    def write_batch(self, records: Sequence[LogRecord]) -> None:
+        """Write the formatted records, one per line."""
+        stream = self.stream or sys.stdout
+        stream.write(format_records(records))
+
+    def flush(self) -> None:
+        """Flush the stream."""
+        (self.stream or sys.stdout).flush()
+
+
+class RotatingFileSink(LogSink):
+    """
+    Writes formatted records to a file, rotating it when it grows too large.
+
+    Rotated files are named ``<path>.1`` (newest) to ``<path>.<backup_count>``.
+
+    With ``compression`` set, output goes through a streaming ``zlib`` or
+    ``lzma`` compressor. ``max_bytes`` always counts bytes on disk; as a
+    compressed batch's size is only known once the compressor emits it,
+    compressed files are rotated before the first batch after they grow past
+    ``max_bytes`` rather than before one would overflow them. ``flush``
+    sync-flushes zlib output so it can be decompressed from disk; lzma streams
+    cannot be flushed, so their data reaches the disk as the compressor emits
+    blocks and on rotation or close. Read such logs back with
+    ``compression.iter_lines``.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 5,
+        compression: Optional[str] = None,
+        level: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the sink.
+
+        Args:
+            path: Path of the active log file
+            max_bytes: Size at which the file is rotated (0 disables rotation)
+            backup_count: Number of rotated files to keep
+            compression: ``"zlib"``, ``"lzma"`` or None for plain text
+            level: Compression level (0-9), None for the codec default
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.compression = check_codec(compression, level)
+        self.level = level
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = self._open()
+        self._size = os.path.getsize(self.path)
+
+    def _open(self) -> Any:
+        """Open the active log file for appending; ``_raw`` is the file on disk."""
+        self._raw = open(self.path, "ab")
+        if self.compression != NONE:
+            return open_compressed(self._raw, "ab", self.compression, self.level)
+        return self._raw
+
+    def _close(self) -> None:
+        """Close the active file, compressor first."""
+        self._file.close()
+        self._raw.close()
+
+    def _rotate(self) -> None:
+        """Shift rotated files up by one and start a new active file."""
+        self._close()
+        if self.backup_count > 0:
+            for index in range(self.backup_count - 1, 0, -1):
+                source = f"{self.path}.{index}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.path}.{index + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._file = self._open()
+        self._size = 0
+
+    def _encode(self, records: Sequence[LogRecord]) -> bytes:
+        """Encode a batch of records as bytes."""
+        return format_records(records).encode("utf-8")
+
+    def write_batch(self, records: Sequence[LogRecord]) -> None:
+        """Append the records, rotating first if the file would overflow."""
+        data = self._encode(records)
+        plain = self.compression == NONE
+        incoming = len(data) if plain else 0
+        if self.max_bytes and self._size and self._size + incoming > self.max_bytes:
+            self._rotate()
+        self._file.write(data)
+        if plain:
+            self._size += len(data)
+        else:
+            self._size = self._raw.tell()
+
+    def flush(self) -> None:
+        """Flush the active file; zlib output is sync-flushed, lzma cannot be."""
+        if self.compression == ZLIB:
+            self._file.flush(zlib.Z_SYNC_FLUSH)
+        self._raw.flush()
+        self._size = self._raw.tell()
+
+    def close(self) -> None:
+        """Flush and close the active file."""
+        if not self._raw.closed:
+            self._close()
+
+
+class BufferedLogWriter:
+    """
+    Bounded in-memory queue drained into a sink by a background thread.
+
+    ``submit`` only appends to a deque. When the queue is full, the
+    backpressure policy decides what happens:
+
+    - ``"block"``: wait until the writer thread has made room
+    - ``"drop-oldest"``: discard the oldest queued record
+    - ``"sample"``: keep one of every ``sample_every`` overflowing records,
+      discarding the oldest queued record to make room for it
+    """
+
+    def __init__(
+        self,
+        sink: LogSink,
+        capacity: int = 65536,
+        policy: str = BLOCK,
+        batch_size: int = 1024,
+        flush_interval: float = 0.05,
+        sample_every: int = 10,
+    ) -> None:
+        """
+        Initialize the writer and start its background thread.
+
+        Args:
+            sink: Destination for the records
+            capacity: Maximum number of queued records
+            policy: One of ``"block"``, ``"drop-oldest"`` or ``"sample"``
+            batch_size: Number of queued records that wakes the writer early
+            flush_interval: Longest time (seconds) a record waits in the queue
+            sample_every: Sampling rate for the ``"sample"`` policy
+
+        Raises:
+            ValueError: If the policy or sizes are invalid
+        """
+        if policy not in POLICIES:
+            raise ValueError(
+                f"Unknown backpressure policy {policy!r}; expected one of {POLICIES}"
+            )
+        if capacity < 1 or batch_size < 1 or sample_every < 1:
+            raise ValueError("capacity, batch_size and sample_every must be positive")
+        self.sink = sink
+        self.capacity = capacity
+        self.policy = policy
+        self.batch_size = min(batch_size, capacity)
+        self.flush_interval = flush_interval
+        self.sample_every = sample_every
+        self.dropped = 0
+        self.written = 0
+        self._overflowed = 0
+        self._queue: deque = deque()
+        self._wake = threading.Event()
+        self._space = threading.Condition()
+        self._drained = threading.Condition()
+        self._closed = False
+        self._cycles_started = 0
+        self._cycles_done = 0
+        self._thread = threading.Thread(
+            target=self._run, name="rpg-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, record: LogRecord) -> None:
+        """
+        Queue a record for writing.
+
+        Args:
+            record: The combat record
+        """
+        queue = self._queue
+        size = len(queue)
+        if size < self.capacity:
+            queue.append(record)
+            if size == self.batch_size:
+                self._wake.set()
+        else:
+            self._overflow(record)
+
+    def _overflow(self, record: LogRecord) -> None:
+        """Apply the backpressure policy to a record that did not fit."""
+        queue = self._queue
+        if self.policy == BLOCK:
+            with self._space:
+                while len(queue) >= self.capacity and not self._closed:
+                    self._wake.set()
+                    self._space.wait(self.flush_interval)
+            queue.append(record)
+            return
+        if self.policy == SAMPLE:
+            self._overflowed += 1
+            if self._overflowed % self.sample_every:
+                self.dropped += 1
+                return
+        try:
+            queue.popleft()
+            self.dropped += 1
+        except IndexError:
+            pass
+        queue.append(record)
+
+    def _drain(self) -> None:
+        """Write everything currently queued to the sink, in batches."""
+        queue = self._queue
+        while queue:
+            count = min(len(queue), self.batch_size)
+            batch: List[LogRecord] = [queue.popleft() for _ in range(count)]
+            try:
+                self.sink.write_batch(batch)
+                self.written += count
+            except Exception as e:
+                self.dropped += count
+                print(f"Error writing combat log: {e}", file=sys.stderr)
+            with self._space:
+                self._space.notify_all()
+        try:
+            self.sink.flush()
+        except Exception as e:
+            print(f"Error flushing combat log: {e}", file=sys.stderr)
+
+    def _run(self) -> None:
+        """Background thread body."""
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            closing = self._closed
+            with self._drained:
+                self._cycles_started += 1
+                cycle = self._cycles_started
+            self._drain()
+            with self._drained:
+                self._cycles_done = cycle
+                self._drained.notify_all()
+            if closing:
+                return
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """
+        Block until every record submitted so far has reached the sink.
+
+        Args:
+            timeout: Optional maximum time to wait in seconds
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._drained:
+            # Wait for a drain cycle that starts after this call
+            target = self._cycles_started + 1
+            while self._cycles_done < target and self._thread.is_alive():
+                self._wake.set()
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return
+                self._drained.wait(
+                    self.flush_interval
+                    if remaining is None
+                    else min(remaining, self.flush_interval)
+                )
+
+    def close(self) -> None:
+        """Drain the queue, stop the writer thread and close the sink."""
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._thread.join()
+        self.sink.close()
+
+    def __enter__(self) -> "BufferedLogWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,279 @@
+"""
+Opt-in instrumentation for the game loop.
+
+``Metrics`` collects counters and per-phase latency histograms. ``Game``
+only touches it when one is passed in, so a game without metrics pays a
+single ``None`` check per phase.
+
+Phases nest: each observation records the phase's own time, excluding
+nested phases. Time spent waiting for the player (the ``input`` phase) is
+therefore not counted against the ``menu`` or ``combat_turn`` phase that
+prompted for it, which keeps rendering and game logic apart from think time.
+
+Snapshots can be written in the Prometheus text exposition format and as a
+JSON summary, and ``export_at_exit`` writes both when the process ends.
+Set ``RPG_METRICS_DIR`` to enable this for ``python -m rpg_game``.
+"""
+
+import atexit
+import json
+import os
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence
+
+# Upper bounds of the latency buckets in seconds (the last bucket is +Inf)
+DEFAULT_BUCKETS = (
+    0.00001,
+    0.00005,
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+# Game phases timed by Game
+MENU = "menu"
+INTRO = "intro"
+COMBAT_TURN = "combat_turn"
+SAVE = "save"
+LOAD = "load"
+RENDER = "render"
+INPUT = "input"
+
+PHASE_METRIC = "rpg_phase_seconds"
+METRICS_DIR_ENV = "RPG_METRICS_DIR"
+
+
+class Histogram:
+    """Fixed-bucket latency histogram."""
+
+    __slots__ = ("buckets", "counts", "count", "sum", "max")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """
+        Initialize an empty histogram.
+
+        Args:
+            buckets: Increasing bucket upper bounds in seconds
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile as the upper bound of the bucket holding it.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            float: The estimate (the maximum for the +Inf bucket, 0 if empty)
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                return self.buckets[index] if index < len(self.buckets) else self.max
+        return self.max
+
+
+class _PhaseTimer:
+    """Context manager timing one phase of a ``Metrics`` instance."""
+
+    __slots__ = ("_metrics", "_name", "_start")
+
+    def __init__(self, metrics: "Metrics", name: str) -> None:
+        self._metrics = metrics
+        self._name = name
+
+    def __enter__(self) -> None:
+        self._metrics._nested.append(0)
+        self._start = time.perf_counter_ns()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        elapsed = time.perf_counter_ns() - self._start
+        nested = self._metrics._nested
+        own = elapsed - nested.pop()
+        if nested:
+            nested[-1] += elapsed
+        self._metrics.observe(self._name, own / 1e9)
+
+
+class Metrics:
+    """Counters and phase latency histograms for one process."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """
+        Initialize empty metrics.
+
+        Args:
+            buckets: Bucket upper bounds in seconds for phase histograms
+        """
+        self.buckets = tuple(buckets)
+        self.counters: Dict[str, int] = {}
+        self.phases: Dict[str, Histogram] = {}
+        # Time spent in nested phases, one entry per open phase
+        self._nested: List[int] = []
+
+    def inc(self, name: str, amount: int = 1) -> None:
+        """
+        Increase a counter.
+
+        Args:
+            name: Counter name, e.g. ``"combat_turns"``
+            amount: Amount to add
+        """
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def observe(self, phase: str, seconds: float) -> None:
+        """
+        Record a duration for a phase.
+
+        Args:
+            phase: Phase name
+            seconds: Duration in seconds
+        """
+        histogram = self.phases.get(phase)
+        if histogram is None:
+            histogram = self.phases[phase] = Histogram(self.buckets)
+        histogram.observe(seconds)
+
+    def phase(self, name: str) -> _PhaseTimer:
+        """
+        Return a context manager that times one run of a phase.
+
+        Args:
+            name: Phase name, e.g. ``metrics.RENDER``
+
+        Returns:
+            A context manager recording the phase's own time on exit
+        """
+        return _PhaseTimer(self, name)
+
+    def to_prometheus(self) -> str:
+        """
+        Render a snapshot in the Prometheus text exposition format.
+
+        Returns:
+            str: The exposition text
+        """
+        lines = []
+        for name in sorted(self.counters):
+            metric = f"rpg_{name}_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {self.counters[name]}")
+        if self.phases:
+            lines.append(
+                f"# HELP {PHASE_METRIC} Time spent in each game phase, "
+                "excluding nested phases"
+            )
+            lines.append(f"# TYPE {PHASE_METRIC} histogram")
+        for phase in sorted(self.phases):
+            histogram = self.phases[phase]
+            cumulative = 0
+            bounds = [repr(bound) for bound in histogram.buckets] + ["+Inf"]
+            for bound, bucket_count in zip(bounds, histogram.counts):
+                cumulative += bucket_count
+                lines.append(
+                    f'{PHASE_METRIC}_bucket{{phase="{phase}",le="{bound}"}} '
+                    f"{cumulative}"
+                )
+            lines.append(f'{PHASE_METRIC}_sum{{phase="{phase}"}} {histogram.sum!r}')
+            lines.append(f'{PHASE_METRIC}_count{{phase="{phase}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Summarize the metrics.
+
+        Returns:
+            Dict[str, Any]: Counters, and per phase the count, total, mean,
+            max and estimated p50/p95 in seconds
+        """
+        return {
+            "counters": dict(self.counters),
+            "phases": {
+                phase: {
+                    "count": histogram.count,
+                    "total": histogram.sum,
+                    "mean": histogram.sum / histogram.count if histogram.count else 0.0,
+                    "max": histogram.max,
+                    "p50": histogram.quantile(0.5),
+                    "p95": histogram.quantile(0.95),
+                }
+                for phase, histogram in sorted(self.phases.items())
+            },
+        }
+
+    def write(
+        self, prometheus_path: Optional[str] = None, json_path: Optional[str] = None
+    ) -> None:
+        """
+        Write the Prometheus snapshot and/or the JSON summary.
+
+        Args:
+            prometheus_path: Where to write the exposition text
+            json_path: Where to write the JSON summary
+        """
+        for path in (prometheus_path, json_path):
+            directory = os.path.dirname(path) if path else ""
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        if prometheus_path:
+            with open(prometheus_path, "w", encoding="utf-8") as f:
+                f.write(self.to_prometheus())
+        if json_path:
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(self.summary(), f, indent=2)
+
+    def export_at_exit(self, directory: str) -> None:
+        """
+        Write ``metrics.prom`` and ``metrics.json`` to ``directory`` at exit.
+
+        Args:
+            directory: Directory for the two files
+        """
+        atexit.register(
+            self.write,
+            os.path.join(directory, "metrics.prom"),
+            os.path.join(directory, "metrics.json"),
+        )
+
+
+def from_environment() -> Optional[Metrics]:
+    """
+    Create metrics exported at exit if ``RPG_METRICS_DIR`` is set.
+
+    Returns:
+        Metrics: The enabled metrics, or None if instrumentation is off
+    """
+    directory = os.environ.get(METRICS_DIR_ENV)
+    if not directory:
+        return None
+    metrics = Metrics()
+    metrics.export_at_exit(directory)
+    return metrics
@@ -0,0 +1,305 @@
+"""
+Diffing ANSI frame renderer for the RPG game.
+
+Screens are composed in memory as a ``Frame`` of styled cells. ``ScreenRenderer``
+compares each frame with the one it drew before and writes only the cells that
+changed, as cursor moves and ANSI escape sequences, in a single
+``stream.write`` followed by one flush. No subprocess is ever spawned.
+
+After each frame the cursor is parked on the line below it and the rest of the
+screen is erased, so ordinary ``print`` output can follow a frame and is
+cleared again by the next one.
+"""
+
+import asyncio
+import sys
+import time
+from typing import Callable, List, Optional, Protocol, Tuple
+
+# Escape sequences
+ESC = "\033["
+RESET = ESC + "0m"
+HOME = ESC + "H"
+CLEAR = HOME + ESC + "2J"
+ERASE_BELOW = ESC + "J"
+
+GREEN = ESC + "92m"
+YELLOW = ESC + "93m"
+RED = ESC + "91m"
+BLUE = ESC + "94m"
+
+# A cell is (character, SGR style); "" is the default style
+Cell = Tuple[str, str]
+BLANK: Cell = (" ", "")
+
+BAR_FULL = "█"
+BAR_EMPTY = "░"
+
+DEFAULT_FPS = 30
+
+
+class TextStream(Protocol):
+    """What a renderer draws to: ``sys.stdout``, a network port or a sink."""
+
+    def write(self, __text: str) -> object:
+        """Write ``text``."""
+
+    def flush(self) -> object:
+        """Send anything buffered."""
+
+
+def cursor_to(row: int, col: int) -> str:
+    """Return the escape sequence moving the cursor to a 0-based cell."""
+    return f"{ESC}{row + 1};{col + 1}H"
+
+
+class Frame:
+    """A fixed-size grid of styled character cells."""
+
+    __slots__ = ("width", "height", "cells")
+
+    def __init__(self, width: int, height: int) -> None:
+        """
+        Initialize a blank frame.
+
+        Args:
+            width: Number of columns
+            height: Number of rows
+        """
+        self.width = width
+        self.height = height
+        self.cells: List[List[Cell]] = [[BLANK] * width for _ in range(height)]
+
+    def text(self, row: int, col: int, text: str, style: str = "") -> int:
+        """
+        Write text into the frame, clipping it at the right edge.
+
+        Args:
+            row: Row to write on (rows outside the frame are ignored)
+            col: Starting column
+            text: The text (a single line)
+            style: SGR escape sequence for the text, e.g. ``renderer.RED``
+
+        Returns:
+            int: The column after the written text
+        """
+        if not 0 <= row < self.height:
+            return col
+        line = self.cells[row]
+        for char in text[: max(0, self.width - col)]:
+            line[col] = (char, style)
+            col += 1
+        return col
+
+    def lines(self) -> List[str]:
+        """Return the frame's rows as plain text without trailing spaces."""
+        return ["".join(char for char, _ in row).rstrip() for row in self.cells]
+
+
+def health_bar(current: float, maximum: float, width: int = 20) -> Tuple[str, str]:
+    """
+    Build a health bar.
+
+    Args:
+        current: Current health
+        maximum: Health of a full bar
+        width: Number of cells in the bar
+
+    Returns:
+        Tuple[str, str]: The bar text and its style (green, yellow or red)
+    """
+    fraction = min(1.0, max(0.0, current / maximum)) if maximum > 0 else 0.0
+    filled = int(round(fraction * width))
+    style = GREEN if fraction > 0.5 else YELLOW if fraction > 0.25 else RED
+    return BAR_FULL * filled + BAR_EMPTY * (width - filled), style
+
+
+class ScreenRenderer:
+    """
+    Draws frames to a terminal, writing only what changed since the last one.
+
+    Attributes:
+        fps: Frame rate of animations
+        animation: Duration in seconds of health-bar animations (0 disables them)
+        frames: Number of frames presented
+        cells_written: Number of cells written in total
+        headless: True if frames are never shown, so callers can skip
+            composing them
+    """
+
+    headless = False
+
+    def __init__(
+        self,
+        stream: Optional[TextStream] = None,
+        fps: int = DEFAULT_FPS,
+        animation: float = 0.0,
+    ) -> None:
+        """
+        Initialize the renderer.
+
+        Args:
+            stream: Output stream (defaults to the current ``sys.stdout``)
+            fps: Frame rate of animations
+            animation: Duration in seconds of health-bar animations
+        """
+        self.stream = stream
+        self.fps = fps
+        self.animation = animation
+        self.frames = 0
+        self.cells_written = 0
+        self._previous: Optional[Frame] = None
+
+    def _write(self, data: str) -> None:
+        """Write ``data`` and flush it in one go."""
+        stream: TextStream = self.stream or sys.stdout
+        stream.write(data)
+        stream.flush()
+
+    def clear(self) -> None:
+        """Clear the screen and forget the previous frame."""
+        self._previous = None
+        self._write(CLEAR)
+
+    def invalidate(self) -> None:
+        """Force the next frame to be drawn in full."""
+        self._previous = None
+
+    def present(self, frame: Frame) -> None:
+        """
+        Draw a frame, writing only the cells that differ from the previous one.
+
+        Args:
+            frame: The frame to draw
+        """
+        previous = self._previous
+        out = []
+        if (
+            previous is None
+            or previous.width != frame.width
+            or previous.height != frame.height
+        ):
+            out.append(CLEAR)
+            previous = None
+        written = 0
+        width = frame.width
+        for row_index, row in enumerate(frame.cells):
+            old = previous.cells[row_index] if previous is not None else None
+            col = 0
+            while col < width:
+                if old is not None and row[col] == old[col]:
+                    col += 1
+                    continue
+                start = col
+                while col < width and (old is None or row[col] != old[col]):
+                    col += 1
+                out.append(cursor_to(row_index, start))
+                style = None
+                for char, cell_style in row[start:col]:
+                    if cell_style != style:
+                        out.append(RESET + cell_style)
+                        style = cell_style
+                    out.append(char)
+                out.append(RESET)
+                written += col - start
+        out.append(cursor_to(frame.height, 0) + ERASE_BELOW)
+        self._write("".join(out))
+        self._previous = frame
+        self.frames += 1
+        self.cells_written += written
+
+    def animate(
+        self,
+        compose: Callable[[float], Frame],
+        duration: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> int:
+        """
+        Present a sequence of frames at the renderer's frame rate.
+
+        Args:
+            compose: Builds the frame for progress ``t`` in ``(0, 1]``
+            duration: Length of the animation in seconds (default ``animation``)
+            clock: Monotonic clock
+            sleep: Sleep function
+
+        Returns:
+            int: Number of frames presented
+        """
+        duration = self.animation if duration is None else duration
+        count = max(1, int(duration * self.fps))
+        start = clock()
+        for index in range(1, count + 1):
+            self.present(compose(index / count))
+            delay = start + index / self.fps - clock()
+            if delay > 0 and index < count:
+                sleep(delay)
+        return count
+
+    async def animate_async(
+        self, compose: Callable[[float], Frame], duration: Optional[float] = None
+    ) -> int:
+        """
+        Like ``animate``, but waits between frames with ``asyncio.sleep``.
+
+        Args:
+            compose: Builds the frame for progress ``t`` in ``(0, 1]``
+            duration: Length of the animation in seconds (default ``animation``)
+
+        Returns:
+            int: Number of frames presented
+        """
+        duration = self.animation if duration is None else duration
+        count = max(1, int(duration * self.fps))
+        start = time.monotonic()
+        for index in range(1, count + 1):
+            self.present(compose(index / count))
+            delay = start + index / self.fps - time.monotonic()
+            if index < count:
+                await asyncio.sleep(max(0.0, delay))
+        return count
+
+
+class NullRenderer(ScreenRenderer):
+    """A renderer that draws nothing, for headless games."""
+
+    headless = True
+
+    def __init__(self) -> None:
+        """Initialize a renderer without an output stream."""
+        super().__init__()
+
+    def clear(self) -> None:
+        """Do nothing."""
+
+    def present(self, frame: Frame) -> None:
+        """Discard the frame."""
+
+    def animate(
+        self,
+        compose: Callable[[float], Frame],
+        duration: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> int:
+        """Present nothing."""
+        return 0
+
+    async def animate_async(
+        self, compose: Callable[[float], Frame], duration: Optional[float] = None
+    ) -> int:
+        """Present nothing."""
+        return 0
+
+
+# Renderer shared by console_utils and Game
+_renderer: Optional[ScreenRenderer] = None
+
+
+def get_renderer() -> ScreenRenderer:
+    """Return the shared renderer, creating it on first use."""
+    global _renderer
+    if _renderer is None:
+        _renderer = ScreenRenderer()
+    return _renderer
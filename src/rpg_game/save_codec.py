@@ -0,0 +1,412 @@
+"""
+Compact versioned binary codec for game saves.
+
+The JSON save written by ``Game.get_game_state`` repeats every key for every
+boss and must be parsed in full before anything can be used. This codec
+stores the same state as fixed-width records behind a small header and a
+section table, so a reader can decode just the player and fetch individual
+bosses on demand.
+
+File layout::
+
+    header         16 bytes   magic, schema version, section count
+    section table  16 bytes per section: id, offset, length, record count
+    STRINGS        u32 count, then (u16 length, UTF-8 bytes) per string
+    PLAYER         one 20-byte record
+    BOSSES         one 12-byte record per boss
+
+Older saves (the JSON format, schema version 0) are upgraded on load.
+"""
+
+import json
+import os
+import struct
+from typing import Any, Callable, Dict, Iterator, List, MutableSequence, Optional, Tuple
+
+from rpg_game.boss import Boss
+from rpg_game.save_game import SaveBackend, atomic_replace
+
+MAGIC = b"RPGSAVE\0"
+SCHEMA_VERSION = 1
+
+HEADER = struct.Struct("<8sHH4x")
+SECTION = struct.Struct("<HHIII")
+PLAYER_RECORD = struct.Struct("<Iiiii")
+BOSS_RECORD = struct.Struct("<Iii")
+_COUNT = struct.Struct("<I")
+_LENGTH = struct.Struct("<H")
+
+# Section ids
+STRINGS = 1
+PLAYER = 2
+BOSSES = 3
+
+# Name id used for a missing weapon
+NO_NAME = -1
+
+
+def _upgrade_v0(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Schema 0 (JSON) to 1: make sure the player has a weapon entry."""
+    player = state.get("player")
+    if player is not None:
+        weapon = player.setdefault("weapon", {})
+        weapon.setdefault("name", None)
+        weapon.setdefault("damage_bonus", 0)
+        player.setdefault("damage", 0)
+    state.setdefault("bosses", [])
+    return state
+
+
+# Upgraders from schema version N to N + 1
+UPGRADERS: Dict[int, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    0: _upgrade_v0,
+}
+
+
+def upgrade_state(state: Dict[str, Any], version: int) -> Dict[str, Any]:
+    """
+    Upgrade a decoded state to the current schema version.
+
+    Args:
+        state: The decoded state
+        version: The schema version it was written with
+
+    Returns:
+        Dict[str, Any]: The upgraded state
+
+    Raises:
+        ValueError: If the version is newer than this codec supports
+    """
+    if version > SCHEMA_VERSION:
+        raise ValueError(
+            f"Save uses schema version {version}; "
+            f"this game supports up to {SCHEMA_VERSION}"
+        )
+    while version < SCHEMA_VERSION:
+        state = UPGRADERS[version](state)
+        version += 1
+    return state
+
+
+def encode_state(game_state: Dict[str, Any]) -> bytes:
+    """
+    Encode a game state in the binary save format.
+
+    Args:
+        game_state: State as returned by ``Game.get_game_state``
+
+    Returns:
+        bytes: The encoded save
+    """
+    strings: List[str] = []
+    ids: Dict[str, int] = {}
+
+    def intern(name: Optional[str]) -> int:
+        if name is None:
+            return NO_NAME
+        name_id = ids.get(name)
+        if name_id is None:
+            name_id = ids[name] = len(strings)
+            strings.append(name)
+        return name_id
+
+    player_section = b""
+    player_count = 0
+    player = game_state.get("player")
+    if player:
+        weapon = player.get("weapon") or {}
+        player_section = PLAYER_RECORD.pack(
+            intern(player["name"]),
+            player["health"],
+            player.get("damage", 0),
+            intern(weapon.get("name")),
+            weapon.get("damage_bonus", 0),
+        )
+        player_count = 1
+
+    bosses = game_state.get("bosses") or []
+    boss_section = bytearray(BOSS_RECORD.size * len(bosses))
+    for index, boss in enumerate(bosses):
+        BOSS_RECORD.pack_into(
+            boss_section,
+            index * BOSS_RECORD.size,
+            intern(boss["name"]),
+            boss["health"],
+            boss["damage"],
+        )
+
+    string_parts = [_COUNT.pack(len(strings))]
+    for name in strings:
+        encoded = name.encode("utf-8")
+        string_parts.append(_LENGTH.pack(len(encoded)))
+        string_parts.append(encoded)
+    string_section = b"".join(string_parts)
+
+    sections = [
+        (STRINGS, string_section, len(strings)),
+        (PLAYER, player_section, player_count),
+        (BOSSES, bytes(boss_section), len(bosses)),
+    ]
+    offset = HEADER.size + SECTION.size * len(sections)
+    table = []
+    for section_id, data, count in sections:
+        table.append(SECTION.pack(section_id, 0, offset, len(data), count))
+        offset += len(data)
+    return b"".join(
+        [
+            HEADER.pack(MAGIC, SCHEMA_VERSION, len(sections)),
+            *table,
+            *(data for _, data, _ in sections),
+        ]
+    )
+
+
+class SaveFile:
+    """
+    Lazily decoded view of an encoded save.
+
+    Only the header and section table are parsed up front. The player and
+    individual bosses are decoded when they are asked for.
+    """
+
+    def __init__(self, data: bytes) -> None:
+        """
+        Parse the header and section table.
+
+        Args:
+            data: The encoded save
+
+        Raises:
+            ValueError: If the data is not a binary save or is too new
+        """
+        if len(data) < HEADER.size:
+            raise ValueError("Save data is too short")
+        magic, version, count = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Not a binary save file")
+        if version > SCHEMA_VERSION:
+            raise ValueError(
+                f"Save uses schema version {version}; "
+                f"this game supports up to {SCHEMA_VERSION}"
+            )
+        self.version = version
+        self._data = memoryview(data)
+        self._sections: Dict[int, Tuple[int, int, int]] = {}
+        for index in range(count):
+            section_id, _, offset, length, records = SECTION.unpack_from(
+                data, HEADER.size + index * SECTION.size
+            )
+            if offset + length > len(data):
+                raise ValueError("Save data is truncated")
+            self._sections[section_id] = (offset, length, records)
+        self._strings: Optional[List[str]] = None
+
+    def _string(self, name_id: int) -> Optional[str]:
+        """Return the string with id ``name_id`` (None for NO_NAME)."""
+        if name_id == NO_NAME or name_id == 0xFFFFFFFF:
+            return None
+        if self._strings is None:
+            self._strings = []
+            offset, _, count = self._sections[STRINGS]
+            offset += _COUNT.size
+            for _ in range(count):
+                (length,) = _LENGTH.unpack_from(self._data, offset)
+                offset += _LENGTH.size
+                self._strings.append(
+                    bytes(self._data[offset : offset + length]).decode("utf-8")
+                )
+                offset += length
+        return self._strings[name_id]
+
+    def player(self) -> Optional[Dict[str, Any]]:
+        """
+        Decode the player section.
+
+        Returns:
+            The player dictionary, or None if the save has no player
+        """
+        offset, _, count = self._sections.get(PLAYER, (0, 0, 0))
+        if not count:
+            return None
+        name_id, health, damage, weapon_id, bonus = PLAYER_RECORD.unpack_from(
+            self._data, offset
+        )
+        return {
+            "name": self._string(name_id),
+            "health": health,
+            "damage": damage,
+            "weapon": {"name": self._string(weapon_id), "damage_bonus": bonus},
+        }
+
+    @property
+    def boss_count(self) -> int:
+        """Number of boss records."""
+        return self._sections.get(BOSSES, (0, 0, 0))[2]
+
+    def boss(self, index: int) -> Dict[str, Any]:
+        """
+        Decode one boss record.
+
+        Args:
+            index: The boss index
+
+        Returns:
+            Dict[str, Any]: The boss dictionary
+        """
+        if not 0 <= index < self.boss_count:
+            raise IndexError("boss index out of range")
+        offset = self._sections[BOSSES][0] + index * BOSS_RECORD.size
+        name_id, health, damage = BOSS_RECORD.unpack_from(self._data, offset)
+        return {"name": self._string(name_id), "health": health, "damage": damage}
+
+    def iter_bosses(self) -> Iterator[Dict[str, Any]]:
+        """Decode boss records one at a time, in order."""
+        for index in range(self.boss_count):
+            yield self.boss(index)
+
+    def to_state(self) -> Dict[str, Any]:
+        """
+        Decode the whole save.
+
+        Returns:
+            Dict[str, Any]: The state in the ``Game.get_game_state`` layout
+        """
+        player = self.player()
+        if player is None:
+            return {}
+        return {"player": player, "bosses": list(self.iter_bosses())}
+
+
+def decode_state(data: bytes) -> Dict[str, Any]:
+    """
+    Decode a save in either the binary or the legacy JSON format.
+
+    Args:
+        data: The file contents
+
+    Returns:
+        Dict[str, Any]: The upgraded state
+    """
+    if data[: len(MAGIC)] == MAGIC:
+        save = SaveFile(data)
+        return upgrade_state(save.to_state(), save.version)
+    return upgrade_state(json.loads(data.decode("utf-8")), 0)
+
+
+class BossRecordList(MutableSequence):
+    """
+    List of bosses that builds each ``Boss`` from its record on first access.
+
+    ``Game`` only ever looks at the next boss, so most bosses of a long
+    campaign are never materialized until they are fought.
+    """
+
+    def __init__(
+        self, save: SaveFile, rng: Optional[Any] = None, io: Optional[Any] = None
+    ) -> None:
+        """
+        Initialize the list.
+
+        Args:
+            save: The save holding the boss records
+            rng: Random source handed to each Boss
+            io: I/O port handed to each Boss
+        """
+        self._save = save
+        self._rng = rng
+        self._io = io
+        # Each slot is either a Boss or the record index still to decode
+        self._items: List[Any] = list(range(save.boss_count))
+
+    def _materialize(self, index: int) -> Boss:
+        item = self._items[index]
+        if isinstance(item, Boss):
+            return item
+        data = self._save.boss(item)
+        boss = self._items[index] = Boss(
+            data["name"], data["health"], data["damage"], rng=self._rng, io=self._io
+        )
+        return boss
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [
+                self._materialize(i) for i in range(*index.indices(len(self._items)))
+            ]
+        if index < 0:
+            index += len(self._items)
+        if not 0 <= index < len(self._items):
+            raise IndexError("boss index out of range")
+        return self._materialize(index)
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        self._items[index] = value
+
+    def __delitem__(self, index: Any) -> None:
+        del self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def insert(self, index: int, value: Boss) -> None:
+        self._items.insert(index, value)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, BossRecordList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"BossRecordList({len(self)} bosses)"
+
+
+class BinarySaveBackend(SaveBackend):
+    """Stores the game state in the binary save format."""
+
+    def __init__(self, path: str) -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            path: Path of the save file
+        """
+        self.path = str(path)
+
+    def save(self, game_state: Dict[str, Any]) -> None:
+        """Encode the state and atomically replace the save file."""
+        data = encode_state(game_state)
+        with atomic_replace(self.path) as temporary:
+            with open(temporary, "wb") as f:
+                f.write(data)
+
+    def _read(self) -> Optional[bytes]:
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Decode the whole save (upgrading legacy JSON saves)."""
+        data = self._read()
+        return decode_state(data) if data is not None else None
+
+    def load_lazy(self) -> Optional[SaveFile]:
+        """
+        Open the save without decoding its sections.
+
+        Legacy JSON saves are upgraded and re-encoded in memory first.
+
+        Returns:
+            SaveFile: A lazily decoded view, or None if there is no save
+        """
+        data = self._read()
+        if data is None:
+            return None
+        if data[: len(MAGIC)] != MAGIC:
+            data = encode_state(decode_state(data))
+        return SaveFile(data)
+
+    def delete(self) -> None:
+        """Remove the save file if it exists."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
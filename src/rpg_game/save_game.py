@@ -2,20 +2,192 @@
 Save and load game functionality.
 
 This module provides functions to save the game state to a file and load it back.
+By default the state is written as a JSON document. Other storage backends
+(see ``save_journal``) can be installed with ``set_save_backend``.
 """
 
+import copy
 import json
 import os
-from typing import Dict, Any, Optional, Callable
+import tempfile
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, Optional, Callable
 from pathlib import Path
 
-# Default save file location
-_SAVE_DIR = os.path.join(str(Path.home()), "rpg_saves")
-_SAVE_FILE = os.path.join(_SAVE_DIR, "save.json")
+from rpg_game.compression import check_codec, open_compressed
+
+# Save file location set by set_save_paths; None means ~/rpg_saves/save.json,
+# resolved on use so it follows the current home directory
+_SAVE_DIR: Optional[str] = None
+_SAVE_FILE: Optional[str] = None
 
 # Allow tests to override these values
-_get_save_dir = lambda: _SAVE_DIR
-_get_save_file = lambda: _SAVE_FILE
+_get_save_dir = lambda: (_SAVE_DIR if _SAVE_DIR is not None
+                         else os.path.join(str(Path.home()), "rpg_saves"))
+_get_save_file = lambda: (_SAVE_FILE if _SAVE_FILE is not None
+                          else os.path.join(_get_save_dir(), "save.json"))
+
+
+def fsync_directory(path: str) -> None:
+    """Flush a directory entry so renames survive a crash (POSIX only)."""
+    if hasattr(os, "O_DIRECTORY"):
+        fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+@contextmanager
+def atomic_replace(path: str) -> Iterator[str]:
+    """
+    Yield a temporary path next to ``path`` and move it into place afterwards.
+
+    The caller writes the temporary file inside the ``with`` block. When the
+    block finishes, the file is fsynced and renamed over ``path`` and the
+    directory is flushed, so readers and crashes see either the old file or
+    the complete new one. If the block raises, the temporary file is removed.
+
+    Args:
+        path: Path of the file to replace
+
+    Yields:
+        str: Path of the temporary file to write
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    fd, temporary = tempfile.mkstemp(dir=directory or None,
+                                     prefix=os.path.basename(path) + ".",
+                                     suffix=".tmp")
+    os.close(fd)
+    try:
+        yield temporary
+        with open(temporary, "rb+") as f:
+            os.fsync(f.fileno())
+        os.replace(temporary, path)
+    except BaseException:
+        os.remove(temporary)
+        raise
+    fsync_directory(directory or os.curdir)
+
+
+class SaveBackend:
+    """
+    Base class for save storage backends.
+
+    Backends raise ``OSError`` or ``ValueError`` on failure; the module-level
+    functions turn those into the ``False``/``None`` results callers expect.
+    """
+
+    def save(self, game_state: Dict[str, Any]) -> None:
+        """Persist ``game_state``."""
+        raise NotImplementedError
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Return the saved state, or None if there is no save."""
+        raise NotImplementedError
+
+    def delete(self) -> None:
+        """Remove the save if it exists."""
+        raise NotImplementedError
+
+
+class JsonFileBackend(SaveBackend):
+    """
+    Stores the game state as a pretty-printed JSON document.
+
+    The document can be written through streaming ``zlib`` or ``lzma``
+    compression. Loading detects the codec, so plain and compressed saves
+    can both be read whatever the backend is configured to write.
+    """
+
+    def __init__(self, path: str, compression: Optional[str] = None,
+                 level: Optional[int] = None) -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            path: Path of the JSON save file
+            compression: ``"zlib"``, ``"lzma"`` or None for plain JSON
+            level: Compression level (0-9), None for the codec default
+        """
+        self.path = str(path)
+        self.compression = check_codec(compression, level)
+        self.level = level
+
+    def save(self, game_state: Dict[str, Any]) -> None:
+        """
+        Write the whole state to the save file.
+
+        The document is written with ``atomic_replace``, so readers never
+        see a partly written save.
+        """
+        with atomic_replace(self.path) as temporary:
+            with open_compressed(temporary, 'wt', self.compression, self.level) as f:
+                json.dump(game_state, f, indent=2)
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Read the state from the save file, if it exists."""
+        if not os.path.exists(self.path):
+            return None
+        with open_compressed(self.path, 'rt') as f:
+            state: Dict[str, Any] = json.load(f)
+        return state
+
+    def delete(self) -> None:
+        """Remove the save file if it exists."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class MemoryBackend(SaveBackend):
+    """Keeps the saved state in memory, for headless and scripted games."""
+
+    def __init__(self) -> None:
+        """Initialize an empty backend."""
+        self.state: Optional[Dict[str, Any]] = None
+
+    def save(self, game_state: Dict[str, Any]) -> None:
+        """Keep a copy of ``game_state``."""
+        self.state = copy.deepcopy(game_state)
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Return a copy of the saved state, if any."""
+        return copy.deepcopy(self.state)
+
+    def delete(self) -> None:
+        """Forget the saved state."""
+        self.state = None
+
+
+# Backend used by the module-level functions (None means the JSON save file)
+_backend: Optional[SaveBackend] = None
+
+
+def set_save_backend(backend: Optional[SaveBackend]) -> Optional[SaveBackend]:
+    """
+    Install the backend used by save_game, load_game and delete_save.
+
+    Args:
+        backend: The backend to use, or None to restore the JSON save file
+
+    Returns:
+        The previously installed backend (None for the JSON save file)
+    """
+    global _backend
+    previous, _backend = _backend, backend
+    return previous
+
+
+def get_save_backend() -> SaveBackend:
+    """
+    Return the backend currently used by the module-level functions.
+
+    Returns:
+        SaveBackend: The installed backend, or a JSON backend for the save file
+    """
+    return _backend if _backend is not None else JsonFileBackend(_get_save_file())
 
 def set_save_paths(save_dir: str, save_file: str) -> None:
     """
@@ -35,7 +207,7 @@ def ensure_save_dir() -> None:
 
 def save_game(game_state: Dict[str, Any]) -> bool:
     """
-    Save the game state to a file.
+    Save the game state with the installed backend (the JSON save file by default).
     
     Args:
         game_state: Dictionary containing the game state to save
@@ -44,44 +216,34 @@ def save_game(game_state: Dict[str, Any]) -> bool:
         bool: True if save was successful, False otherwise
     """
     try:
-        ensure_save_dir()
-        save_file = _get_save_file()
-        with open(save_file, 'w', encoding='utf-8') as f:
-            json.dump(game_state, f, indent=2)
+        get_save_backend().save(game_state)
         return True
-    except (IOError, OSError, json.JSONDecodeError) as e:
+    except (IOError, OSError, ValueError) as e:
         print(f"Error saving game: {e}")
         return False
 
 def load_game() -> Optional[Dict[str, Any]]:
     """
-    Load the game state from a file.
+    Load the game state with the installed backend (the JSON save file by default).
     
     Returns:
         Optional[Dict[str, Any]]: The loaded game state, or None if loading failed
     """
     try:
-        save_file = _get_save_file()
-        if not os.path.exists(save_file):
-            return None
-            
-        with open(save_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except (IOError, OSError, json.JSONDecodeError) as e:
+        return get_save_backend().load()
+    except (IOError, OSError, ValueError) as e:
         print(f"Error loading game: {e}")
         return None
 
 def delete_save() -> bool:
     """
-    Delete the save file if it exists.
+    Delete the save of the installed backend (the JSON save file by default).
     
     Returns:
-        bool: True if file was deleted or didn't exist, False if an error occurred
+        bool: True if the save was deleted or didn't exist, False if an error occurred
     """
     try:
-        save_file = _get_save_file()
-        if os.path.exists(save_file):
-            os.remove(save_file)
+        get_save_backend().delete()
         return True
     except OSError as e:
         print(f"Error deleting save file: {e}")
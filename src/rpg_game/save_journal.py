@@ -0,0 +1,319 @@
+"""
+Append-only journaled save storage for the RPG game.
+
+Rewriting the whole save document on every save costs time in proportion to
+the size of the game state, and a crash mid-write can leave a torn file.
+``JournalSaveBackend`` instead appends a small delta record (only the fields
+that changed since the previous save) to a journal and fsyncs it. Once the
+journal holds enough records, a background thread folds the current state
+into a snapshot, which is written to a temporary file and atomically renamed
+into place.
+
+Directory layout::
+
+    snapshot.json       {"generation": G, "state": {...}}
+    journal.<G>.log     one "<crc32> <json delta>" line per save
+
+Loading replays the snapshot plus every journal of generation G or later.
+A torn or corrupt trailing record is detected by its checksum and dropped.
+"""
+
+import copy
+import json
+import os
+import threading
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+from rpg_game.save_game import SaveBackend, atomic_replace
+
+SNAPSHOT_FILE = "snapshot.json"
+JOURNAL_PREFIX = "journal."
+JOURNAL_SUFFIX = ".log"
+
+# Marker for "no previous value" in deltas
+_MISSING = object()
+
+
+def diff_state(old: Any, new: Any) -> Optional[Dict[str, Any]]:
+    """
+    Compute a delta that turns ``old`` into ``new``.
+
+    Deltas are JSON-serializable dictionaries of one of these forms:
+
+    - ``{"$set": value}``: replace the value
+    - ``{"$dict": {key: delta}, "$del": [keys]}``: patch a dictionary
+    - ``{"$list": {index: delta}, "$len": n, "$drop": k}``: drop ``k`` leading
+      items, patch items by index and truncate to ``n`` items
+
+    Args:
+        old: The previous value (``_MISSING`` for none)
+        new: The new value
+
+    Returns:
+        The delta, or None if the values are equal
+    """
+    if old is not _MISSING and type(old) is type(new) and old == new:
+        return None
+    if isinstance(old, dict) and isinstance(new, dict):
+        changes = {}
+        for key, value in new.items():
+            delta = diff_state(old.get(key, _MISSING), value)
+            if delta is not None:
+                changes[key] = delta
+        delta = {"$dict": changes}
+        removed = [key for key in old if key not in new]
+        if removed:
+            delta["$del"] = removed
+        return delta
+    if isinstance(old, list) and isinstance(new, list):
+        # Removing bosses from the front of the list is the common case
+        drop = len(old) - len(new)
+        if drop > 0 and old[drop:] == new:
+            return {"$list": {}, "$len": len(new), "$drop": drop}
+        changes = {}
+        for index, value in enumerate(new):
+            delta = diff_state(old[index] if index < len(old) else _MISSING, value)
+            if delta is not None:
+                changes[str(index)] = delta
+        return {"$list": changes, "$len": len(new)}
+    return {"$set": copy.deepcopy(new)}
+
+
+def apply_delta(value: Any, delta: Dict[str, Any]) -> Any:
+    """
+    Apply a delta produced by ``diff_state``.
+
+    Args:
+        value: The value to patch (may be modified in place)
+        delta: The delta to apply
+
+    Returns:
+        The patched value
+    """
+    if "$set" in delta:
+        return delta["$set"]
+    if "$dict" in delta:
+        for key in delta.get("$del", ()):
+            value.pop(key, None)
+        for key, change in delta["$dict"].items():
+            value[key] = apply_delta(value.get(key), change)
+        return value
+    value = value[delta.get("$drop", 0) :]
+    del value[delta["$len"] :]
+    for index, change in delta["$list"].items():
+        index = int(index)
+        if index < len(value):
+            value[index] = apply_delta(value[index], change)
+        else:
+            value.append(apply_delta(None, change))
+    return value
+
+
+def _encode_record(delta: Dict[str, Any]) -> bytes:
+    """Encode a delta as a checksummed journal line."""
+    payload = json.dumps(delta, separators=(",", ":")).encode("utf-8")
+    return b"%08x %s\n" % (zlib.crc32(payload), payload)
+
+
+def _decode_record(line: bytes) -> Optional[Dict[str, Any]]:
+    """Decode a journal line, returning None if it is torn or corrupt."""
+    if not line.endswith(b"\n") or len(line) < 10:
+        return None
+    checksum, payload = line[:8], line[9:-1]
+    try:
+        if int(checksum, 16) != zlib.crc32(payload):
+            return None
+        record: Dict[str, Any] = json.loads(payload)
+        return record
+    except ValueError:
+        return None
+
+
+class JournalSaveBackend(SaveBackend):
+    """
+    Save backend that appends deltas to a journal and compacts in the background.
+
+    Save latency depends on the size of the change, not of the whole state.
+    """
+
+    def __init__(
+        self, directory: str, compact_after: int = 64, background: bool = True
+    ) -> None:
+        """
+        Open (and recover) the journal in ``directory``.
+
+        Args:
+            directory: Directory holding the snapshot and journals
+            compact_after: Number of journal records that triggers compaction
+            background: Compact on a background thread (False compacts inline)
+        """
+        self.directory = str(directory)
+        self.compact_after = compact_after
+        self.background = background
+        self._lock = threading.Lock()
+        self._compactor: Optional[threading.Thread] = None
+        self._state: Optional[Dict[str, Any]] = None
+        self._generation = 0
+        self._records = 0
+        self._journal: Any = None
+        os.makedirs(self.directory, exist_ok=True)
+        self._recover()
+
+    def _journal_path(self, generation: int) -> str:
+        """Return the path of the journal for ``generation``."""
+        return os.path.join(
+            self.directory, f"{JOURNAL_PREFIX}{generation}{JOURNAL_SUFFIX}"
+        )
+
+    def _journal_generations(self) -> List[int]:
+        """Return the generations of all journal files, sorted."""
+        generations = []
+        for name in os.listdir(self.directory):
+            if name.startswith(JOURNAL_PREFIX) and name.endswith(JOURNAL_SUFFIX):
+                number = name[len(JOURNAL_PREFIX) : -len(JOURNAL_SUFFIX)]
+                if number.isdigit():
+                    generations.append(int(number))
+        return sorted(generations)
+
+    def _read_snapshot(self) -> Tuple[int, Any]:
+        """Return ``(generation, state)`` from the snapshot, if any."""
+        path = os.path.join(self.directory, SNAPSHOT_FILE)
+        if not os.path.exists(path):
+            return 0, None
+        with open(path, "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+        return snapshot["generation"], snapshot["state"]
+
+    def _replay(self, generation: int, state: Any) -> Tuple[Any, int]:
+        """
+        Apply one journal to ``state``, truncating any torn tail.
+
+        Returns:
+            The new state and the number of valid records
+        """
+        path = self._journal_path(generation)
+        valid_bytes = 0
+        records = 0
+        with open(path, "rb") as f:
+            for line in f:
+                delta = _decode_record(line)
+                if delta is None:
+                    break
+                state = apply_delta(state, delta)
+                valid_bytes += len(line)
+                records += 1
+        if valid_bytes != os.path.getsize(path):
+            with open(path, "r+b") as f:
+                f.truncate(valid_bytes)
+        return state, records
+
+    def _recover(self) -> None:
+        """Rebuild the in-memory state from the snapshot and journals."""
+        generation, state = self._read_snapshot()
+        records = 0
+        for journal in self._journal_generations():
+            if journal < generation:
+                # Left behind by a compaction that finished its snapshot
+                os.remove(self._journal_path(journal))
+                continue
+            state, records = self._replay(journal, state)
+            generation = journal
+        self._state = state
+        self._generation = generation
+        self._records = records
+        self._journal = open(self._journal_path(generation), "ab")
+
+    def save(self, game_state: Dict[str, Any]) -> None:
+        """Append the changes since the last save to the journal."""
+        with self._lock:
+            delta = diff_state(
+                self._state if self._state is not None else _MISSING, game_state
+            )
+            if delta is None:
+                return
+            self._journal.write(_encode_record(delta))
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+            self._state = apply_delta(self._state, json.loads(json.dumps(delta)))
+            self._records += 1
+            compact = self._records >= self.compact_after and self._compactor is None
+        if compact:
+            self._start_compaction()
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Return a copy of the saved state, or None if there is no save."""
+        with self._lock:
+            return copy.deepcopy(self._state)
+
+    def delete(self) -> None:
+        """Remove the snapshot and every journal."""
+        self.wait_for_compaction()
+        with self._lock:
+            self._journal.close()
+            for generation in self._journal_generations():
+                os.remove(self._journal_path(generation))
+            snapshot = os.path.join(self.directory, SNAPSHOT_FILE)
+            if os.path.exists(snapshot):
+                os.remove(snapshot)
+            self._state = None
+            self._generation = 0
+            self._records = 0
+            self._journal = open(self._journal_path(0), "ab")
+
+    def _start_compaction(self) -> None:
+        """Compact now or on a background thread."""
+        if not self.background:
+            self.compact()
+            return
+        with self._lock:
+            if self._compactor is not None:
+                return
+            self._compactor = threading.Thread(
+                target=self.compact, name="rpg-save-compactor", daemon=True
+            )
+            self._compactor.start()
+
+    def compact(self) -> None:
+        """
+        Fold the journal into a new snapshot.
+
+        Saves continue in a fresh journal while the snapshot is written.
+        """
+        try:
+            with self._lock:
+                generation = self._generation + 1
+                state = copy.deepcopy(self._state)
+                self._journal.close()
+                self._journal = open(self._journal_path(generation), "ab")
+                self._generation = generation
+                self._records = 0
+
+            path = os.path.join(self.directory, SNAPSHOT_FILE)
+            with atomic_replace(path) as temporary:
+                with open(temporary, "w", encoding="utf-8") as f:
+                    json.dump(
+                        {"generation": generation, "state": state},
+                        f,
+                        separators=(",", ":"),
+                    )
+
+            for old in self._journal_generations():
+                if old < generation:
+                    os.remove(self._journal_path(old))
+        finally:
+            with self._lock:
+                self._compactor = None
+
+    def wait_for_compaction(self) -> None:
+        """Block until a running background compaction has finished."""
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+
+    def close(self) -> None:
+        """Wait for compaction and close the journal."""
+        self.wait_for_compaction()
+        with self._lock:
+            if self._journal is not None and not self._journal.closed:
+                self._journal.close()
@@ -0,0 +1,276 @@
+"""
+SQLite-backed multi-slot save storage for the RPG game.
+
+``SQLiteSaveStore`` keeps any number of named save slots in one SQLite
+database using the standard-library ``sqlite3`` module. The database runs in
+WAL mode so readers never block the writer, and it has indexes on player
+name, modification time and progress (bosses remaining), so listing and
+loading stay fast as the number of saves grows.
+
+``SQLiteSaveBackend`` exposes one slot through the ``SaveBackend`` interface,
+so ``save_game``/``load_game``/``delete_save`` and ``Game`` work on top of it.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from rpg_game.save_game import SaveBackend
+
+DEFAULT_SLOT = "default"
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS saves (
+        slot TEXT PRIMARY KEY,
+        player_name TEXT,
+        bosses_remaining INTEGER NOT NULL,
+        modified REAL NOT NULL,
+        state TEXT NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_saves_player ON saves(player_name)",
+    "CREATE INDEX IF NOT EXISTS idx_saves_modified ON saves(modified)",
+    "CREATE INDEX IF NOT EXISTS idx_saves_progress ON saves(bosses_remaining)",
+)
+
+# Statements are constant strings so sqlite3's statement cache reuses them
+_UPSERT = (
+    "INSERT INTO saves (slot, player_name, bosses_remaining, modified, state) "
+    "VALUES (?, ?, ?, ?, ?) "
+    "ON CONFLICT(slot) DO UPDATE SET player_name = excluded.player_name, "
+    "bosses_remaining = excluded.bosses_remaining, modified = excluded.modified, "
+    "state = excluded.state"
+)
+_SELECT_STATE = "SELECT state FROM saves WHERE slot = ?"
+_DELETE = "DELETE FROM saves WHERE slot = ?"
+_COUNT = "SELECT COUNT(*) FROM saves"
+_EXPORT = "SELECT slot, state FROM saves ORDER BY slot"
+
+# Orderings accepted by list_slots, mapped to indexed columns
+_ORDERS = {
+    "slot": "slot",
+    "player": "player_name",
+    "modified": "modified DESC",
+    "progress": "bosses_remaining",
+}
+
+
+class SlotInfo(NamedTuple):
+    """Summary of one save slot."""
+
+    slot: str
+    player_name: Optional[str]
+    bosses_remaining: int
+    modified: float
+
+
+def _summary(state: Dict[str, Any]) -> Tuple[Optional[str], int]:
+    """Return the indexed ``(player_name, bosses_remaining)`` of a state."""
+    player = state.get("player") or {}
+    return player.get("name"), len(state.get("bosses") or ())
+
+
+class SQLiteSaveStore:
+    """Many named save slots in a single SQLite database."""
+
+    def __init__(self, path: str) -> None:
+        """
+        Open (creating if needed) the save database.
+
+        Args:
+            path: Path of the database file, or ``":memory:"``
+        """
+        self.path = str(path)
+        directory = os.path.dirname(self.path)
+        if directory and self.path != ":memory:":
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, check_same_thread=False, cached_statements=64
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+
+    def save(self, slot: str, game_state: Dict[str, Any]) -> None:
+        """
+        Write a slot, replacing any previous save in it.
+
+        Args:
+            slot: The slot name
+            game_state: The state to save
+        """
+        player_name, remaining = _summary(game_state)
+        payload = json.dumps(game_state, separators=(",", ":"))
+        with self._lock, self._conn:
+            self._conn.execute(
+                _UPSERT, (slot, player_name, remaining, time.time(), payload)
+            )
+
+    def load(self, slot: str) -> Optional[Dict[str, Any]]:
+        """
+        Read a slot.
+
+        Args:
+            slot: The slot name
+
+        Returns:
+            The saved state, or None if the slot is empty
+        """
+        with self._lock:
+            row = self._conn.execute(_SELECT_STATE, (slot,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def delete(self, slot: str) -> bool:
+        """
+        Remove a slot.
+
+        Args:
+            slot: The slot name
+
+        Returns:
+            bool: True if a save was removed
+        """
+        with self._lock, self._conn:
+            return self._conn.execute(_DELETE, (slot,)).rowcount > 0
+
+    def count(self) -> int:
+        """Return the number of saved slots."""
+        with self._lock:
+            count: int = self._conn.execute(_COUNT).fetchone()[0]
+        return count
+
+    def list_slots(
+        self,
+        player_name: Optional[str] = None,
+        order_by: str = "modified",
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[SlotInfo]:
+        """
+        List slots, optionally filtered by player, using the indexes.
+
+        Args:
+            player_name: Only list this player's saves
+            order_by: One of ``"modified"`` (newest first), ``"slot"``,
+                ``"player"`` or ``"progress"`` (fewest bosses remaining first)
+            limit: Maximum number of slots to return
+            offset: Number of slots to skip, for paging
+
+        Returns:
+            List[SlotInfo]: The matching slots
+
+        Raises:
+            ValueError: If ``order_by`` is unknown
+        """
+        if order_by not in _ORDERS:
+            raise ValueError(
+                f"Unknown ordering {order_by!r}; expected one of {sorted(_ORDERS)}"
+            )
+        sql = "SELECT slot, player_name, bosses_remaining, modified FROM saves"
+        params: List[Any] = []
+        if player_name is not None:
+            sql += " WHERE player_name = ?"
+            params.append(player_name)
+        sql += f" ORDER BY {_ORDERS[order_by]} LIMIT ? OFFSET ?"
+        params.extend([-1 if limit is None else limit, offset])
+        with self._lock:
+            return [SlotInfo(*row) for row in self._conn.execute(sql, params)]
+
+    def import_many(self, saves: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        """
+        Write many slots in a single transaction.
+
+        Args:
+            saves: ``(slot, game_state)`` pairs
+
+        Returns:
+            int: Number of slots written
+        """
+        now = time.time()
+        rows = []
+        for slot, state in saves:
+            player_name, remaining = _summary(state)
+            rows.append(
+                (
+                    slot,
+                    player_name,
+                    remaining,
+                    now,
+                    json.dumps(state, separators=(",", ":")),
+                )
+            )
+        with self._lock, self._conn:
+            self._conn.executemany(_UPSERT, rows)
+        return len(rows)
+
+    def export_all(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Iterate over every slot in slot order.
+
+        Yields:
+            ``(slot, game_state)`` pairs
+        """
+        with self._lock:
+            rows = self._conn.execute(_EXPORT).fetchall()
+        for slot, payload in rows:
+            yield slot, json.loads(payload)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class SQLiteSaveBackend(SaveBackend):
+    """Exposes one slot of an SQLiteSaveStore as a SaveBackend."""
+
+    def __init__(
+        self, store: Union[SQLiteSaveStore, str], slot: str = DEFAULT_SLOT
+    ) -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            store: An open store, or the path of a database to open
+            slot: The slot this backend reads and writes
+        """
+        self.store = (
+            store if isinstance(store, SQLiteSaveStore) else SQLiteSaveStore(store)
+        )
+        self.slot = slot
+
+    def save(self, game_state: Dict[str, Any]) -> None:
+        """Write the state to the slot."""
+        try:
+            self.store.save(self.slot, game_state)
+        except sqlite3.Error as e:
+            raise OSError(str(e)) from e
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Read the state from the slot."""
+        try:
+            return self.store.load(self.slot)
+        except sqlite3.Error as e:
+            raise OSError(str(e)) from e
+
+    def delete(self) -> None:
+        """Empty the slot."""
+        try:
+            self.store.delete(self.slot)
+        except sqlite3.Error as e:
+            raise OSError(str(e)) from e
@@ -0,0 +1,331 @@
+"""
+Scripted playthroughs of the interactive game.
+
+``ScriptedIO`` feeds ``Game`` a transcript of input lines in place of a
+keyboard and sends everything the game writes to a sink: ``NullSink``
+discards it, ``HashSink`` folds it into a fingerprint without keeping it and
+``CaptureSink`` also keeps the text. The real menu, weapon, battle and end
+screen code runs unchanged, so a fingerprint change means the player-visible
+output changed.
+
+``run_transcripts`` plays many transcripts, optionally in a
+``ProcessPoolExecutor``. Playthrough ``i`` draws from random substream ``i``
+of the master seed, so fingerprints do not depend on the number of workers.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from rpg_game.game import Game
+from rpg_game.game_io import GameIO
+from rpg_game.game_logger import GameLogger
+from rpg_game.renderer import NullRenderer, ScreenRenderer, TextStream
+from rpg_game.rng import derive_seed, make_rng
+from rpg_game.save_game import MemoryBackend
+
+# Ways a playthrough can end
+QUIT = "quit"
+EOF = "eof"
+
+# Sinks
+NULL = "null"
+HASH = "hash"
+CAPTURE = "capture"
+
+# Playthroughs per task sent to a worker process
+DEFAULT_CHUNK_SIZE = 256
+
+Transcript = Sequence[str]
+
+
+class NullSink:
+    """Discards output."""
+
+    def write(self, text: str) -> None:
+        """Discard ``text``."""
+
+    def flush(self) -> None:
+        """Nothing to flush."""
+
+    def fingerprint(self) -> Optional[str]:
+        """Null sinks have no fingerprint."""
+        return None
+
+
+class HashSink(NullSink):
+    """Hashes output into a fingerprint without keeping it."""
+
+    def __init__(self) -> None:
+        """Initialize an empty hash."""
+        self._hash = hashlib.blake2b(digest_size=16)
+
+    def write(self, text: str) -> None:
+        """Add ``text`` to the fingerprint."""
+        self._hash.update(text.encode("utf-8"))
+
+    def fingerprint(self) -> str:
+        """Return the hex digest of everything written so far."""
+        return self._hash.hexdigest()
+
+
+class CaptureSink(HashSink):
+    """Hashes output and keeps it."""
+
+    def __init__(self) -> None:
+        """Initialize an empty capture."""
+        super().__init__()
+        self.chunks: List[str] = []
+
+    def write(self, text: str) -> None:
+        """Keep ``text`` and add it to the fingerprint."""
+        super().write(text)
+        self.chunks.append(text)
+
+    def text(self) -> str:
+        """Return everything written so far."""
+        return "".join(self.chunks)
+
+
+_SINKS = {NULL: NullSink, HASH: HashSink, CAPTURE: CaptureSink}
+
+
+class ScriptedIO(GameIO):
+    """Game I/O that reads a transcript and writes to a sink."""
+
+    def __init__(
+        self, transcript: Transcript, sink: Optional[TextStream] = None
+    ) -> None:
+        """
+        Initialize scripted I/O.
+
+        Args:
+            transcript: Input lines, one per prompt (without newlines)
+            sink: Destination of output, such as one of the sinks above or
+                ``sys.stdout`` (defaults to a ``NullSink``)
+        """
+        self.sink: TextStream = sink if sink is not None else NullSink()
+        # Skip rendering and formatting entirely when the output is discarded
+        self.quiet = type(self.sink) is NullSink
+        self.renderer = (
+            NullRenderer() if self.quiet else ScreenRenderer(stream=self.sink)
+        )
+        self._lines = iter(transcript)
+        self.lines_read = 0
+
+    def print(self, *values: Any, sep: str = " ", end: str = "\n") -> None:
+        """Write values to the sink, formatted like ``print``."""
+        if not self.quiet:
+            self.sink.write(sep.join(map(str, values)) + end)
+
+    def say(self, template: str, *args: Any) -> None:
+        """Write a formatted message to the sink, unless output is discarded."""
+        if not self.quiet:
+            super().say(template, *args)
+
+    async def read_line(self, prompt: str = "") -> str:
+        """
+        Return the next transcript line, echoing the prompt and line to the sink.
+
+        Raises:
+            EOFError: If the transcript is exhausted
+        """
+        line = next(self._lines, None)
+        if line is None:
+            raise EOFError("transcript exhausted")
+        self.lines_read += 1
+        if not self.quiet:
+            self.sink.write(f"{prompt}{line}\n")
+        return line
+
+
+class Playthrough(NamedTuple):
+    """Outcome of one scripted playthrough."""
+
+    ending: str
+    state: Optional[str]
+    lines_read: int
+    fingerprint: Optional[str]
+    output: Optional[str]
+
+
+async def play_async(
+    transcript: Transcript, seed: Optional[int] = 0, sink: str = HASH
+) -> Playthrough:
+    """
+    Play one transcript through a fresh game on the running event loop.
+
+    Args:
+        transcript: Input lines, one per prompt
+        seed: Seed of the game's random stream (None for unseeded)
+        sink: ``"null"``, ``"hash"`` or ``"capture"``
+
+    Returns:
+        Playthrough: How the game ended, its last state, the number of lines
+        consumed and, unless the sink is ``"null"``, the output fingerprint
+        (and text for ``"capture"``)
+    """
+    out = _SINKS[sink]()
+    io = ScriptedIO(transcript, out)
+    game = Game(rng=make_rng(seed), save_backend=MemoryBackend(), io=io)
+    # Combat log lines carry wall-clock timestamps, which would break fingerprints
+    game.logger = GameLogger(log_to_console=False)
+    ending = QUIT
+    try:
+        await game.run_async()
+    except EOFError:
+        ending = EOF
+    return Playthrough(
+        ending,
+        game.state,
+        io.lines_read,
+        out.fingerprint(),
+        out.text() if isinstance(out, CaptureSink) else None,
+    )
+
+
+def play(
+    transcript: Transcript, seed: Optional[int] = 0, sink: str = HASH
+) -> Playthrough:
+    """
+    Play one transcript through a fresh game.
+
+    Args:
+        transcript: Input lines, one per prompt
+        seed: Seed of the game's random stream (None for unseeded)
+        sink: ``"null"``, ``"hash"`` or ``"capture"``
+
+    Returns:
+        Playthrough: The outcome, as for ``play_async``
+    """
+    return asyncio.run(play_async(transcript, seed, sink))
+
+
+async def _play_all(
+    items: Sequence[Tuple[int, Transcript]], seed: int, sink: str
+) -> List[Playthrough]:
+    """Play ``(index, transcript)`` pairs in turn, seeding each from its index."""
+    return [
+        await play_async(transcript, derive_seed(seed, index), sink)
+        for index, transcript in items
+    ]
+
+
+def _play_chunk(
+    chunk: Tuple[Sequence[Tuple[int, Transcript]], int, str]
+) -> List[Playthrough]:
+    """Play a chunk of playthroughs on one event loop."""
+    return asyncio.run(_play_all(*chunk))
+
+
+class ScriptReport(NamedTuple):
+    """Results of ``run_transcripts``."""
+
+    playthroughs: List[Playthrough]
+    seconds: float
+
+    @property
+    def per_second(self) -> float:
+        """Playthroughs completed per second of wall time."""
+        return len(self.playthroughs) / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def fingerprints(self) -> List[Optional[str]]:
+        """Output fingerprint of each playthrough, in order."""
+        return [playthrough.fingerprint for playthrough in self.playthroughs]
+
+
+def run_transcripts(
+    transcripts: Iterable[Transcript],
+    seed: int = 0,
+    workers: Optional[int] = 1,
+    sink: str = HASH,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> ScriptReport:
+    """
+    Play every transcript and time the run.
+
+    Args:
+        transcripts: Input transcripts
+        seed: Master seed; playthrough ``i`` uses substream ``i``
+        workers: Number of worker processes (None uses all cores, 1 runs inline)
+        sink: ``"null"``, ``"hash"`` or ``"capture"``
+        chunk_size: Playthroughs per task sent to a worker
+
+    Returns:
+        ScriptReport: The playthroughs, in transcript order, and the wall time
+    """
+    items = list(enumerate(transcripts))
+    chunks = [
+        (items[start : start + chunk_size], seed, sink)
+        for start in range(0, len(items), chunk_size)
+    ]
+    start = time.perf_counter()
+    if workers == 1:
+        results = list(map(_play_chunk, chunks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_play_chunk, chunks))
+    seconds = time.perf_counter() - start
+    return ScriptReport(
+        [playthrough for chunk in results for playthrough in chunk], seconds
+    )
+
+
+def read_transcript(path: str) -> List[str]:
+    """
+    Read a transcript file: one input line per line, blank lines press Enter.
+
+    Args:
+        path: Path of the transcript
+
+    Returns:
+        List[str]: The input lines
+    """
+    with open(path, encoding="utf-8") as f:
+        return f.read().splitlines()
+
+
+def script_main(argv: Optional[List[str]] = None) -> None:
+    """
+    Play transcript files from the command line and print their fingerprints.
+
+    Args:
+        argv: Command-line arguments (defaults to ``sys.argv[1:]``)
+    """
+    parser = argparse.ArgumentParser(
+        prog="rpg_game script", description="Play scripted input transcripts."
+    )
+    parser.add_argument("transcripts", nargs="+", help="transcript files")
+    parser.add_argument(
+        "--repeat", type=int, default=1, help="play each transcript this many times"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="master seed")
+    parser.add_argument(
+        "--workers", type=int, default=1, help="worker processes (0 uses all cores)"
+    )
+    parser.add_argument(
+        "--sink", choices=sorted(_SINKS), default=HASH, help="where game output goes"
+    )
+    args = parser.parse_args(argv)
+
+    names = [path for path in args.transcripts for _ in range(args.repeat)]
+    transcripts = [read_transcript(path) for path in args.transcripts]
+    report = run_transcripts(
+        (t for t in transcripts for _ in range(args.repeat)),
+        seed=args.seed,
+        workers=args.workers or None,
+        sink=args.sink,
+    )
+    for name, playthrough in zip(names, report.playthroughs):
+        print(
+            f"{name}\t{playthrough.ending}\t{playthrough.state}\t"
+            f"{playthrough.lines_read}\t{playthrough.fingerprint}"
+        )
+    print(
+        f"{len(report.playthroughs)} playthroughs in {report.seconds:.3f}s "
+        f"({report.per_second:.1f}/s)"
+    )
@@ -0,0 +1,222 @@
+"""
+Multi-session game server for the RPG game.
+
+Each connection to a ``GameServer`` plays its own ``Game`` over a
+``game_io.StreamIO``, so a single process and event loop host many players.
+An idle session is a coroutine suspended on its socket plus its game state,
+a few kilobytes. Quitting or disconnecting ends that session only.
+
+A session starts by asking for a player name, which names its save slot, so
+a player who reconnects under the same name can load their game.
+
+Run with ``python -m rpg_game serve --port 4000`` and connect with a line
+based client such as ``nc localhost 4000``.
+"""
+
+import argparse
+import asyncio
+import os
+from asyncio.base_events import Server
+from typing import Any, List, Optional
+
+from rpg_game.game import Game
+from rpg_game.game_io import StreamIO
+from rpg_game.save_game import _get_save_dir
+from rpg_game.save_sqlite import SQLiteSaveBackend, SQLiteSaveStore
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 4000
+
+# Longest input line accepted from a client; it bounds each session's buffer
+LINE_LIMIT = 1024
+
+# Pending connections queued by the kernel while sessions are being accepted
+BACKLOG = 4096
+
+# Asked before the main menu; the answer names the session's save slot
+NAME_PROMPT = "Enter your player name: "
+
+# File name of the default save database, in the save directory
+SAVES_FILE = "server_saves.db"
+
+
+def default_store_path() -> str:
+    """Return the path of the default save database."""
+    return os.path.join(_get_save_dir(), SAVES_FILE)
+
+
+class GameServer:
+    """
+    Serves one ``Game`` per TCP or Unix socket connection.
+
+    Saves of all sessions go to one ``SQLiteSaveStore``, one slot per player
+    name. Games save, load and delete on the default executor (the store serializes
+    them with its lock), so a slow disk never stalls the other sessions.
+
+    Attributes:
+        active: Number of sessions currently connected
+        completed: Number of sessions that have ended
+    """
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        path: Optional[str] = None,
+        store: Optional[SQLiteSaveStore] = None,
+    ) -> None:
+        """
+        Initialize the server.
+
+        Args:
+            host: Interface to listen on
+            port: TCP port to listen on (0 picks a free port)
+            path: Listen on this Unix socket instead of TCP
+            store: Save store shared by the sessions; defaults to
+                ``server_saves.db`` in the save directory
+        """
+        self.host = host
+        self.port = port
+        self.path = path
+        self.store = (
+            store if store is not None else SQLiteSaveStore(default_store_path())
+        )
+        self.active = 0
+        self.completed = 0
+        self._server: Optional[Server] = None
+
+    async def ask_player(self, io: StreamIO) -> str:
+        """
+        Ask the client for a player name until a non-blank one is given.
+
+        Args:
+            io: The session's connection
+
+        Returns:
+            str: The name, without surrounding whitespace
+
+        Raises:
+            EOFError: If the connection ends first
+        """
+        while True:
+            name = (await io.read_line(NAME_PROMPT)).strip()
+            if name:
+                return name
+
+    def new_game(self, player: str, io: StreamIO) -> Game:
+        """
+        Create the game played by one session.
+
+        Args:
+            player: Player name given by the client; it names the save slot
+            io: The session's connection
+
+        Returns:
+            Game: A game saving to the player's slot
+        """
+        return Game(save_backend=SQLiteSaveBackend(self.store, player), io=io)
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Play one session until the player quits or disconnects.
+
+        Args:
+            reader: The connection's input
+            writer: The connection's output
+        """
+        io = StreamIO(reader, writer)
+        self.active += 1
+        try:
+            player = await self.ask_player(io)
+            await self.new_game(player, io).run_async()
+        except (EOFError, ConnectionError):
+            pass
+        finally:
+            self.active -= 1
+            self.completed += 1
+            io.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def start(self) -> Server:
+        """
+        Start listening.
+
+        Returns:
+            asyncio.Server: The listening server
+        """
+        if self.path is not None:
+            self._server = await asyncio.start_unix_server(
+                self.handle, self.path, limit=LINE_LIMIT, backlog=BACKLOG
+            )
+        else:
+            self._server = await asyncio.start_server(
+                self.handle, self.host, self.port, limit=LINE_LIMIT, backlog=BACKLOG
+            )
+        return self._server
+
+    @property
+    def address(self) -> Any:
+        """
+        The address the server listens on (``(host, port)`` or a socket path).
+
+        Raises:
+            RuntimeError: If the server has not been started
+        """
+        if self._server is None:
+            raise RuntimeError("The server has not been started")
+        return self._server.sockets[0].getsockname()
+
+    async def serve_forever(self) -> None:
+        """Start the server if needed and serve until cancelled."""
+        server = self._server if self._server is not None else await self.start()
+        async with server:
+            await server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop accepting connections."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+
+def serve_main(argv: Optional[List[str]] = None) -> None:
+    """
+    Run the game server from the command line.
+
+    Args:
+        argv: Command-line arguments (defaults to ``sys.argv[1:]``)
+    """
+    parser = argparse.ArgumentParser(
+        prog="rpg_game serve", description="Host many concurrent games over sockets."
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST, help="interface to listen on")
+    parser.add_argument(
+        "--port", type=int, default=DEFAULT_PORT, help="TCP port to listen on"
+    )
+    parser.add_argument(
+        "--unix", metavar="PATH", help="listen on a Unix socket instead"
+    )
+    parser.add_argument(
+        "--saves",
+        metavar="DB",
+        help=f"SQLite database for session saves (default: {default_store_path()})",
+    )
+    args = parser.parse_args(argv)
+
+    store = SQLiteSaveStore(args.saves) if args.saves is not None else None
+    server = GameServer(args.host, args.port, args.unix, store)
+
+    async def serve() -> None:
+        await server.start()
+        print(f"Serving on {server.address}", flush=True)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,263 @@
+"""
+Headless combat simulation for the RPG game.
+
+This module runs fights between a player and a boss without any terminal
+I/O. Attacks are rolled from the same ``damage.DamageTable``s as
+``Character.attack`` and ``Boss.attack``, so simulated fights can be used
+for balance checks.
+"""
+
+from typing import Any, Iterator, NamedTuple, Optional, Tuple, Union
+
+from rpg_game.constants import BOSS_WEAPON_DAMAGE
+from rpg_game.damage import (
+    DEFAULT_RULES,
+    CombatRules,
+    DamageTable,
+    boss_table,
+    player_table,
+)
+from rpg_game.rng import make_rng
+
+# Winner labels used in DuelResult
+PLAYER = "player"
+BOSS = "boss"
+
+
+class CombatantSpec(NamedTuple):
+    """Immutable description of a combatant's fighting stats."""
+
+    name: str
+    health: int
+    damage: int
+    weapon_bonus: int = 0
+
+    @property
+    def attack_damage(self) -> int:
+        """Attack value (base damage plus weapon bonus) before any roll."""
+        return self.damage + self.weapon_bonus
+
+    @classmethod
+    def from_character(cls, character: Any) -> "CombatantSpec":
+        """
+        Build a spec from a Character or Boss instance.
+
+        Args:
+            character: The character to describe
+
+        Returns:
+            CombatantSpec: The character's current stats
+        """
+        bonus = character.weapon.damage_bonus if character.weapon else 0
+        return cls(character.name, character.health, character.damage, bonus)
+
+
+def boss_spec(name: str, health: int, damage: int) -> CombatantSpec:
+    """
+    Build a spec for a boss, including the weapon every Boss carries.
+
+    Args:
+        name: The boss's name
+        health: The boss's health points
+        damage: The boss's base damage
+
+    Returns:
+        CombatantSpec: The boss's stats
+    """
+    return CombatantSpec(name, health, damage, BOSS_WEAPON_DAMAGE)
+
+
+class DuelResult(NamedTuple):
+    """Outcome of a single simulated fight."""
+
+    winner: str
+    turns: int
+    player_damage_dealt: int
+    boss_damage_dealt: int
+    player_health: int
+    boss_health: int
+
+    @property
+    def player_won(self) -> bool:
+        """Whether the player won the fight."""
+        return self.winner == PLAYER
+
+
+SpecLike = Union[CombatantSpec, Any]
+
+
+def _as_spec(combatant: SpecLike) -> CombatantSpec:
+    """Return ``combatant`` as a CombatantSpec, converting entities if needed."""
+    if isinstance(combatant, CombatantSpec):
+        return combatant
+    return CombatantSpec.from_character(combatant)
+
+
+def _check_terminates(player: CombatantSpec, boss: CombatantSpec) -> None:
+    """Raise ValueError if neither side can ever damage the other."""
+    if player.attack_damage <= 0 and boss.attack_damage <= 0:
+        raise ValueError(
+            f"Fight between {player.name} and {boss.name} can never end: "
+            "neither side deals damage"
+        )
+
+
+def _duel(
+    player: CombatantSpec,
+    boss: CombatantSpec,
+    rng_random: Any,
+    player_attack: DamageTable,
+    boss_attack: DamageTable,
+) -> DuelResult:
+    """
+    Run one fight using ``rng_random`` as the source of uniform floats.
+
+    The loop follows ``Game.combat``: the player attacks first, then the boss
+    strikes back, each drawing one roll from its damage table unless the
+    table has a single outcome.
+    """
+    player_hp = player.health
+    boss_hp = boss.health
+    # DamageTable.sample, inlined
+    player_size = player_attack.size
+    player_threshold, player_damage, player_alias = player_attack.arrays()
+    boss_size = boss_attack.size
+    boss_threshold, boss_damage, boss_alias = boss_attack.arrays()
+    turns = 0
+
+    while player_hp > 0 and boss_hp > 0:
+        turns += 1
+
+        # Player's turn (Boss.take_damage applies the raw amount, clamped at 0);
+        # like Character.attack, a table with one outcome draws nothing
+        if player_size == 1:
+            boss_hp -= player_damage[0]
+        else:
+            u = rng_random() * player_size
+            i = int(u)
+            boss_hp -= (
+                player_damage[i] if u - i < player_threshold[i] else player_alias[i]
+            )
+        if boss_hp <= 0:
+            boss_hp = 0
+            break
+
+        # Boss's turn (Character.take_damage ignores non-positive amounts)
+        if boss_size == 1:
+            hit = boss_damage[0]
+        else:
+            u = rng_random() * boss_size
+            i = int(u)
+            hit = boss_damage[i] if u - i < boss_threshold[i] else boss_alias[i]
+        if hit > 0:
+            player_hp -= hit
+            if player_hp < 0:
+                player_hp = 0
+
+    winner = PLAYER if boss_hp <= 0 else BOSS
+    return DuelResult(
+        winner,
+        turns,
+        boss.health - boss_hp,
+        player.health - player_hp,
+        player_hp,
+        boss_hp,
+    )
+
+
+def damage_tables(
+    player: CombatantSpec, boss: CombatantSpec, rules: CombatRules = DEFAULT_RULES
+) -> Tuple[DamageTable, DamageTable]:
+    """
+    Return the damage tables of a matchup.
+
+    Args:
+        player: The player's stats
+        boss: The boss's stats
+        rules: Damage rules
+
+    Returns:
+        Tuple[DamageTable, DamageTable]: The player's and the boss's tables
+    """
+    return player_table(player.attack_damage, rules), boss_table(
+        boss.attack_damage, rules
+    )
+
+
+def run_duel(
+    player: SpecLike,
+    boss: SpecLike,
+    seed: Optional[int] = None,
+    stream_id: int = 0,
+    rng: Optional[Any] = None,
+    rules: CombatRules = DEFAULT_RULES,
+) -> DuelResult:
+    """
+    Simulate a single fight between a player and a boss.
+
+    The fight consumes the same random draws as a ``Character`` and ``Boss``
+    sharing ``rng=make_rng(seed, stream_id)`` would in ``Game.combat``, so
+    it can be replayed exactly.
+
+    Args:
+        player: The player as a CombatantSpec or Character
+        boss: The boss as a CombatantSpec or Boss
+        seed: Optional seed making the fight reproducible
+        stream_id: Substream of ``seed`` to draw from
+        rng: Optional random source to use instead of ``(seed, stream_id)``
+        rules: Damage rules (``damage.FIXED_RULES`` for fixed damage)
+
+    Returns:
+        DuelResult: The winner, number of turns and damage dealt by each side
+
+    Raises:
+        ValueError: If neither side can damage the other
+    """
+    player_spec = _as_spec(player)
+    boss_spec_ = _as_spec(boss)
+    _check_terminates(player_spec, boss_spec_)
+    if rng is None:
+        rng = make_rng(seed, stream_id)
+    return _duel(
+        player_spec,
+        boss_spec_,
+        rng.random,
+        *damage_tables(player_spec, boss_spec_, rules),
+    )
+
+
+def run_duels(
+    player: SpecLike,
+    boss: SpecLike,
+    count: int,
+    seed: Optional[int] = None,
+    stream_id: int = 0,
+    rules: CombatRules = DEFAULT_RULES,
+) -> Iterator[DuelResult]:
+    """
+    Simulate ``count`` independent fights sharing one random generator.
+
+    This avoids re-seeding a generator per fight and is the fastest way to
+    run many scalar duels.
+
+    Args:
+        player: The player as a CombatantSpec or Character
+        boss: The boss as a CombatantSpec or Boss
+        count: Number of fights to run
+        seed: Optional seed making the sequence of fights reproducible
+        stream_id: Substream of ``seed`` to draw from
+        rules: Damage rules (``damage.FIXED_RULES`` for fixed damage)
+
+    Yields:
+        DuelResult: The outcome of each fight in order
+
+    Raises:
+        ValueError: If neither side can damage the other
+    """
+    player_spec = _as_spec(player)
+    boss_spec_ = _as_spec(boss)
+    _check_terminates(player_spec, boss_spec_)
+    rng_random = make_rng(seed, stream_id).random
+    player_attack, boss_attack = damage_tables(player_spec, boss_spec_, rules)
+    for _ in range(count):
+        yield _duel(player_spec, boss_spec_, rng_random, player_attack, boss_attack)
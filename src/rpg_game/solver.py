@@ -0,0 +1,221 @@
+"""
+Exact combat outcome solver for the RPG game.
+
+A fight in ``Game.combat`` is a small Markov chain: the state is the pair
+``(player_hp, boss_hp)``, and each side's attack damage is drawn from its
+``damage.DamageTable``. This module evaluates that chain exactly instead of
+sampling it, by pushing probability mass forward from the starting state.
+
+Each turn is split into the player's half and the boss's half, so a state
+fans out to one successor per damage value rather than one per pair of
+values. Mass only ever moves to states with less total health, except when
+both attacks deal nothing (dodges); that self-loop is solved in closed form,
+so every state is visited once in order of decreasing total health.
+
+Solvers are cached per matchup and solutions per starting state.
+"""
+
+from collections import defaultdict
+from typing import DefaultDict, Dict, List, NamedTuple, Tuple
+
+from rpg_game.damage import DEFAULT_RULES, CombatRules, DamageTable
+from rpg_game.sim import SpecLike, _as_spec, _check_terminates, damage_tables
+
+State = Tuple[int, int]
+# A damage distribution as (damage, probability) pairs
+Distribution = List[Tuple[int, float]]
+
+
+class Solution(NamedTuple):
+    """Exact outcome of a fight from a given starting state."""
+
+    win_probability: float
+    expected_turns: float
+    health_distribution: Dict[int, float]
+
+    @property
+    def loss_probability(self) -> float:
+        """Probability that the boss wins."""
+        return self.health_distribution.get(0, 0.0)
+
+    @property
+    def expected_player_health(self) -> float:
+        """Expected player health at the end of the fight."""
+        return sum(hp * p for hp, p in self.health_distribution.items())
+
+
+class CombatSolver:
+    """
+    Solves fights for one fixed pair of damage distributions.
+
+    Solutions are memoized per starting state, so repeated queries for the
+    same matchup are answered from cache.
+    """
+
+    def __init__(
+        self, player_damage: Dict[int, float], boss_damage: Dict[int, float]
+    ) -> None:
+        """
+        Initialize a solver.
+
+        Args:
+            player_damage: Probability of each damage value of the player's attack
+            boss_damage: Probability of each damage value of the boss's attack
+
+        Raises:
+            ValueError: If neither attack can deal damage (for example when
+                both sides always dodge), so no fight would ever end
+        """
+        # Non-positive damage never helps the attacker: Character.take_damage
+        # ignores it, and a player who cannot deal damage can never win, so
+        # the boss's health no longer matters
+        self.player_damage = self._clamp(player_damage)
+        self.boss_damage = self._clamp(boss_damage)
+        if not any(damage > 0 for damage, _ in self.player_damage + self.boss_damage):
+            raise ValueError("Fight can never end: neither side deals damage")
+        self._solutions: Dict[State, Solution] = {}
+
+    @staticmethod
+    def _clamp(distribution: Dict[int, float]) -> Distribution:
+        """Merge non-positive damage into 0 and drop impossible values."""
+        merged: Dict[int, float] = {}
+        for damage, p in distribution.items():
+            if p > 0:
+                merged[max(0, damage)] = merged.get(max(0, damage), 0.0) + p
+        return sorted(merged.items())
+
+    @classmethod
+    def from_tables(cls, player: DamageTable, boss: DamageTable) -> "CombatSolver":
+        """Create a solver from the two sides' damage tables."""
+        return cls(player.distribution(), boss.distribution())
+
+    @property
+    def cache_size(self) -> int:
+        """Number of memoized solutions."""
+        return len(self._solutions)
+
+    def _propagate(self, start: State) -> Solution:
+        """Push the probability mass of ``start`` through the fight."""
+        player_misses = sum(p for damage, p in self.player_damage if damage == 0)
+        boss_misses = sum(p for damage, p in self.boss_damage if damage == 0)
+        player_hits = [(damage, p) for damage, p in self.player_damage if damage > 0]
+        boss_hits = [(damage, p) for damage, p in self.boss_damage if damage > 0]
+        loop = 1.0 / (1.0 - player_misses * boss_misses)
+
+        # Mass arriving at the start of a turn, and after the player's attack
+        turn_start: DefaultDict[State, float] = defaultdict(float)
+        boss_reply: DefaultDict[State, float] = defaultdict(float)
+        # States with mass, bucketed by total health
+        pending: DefaultDict[int, set] = defaultdict(set)
+        turn_start[start] = 1.0
+        pending[sum(start)].add(start)
+        turns = 0.0
+        distribution: DefaultDict[int, float] = defaultdict(float)
+
+        for total in range(sum(start), 1, -1):
+            for state in pending.pop(total, ()):
+                player_hp, boss_hp = state
+                incoming_turn = turn_start.pop(state, 0.0)
+                incoming_reply = boss_reply.pop(state, 0.0)
+                # Expected visits, counting the turns where both sides miss
+                visits = (incoming_turn + boss_misses * incoming_reply) * loop
+                replies = incoming_reply + player_misses * visits
+                turns += visits
+
+                for damage, p in player_hits if visits else ():
+                    if damage >= boss_hp:
+                        distribution[player_hp] += visits * p
+                    else:
+                        boss_reply[(player_hp, boss_hp - damage)] += visits * p
+                        pending[total - damage].add((player_hp, boss_hp - damage))
+                for damage, p in boss_hits if replies else ():
+                    if damage >= player_hp:
+                        distribution[0] += replies * p
+                    else:
+                        turn_start[(player_hp - damage, boss_hp)] += replies * p
+                        pending[total - damage].add((player_hp - damage, boss_hp))
+
+        win = sum((p for hp, p in distribution.items() if hp > 0), 0.0)
+        return Solution(win, turns, dict(distribution))
+
+    def solve(self, player_hp: int, boss_hp: int) -> Solution:
+        """
+        Solve the fight starting from the given health values.
+
+        Args:
+            player_hp: The player's starting health
+            boss_hp: The boss's starting health
+
+        Returns:
+            Solution: Win probability, expected turns and final health distribution
+        """
+        if player_hp <= 0 or boss_hp <= 0:
+            # Game.combat never enters its loop
+            won = boss_hp <= 0
+            return Solution(1.0 if won else 0.0, 0.0, {max(0, player_hp): 1.0})
+        solution = self._solutions.get((player_hp, boss_hp))
+        if solution is None:
+            solution = self._solutions[(player_hp, boss_hp)] = self._propagate(
+                (player_hp, boss_hp)
+            )
+        return solution
+
+
+_SOLVERS: Dict[Tuple[DamageTable, DamageTable], CombatSolver] = {}
+
+
+def solver_for(
+    player: SpecLike, boss: SpecLike, rules: CombatRules = DEFAULT_RULES
+) -> CombatSolver:
+    """
+    Return the cached solver for a matchup, creating it if necessary.
+
+    Args:
+        player: The player as a CombatantSpec or Character
+        boss: The boss as a CombatantSpec or Boss
+        rules: Damage rules (``damage.FIXED_RULES`` for fixed damage)
+
+    Returns:
+        CombatSolver: The solver for these damage tables
+
+    Raises:
+        ValueError: If neither side can damage the other
+    """
+    player_spec = _as_spec(player)
+    boss_spec_ = _as_spec(boss)
+    _check_terminates(player_spec, boss_spec_)
+    # Tables are cached per attack value and rules, so they identify the matchup
+    key = damage_tables(player_spec, boss_spec_, rules)
+    solver = _SOLVERS.get(key)
+    if solver is None:
+        solver = _SOLVERS[key] = CombatSolver.from_tables(*key)
+    return solver
+
+
+def solve(
+    player: SpecLike, boss: SpecLike, rules: CombatRules = DEFAULT_RULES
+) -> Solution:
+    """
+    Solve a fight exactly.
+
+    Args:
+        player: The player as a CombatantSpec or Character
+        boss: The boss as a CombatantSpec or Boss
+        rules: Damage rules (``damage.FIXED_RULES`` for fixed damage)
+
+    Returns:
+        Solution: Win probability, expected turns and final health distribution
+
+    Raises:
+        ValueError: If neither side can damage the other
+    """
+    player_spec = _as_spec(player)
+    boss_spec_ = _as_spec(boss)
+    return solver_for(player_spec, boss_spec_, rules).solve(
+        player_spec.health, boss_spec_.health
+    )
+
+
+def clear_cache() -> None:
+    """Forget every cached solver and memoized state."""
+    _SOLVERS.clear()
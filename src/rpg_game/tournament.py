@@ -0,0 +1,211 @@
+"""
+Tournament runner for weapon-versus-boss balance checks.
+
+This module simulates every starting weapon against every boss in the
+campaign roster. Trials are split into fixed-size shards which run in a
+``ProcessPoolExecutor``. Each shard draws from its own seeded random stream,
+so the merged results are identical for a given master seed no matter how
+many worker processes are used.
+"""
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from rpg_game.batch_sim import np, simulate_batch
+from rpg_game.catalog import default_catalog
+from rpg_game.constants import PLAYER_INITIAL_DAMAGE, PLAYER_INITIAL_HEALTH
+from rpg_game.rng import derive_seed
+from rpg_game.sim import CombatantSpec, boss_spec, run_duels
+
+# Trials per shard. Fixed so that shard boundaries (and therefore the random
+# streams) do not depend on the number of workers.
+DEFAULT_CHUNK_SIZE = 100_000
+
+# z-score for a 95% confidence interval
+Z_95 = 1.959963984540054
+
+Shard = Tuple[CombatantSpec, CombatantSpec, int, int]
+
+
+class MatchupResult(NamedTuple):
+    """Merged statistics for one weapon-versus-boss matchup."""
+
+    weapon: str
+    boss: str
+    trials: int
+    wins: int
+    total_turns: int
+    ci_low: float
+    ci_high: float
+
+    @property
+    def win_rate(self) -> float:
+        """Fraction of trials won by the player."""
+        return self.wins / self.trials if self.trials else 0.0
+
+    @property
+    def mean_turns(self) -> float:
+        """Average fight length in turns."""
+        return self.total_turns / self.trials if self.trials else 0.0
+
+
+def wilson_interval(wins: int, trials: int, z: float = Z_95) -> Tuple[float, float]:
+    """
+    Compute the Wilson score confidence interval for a win rate.
+
+    Args:
+        wins: Number of successes
+        trials: Number of trials
+        z: z-score of the desired confidence level
+
+    Returns:
+        Tuple[float, float]: Lower and upper bound of the interval
+    """
+    if trials == 0:
+        return 0.0, 1.0
+    p = wins / trials
+    z2 = z * z
+    denominator = 1 + z2 / trials
+    centre = (p + z2 / (2 * trials)) / denominator
+    margin = (
+        z * math.sqrt(p * (1 - p) / trials + z2 / (4 * trials * trials)) / denominator
+    )
+    return max(0.0, centre - margin), min(1.0, centre + margin)
+
+
+def shard_seed(master_seed: int, matchup: int, shard: int) -> int:
+    """
+    Derive the seed of one shard from the master seed.
+
+    Args:
+        master_seed: Seed of the whole tournament
+        matchup: Index of the matchup
+        shard: Index of the shard within the matchup
+
+    Returns:
+        int: A 64-bit seed unique to this shard
+    """
+    return derive_seed(derive_seed(master_seed, matchup), shard)
+
+
+def _run_shard(shard: Shard) -> Tuple[int, int]:
+    """Run one shard and return ``(wins, total_turns)``."""
+    player, boss, trials, seed = shard
+    if np is not None:
+        result = simulate_batch(player, boss, trials, seed=seed)
+        return result.wins, int(result.turns.sum())
+    wins = turns = 0
+    for duel in run_duels(player, boss, trials, seed=seed):
+        wins += duel.player_won
+        turns += duel.turns
+    return wins, turns
+
+
+def default_matchups() -> List[Tuple[CombatantSpec, CombatantSpec]]:
+    """
+    Build every starting-weapon versus campaign-boss matchup.
+
+    Both lists come from the default catalog.
+
+    Returns:
+        List of (player, boss) spec pairs
+    """
+    catalog = default_catalog()
+    return [
+        (
+            CombatantSpec(
+                weapon.name, PLAYER_INITIAL_HEALTH, PLAYER_INITIAL_DAMAGE, weapon.damage
+            ),
+            boss_spec(boss.name, boss.health, boss.damage),
+        )
+        for weapon in catalog.starting_weapons()
+        for boss in catalog.campaign()
+    ]
+
+
+def _shards(
+    matchups: Sequence[Tuple[CombatantSpec, CombatantSpec]],
+    trials: int,
+    seed: int,
+    chunk_size: int,
+) -> Iterable[Tuple[int, Shard]]:
+    """Yield ``(matchup_index, shard)`` pairs covering every trial."""
+    for index, (player, boss) in enumerate(matchups):
+        for shard, start in enumerate(range(0, trials, chunk_size)):
+            size = min(chunk_size, trials - start)
+            yield index, (player, boss, size, shard_seed(seed, index, shard))
+
+
+def run_tournament(
+    trials: int = 1_000_000,
+    seed: int = 0,
+    workers: Optional[int] = None,
+    matchups: Optional[Sequence[Tuple[CombatantSpec, CombatantSpec]]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> List[MatchupResult]:
+    """
+    Simulate every matchup and merge the results.
+
+    Args:
+        trials: Number of fights per matchup
+        seed: Master seed; results are identical for any ``workers`` value
+        workers: Number of worker processes (None uses all cores, 1 runs inline)
+        matchups: Optional (player, boss) pairs; defaults to all weapon x boss pairs
+        chunk_size: Number of trials per shard
+
+    Returns:
+        List[MatchupResult]: One entry per matchup, in matchup order
+    """
+    if matchups is None:
+        matchups = default_matchups()
+    indices, shards = [], []
+    for index, shard in _shards(matchups, trials, seed, chunk_size):
+        indices.append(index)
+        shards.append(shard)
+
+    if workers == 1:
+        outcomes = list(map(_run_shard, shards))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(_run_shard, shards))
+
+    wins = [0] * len(matchups)
+    turns = [0] * len(matchups)
+    for index, (shard_wins, shard_turns) in zip(indices, outcomes):
+        wins[index] += shard_wins
+        turns[index] += shard_turns
+
+    results = []
+    for index, (player, boss) in enumerate(matchups):
+        low, high = wilson_interval(wins[index], trials)
+        results.append(
+            MatchupResult(
+                player.name, boss.name, trials, wins[index], turns[index], low, high
+            )
+        )
+    return results
+
+
+def format_table(results: Sequence[MatchupResult]) -> str:
+    """
+    Format tournament results as a plain-text table.
+
+    Args:
+        results: Results returned by run_tournament
+
+    Returns:
+        str: The formatted table
+    """
+    lines = [f"{'Weapon':<10} {'Boss':<15} {'Win rate':>9} {'95% CI':>19} {'Turns':>6}"]
+    lines.append("-" * len(lines[0]))
+    for r in results:
+        lines.append(
+            f"{r.weapon:<10} {r.boss:<15} {r.win_rate:>9.4f} "
+            f"[{r.ci_low:.4f}, {r.ci_high:.4f}] {r.mean_turns:>6.2f}"
+        )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    print(format_table(run_tournament()))
@@ -13,6 +13,8 @@ class Weapon:
     
     This class is used in composition with the Character class.
     """
+
+    __slots__ = ('name', 'damage_bonus')
     
     def __init__(self, name: str, damage_bonus: int) -> None:
         """
@@ -1,10 +1,66 @@
 """
 Pytest configuration and fixtures for testing the RPG game.
 """
+import importlib
 import pytest
 from rpg_game.character import Character
 from rpg_game.boss import Boss
 from rpg_game.weapon import Weapon
+from rpg_game.damage import FIXED_RULES
+from rpg_game.game_io import NullIO
+
+@pytest.fixture(autouse=True)
+def isolated_home(tmp_path_factory, monkeypatch):
+    """Point the home directory away from the developer's real saves and caches."""
+    home = tmp_path_factory.mktemp("home")
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("USERPROFILE", str(home))
+    # Undo set_save_paths calls; ``rpg_game.save_game`` is also a function name
+    save_game_module = importlib.import_module("rpg_game.save_game")
+    monkeypatch.setattr(save_game_module, "_SAVE_DIR", None)
+    monkeypatch.setattr(save_game_module, "_SAVE_FILE", None)
+    return home
+
+@pytest.fixture
+def roll_for():
+    """Return a function giving a uniform roll that samples a table's outcome."""
+    def roll(table, outcome):
+        for index in range(table.size):
+            # Rolls in [index, cutoff) take the slot's own outcome, the rest its alias
+            if table.outcomes[index] == outcome and table.cutoff[index] > index:
+                return index / table.size
+            if table.alias[index] == outcome and table.cutoff[index] < index + 1:
+                return (table.cutoff[index] + index + 1) / 2 / table.size
+        raise ValueError(f"{outcome} is not an outcome of the table")
+    return roll
+
+@pytest.fixture
+def fighter():
+    """Return a function creating a quiet character with fixed damage."""
+    def make(name, health=100, damage=10):
+        return Character(name, health, damage, rules=FIXED_RULES, io=NullIO())
+    return make
+
+@pytest.fixture
+def make_state():
+    """Return a function building a save state like ``Game.get_game_state``."""
+    def make(name="Hero", health=110, bosses=2, weapon="Rock"):
+        # ``bosses`` is a count or a sequence of (name, health) pairs
+        if isinstance(bosses, int):
+            bosses = [(f"Boss {i % 7}", 50 + i) for i in range(bosses)]
+        return {
+            "player": {
+                "name": name,
+                "health": health,
+                "damage": 10,
+                "weapon": {"name": weapon, "damage_bonus": 2 if weapon else 0},
+            },
+            "bosses": [
+                {"name": boss, "health": boss_health, "damage": 8}
+                for boss, boss_health in bosses
+            ],
+        }
+    return make
 
 @pytest.fixture
 def sample_weapon():
@@ -13,13 +69,13 @@ def sample_weapon():
 
 @pytest.fixture
 def sample_character():
-    """Create a sample character for testing."""
-    return Character("Test Hero", 100, 10, "Test Weapon", 5)
+    """Create a sample character for testing (fixed damage)."""
+    return Character("Test Hero", 100, 10, "Test Weapon", 5, rules=FIXED_RULES)
 
 @pytest.fixture
 def sample_boss():
-    """Create a sample boss for testing."""
-    return Boss("Test Boss", 150, 15)
+    """Create a sample boss for testing (fixed damage apart from specials)."""
+    return Boss("Test Boss", 150, 15, rules=FIXED_RULES)
 
 @pytest.fixture
 def game_instance():
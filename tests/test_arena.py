@@ -0,0 +1,148 @@
+"""
+Tests for arena battles and their initiative scheduler.
+"""
+import functools
+import json
+import random
+from collections import Counter
+
+import pytest
+
+from rpg_game.__main__ import main
+from rpg_game.arena import INITIATIVE_SCALE, Arena, build_arena
+from rpg_game.benchmarks.arena import build, measure
+from rpg_game.boss import Boss
+from rpg_game.character import Character
+from rpg_game.constants import BOSS_SPEED, PLAYER_SPEED
+from rpg_game.game_io import NullIO
+
+
+@pytest.fixture
+def fighter(fighter):
+    """Arena fighters default to 1000 health and 1 damage, so battles run long."""
+    return functools.partial(fighter, health=1000, damage=1)
+
+
+class TestScheduler:
+    """Test cases for initiative order."""
+
+    def test_speed_sets_action_rate(self, fighter):
+        """Test that entities act in proportion to their speed."""
+        arena = Arena(rng=random.Random(0))
+        arena.add(fighter("Fast"), "a", speed=6)
+        arena.add(fighter("Slow"), "b", speed=2)
+        counts = Counter(arena.step().attacker.name for _ in range(800))
+        assert counts == {"Fast": 600, "Slow": 200}
+
+    def test_ticks_never_go_back(self):
+        """Test that actions come out in initiative order."""
+        arena = build(200)
+        ticks = [arena.step().tick for _ in range(2000)]
+        assert ticks == sorted(ticks)
+
+    def test_ties_keep_insertion_order(self, fighter):
+        """Test that equally fast entities act in the order they joined."""
+        arena = Arena(rng=random.Random(0))
+        for name in ("A", "B", "C"):
+            arena.add(fighter(name), "a")
+        arena.add(fighter("D"), "b")
+        names = [arena.step().attacker.name for _ in range(8)]
+        assert names == ["A", "B", "C", "D"] * 2
+
+    def test_default_speeds(self, fighter):
+        """Test that characters and bosses bring their own speeds."""
+        assert Character("Hero", 10, 1).speed == PLAYER_SPEED
+        assert Boss("Boss", 10, 1).speed == BOSS_SPEED
+        arena = Arena()
+        arena.add(fighter("Hero"), "a")
+        assert arena.step() is None
+        assert arena._queue[0][0] == INITIATIVE_SCALE // PLAYER_SPEED
+
+    def test_rejects_bad_speed(self, fighter):
+        """Test that speeds must be positive."""
+        with pytest.raises(ValueError):
+            Arena().add(fighter("Hero"), "a", speed=0)
+
+
+class TestBattle:
+    """Test cases for fighting battles."""
+
+    def test_defeated_entities_stop_acting(self, fighter):
+        """Test that the defeated are neither attacked nor act again."""
+        arena = Arena(rng=random.Random(3))
+        heroes = [fighter(f"Hero {i}", health=5, damage=5) for i in range(10)]
+        bosses = [fighter(f"Boss {i}", health=5, damage=5) for i in range(10)]
+        arena.add_many(heroes, "heroes")
+        arena.add_many(bosses, "bosses")
+        defeated = set()
+        while True:
+            action = arena.step()
+            if action is None:
+                break
+            assert action.attacker.name not in defeated
+            assert action.target.name not in defeated
+            if action.defeated:
+                defeated.add(action.target.name)
+        assert arena.over
+        assert len(defeated) == 20 - arena.alive("heroes") - arena.alive("bosses")
+
+    def test_run_reports_winner(self, fighter):
+        """Test the result of a decided battle."""
+        arena = Arena(rng=random.Random(0))
+        arena.add(fighter("Giant", health=100, damage=10), "giants")
+        arena.add_many([fighter(f"Imp {i}", health=10) for i in range(5)], "imps")
+        result = arena.run()
+        assert result.winner == "giants"
+        assert result.survivors == {"giants": 1, "imps": 0}
+        assert result.actions == arena.actions
+        assert arena.step() is None
+
+    def test_max_actions(self):
+        """Test that a battle can be stopped early."""
+        result = build(50).run(max_actions=30)
+        assert result.actions == 30
+        assert result.winner is None
+
+    def test_three_teams(self, fighter):
+        """Test a free-for-all between more than two teams."""
+        arena = Arena(rng=random.Random(1))
+        for team in ("red", "green", "blue"):
+            arena.add_many(
+                [fighter(f"{team} {i}", health=20, damage=3) for i in range(4)], team
+            )
+        result = arena.run()
+        assert result.winner in ("red", "green", "blue")
+        assert sum(result.survivors.values()) == result.survivors[result.winner] > 0
+
+    def test_reproducible(self):
+        """Test that a seeded battle plays out the same way twice."""
+        first = build_arena(40, 8, seed=7, io=NullIO()).run()
+        second = build_arena(40, 8, seed=7, io=NullIO()).run()
+        assert first == second
+        assert first.winner is not None
+
+    def test_logger(self, fighter, mocker):
+        """Test that attacks are logged."""
+        logger = mocker.Mock()
+        arena = Arena(rng=random.Random(0), logger=logger)
+        arena.add(fighter("A"), "a")
+        arena.add(fighter("B"), "b")
+        arena.run(max_actions=4)
+        assert logger.log_combat.call_count == 4
+
+
+class TestCommand:
+    """Test cases for the arena subcommand and its benchmark."""
+
+    def test_subcommand(self, capsys):
+        """Test that the subcommand prints the result as JSON."""
+        main(["arena", "--heroes", "30", "--bosses", "5", "--seed", "2"])
+        result = json.loads(capsys.readouterr().out)
+        assert result["winner"] in ("heroes", "bosses")
+        assert result["actions"] > 0
+
+    def test_benchmark(self):
+        """Test that the benchmark reports every size."""
+        results = measure(sizes=(10, 100), actions=200, repeat=1)
+        assert [result["entities"] for result in results] == [10, 100]
+        assert all(result["action_ns"] > 0 for result in results)
@@ -0,0 +1,69 @@
+"""
+Tests for the vectorized batch simulator.
+"""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from rpg_game.batch_sim import simulate_batch
+from rpg_game.damage import FIXED_RULES
+from rpg_game.sim import CombatantSpec, boss_spec, run_duels
+from rpg_game.solver import solve
+
+
+class TestBatchSim:
+    """Test cases for simulate_batch."""
+
+    def test_deterministic_fights(self):
+        """Test fights whose outcome does not depend on the dice."""
+        result = simulate_batch(
+            CombatantSpec("Hero", 100, 100),
+            boss_spec("Boss", 50, 1),
+            1000,
+            seed=1,
+            rules=FIXED_RULES,
+        )
+        assert result.fights == 1000
+        assert result.wins == 1000
+        assert (result.turns == 1).all()
+        assert (result.player_damage_dealt == 50).all()
+        assert (result.boss_damage_dealt == 0).all()
+
+    def test_seed_is_reproducible(self):
+        """Test that the same seed gives the same batch."""
+        player = CombatantSpec("Hero", 110, 10, 4)
+        boss = boss_spec("Boss", 60, 20)
+        first = simulate_batch(player, boss, 500, seed=3)
+        second = simulate_batch(player, boss, 500, seed=3)
+        assert (first.turns == second.turns).all()
+        assert (first.player_health == second.player_health).all()
+
+    def test_matches_scalar_distribution(self):
+        """Test that batch and scalar paths agree statistically."""
+        # Player needs 5 hits; the boss wins if any of its 4 attacks is special
+        player = CombatantSpec("Hero", 110, 10, 4)
+        boss = boss_spec("Boss", 60, 20)
+        exact = 0.75**4
+        n = 100_000
+        tolerance = 5 * (exact * (1 - exact) / n) ** 0.5
+
+        batch = simulate_batch(player, boss, n, seed=11, rules=FIXED_RULES)
+        scalar = list(run_duels(player, boss, n, seed=11, rules=FIXED_RULES))
+        scalar_rate = sum(r.player_won for r in scalar) / n
+        scalar_turns = sum(r.turns for r in scalar) / n
+
+        assert batch.win_rate == pytest.approx(exact, abs=tolerance)
+        assert scalar_rate == pytest.approx(exact, abs=tolerance)
+        assert batch.mean_turns == pytest.approx(scalar_turns, abs=0.02)
+        assert set(np.unique(batch.player_health)) == {r.player_health for r in scalar}
+
+    def test_damage_rolls_match_solver(self):
+        """Test that batch fights with dodges, variance and crits match exact odds."""
+        player = CombatantSpec("Hero", 110, 10, 2)
+        boss = boss_spec("Boss", 70, 12)
+        exact = solve(player, boss)
+        n = 100_000
+        batch = simulate_batch(player, boss, n, seed=2)
+        tolerance = 5 * (exact.win_probability * (1 - exact.win_probability) / n) ** 0.5
+        assert batch.win_rate == pytest.approx(exact.win_probability, abs=tolerance)
+        assert batch.mean_turns == pytest.approx(exact.expected_turns, abs=0.03)
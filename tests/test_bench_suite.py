@@ -0,0 +1,85 @@
+"""
+Tests for the hot-path benchmark suite.
+"""
+import json
+
+import pytest
+
+from rpg_game.__main__ import COMMANDS
+from rpg_game.benchmarks.suite import (
+    BENCHMARKS,
+    bench_main,
+    compare,
+    run_suite,
+    time_function,
+)
+from rpg_game.save_game import set_save_backend
+
+
+def fake_results(**medians):
+    return {
+        "benchmarks": {name: {"median": median} for name, median in medians.items()}
+    }
+
+
+class TestBenchSuite:
+    """Test cases for the benchmark suite."""
+
+    def test_time_function(self):
+        """Test that timings are summarized per call."""
+        stats = time_function(lambda: None, repeat=3, warmup=1, min_time=0.001)
+        assert stats["repeat"] == 3
+        assert stats["number"] >= 1
+        assert 0 < stats["min"] <= stats["median"]
+        assert stats["ops_per_sec"] > 0
+
+    def test_run_suite(self):
+        """Test that every benchmark runs and restores global state."""
+        results = run_suite(repeat=2, warmup=0, min_time=0.001)
+        assert list(results["benchmarks"]) == [
+            benchmark.name for benchmark in BENCHMARKS
+        ]
+        assert set_save_backend(None) is None
+
+    def test_unknown_benchmark(self):
+        """Test that unknown benchmark names are rejected."""
+        with pytest.raises(ValueError):
+            run_suite(["nope"])
+
+    def test_compare(self):
+        """Test regression detection against a baseline."""
+        comparison = compare(
+            fake_results(a=1.2, b=1.05, c=1.0),
+            fake_results(a=1.0, b=1.0),
+            threshold=0.1,
+        )
+        assert comparison["a"]["regressed"] == 1.0
+        assert comparison["b"]["regressed"] == 0.0
+        assert "c" not in comparison
+
+    def test_bench_main_fails_on_regression(self, tmp_path, capsys):
+        """Test that the command writes JSON and exits non-zero on regressions."""
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(json.dumps(fake_results(health_setter=1e-12)))
+        output = tmp_path / "results.json"
+        with pytest.raises(SystemExit) as excinfo:
+            bench_main(
+                [
+                    "health_setter",
+                    "--repeat",
+                    "2",
+                    "--min-time",
+                    "0.001",
+                    "--baseline",
+                    str(baseline),
+                    "--output",
+                    str(output),
+                ]
+            )
+        assert excinfo.value.code == 1
+        assert json.loads(output.read_text())["regressions"] == ["health_setter"]
+        assert json.loads(capsys.readouterr().out)["benchmarks"]["health_setter"]
+
+    def test_registered_command(self):
+        """Test that the suite is available as ``python -m rpg_game bench``."""
+        assert COMMANDS["bench"] == ("rpg_game.benchmarks.suite", "bench_main")
@@ -8,14 +8,15 @@ from rpg_game.boss import Boss
 from rpg_game.character import Character
 from rpg_game.weapon import Weapon
 from rpg_game.game_logger import GameLogger
+from rpg_game.damage import FIXED_RULES, boss_table
 
 @pytest.fixture
 def sample_boss():
-    return Boss("Test Boss", 200, 15)
+    return Boss("Test Boss", 200, 15, rules=FIXED_RULES)
 
 @pytest.fixture
 def sample_character():
-    return Character("Test Character", 100, 10)
+    return Character("Test Character", 100, 10, rules=FIXED_RULES)
 
 class TestBoss:
     """Test cases for the Boss class."""
@@ -30,10 +31,10 @@ class TestBoss:
         assert sample_boss.weapon.damage_bonus == 5  # Boss weapon bonus
 
     @patch('random.random')
-    def test_attack_normal(self, mock_random, sample_boss, sample_character):
+    def test_attack_normal(self, mock_random, sample_boss, sample_character, roll_for):
         """Test normal boss attack."""
         # Setup
-        mock_random.return_value = 0.8  # Not a special attack (0.8 > 0.25)
+        mock_random.return_value = roll_for(boss_table(20, FIXED_RULES), (20, False))
         logger = Mock()
         
         # Mock take_damage to track actual damage
@@ -55,12 +56,12 @@ class TestBoss:
         assert damage == expected_damage
 
     @patch('random.random')
-    def test_boss_attack_special(self, mock_random):
+    def test_boss_attack_special(self, mock_random, roll_for):
         """Test boss special attack."""
-        # Mock random.random to trigger special attack (0.1 < 0.25)
-        mock_random.return_value = 0.1
+        # Mock random.random to trigger the special attack
+        mock_random.return_value = roll_for(boss_table(25, FIXED_RULES), (37, True))
         
-        boss = Boss("Dragon", 200, 20)
+        boss = Boss("Dragon", 200, 20, rules=FIXED_RULES)
         enemy = Character("Hero", 100, 10)
         logger = Mock()
         
@@ -83,12 +84,12 @@ class TestBoss:
         assert damage == expected_damage
     
     @patch('random.random')
-    def test_boss_attack_with_logger(self, mock_random):
+    def test_boss_attack_with_logger(self, mock_random, roll_for):
         """Test boss attack with logger."""
         # Mock random.random to trigger special attack
-        mock_random.return_value = 0.1
+        mock_random.return_value = roll_for(boss_table(25, FIXED_RULES), (37, True))
     
-        boss = Boss("Dragon", 200, 20)
+        boss = Boss("Dragon", 200, 20, rules=FIXED_RULES)
         enemy = Character("Hero", 100, 10)
         logger = GameLogger()
     
@@ -0,0 +1,288 @@
+"""
+Tests for the content catalog and its compiled cache.
+"""
+import json
+import os
+
+import pytest
+
+from rpg_game import catalog as catalog_module
+from rpg_game.benchmarks.catalog import measure, synthetic_content
+from rpg_game.boss import Boss
+from rpg_game.catalog import (
+    HEADER,
+    MAGIC,
+    BossEntry,
+    WeaponEntry,
+    cache_path,
+    compile_catalog,
+    decode_catalog,
+    default_catalog,
+    encode_catalog,
+    load_catalog,
+)
+from rpg_game.game import Game
+from rpg_game.game_io import NullIO
+
+CONTENT = {
+    "weapons": [
+        {"name": "Stick", "damage": 1, "description": "A stick.", "starter": True},
+        {"name": "Ñandú feather", "damage": 7, "description": "Très légère."},
+        {"name": "Axe", "damage": 5, "starter": True},
+    ],
+    "bosses": [
+        {"name": "Second", "health": 20, "damage": 3, "level": 2},
+        {
+            "name": "First",
+            "health": 10,
+            "damage": 2,
+            "level": 1,
+            "intro": "Hello {player}!",
+        },
+    ],
+}
+
+
+def write_content(path, content=CONTENT):
+    """Write content as JSON and return the path."""
+    path.write_text(json.dumps(content), encoding="utf-8")
+    return path
+
+
+class TestCompile:
+    """Test cases for compiling content into a catalog."""
+
+    def test_lookups(self):
+        """Test lookups by id and by name."""
+        catalog = compile_catalog(CONTENT)
+        assert catalog.weapon_count == 3
+        assert catalog.boss_count == 2
+        assert catalog.weapon(catalog.weapon_id("Axe")) == WeaponEntry(2, "Axe", 5, "")
+        assert catalog.boss(catalog.boss_id("First")) == BossEntry(
+            1, "First", 10, 2, 1, "Hello {player}!"
+        )
+        assert catalog.find_boss("Nobody") is None
+        with pytest.raises(KeyError):
+            catalog.weapon_id("Nothing")
+
+    def test_starters_and_campaign(self):
+        """Test starters keep file order and the campaign defaults to level order."""
+        catalog = compile_catalog(CONTENT)
+        assert [weapon.name for weapon in catalog.starting_weapons()] == [
+            "Stick",
+            "Axe",
+        ]
+        assert [boss.name for boss in catalog.campaign()] == ["First", "Second"]
+        explicit = compile_catalog(dict(CONTENT, campaign=["Second"]))
+        assert [boss.name for boss in explicit.campaign()] == ["Second"]
+
+    def test_level_is_optional(self):
+        """Test that bosses without a level sort first at level 0."""
+        content = dict(
+            CONTENT,
+            bosses=CONTENT["bosses"] + [{"name": "Zero", "health": 1, "damage": 1}],
+        )
+        catalog = compile_catalog(content)
+        assert [boss.name for boss in catalog.campaign()] == ["Zero", "First", "Second"]
+        assert catalog.boss(catalog.boss_id("Zero")).level == 0
+
+    def test_invalid_content(self):
+        """Test duplicate names and unknown campaign bosses are rejected."""
+        with pytest.raises(ValueError):
+            compile_catalog({"weapons": CONTENT["weapons"] * 2})
+        with pytest.raises(ValueError):
+            compile_catalog(dict(CONTENT, campaign=["Nobody"]))
+
+    def test_names_are_shared(self):
+        """Test that the index and the name column hold the same string objects."""
+        catalog = compile_catalog(CONTENT)
+        for name in catalog.boss_names:
+            assert catalog.boss(catalog.boss_id(name)).name is name
+
+
+class TestEncoding:
+    """Test cases for the binary cache format."""
+
+    def test_round_trip(self):
+        """Test that a decoded catalog matches the original."""
+        catalog = compile_catalog(CONTENT)
+        data = encode_catalog(catalog)
+        assert data.startswith(MAGIC)
+        decoded = decode_catalog(data)
+        assert [decoded.weapon(i) for i in range(3)] == [
+            catalog.weapon(i) for i in range(3)
+        ]
+        assert decoded.campaign() == catalog.campaign()
+        assert decoded.starting_weapons() == catalog.starting_weapons()
+
+    def test_empty_catalog(self):
+        """Test that a catalog without entries round-trips."""
+        decoded = decode_catalog(encode_catalog(compile_catalog({})))
+        assert decoded.weapon_count == decoded.boss_count == 0
+
+    def test_rejects_bad_data(self):
+        """Test that foreign or truncated data raises ValueError."""
+        data = encode_catalog(compile_catalog(CONTENT))
+        with pytest.raises(ValueError):
+            decode_catalog(b"NOTACAT!" + data[8:])
+        for end in range(len(data)):
+            with pytest.raises(ValueError):
+                decode_catalog(data[:end])
+
+
+class TestLoad:
+    """Test cases for loading with the on-disk cache."""
+
+    def test_writes_and_uses_cache(self, tmp_path, mocker):
+        """Test that the second load decodes the cache without parsing."""
+        source = write_content(tmp_path / "content.json")
+        first = load_catalog(source, cache_dir=tmp_path / "cache")
+        assert cache_path(source, tmp_path / "cache").exists()
+        compile_spy = mocker.spy(catalog_module, "compile_catalog")
+        second = load_catalog(source, cache_dir=tmp_path / "cache")
+        assert compile_spy.call_count == 0
+        assert second.campaign() == first.campaign()
+
+    def test_touched_source_checks_hash(self, tmp_path, mocker):
+        """Test that a new mtime with the same contents reuses the cache."""
+        source = write_content(tmp_path / "content.json")
+        load_catalog(source, cache_dir=tmp_path)
+        stat = os.stat(source)
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+        compile_spy = mocker.spy(catalog_module, "compile_catalog")
+        load_catalog(source, cache_dir=tmp_path)
+        assert compile_spy.call_count == 0
+
+    def test_changed_source_recompiles(self, tmp_path):
+        """Test that edited content invalidates the cache."""
+        source = write_content(tmp_path / "content.json")
+        load_catalog(source, cache_dir=tmp_path)
+        changed = json.loads(json.dumps(CONTENT))
+        changed["weapons"][0]["damage"] = 99
+        write_content(source, changed)
+        stat = os.stat(source)
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+        catalog = load_catalog(source, cache_dir=tmp_path)
+        assert catalog.weapon(catalog.weapon_id("Stick")).damage == 99
+
+    def test_corrupt_cache_recompiles(self, tmp_path):
+        """Test that a damaged cache file is replaced."""
+        source = write_content(tmp_path / "content.json")
+        cached = cache_path(source, tmp_path)
+        cached.write_bytes(b"garbage")
+        catalog = load_catalog(source, cache_dir=tmp_path)
+        assert catalog.boss_count == 2
+        assert cached.read_bytes().startswith(MAGIC)
+
+    @pytest.mark.parametrize("touched", [False, True])
+    @pytest.mark.parametrize("keep", [HEADER.size + 2, -1])
+    def test_truncated_cache_recompiles(self, tmp_path, touched, keep):
+        """Test that a cache cut short, after a valid header, is replaced."""
+        source = write_content(tmp_path / "content.json")
+        load_catalog(source, cache_dir=tmp_path)
+        cached = cache_path(source, tmp_path)
+        cached.write_bytes(cached.read_bytes()[:keep])
+        if touched:
+            stat = os.stat(source)
+            os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+        assert load_catalog(source, cache_dir=tmp_path).boss_count == 2
+        assert decode_catalog(cached.read_bytes()).boss_count == 2
+
+    def test_unwritable_cache_is_skipped(self, tmp_path):
+        """Test that loading works when the cache directory cannot be created."""
+        source = write_content(tmp_path / "content.json")
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        assert load_catalog(source, cache_dir=blocker / "cache").weapon_count == 3
+
+
+class TestDefaultCatalog:
+    """Test cases for the bundled content and its use by Game."""
+
+    def test_bundled_content(self):
+        """Test the bundled starting weapons and campaign."""
+        catalog = load_catalog(use_cache=False)
+        assert [(w.name, w.damage) for w in catalog.starting_weapons()] == [
+            ("Rock", 2),
+            ("Paper", 3),
+            ("Scissors", 4),
+        ]
+        assert [(b.name, b.health, b.damage) for b in catalog.campaign()] == [
+            ("Goblin King", 50, 8),
+            ("Dark Sorcerer", 60, 9),
+        ]
+
+    def test_environment_override(self, tmp_path, monkeypatch):
+        """Test that RPG_CATALOG selects custom content."""
+        source = write_content(tmp_path / "content.json")
+        monkeypatch.setenv("RPG_CATALOG", str(source))
+        monkeypatch.setenv("RPG_CACHE_DIR", str(tmp_path / "cache"))
+        monkeypatch.setattr(catalog_module, "_default", None)
+        assert default_catalog().boss_count == 2
+        assert any((tmp_path / "cache").iterdir())
+
+    def test_game_uses_catalog(self, mocker):
+        """Test that Game builds its bosses and menus from its catalog."""
+        io = NullIO()
+        game = Game(io=io, catalog=compile_catalog(CONTENT))
+        mocker.patch.object(io, "read_line", side_effect=["2", ""])
+        game.setup_game("Hero")
+        assert game.player.weapon.name == "Axe"
+        assert game.player.weapon.damage_bonus == 5
+        assert [(b.name, b.health) for b in game.bosses] == [
+            ("First", 10),
+            ("Second", 20),
+        ]
+
+    def test_intro_and_level(self, mocker):
+        """Test intros and levels come from the catalog."""
+        game = Game(catalog=compile_catalog(CONTENT))
+        mocker.patch("builtins.input", return_value="")
+        mocker.patch("rpg_game.game_io.clear_screen")
+        printed = mocker.patch("builtins.print")
+        game.player = Boss("Hero", 10, 1)
+        game.introduce_boss(Boss("First", 10, 2))
+        game.introduce_boss(Boss("Stranger", 10, 2))
+        output = " ".join(
+            str(arg) for call in printed.call_args_list for arg in call.args
+        )
+        assert "Hello Hero!" in output
+        assert "A new boss appears!" in output
+        enemy = Boss("Second", 20, 3)
+        frame = game._combat_frame(game.player, enemy, {"Hero": 10, "Second": 20}, 1.0)
+        assert "LEVEL 2: Second" in frame.lines()[2]
+
+    def test_intro_with_braces(self, mocker):
+        """Test that braces other than ``{player}`` are printed as written."""
+        content = dict(
+            CONTENT,
+            bosses=[
+                {
+                    "name": "Brace",
+                    "health": 1,
+                    "damage": 1,
+                    "intro": "{player} meets {the} {0} }{",
+                }
+            ],
+        )
+        io = NullIO()
+        printed = mocker.patch.object(io, "print")
+        game = Game(io=io, catalog=compile_catalog(content))
+        game.player = Boss("Hero", 10, 1)
+        game.introduce_boss(Boss("Brace", 1, 1))
+        assert mocker.call("Hero meets {the} {0} }{") in printed.call_args_list
+
+
+class TestBenchmark:
+    """Test cases for the catalog benchmark."""
+
+    def test_synthetic_content_compiles(self):
+        """Test that the synthetic content is valid."""
+        catalog = compile_catalog(synthetic_content(20))
+        assert catalog.boss_count == 20
+        assert len(catalog.starting_weapons()) == 3
+
+    def test_cached_load_is_faster(self, tmp_path):
+        """Test that reloading from the cache beats compiling."""
+        results = measure(entries=20_000, repeat=2, directory=tmp_path)
+        assert results["cached_load_ms"] < results["compile_ms"]
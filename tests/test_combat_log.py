@@ -0,0 +1,117 @@
+"""
+Tests for the binary combat log.
+"""
+import pytest
+
+from rpg_game.boss import Boss
+from rpg_game.character import Character
+from rpg_game.combat_log import (
+    HEADER,
+    RECORD,
+    BinaryLogSink,
+    CombatLogReader,
+    replay_main,
+)
+from rpg_game.game_logger import GameLogger
+from rpg_game.log_sinks import CRITICAL, FIGHT_START, BufferedLogWriter
+from rpg_game.rng import make_rng
+
+
+def write_fights(path, fights=2):
+    """Log a few real fights through GameLogger into a binary log."""
+    logger = GameLogger(writer=BufferedLogWriter(BinaryLogSink(str(path))))
+    players = []
+    for index in range(fights):
+        player = Character("Hero", 110, 10, "Rock", 2)
+        boss = Boss(f"Boss {index}", 60, 20, rng=make_rng(index))
+        logger.begin_fight(player, boss)
+        while player.is_alive and boss.is_alive:
+            player.attack(boss, logger)
+            if boss.is_alive:
+                boss.attack(player, logger)
+        players.append((player.health, boss.health))
+    logger.close()
+    return players
+
+
+class TestCombatLog:
+    """Test cases for the binary combat log."""
+
+    def test_record_layout(self):
+        """Test the fixed record and header sizes."""
+        assert RECORD.size == 32
+        assert HEADER.size == 32
+
+    def test_round_trip(self, tmp_path):
+        """Test writing records and reading them back."""
+        path = tmp_path / "combat.bin"
+        sink = BinaryLogSink(str(path))
+        sink.write_batch(
+            [
+                (1.0, "Hero", "Goblin", 110, FIGHT_START),
+                (1.0, "Goblin", "Hero", 50, FIGHT_START),
+                (2.0, "Hero", "Goblin", 12, False),
+                (3.0, "Goblin", "Hero", 19, CRITICAL),
+            ]
+        )
+        sink.close()
+
+        with CombatLogReader(str(path)) as reader:
+            assert len(reader) == 4
+            assert reader.names == ["Hero", "Goblin"]
+            last = reader[-1]
+            assert reader.name(last.attacker) == "Goblin"
+            assert last.damage == 19
+            assert last.is_critical
+            assert [r.timestamp for r in reader] == [1.0, 1.0, 2.0, 3.0]
+            with pytest.raises(IndexError):
+                reader[4]
+
+    def test_timeline_matches_fight(self, tmp_path):
+        """Test that replaying the log reproduces the final health."""
+        path = tmp_path / "combat.bin"
+        finals = write_fights(path, fights=3)
+        with CombatLogReader(str(path)) as reader:
+            assert len(reader.fight_ranges()) == 3
+            for index, (player_hp, boss_hp) in enumerate(finals):
+                last = reader.timeline(index)[-1]
+                assert last.health == {"Hero": player_hp, f"Boss {index}": boss_hp}
+
+    def test_numpy_view(self, tmp_path):
+        """Test the zero-copy structured-array view."""
+        np = pytest.importorskip("numpy")
+        path = tmp_path / "combat.bin"
+        write_fights(path)
+        with CombatLogReader(str(path)) as reader:
+            records = reader.as_array()
+            assert len(records) == len(reader)
+            assert records["damage"][2] == reader[2].damage
+            assert set(np.unique(records["fight"])) == {0, 1}
+            del records
+
+    def test_unclosed_log_is_readable(self, tmp_path):
+        """Test reading a log whose writer never wrote the string table."""
+        path = tmp_path / "combat.bin"
+        sink = BinaryLogSink(str(path))
+        sink.write_batch([(2.0, "Hero", "Goblin", 12, False)])
+        sink.flush()
+        with CombatLogReader(str(path)) as reader:
+            assert len(reader) == 1
+            assert reader.name(reader[0].attacker) == "#0"
+        sink.close()
+
+    def test_rejects_other_files(self, tmp_path):
+        """Test that non-log files are rejected."""
+        path = tmp_path / "notes.txt"
+        path.write_bytes(b"x" * 64)
+        with pytest.raises(ValueError):
+            CombatLogReader(str(path))
+
+    def test_replay_command(self, tmp_path, capsys):
+        """Test the replay command output."""
+        path = tmp_path / "combat.bin"
+        write_fights(path)
+        replay_main([str(path)])
+        assert "2 fights" in capsys.readouterr().out
+        replay_main([str(path), "--fight", "1"])
+        assert "Hero -> Boss 1" in capsys.readouterr().out
@@ -0,0 +1,162 @@
+"""
+Tests for streaming compression of saves and logs.
+"""
+import io
+import json
+import os
+import zlib
+
+import pytest
+
+from rpg_game.benchmarks.compression import measure, save_payload
+from rpg_game.compression import detect_codec, iter_chunks, iter_lines, open_compressed
+from rpg_game.log_sinks import RotatingFileSink
+from rpg_game.save_game import JsonFileBackend
+
+STATE = {
+    "player": {
+        "name": "Hero",
+        "health": 110,
+        "damage": 10,
+        "weapon": {"name": "Rock", "damage_bonus": 2},
+    },
+    "bosses": [{"name": "Goblin King", "health": 50, "damage": 8}] * 200,
+}
+
+
+class TestCompression:
+    """Test cases for the compression helpers."""
+
+    @pytest.mark.parametrize("codec", ["none", "zlib", "lzma"])
+    def test_round_trip(self, tmp_path, codec):
+        """Test writing and reading back each codec, detecting it on read."""
+        path = str(tmp_path / "data")
+        with open_compressed(path, "wt", codec, level=1) as f:
+            f.write("line one\nline two\n")
+        assert detect_codec(path) == codec
+        assert list(iter_lines(path)) == ["line one", "line two"]
+
+    def test_incremental_read(self, tmp_path):
+        """Test that chunks are bounded by the chunk size."""
+        path = str(tmp_path / "data.gz")
+        with open_compressed(path, "wb", "zlib") as f:
+            f.write(b"x" * 10000)
+        chunks = list(iter_chunks(path, chunk_size=1024))
+        assert max(len(chunk) for chunk in chunks) <= 1024
+        assert b"".join(chunks) == b"x" * 10000
+
+    @pytest.mark.parametrize("codec", ["zlib", "lzma"])
+    def test_wraps_open_file(self, codec):
+        """Test wrapping an open binary file, and that it needs a codec."""
+        buffer = io.BytesIO()
+        with open_compressed(buffer, "wb", codec) as f:
+            f.write(b"payload")
+        assert not buffer.closed
+        buffer.seek(0)
+        with open_compressed(buffer, "rb", codec) as f:
+            assert f.read() == b"payload"
+        for missing in (None, "none"):
+            with pytest.raises(ValueError):
+                open_compressed(io.BytesIO(), "rb", missing)
+
+    def test_invalid_codec(self, tmp_path):
+        """Test that unknown codecs and levels are rejected."""
+        with pytest.raises(ValueError):
+            JsonFileBackend(str(tmp_path / "save"), compression="bz2")
+        with pytest.raises(ValueError):
+            RotatingFileSink(str(tmp_path / "log"), compression="zlib", level=10)
+
+
+class TestCompressedSaves:
+    """Test cases for compressed JSON saves."""
+
+    @pytest.mark.parametrize("codec", ["zlib", "lzma"])
+    def test_save_load(self, tmp_path, codec):
+        """Test that compressed saves round-trip and are smaller."""
+        backend = JsonFileBackend(
+            str(tmp_path / "save.json"), compression=codec, level=9
+        )
+        backend.save(STATE)
+        assert backend.load() == STATE
+        plain = JsonFileBackend(str(tmp_path / "plain.json"))
+        plain.save(STATE)
+        assert (tmp_path / "save.json").stat().st_size * 10 < (
+            tmp_path / "plain.json"
+        ).stat().st_size
+
+    def test_reads_plain_save(self, tmp_path):
+        """Test that a compressing backend still reads an old plain save."""
+        path = tmp_path / "save.json"
+        path.write_text(json.dumps(STATE))
+        assert JsonFileBackend(str(path), compression="zlib").load() == STATE
+
+
+class TestCompressedLogs:
+    """Test cases for compressed combat logs."""
+
+    @pytest.mark.parametrize("codec", ["zlib", "lzma"])
+    def test_append_and_rotate(self, tmp_path, codec):
+        """Test that reopened and rotated compressed logs read back fully."""
+        path = tmp_path / "combat.log"
+        for _ in range(2):
+            sink = RotatingFileSink(str(path), max_bytes=0, compression=codec)
+            sink.write_batch([(0.0, "Hero", "Goblin", 3, False)] * 5)
+            sink.flush()
+            sink.close()
+        lines = list(iter_lines(str(path)))
+        assert len(lines) == 10
+        assert "Hero attacks Goblin for 3 damage" in lines[0]
+
+        sink = RotatingFileSink(
+            str(path), max_bytes=200, backup_count=1, compression=codec
+        )
+        for _ in range(5):
+            sink.write_batch([(0.0, "Hero", "Goblin", 3, False)] * 3)
+        sink.close()
+        assert detect_codec(str(path) + ".1") == codec
+
+    @pytest.mark.parametrize("codec", ["zlib", "lzma"])
+    def test_reopened_size_counts_disk_bytes(self, tmp_path, codec):
+        """Test that an existing compressed log counts toward max_bytes."""
+        path = tmp_path / "combat.log"
+        sink = RotatingFileSink(str(path), max_bytes=0, compression=codec)
+        sink.write_batch([(0.0, "Hero", "Goblin", 3, False)] * 5)
+        sink.close()
+        sink = RotatingFileSink(
+            str(path), max_bytes=os.path.getsize(path) - 1, compression=codec
+        )
+        sink.write_batch([(0.0, "Hero", "Goblin", 3, False)])
+        sink.close()
+        assert len(list(iter_lines(str(path) + ".1"))) == 5
+        assert len(list(iter_lines(str(path)))) == 1
+
+    def test_zlib_flush_reaches_disk(self, tmp_path):
+        """Test that a flushed zlib log can be decompressed before it is closed."""
+        path = tmp_path / "combat.log"
+        sink = RotatingFileSink(str(path), compression="zlib")
+        sink.write_batch([(0.0, "Hero", "Goblin", 3, False)] * 5)
+        sink.flush()
+        text = zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(path.read_bytes())
+        assert text.count(b"Hero attacks Goblin for 3 damage") == 5
+        sink.close()
+
+
+class TestCompressionBenchmark:
+    """Test cases for the compression benchmark."""
+
+    def test_measure(self):
+        """Test that every codec and level is reported for both payloads."""
+        result = measure(bosses=50, records=200, levels=[1])
+        assert set(result) == {"save", "log"}
+        for payload in result.values():
+            assert [(r["codec"], r["level"]) for r in payload["results"]] == [
+                ("zlib", 1),
+                ("lzma", 1),
+            ]
+            assert all(r["ratio"] > 1 for r in payload["results"])
+
+    def test_save_payload_matches_game_state(self):
+        """Test that the save payload has the get_game_state layout."""
+        state = json.loads(save_payload(bosses=3))
+        assert set(state) == {"player", "bosses"}
+        assert len(state["bosses"]) == 3
@@ -0,0 +1,169 @@
+"""
+Tests for damage-roll tables.
+"""
+import random
+from collections import Counter
+
+import pytest
+
+from rpg_game.boss import Boss
+from rpg_game.character import Character
+from rpg_game.constants import CombatConstants
+from rpg_game.damage import (
+    DEFAULT_RULES,
+    FIXED_RULES,
+    CombatRules,
+    boss_table,
+    build_table,
+    damage_table,
+    player_table,
+)
+from rpg_game.game_io import NullIO
+from rpg_game.weapon import Weapon
+
+
+def naive_roll(rng, base, rules=DEFAULT_RULES):
+    """Roll an attack mechanic by mechanic, as a reference."""
+    if rng.random() < rules.dodge_chance:
+        return 0
+    damage = round(base * rng.uniform(rules.min_multiplier, rules.max_multiplier))
+    if rng.random() < rules.critical_chance:
+        damage = int(damage * rules.critical_multiplier)
+    return damage
+
+
+class TestBuildTable:
+    """Test cases for building damage tables."""
+
+    def test_fixed_rules(self):
+        """Test that fixed rules leave a single outcome."""
+        table = build_table(12, rules=FIXED_RULES)
+        assert table.outcomes == [(12, False)]
+        assert table.distribution() == {12: 1.0}
+
+    def test_default_rules(self):
+        """Test dodge chance, damage range and critical hits."""
+        table = player_table(12)
+        distribution = table.distribution()
+        assert sum(distribution.values()) == pytest.approx(1.0)
+        assert distribution[0] == pytest.approx(CombatConstants.DODGE_CHANCE)
+        normal = [
+            damage for damage, critical in table.outcomes if damage and not critical
+        ]
+        assert min(normal) == 10 and max(normal) == 14
+        assert table.max_damage == 28
+        critical = sum(
+            p for (damage, flag), p in zip(table.outcomes, table.probabilities) if flag
+        )
+        assert critical == pytest.approx(
+            (1 - CombatConstants.DODGE_CHANCE) * CombatConstants.CRITICAL_HIT_CHANCE
+        )
+
+    def test_matches_naive_rolls(self):
+        """Test the table against rolling each mechanic separately."""
+        rng = random.Random(4)
+        n = 200_000
+        counts = Counter(naive_roll(rng, 13) for _ in range(n))
+        for damage, p in player_table(13).distribution().items():
+            assert counts[damage] / n == pytest.approx(p, abs=5 * (p / n) ** 0.5 + 1e-4)
+
+    def test_boss_special_attack(self):
+        """Test that boss tables include the special attack."""
+        table = boss_table(25, FIXED_RULES)
+        assert table.outcomes == [(25, False), (37, True)]
+        assert table.probabilities == pytest.approx([0.75, 0.25])
+
+    def test_custom_rules(self):
+        """Test that every rule is taken into account."""
+        rules = CombatRules(
+            critical_chance=1.0,
+            critical_multiplier=3.0,
+            dodge_chance=0.5,
+            min_multiplier=1.0,
+            max_multiplier=1.0,
+        )
+        assert build_table(4, rules=rules).distribution() == {0: 0.5, 12: 0.5}
+
+
+class TestSampling:
+    """Test cases for alias-table sampling."""
+
+    def test_frequencies(self):
+        """Test that samples follow the table's probabilities."""
+        table = boss_table(17)
+        rng = random.Random(1)
+        n = 200_000
+        counts = Counter(table.sample(rng.random) for _ in range(n))
+        for outcome, p in zip(table.outcomes, table.probabilities):
+            assert counts[outcome] / n == pytest.approx(
+                p, abs=5 * (p / n) ** 0.5 + 1e-4
+            )
+
+    def test_one_draw_per_sample(self):
+        """Test that sampling consumes exactly one uniform draw."""
+        draws = []
+
+        def rng_random():
+            draws.append(0.5)
+            return 0.5
+
+        player_table(12).sample(rng_random)
+        assert len(draws) == 1
+
+    def test_single_outcome_draws_nothing(self):
+        """Test that tables without randomness skip the draw, in attacks too."""
+        rng = random.Random(3)
+        assert player_table(12, FIXED_RULES).sample(rng.random) == (12, False)
+        hero = Character(
+            "Hero", 100, 10, "Rock", 2, rng=rng, rules=FIXED_RULES, io=NullIO()
+        )
+        hero.attack(Character("Enemy", 100, 1, rules=FIXED_RULES, io=NullIO()))
+        assert rng.random() == random.Random(3).random()
+
+    def test_arrays(self):
+        """Test that the plain columns describe the same alias table."""
+        table = player_table(12)
+        threshold, damages, alias_damages = table.arrays()
+        for u in (0.0, 0.13, 0.5, 0.77, 0.999):
+            scaled = u * table.size
+            index = int(scaled)
+            expected = (
+                damages[index]
+                if scaled - index < threshold[index]
+                else alias_damages[index]
+            )
+            assert table.sample(lambda: u)[0] == expected
+
+
+class TestCaching:
+    """Test cases for table caching."""
+
+    def test_tables_are_shared(self):
+        """Test that equal stats share one table."""
+        assert damage_table(12) is player_table(12)
+        assert boss_table(12) is not player_table(12)
+        assert player_table(12, FIXED_RULES) is not player_table(12)
+
+    def test_character_rebuilds_on_stat_change(self):
+        """Test that a character only changes table when its attack value changes."""
+        hero = Character("Hero", 100, 10, "Rock", 2)
+        table = hero.damage_table()
+        assert table.base == 12
+        assert hero.damage_table() is table
+        hero.weapon = Weapon("Sword", 5)
+        assert hero.damage_table().base == 15
+        hero.damage = 20
+        assert hero.damage_table() is player_table(25)
+
+    def test_boss_uses_boss_table(self):
+        """Test that bosses roll from tables with the special attack."""
+        boss = Boss("Dragon", 100, 20, rules=FIXED_RULES)
+        assert boss.damage_table() is boss_table(25, FIXED_RULES)
+
+    def test_attack_uses_rules(self):
+        """Test that attacks follow the character's rules."""
+        hero = Character("Hero", 100, 10, rules=FIXED_RULES, rng=random.Random(0))
+        target = Character("Target", 1000, 1)
+        assert {hero.attack(target) for _ in range(20)} == {10}
+        varied = Character("Hero", 100, 10, rng=random.Random(0))
+        assert len({varied.attack(target) for _ in range(200)}) > 3
@@ -0,0 +1,228 @@
+"""
+Tests for status effects and their timing wheel.
+"""
+import random
+
+import pytest
+
+from rpg_game.arena import EFFECT_TICK, Arena
+from rpg_game.benchmarks.effects import measure
+from rpg_game.boss import Boss
+from rpg_game.damage import FIXED_RULES
+from rpg_game.effects import (
+    ARMOR_UP,
+    ATTACK_UP,
+    POISON,
+    STUN,
+    StatusEffects,
+    TimingWheel,
+)
+from rpg_game.game_io import NullIO
+
+
+class TestTimingWheel:
+    """Test cases for the hierarchical timing wheel."""
+
+    def test_matches_sorted_order(self):
+        """Test that items come due in order, whatever the distance and steps."""
+        rng = random.Random(5)
+        wheel = TimingWheel()
+        expected = []
+        for item in range(3000):
+            # Spread over every level and past the top one
+            when = 1 + int(rng.random() ** 4 * 2**30)
+            wheel.schedule(when, item)
+            expected.append((when, item))
+        expected.sort()
+        fired = []
+        while len(fired) < len(expected):
+            to = wheel.now + 1 + int(rng.random() ** 3 * 2**24)
+            due = wheel.advance(to)
+            assert all(when <= to for when, _ in due)
+            fired.extend(due)
+        assert fired == expected
+        assert len(wheel) == 0
+
+    @pytest.mark.parametrize("seed", range(40))
+    def test_interleaved_matches_reference(self, seed):
+        """Test scheduling between advances, across top-level span boundaries."""
+        rng = random.Random(seed)
+        span = 1 << (TimingWheel.BITS * TimingWheel.LEVELS)
+        now = span * (1 + int(rng.random() * 3)) - int(rng.random() * 200)
+        wheel = TimingWheel(now)
+        pending = []
+        for item in range(400):
+            for _ in range(int(rng.random() * 4)):
+                # Mostly near expiries, some a span or more away
+                reach = 300 if rng.random() < 0.9 else 3 * span
+                when = wheel.now + 1 + int(rng.random() * reach)
+                wheel.schedule(when, (item, when))
+                pending.append((when, (item, when)))
+            to = wheel.now + int(rng.random() ** 2 * 150)
+            expected = sorted(
+                (entry for entry in pending if entry[0] <= to),
+                key=lambda entry: entry[0],
+            )
+            pending = [entry for entry in pending if entry[0] > to]
+            assert wheel.advance(to) == expected
+        assert len(wheel) == len(pending)
+
+    def test_schedule_while_advancing(self):
+        """Test scheduling relative to a clock that has moved."""
+        wheel = TimingWheel(now=1000)
+        wheel.schedule(1070, "a")
+        assert wheel.advance(1065) == []
+        wheel.schedule(1066, "b")
+        wheel.schedule(5000, "c")
+        assert wheel.advance(1070) == [(1066, "b"), (1070, "a")]
+        assert wheel.advance(10**9) == [(5000, "c")]
+
+    def test_rejects_the_past(self):
+        """Test that the clock only moves forward."""
+        wheel = TimingWheel(now=10)
+        with pytest.raises(ValueError):
+            wheel.schedule(10, "now")
+        with pytest.raises(ValueError):
+            wheel.advance(9)
+
+
+class TestStatusEffects:
+    """Test cases for applying and expiring effects."""
+
+    def test_stun(self, fighter):
+        """Test that stunned characters deal no damage until the stun ends."""
+        effects = StatusEffects()
+        hero, enemy = fighter("Hero"), fighter("Enemy")
+        effects.apply(hero, STUN, 2)
+        effects.apply(hero, STUN, 3)
+        assert hero.attack(enemy) == 0
+        effects.advance(2)
+        assert effects.active(hero) == STUN
+        assert hero.attack(enemy) == 0
+        effects.advance(3)
+        assert effects.active(hero) == 0
+        assert hero.attack(enemy) == 10
+        assert enemy.health == 90
+
+    def test_attack_buff(self, fighter):
+        """Test that buffs change the attack value and its damage table."""
+        effects = StatusEffects()
+        hero, enemy = fighter("Hero"), fighter("Enemy", health=1000)
+        effects.apply(hero, ATTACK_UP, 5, value=5)
+        assert hero.attack_value == 15
+        assert hero.damage_table().base == 15
+        assert hero.attack(enemy) == 15
+        weaken = effects.apply(hero, ATTACK_UP, 5, value=-50)
+        assert hero.attack(enemy) == 0
+        effects.remove(weaken)
+        effects.advance(5)
+        assert hero.attack(enemy) == 10
+
+    def test_armor(self, fighter):
+        """Test that armor absorbs damage from every hit."""
+        effects = StatusEffects()
+        hero, boss = fighter("Hero"), Boss(
+            "Boss", 100, 10, rules=FIXED_RULES, io=NullIO()
+        )
+        effects.apply(hero, ARMOR_UP, 5, value=4)
+        effects.apply(boss, ARMOR_UP, 5, value=40)
+        hero.take_damage(10)
+        assert hero.health == 94
+        assert hero.attack(boss) == 0
+        assert boss.health == 100
+
+    def test_poison_accrues_until_expiry(self, fighter):
+        """Test that poison deals its rate per tick for exactly its duration."""
+        effects = StatusEffects()
+        hero = fighter("Hero")
+        effects.apply(hero, POISON, 4, value=3)
+        effects.advance(2)
+        effects.apply(hero, POISON, 10, value=1)
+        effects.advance(3)
+        effects.settle(hero.effect_slot)
+        assert hero.health == 100 - 3 * 3 - 1
+        effects.advance(100)
+        effects.settle(hero.effect_slot)
+        assert hero.health == 100 - 3 * 4 - 1 * 10
+        assert len(effects) == 0
+
+    def test_poison_settles_before_hits(self, fighter):
+        """Test that attacks report only their own damage on poisoned enemies."""
+        effects = StatusEffects()
+        hero, enemy = fighter("Hero"), fighter("Enemy")
+        effects.apply(enemy, POISON, 10, value=2)
+        effects.advance(5)
+        assert hero.attack(enemy) == 10
+        assert enemy.health == 80
+
+    def test_remove_and_reuse(self, fighter):
+        """Test that removed effects end once and their ids are reused safely."""
+        effects = StatusEffects()
+        hero = fighter("Hero")
+        first = effects.apply(hero, STUN, 5)
+        assert effects.remove(first)
+        assert not effects.remove(first)
+        second = effects.apply(hero, STUN, 8)
+        assert second == first
+        effects.advance(5)
+        assert effects.active(hero) == STUN
+        effects.advance(8)
+        assert effects.active(hero) == 0
+
+    def test_invalid_effects(self, fighter):
+        """Test that bad kinds, durations and trackers are rejected."""
+        effects = StatusEffects()
+        hero = fighter("Hero")
+        with pytest.raises(ValueError):
+            effects.apply(hero, 16, 3)
+        with pytest.raises(ValueError):
+            effects.apply(hero, STUN, 0)
+        effects.apply(hero, STUN, 1)
+        with pytest.raises(ValueError):
+            StatusEffects().apply(hero, STUN, 1)
+
+
+class TestArena:
+    """Test cases for status effects in arena battles."""
+
+    def test_stunned_attackers_miss_turns(self, fighter):
+        """Test that a stunned entity deals no damage while the stun lasts."""
+        effects = StatusEffects()
+        arena = Arena(rng=random.Random(0), effects=effects)
+        hero, enemy = fighter("Hero", health=1000), fighter(
+            "Enemy", health=1000, damage=1
+        )
+        arena.add(hero, "a")
+        arena.add(enemy, "b", speed=1)
+        effects.apply(hero, STUN, 3)
+        damage = [action.damage for action in (arena.step() for _ in range(5))]
+        assert damage == [0, 0, 10, 10, 10]
+
+    def test_poison_defeats(self, fighter):
+        """Test that entities poison defeats leave the battle."""
+        effects = StatusEffects()
+        arena = Arena(rng=random.Random(0), effects=effects)
+        victim = fighter("Victim", health=5, damage=0)
+        arena.add(victim, "a")
+        arena.add(fighter("Bystander", health=1000, damage=0), "a")
+        arena.add(fighter("Enemy", health=1000, damage=0), "b")
+        effects.apply(victim, POISON, 100, value=1)
+        actions = [arena.step() for _ in range(18)]
+        assert victim.health == 0
+        assert arena.alive("a") == 1
+        # One action per tick before the fifth tick's poison defeats it
+        assert sum(action.attacker is victim for action in actions) == 4
+        assert arena.tick >= 5 * EFFECT_TICK
+
+
+class TestBenchmark:
+    """Test cases for the status-effect benchmark."""
+
+    def test_measure(self):
+        """Test that the benchmark reports both engines."""
+        results = measure(
+            counts=(100, 1000), entities=50, turns=20, scan_limit=100, repeat=1
+        )
+        assert [result["effects"] for result in results] == [100, 1000]
+        assert results[0]["scan_turn_us"] > 0
+        assert results[1]["scan_turn_us"] is None
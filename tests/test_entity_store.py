@@ -0,0 +1,112 @@
+"""
+Tests for the array-backed entity store.
+"""
+import random
+from unittest.mock import Mock
+
+import pytest
+
+from rpg_game.benchmarks.memory import measure
+from rpg_game.boss import Boss
+from rpg_game.character import Character
+from rpg_game.damage import FIXED_RULES, boss_table
+from rpg_game.entity_store import (
+    KIND_BOSS,
+    NO_WEAPON,
+    BossRow,
+    CharacterRow,
+    EntityTable,
+)
+from rpg_game.weapon import Weapon
+
+
+class TestEntityTable:
+    """Test cases for EntityTable and its row views."""
+
+    def test_add_and_view_character(self):
+        """Test that a character row behaves like a Character."""
+        table = EntityTable()
+        row = table.add("Hero", 100, 10, "Sword", 5)
+        hero = table.view(row)
+        assert isinstance(hero, CharacterRow)
+        assert isinstance(hero, Character)
+        assert hero.name == "Hero"
+        assert hero.health == 100
+        assert hero.weapon == Weapon("Sword", 5)
+
+        hero.health = -5
+        assert table.health[row] == 0
+        assert not hero.is_alive
+
+    def test_view_setters_write_to_table(self):
+        """Test that name, rng and rules assignments go through the table."""
+        table = EntityTable()
+        hero = table.view(table.add("Hero", 100, 10))
+        hero.name = "Renamed"
+        assert table.names[table.name_id[hero.row]] == "Renamed"
+        rng = random.Random(1)
+        hero.rng = rng
+        hero.rules = FIXED_RULES
+        assert table.rng is rng
+        assert table.rules is FIXED_RULES
+
+    def test_weapons_and_names_are_interned(self):
+        """Test that identical weapons and names are stored once."""
+        table = EntityTable()
+        first = table.add_boss("Goblin King", 50, 8)
+        second = table.add_boss("Goblin King", 50, 8)
+        table.add("Hero", 100, 10)
+        assert len(table) == 3
+        assert len(table.names) == 2
+        assert len(table.weapons) == 1
+        assert table.view(first).weapon is table.view(second).weapon
+        assert table.weapon_id[2] == NO_WEAPON
+
+    def test_boss_row_combat(self, roll_for):
+        """Test that views fight with the regular combat rules."""
+        rng = Mock()
+        rng.random.return_value = roll_for(boss_table(25, FIXED_RULES), (37, True))
+        table = EntityTable(rng=rng, rules=FIXED_RULES)
+        boss = table.view(table.add_boss("Dragon", 200, 20))
+        hero = table.view(table.add("Hero", 100, 10, "Sword", 5))
+        assert isinstance(boss, BossRow)
+        assert isinstance(boss, Boss)
+
+        assert boss.attack(hero) == 37
+        assert table.health[hero.row] == 63
+        assert hero.attack(boss) == 15
+        assert table.health[boss.row] == 185
+
+    def test_view_defeats_boss_view(self, capsys):
+        """Test that views print through the console port when they have no io."""
+        table = EntityTable(rules=FIXED_RULES)
+        boss = table.view(table.add_boss("Goblin", 5, 3))
+        hero = table.view(table.add("Hero", 100, 50, "Rock", 2))
+        assert hero.attack(boss) == 5
+        assert boss.health == 0
+        hero.display()
+        output = capsys.readouterr().out
+        assert "Goblin has been defeated!" in output
+        assert "Hero" in output
+
+    def test_add_entity_copies_stats(self):
+        """Test copying existing objects into the table."""
+        table = EntityTable()
+        row = table.add_entity(Boss("Dark Sorcerer", 60, 9))
+        assert table.kind[row] == KIND_BOSS
+        boss = table.view(row)
+        assert (boss.name, boss.health, boss.damage) == ("Dark Sorcerer", 60, 9)
+        assert boss.weapon.damage_bonus == 5
+
+    def test_add_many(self):
+        """Test bulk insertion of identical rows."""
+        table = EntityTable()
+        first = table.add_many(1000, "Goblin", 30, 4)
+        assert first == 0
+        assert len(table) == 1000
+        assert table.nbytes() == 1000 * 17
+
+    def test_memory_reduction(self):
+        """Test that the table is at least 5x smaller than objects."""
+        result = measure(entities=200_000, object_sample=20_000)
+        assert result["reduction"] >= 5
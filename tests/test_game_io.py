@@ -0,0 +1,268 @@
+"""
+Tests for the asyncio game loop and its I/O channels.
+"""
+import asyncio
+import os
+import select
+import signal
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from rpg_game.boss import Boss
+from rpg_game.character import Character
+from rpg_game.game import Game
+from rpg_game.game_io import ConsoleIO, NullIO, StreamIO
+from rpg_game.game_logger import GameLogger
+from rpg_game.save_game import MemoryBackend
+
+
+class FakeWriter:
+    """Collects bytes written by StreamIO."""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.closed = False
+        self.drains = 0
+
+    def write(self, data):
+        self.data.extend(data)
+
+    async def drain(self):
+        self.drains += 1
+
+    def close(self):
+        self.closed = True
+
+    def text(self):
+        return self.data.decode()
+
+
+class CountingBackend(MemoryBackend):
+    """In-memory save backend that counts saves."""
+
+    def __init__(self):
+        super().__init__()
+        self.saves = 0
+
+    def save(self, game_state):
+        super().save(game_state)
+        self.saves += 1
+
+
+def scripted_io(*lines):
+    """Return a StreamIO whose reader yields ``lines`` and then ends."""
+    reader = asyncio.StreamReader()
+    reader.feed_data("".join(line + "\n" for line in lines).encode())
+    reader.feed_eof()
+    return StreamIO(reader, FakeWriter())
+
+
+class TestStreamIO:
+    """Test cases for StreamIO."""
+
+    def test_read_line_sends_prompt(self):
+        """Test that prompts are written and lines come back without newlines."""
+
+        async def scenario():
+            io = scripted_io("hello")
+            line = await io.read_line("name? ")
+            return io, line
+
+        io, line = asyncio.run(scenario())
+        assert line == "hello"
+        assert io.writer.text() == "name? "
+        assert io.writer.drains == 1
+
+    def test_eof(self):
+        """Test that a closed input raises EOFError."""
+
+        async def scenario():
+            io = scripted_io()
+            await io.read_line()
+
+        with pytest.raises(EOFError):
+            asyncio.run(scenario())
+
+    def test_renderer_writes_to_stream(self):
+        """Test that clearing the screen goes over the stream."""
+        io = StreamIO(None, FakeWriter())
+        io.clear()
+        assert io.writer.text().startswith("\033[H\033[2J")
+
+
+class TestConsoleIO:
+    """Test cases for reading from standard input."""
+
+    def test_reads_lines_from_pipe(self):
+        """Test that piped lines are split and the end raises EOFError."""
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, b"first\nsecond\nlast")
+        os.close(write_fd)
+        io = ConsoleIO()
+
+        async def read_all():
+            lines = []
+            try:
+                while True:
+                    lines.append(await io.read_line())
+            except EOFError:
+                return lines
+
+        stdin = os.fdopen(read_fd, "r")
+        try:
+            original, sys.stdin = sys.stdin, stdin
+            assert asyncio.run(read_all()) == ["first", "second", "last"]
+        finally:
+            sys.stdin = original
+            stdin.close()
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="needs a pseudo-terminal")
+    def test_ctrl_c_at_prompt_exits(self, tmp_path):
+        """Test that SIGINT at the main menu ends the game without waiting for Enter."""
+        import pty
+
+        env = dict(os.environ, HOME=str(tmp_path), PYTHONUNBUFFERED="1")
+        # Standard input is a terminal, as when a player runs the game
+        terminal, player_side = pty.openpty()
+        process = subprocess.Popen(
+            [sys.executable, "-m", "rpg_game"],
+            stdin=player_side,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=env,
+        )
+        os.close(player_side)
+        try:
+            output = b""
+            deadline = time.monotonic() + 20
+            while b"Enter your choice" not in output and time.monotonic() < deadline:
+                if select.select([process.stdout], [], [], 0.5)[0]:
+                    output += os.read(process.stdout.fileno(), 4096)
+            assert b"Enter your choice" in output
+            process.send_signal(signal.SIGINT)
+            _, stderr = process.communicate(timeout=10)
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.communicate()
+            os.close(terminal)
+        assert b"KeyboardInterrupt" in stderr
+        assert b"Fatal Python error" not in stderr
+
+
+class TestAsyncGame:
+    """Test cases for the asyncio game loop."""
+
+    def test_run_over_stream(self):
+        """Test a new game played through StreamIO up to save and quit."""
+        backend = CountingBackend()
+
+        async def scenario():
+            io = scripted_io("1", "hero", "1", "", "3")
+            game = Game(save_backend=backend, io=io)
+            await game.run_async()
+            return io
+
+        io = asyncio.run(scenario())
+        output = io.writer.text()
+        assert "Welcome to the RPG Adventure!" in output
+        assert "Name: Hero" in output
+        assert "Game saved. Goodbye!" in output
+        assert backend.state["player"]["name"] == "Hero"
+
+    def test_autosave(self):
+        """Test that autosave runs while the game waits for input."""
+        backend = CountingBackend()
+
+        async def scenario():
+            reader = asyncio.StreamReader()
+            game = Game(save_backend=backend, io=StreamIO(reader, FakeWriter()))
+            game.player = Character("Hero", 100, 10)
+            task = asyncio.ensure_future(game.run_async(autosave_interval=0.01))
+            await asyncio.sleep(0.1)
+            reader.feed_eof()
+            with pytest.raises(EOFError):
+                await task
+
+        asyncio.run(scenario())
+        assert backend.saves >= 2
+
+    def test_play_again_waits_for_autosave(self):
+        """Test that a write in flight cannot bring back a deleted save."""
+        started = threading.Event()
+
+        class SlowBackend(MemoryBackend):
+            def save(self, game_state):
+                started.set()
+                time.sleep(0.2)
+                super().save(game_state)
+
+        backend = SlowBackend()
+
+        async def scenario():
+            game = Game(save_backend=backend, io=scripted_io("y"))
+            game.player = Character("Hero", 100, 10)
+            game._autosave_task = asyncio.ensure_future(game._autosave(0.01))
+            while not started.is_set():
+                await asyncio.sleep(0.01)
+            await game.end_game_async(False)
+            assert backend.state is None
+            await game._stop_autosave()
+            assert game._autosave_write.done()
+
+        asyncio.run(scenario())
+        assert backend.state is None
+
+    def test_sync_wrapper(self, mocker):
+        """Test that the synchronous API still reads from the console."""
+        mocker.patch("builtins.input", return_value="2")
+        game = Game(save_backend=MemoryBackend())
+        assert game.choose_weapon()[1] > 0
+
+
+class TestIOPort:
+    """Test cases for routing entity and logger output through the port."""
+
+    def test_entities_write_to_their_port(self, capsys):
+        """Test that display and defeat messages go to the injected port."""
+        io = StreamIO(None, FakeWriter())
+        boss = Boss("Goblin King", 5, 8, io=io)
+        boss.display()
+        boss.take_damage(10)
+        GameLogger(io=io).log_combat("Hero", "Goblin King", 10)
+        text = io.writer.text()
+        assert "Name: Goblin King" in text
+        assert "Goblin King has been defeated!" in text
+        assert "COMBAT LOG: Hero attacks Goblin King for 10 damage" in text
+        assert capsys.readouterr().out == ""
+
+    def test_null_io_skips_formatting(self, mocker):
+        """Test that a quiet port never formats messages."""
+        io = NullIO()
+        display_lines = mocker.spy(Character, "display_lines")
+        now = mocker.patch("rpg_game.game_logger.datetime")
+        player = Character("Hero", 100, 10, io=io)
+        player.display()
+        GameLogger(io=io).log_combat("Hero", "Boss", 5)
+        io.say("{} never formatted", object())
+        display_lines.assert_not_called()
+        now.datetime.now.assert_not_called()
+
+    def test_headless_combat(self):
+        """Test that a headless game fights through its pauses."""
+        game = Game(io=NullIO(), save_backend=MemoryBackend())
+        player = Character("Hero", 100, 50, io=game.io)
+        boss = Boss("Goblin King", 50, 8, io=game.io)
+        assert game.combat(player, boss) is True
+
+    def test_no_filesystem_work_on_init(self, mocker):
+        """Test that constructing a game does not touch the save directory."""
+        mkdir = mocker.patch("pathlib.Path.mkdir")
+        home = mocker.patch("pathlib.Path.home")
+        Game(io=NullIO())
+        mkdir.assert_not_called()
+        home.assert_not_called()
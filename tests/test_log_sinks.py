@@ -0,0 +1,136 @@
+"""
+Tests for the buffered combat-log writer and its sinks.
+"""
+import io
+import threading
+
+import pytest
+
+from rpg_game.game_logger import GameLogger
+from rpg_game.log_sinks import (
+    BufferedLogWriter,
+    ConsoleSink,
+    LogSink,
+    RotatingFileSink,
+    format_record,
+    format_records,
+)
+
+
+class ListSink(LogSink):
+    """Sink that keeps every record in memory."""
+
+    def __init__(self, gate=None):
+        self.records = []
+        self.batches = 0
+        self.closed = False
+        self.gate = gate
+
+    def write_batch(self, records):
+        if self.gate is not None:
+            self.gate.wait()
+        self.records.extend(records)
+        self.batches += 1
+
+    def close(self):
+        self.closed = True
+
+
+class TestLogSinks:
+    """Test cases for the log sinks and writer."""
+
+    def test_format_matches_logger(self):
+        """Test that formatted records look like GameLogger output."""
+        record = (0.0, "Hero", "Goblin", 12, True)
+        line = format_record(record)
+        assert line.endswith(
+            "COMBAT LOG: Hero attacks Goblin for 12 damage (CRITICAL!)"
+        )
+        assert format_records([record, record]) == (line + "\n") * 2
+
+    def test_logger_uses_writer(self):
+        """Test that GameLogger queues records instead of printing."""
+        sink = ListSink()
+        logger = GameLogger(writer=BufferedLogWriter(sink))
+        for damage in range(100):
+            logger.log_combat("Hero", "Goblin", damage)
+        logger.close()
+        assert [r[3] for r in sink.records] == list(range(100))
+        assert sink.closed
+
+    def test_flush_writes_pending_records(self):
+        """Test that flush waits for queued records to reach the sink."""
+        sink = ListSink()
+        writer = BufferedLogWriter(sink, flush_interval=10)
+        writer.submit((0.0, "A", "B", 1, False))
+        writer.flush(timeout=5)
+        assert len(sink.records) == 1
+        writer.close()
+
+    def test_drop_oldest_policy(self):
+        """Test that a full queue discards the oldest records."""
+        gate = threading.Event()
+        sink = ListSink(gate)
+        writer = BufferedLogWriter(
+            sink, capacity=10, batch_size=10, policy="drop-oldest", flush_interval=10
+        )
+        for damage in range(50):
+            writer.submit((0.0, "A", "B", damage, False))
+        gate.set()
+        writer.close()
+        assert writer.dropped > 0
+        assert len(sink.records) + writer.dropped == 50
+        assert sink.records[-1][3] == 49
+
+    def test_sample_policy(self):
+        """Test that a full queue keeps a sample of new records."""
+        gate = threading.Event()
+        sink = ListSink(gate)
+        writer = BufferedLogWriter(
+            sink,
+            capacity=10,
+            batch_size=10,
+            policy="sample",
+            sample_every=5,
+            flush_interval=10,
+        )
+        for damage in range(200):
+            writer.submit((0.0, "A", "B", damage, False))
+        gate.set()
+        writer.close()
+        assert writer.dropped > 0
+        assert len(sink.records) + writer.dropped == 200
+
+    def test_block_policy_loses_nothing(self):
+        """Test that the blocking policy never drops records."""
+        sink = ListSink()
+        writer = BufferedLogWriter(
+            sink, capacity=16, batch_size=4, flush_interval=0.001
+        )
+        for damage in range(5000):
+            writer.submit((0.0, "A", "B", damage, False))
+        writer.close()
+        assert writer.dropped == 0
+        assert [r[3] for r in sink.records] == list(range(5000))
+
+    def test_invalid_policy(self):
+        """Test that unknown policies are rejected."""
+        with pytest.raises(ValueError):
+            BufferedLogWriter(ListSink(), policy="ignore")
+
+    def test_console_sink(self):
+        """Test writing formatted lines to a stream."""
+        stream = io.StringIO()
+        ConsoleSink(stream).write_batch([(0.0, "Hero", "Goblin", 3, False)])
+        assert "Hero attacks Goblin for 3 damage" in stream.getvalue()
+
+    def test_rotating_file_sink(self, tmp_path):
+        """Test that the file sink rotates and keeps a bounded history."""
+        path = tmp_path / "logs" / "combat.log"
+        sink = RotatingFileSink(str(path), max_bytes=200, backup_count=2)
+        for _ in range(10):
+            sink.write_batch([(0.0, "Hero", "Goblin", 3, False)] * 3)
+        sink.close()
+        files = sorted(p.name for p in path.parent.iterdir())
+        assert files == ["combat.log", "combat.log.1", "combat.log.2"]
+        assert path.stat().st_size <= 200
@@ -0,0 +1,120 @@
+"""
+Tests for game loop instrumentation.
+"""
+import json
+
+import pytest
+
+from rpg_game.boss import Boss
+from rpg_game.character import Character
+from rpg_game.damage import FIXED_RULES
+from rpg_game.game import Game
+from rpg_game.metrics import (
+    COMBAT_TURN,
+    INPUT,
+    LOAD,
+    MENU,
+    RENDER,
+    SAVE,
+    Histogram,
+    Metrics,
+    from_environment,
+)
+
+
+class TestMetrics:
+    """Test cases for Metrics and Histogram."""
+
+    def test_histogram(self):
+        """Test bucketing, sums and quantile estimates."""
+        histogram = Histogram(buckets=(0.1, 1.0))
+        for value in (0.05, 0.05, 0.5, 2.0):
+            histogram.observe(value)
+        assert histogram.counts == [2, 1, 1]
+        assert histogram.count == 4
+        assert histogram.sum == pytest.approx(2.6)
+        assert histogram.quantile(0.5) == 0.1
+        assert histogram.quantile(0.99) == 2.0
+        assert Histogram().quantile(0.5) == 0.0
+
+    def test_nested_phases_exclude_inner_time(self, mocker):
+        """Test that an outer phase does not count time spent in inner phases."""
+        clock = iter([0, 10, 70, 100])
+        mocker.patch("time.perf_counter_ns", side_effect=lambda: next(clock))
+        metrics = Metrics()
+        with metrics.phase(MENU):
+            with metrics.phase(INPUT):
+                pass
+        assert metrics.phases[INPUT].sum == pytest.approx(60e-9)
+        assert metrics.phases[MENU].sum == pytest.approx(40e-9)
+
+    def test_exports(self, tmp_path):
+        """Test the Prometheus snapshot and JSON summary."""
+        metrics = Metrics(buckets=(0.5,))
+        metrics.inc("combat_turns", 3)
+        metrics.observe(RENDER, 0.25)
+        text = metrics.to_prometheus()
+        assert "rpg_combat_turns_total 3" in text
+        assert "# TYPE rpg_phase_seconds histogram" in text
+        assert 'rpg_phase_seconds_bucket{phase="render",le="0.5"} 1' in text
+        assert 'rpg_phase_seconds_bucket{phase="render",le="+Inf"} 1' in text
+        assert 'rpg_phase_seconds_count{phase="render"} 1' in text
+
+        metrics.write(
+            str(tmp_path / "out" / "metrics.prom"),
+            str(tmp_path / "out" / "metrics.json"),
+        )
+        assert (tmp_path / "out" / "metrics.prom").read_text() == text
+        summary = json.loads((tmp_path / "out" / "metrics.json").read_text())
+        assert summary["counters"] == {"combat_turns": 3}
+        assert summary["phases"]["render"]["count"] == 1
+        assert summary["phases"]["render"]["mean"] == pytest.approx(0.25)
+
+    def test_from_environment(self, monkeypatch, mocker):
+        """Test that metrics are only enabled when RPG_METRICS_DIR is set."""
+        monkeypatch.delenv("RPG_METRICS_DIR", raising=False)
+        assert from_environment() is None
+        register = mocker.patch("atexit.register")
+        monkeypatch.setenv("RPG_METRICS_DIR", "/tmp/rpg-metrics")
+        assert isinstance(from_environment(), Metrics)
+        register.assert_called_once()
+
+
+class TestGameInstrumentation:
+    """Test cases for the phases timed by Game."""
+
+    def test_combat_phases(self, mocker):
+        """Test that combat turns, rendering and input are recorded separately."""
+        mocker.patch("builtins.input", return_value="")
+        mocker.patch("rpg_game.game_io.clear_screen")
+        mocker.patch("random.random", return_value=0.9)
+        metrics = Metrics()
+        game = Game(metrics=metrics)
+        assert game.combat(
+            Character("Hero", 100, 20, rules=FIXED_RULES),
+            Boss("Boss", 30, 1, rules=FIXED_RULES),
+        )
+        assert metrics.counters == {"combat_turns": 2, "fights_won": 1}
+        assert metrics.phases[COMBAT_TURN].count == 2
+        assert metrics.phases[RENDER].count == 2
+        # One pause between turns and one after the victory message
+        assert metrics.phases[INPUT].count == 2
+
+    def test_save_and_load_phases(self, tmp_path, mocker):
+        """Test that save and load are timed."""
+        mocker.patch("pathlib.Path.home", return_value=tmp_path)
+        metrics = Metrics()
+        game = Game(metrics=metrics)
+        game.player = Character("Hero", 100, 10, "Rock", 2)
+        assert game.save_current_game()
+        assert game.load_game()
+        assert metrics.phases[SAVE].count == 1
+        assert metrics.phases[LOAD].count == 1
+
+    def test_disabled_by_default(self, mocker):
+        """Test that a game without metrics records nothing."""
+        mocker.patch("builtins.input", return_value="")
+        mocker.patch("rpg_game.game_io.clear_screen")
+        game = Game()
+        assert game.metrics is None
+        assert game.combat(Character("Hero", 100, 50), Boss("Boss", 10, 1))
@@ -0,0 +1,163 @@
+"""
+Tests for the diffing frame renderer.
+"""
+import io
+
+import pytest
+
+from rpg_game.boss import Boss
+from rpg_game.character import Character
+from rpg_game.console_utils import clear_screen
+from rpg_game.game import Game
+from rpg_game.renderer import (
+    CLEAR,
+    GREEN,
+    RED,
+    Frame,
+    NullRenderer,
+    ScreenRenderer,
+    cursor_to,
+    health_bar,
+)
+
+
+class CountingStream(io.StringIO):
+    """StringIO that counts write calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, data):
+        self.writes += 1
+        return super().write(data)
+
+
+class TestFrame:
+    """Test cases for Frame and health bars."""
+
+    def test_text_clips(self):
+        """Test that text is clipped to the frame."""
+        frame = Frame(5, 2)
+        assert frame.text(0, 3, "abcdef") == 5
+        frame.text(5, 0, "ignored")
+        assert frame.lines() == ["   ab", ""]
+
+    def test_health_bar(self):
+        """Test bar length and color thresholds."""
+        assert health_bar(10, 10, 4) == ("████", GREEN)
+        assert health_bar(2, 10, 4) == ("█░░░", RED)
+        assert health_bar(-5, 10, 4)[0] == "░░░░"
+        assert health_bar(5, 0, 2)[0] == "░░"
+
+
+class TestScreenRenderer:
+    """Test cases for ScreenRenderer."""
+
+    def test_first_frame_draws_everything(self):
+        """Test that the first frame clears the screen and draws all cells."""
+        stream = CountingStream()
+        renderer = ScreenRenderer(stream)
+        frame = Frame(4, 2)
+        frame.text(0, 0, "hi")
+        renderer.present(frame)
+        assert stream.getvalue().startswith(CLEAR)
+        assert renderer.cells_written == 8
+        assert stream.writes == 1
+
+    def test_only_changes_are_written(self):
+        """Test that an unchanged frame writes no cells and a change writes one run."""
+        stream = CountingStream()
+        renderer = ScreenRenderer(stream)
+        first = Frame(10, 3)
+        first.text(1, 0, "Health: 50")
+        renderer.present(first)
+        renderer.present(first)
+        assert renderer.cells_written == 30
+
+        second = Frame(10, 3)
+        second.text(1, 0, "Health: 42")
+        before = len(stream.getvalue())
+        renderer.present(second)
+        output = stream.getvalue()[before:]
+        assert renderer.cells_written == 32
+        assert cursor_to(1, 8) + "\033[0m42" in output
+        assert CLEAR not in output
+        assert stream.writes == 3
+
+    def test_clear_invalidates(self):
+        """Test that clearing forces a full redraw."""
+        renderer = ScreenRenderer(io.StringIO())
+        frame = Frame(3, 1)
+        renderer.present(frame)
+        renderer.clear()
+        renderer.present(frame)
+        assert renderer.cells_written == 6
+
+    def test_animate_at_fixed_rate(self):
+        """Test that animations present frames on a fixed schedule."""
+        renderer = ScreenRenderer(io.StringIO(), fps=10)
+        progress = []
+        sleeps = []
+
+        def compose(t):
+            progress.append(t)
+            return Frame(2, 1)
+
+        count = renderer.animate(
+            compose, duration=0.5, clock=lambda: 0.0, sleep=sleeps.append
+        )
+        assert count == 5
+        assert progress == pytest.approx([0.2, 0.4, 0.6, 0.8, 1.0])
+        assert sleeps == pytest.approx([0.1, 0.2, 0.3, 0.4])
+
+    def test_clear_screen_spawns_no_shell(self, mocker):
+        """Test that clear_screen writes escapes instead of running a command."""
+        system = mocker.patch("os.system")
+        clear_screen()
+        system.assert_not_called()
+
+
+class TestCombatScreen:
+    """Test cases for the combat status frame."""
+
+    def test_combat_status(self):
+        """Test the combat screen layout and incremental redraw."""
+        stream = io.StringIO()
+        renderer = ScreenRenderer(stream)
+        game = Game(renderer=renderer)
+        player = Character("Hero", 100, 10, "Rock", 2)
+        boss = Boss("Goblin King", 50, 8)
+        game.display_combat_status(player, boss)
+        lines = renderer._previous.lines()
+        assert "LEVEL 1: Goblin King" in lines[2]
+        assert lines[4].startswith("Health: 100")
+        assert lines[9].startswith("Health: 50")
+
+        drawn = renderer.cells_written
+        boss.health = 40
+        game.display_combat_status(player, boss)
+        assert 0 < renderer.cells_written - drawn < 10
+
+    def test_animated_health(self):
+        """Test that health changes animate when enabled."""
+        renderer = ScreenRenderer(io.StringIO(), fps=20, animation=0.1)
+        game = Game(renderer=renderer)
+        player = Character("Hero", 100, 10)
+        boss = Boss("Goblin King", 50, 8)
+        game._full_health = {"Hero": 100, "Goblin King": 50}
+        game.display_combat_status(player, boss)
+        assert renderer.frames == 1
+        boss.health = 10
+        game.display_combat_status(player, boss)
+        assert renderer.frames == 3
+        assert renderer._previous.lines()[9].startswith("Health: 10")
+
+    def test_headless_skips_frames(self, mocker):
+        """Test that a null renderer stops the game composing frames."""
+        game = Game(renderer=NullRenderer())
+        compose = mocker.spy(game, "_combat_frame")
+        game.display_combat_status(
+            Character("Hero", 100, 10), Boss("Goblin King", 50, 8)
+        )
+        compose.assert_not_called()
@@ -0,0 +1,149 @@
+"""
+Tests for the binary save codec.
+"""
+import json
+import os
+
+import pytest
+
+from rpg_game.boss import Boss
+from rpg_game.game import Game
+from rpg_game.save_codec import (
+    HEADER,
+    MAGIC,
+    SCHEMA_VERSION,
+    BinarySaveBackend,
+    BossRecordList,
+    SaveFile,
+    decode_state,
+    encode_state,
+    upgrade_state,
+)
+
+
+class TestCodec:
+    """Test cases for encoding and decoding."""
+
+    @pytest.mark.parametrize("options", [{}, {"bosses": 0}, {"weapon": None}])
+    def test_round_trip(self, make_state, options):
+        """Test that encoded states decode unchanged."""
+        state = make_state(**options)
+        data = encode_state(state)
+        assert data.startswith(MAGIC)
+        assert decode_state(data) == state
+
+    def test_empty_state(self):
+        """Test that a state without a player round-trips as empty."""
+        assert decode_state(encode_state({})) == {}
+
+    def test_lazy_sections(self, make_state):
+        """Test decoding the player and single bosses without the rest."""
+        save = SaveFile(encode_state(make_state(bosses=100)))
+        assert save.version == SCHEMA_VERSION
+        assert save.player()["name"] == "Hero"
+        assert save.boss_count == 100
+        assert save.boss(42) == {"name": "Boss 0", "health": 92, "damage": 8}
+        with pytest.raises(IndexError):
+            save.boss(100)
+
+    def test_rejects_bad_data(self, make_state):
+        """Test that foreign, truncated and future saves are rejected."""
+        with pytest.raises(ValueError):
+            SaveFile(b"not a save at all")
+        data = encode_state(make_state())
+        with pytest.raises(ValueError):
+            SaveFile(data[:-4])
+        future = HEADER.pack(MAGIC, SCHEMA_VERSION + 1, 0)
+        with pytest.raises(ValueError):
+            SaveFile(future)
+
+    def test_upgrades_legacy_json(self):
+        """Test that version 0 (JSON) saves are upgraded."""
+        legacy = {"player": {"name": "Old", "health": 50}, "bosses": []}
+        state = decode_state(json.dumps(legacy).encode("utf-8"))
+        assert state["player"]["weapon"] == {"name": None, "damage_bonus": 0}
+        assert state["player"]["damage"] == 0
+        with pytest.raises(ValueError):
+            upgrade_state({}, SCHEMA_VERSION + 1)
+
+    def test_smaller_than_json(self, make_state):
+        """Test that large boss lists encode far smaller than the JSON save."""
+        state = make_state(bosses=10000)
+        assert len(json.dumps(state, indent=2)) >= 5 * len(encode_state(state))
+
+
+class TestBossRecordList:
+    """Test cases for the lazily materialized boss list."""
+
+    def test_materializes_on_access(self, make_state):
+        """Test that bosses are built only when accessed and then cached."""
+        bosses = BossRecordList(SaveFile(encode_state(make_state(bosses=5))))
+        assert len(bosses) == 5
+        assert not any(isinstance(item, Boss) for item in bosses._items)
+        first = bosses[0]
+        assert isinstance(first, Boss) and first.name == "Boss 0"
+        assert bosses[0] is first
+        assert bosses[-1].health == 54
+
+    def test_list_operations(self, make_state):
+        """Test pop, append and truthiness as used by Game."""
+        bosses = BossRecordList(SaveFile(encode_state(make_state(bosses=2))))
+        assert bosses.pop(0).name == "Boss 0"
+        extra = Boss("Extra", 10, 1)
+        bosses.append(extra)
+        assert [boss.name for boss in bosses] == ["Boss 1", "Extra"]
+        bosses.pop(0)
+        bosses.pop(0)
+        assert not bosses
+
+
+class TestBinarySaveBackend:
+    """Test cases for BinarySaveBackend."""
+
+    def test_save_load_delete(self, make_state, tmp_path):
+        """Test the SaveBackend interface."""
+        backend = BinarySaveBackend(str(tmp_path / "saves" / "save.bin"))
+        assert backend.load() is None
+        assert backend.load_lazy() is None
+        backend.save(make_state())
+        assert backend.load() == make_state()
+        backend.delete()
+        assert backend.load() is None
+
+    def test_save_is_atomic(self, make_state, tmp_path, mocker):
+        """Test that saves are fsynced and a failed save keeps the old file."""
+        backend = BinarySaveBackend(str(tmp_path / "save.bin"))
+        fsync = mocker.spy(os, "fsync")
+        backend.save(make_state(health=90))
+        assert fsync.called
+        mocker.patch("os.replace", side_effect=OSError("disk full"))
+        with pytest.raises(OSError):
+            backend.save(make_state(health=10))
+        assert backend.load() == make_state(health=90)
+        assert os.listdir(tmp_path) == ["save.bin"]
+
+    def test_reads_legacy_json_file(self, make_state, tmp_path):
+        """Test that an old JSON save file is loaded and upgraded."""
+        path = tmp_path / "save.json"
+        path.write_text(json.dumps(make_state(), indent=2))
+        backend = BinarySaveBackend(str(path))
+        assert backend.load() == make_state()
+        assert backend.load_lazy().boss(1)["name"] == "Boss 1"
+
+    def test_game_loads_lazily(self, make_state, tmp_path, mocker):
+        """Test that Game restores the player and streams bosses from the save."""
+        mocker.patch("pathlib.Path.home", return_value=tmp_path)
+        backend = BinarySaveBackend(str(tmp_path / "save.bin"))
+        backend.save(make_state(bosses=3))
+
+        game = Game(save_backend=backend)
+        assert game.load_game()
+        assert game.player.name == "Hero"
+        assert game.player.weapon.name == "Rock"
+        assert isinstance(game.bosses, BossRecordList)
+        assert game.bosses[0].name == "Boss 0"
+        assert game.get_game_state() == make_state(bosses=3)
+
+        game.bosses.pop(0)
+        assert game.save_current_game()
+        assert len(backend.load()["bosses"]) == 2
@@ -10,7 +10,9 @@ from unittest.mock import patch, mock_open
 
 # Import the module to test
 import rpg_game.save_game as save_game_module
-from rpg_game.save_game import save_game, load_game, delete_save, set_save_paths
+from rpg_game.save_game import (
+    JsonFileBackend, save_game, load_game, delete_save, set_save_paths
+)
 
 @pytest.fixture
 def temp_save_file(tmp_path):
@@ -156,3 +158,21 @@ class TestSaveGame:
         
         # This should call our mock and return False due to the error
         assert delete_save() is False
+
+    def test_failed_write_keeps_old_save(self, tmp_path):
+        """Test that a write that fails halfway leaves the previous save whole."""
+        backend = JsonFileBackend(str(tmp_path / "save.json"))
+        backend.save({"player": {"name": "Hero"}})
+        with pytest.raises(TypeError):
+            backend.save({"player": {"name": "Hero", "weapon": object()}})
+        assert backend.load() == {"player": {"name": "Hero"}}
+        assert os.listdir(tmp_path) == ["save.json"]
+
+    def test_default_file_is_shared_with_game(self, temp_save_file):
+        """Test that save_game and Game use the same file, written atomically."""
+        from rpg_game.game import Game
+        game = Game()
+        assert game.save_file == temp_save_file
+        assert save_game({"player": {"name": "Hero"}})
+        assert game.save_backend.load() == {"player": {"name": "Hero"}}
+        assert os.listdir(temp_save_file.parent) == ["save.json"]
@@ -0,0 +1,137 @@
+"""
+Tests for the journaled save backend.
+"""
+import copy
+import os
+
+import pytest
+
+from rpg_game.boss import Boss
+from rpg_game.character import Character
+from rpg_game.game import Game
+from rpg_game.save_game import delete_save, load_game, save_game, set_save_backend
+from rpg_game.save_journal import _MISSING, JournalSaveBackend, apply_delta, diff_state
+
+
+def check_diff(old, new):
+    """Check that applying the diff of ``old`` and ``new`` reproduces ``new``."""
+    delta = diff_state(copy.deepcopy(old), new)
+    if old == new:
+        assert delta is None
+    else:
+        assert apply_delta(copy.deepcopy(old), delta) == new
+    assert apply_delta(None, diff_state(_MISSING, new)) == new
+
+
+class TestSaveJournal:
+    """Test cases for JournalSaveBackend."""
+
+    @pytest.mark.parametrize(
+        "old, new",
+        [
+            ({"a": 1, "b": [1, 2]}, {"a": True, "c": None}),
+            ({}, {}),
+        ],
+    )
+    def test_diff_and_apply(self, old, new):
+        """Test that applying a diff reproduces the new state."""
+        check_diff(old, new)
+
+    @pytest.mark.parametrize(
+        "changes",
+        [
+            {"health": 90},
+            {"bosses": (("Boss 1", 51),)},
+            {"bosses": (("Boss 0", 10), ("Boss 1", 51), ("Dragon", 99))},
+        ],
+    )
+    def test_diff_and_apply_saves(self, make_state, changes):
+        """Test that applying a diff reproduces a changed save."""
+        check_diff(make_state(), make_state(**changes))
+
+    def test_deltas_are_small(self, make_state):
+        """Test that a health change journals only the changed field."""
+        delta = diff_state(make_state(), make_state(health=90))
+        assert delta == {"$dict": {"player": {"$dict": {"health": {"$set": 90}}}}}
+        popped = diff_state(make_state(), make_state(bosses=(("Boss 1", 51),)))
+        assert popped == {"$dict": {"bosses": {"$list": {}, "$len": 1, "$drop": 1}}}
+
+    def test_save_and_reload(self, make_state, tmp_path):
+        """Test that a new backend recovers the last save."""
+        backend = JournalSaveBackend(tmp_path, compact_after=1000)
+        for health in range(110, 50, -5):
+            backend.save(make_state(health=health))
+        backend.close()
+
+        reopened = JournalSaveBackend(tmp_path)
+        assert reopened.load() == make_state(health=55)
+        reopened.close()
+
+    def test_compaction(self, make_state, tmp_path):
+        """Test that compaction writes a snapshot and drops old journals."""
+        backend = JournalSaveBackend(tmp_path, compact_after=4, background=False)
+        for health in range(100, 90, -1):
+            backend.save(make_state(health=health))
+        backend.close()
+        files = sorted(os.listdir(tmp_path))
+        assert "snapshot.json" in files
+        assert files == ["journal.2.log", "snapshot.json"]
+        assert JournalSaveBackend(tmp_path).load() == make_state(health=91)
+
+    def test_background_compaction(self, make_state, tmp_path):
+        """Test that saves keep working while compaction runs."""
+        backend = JournalSaveBackend(tmp_path, compact_after=3)
+        for health in range(100, 70, -1):
+            backend.save(make_state(health=health))
+        backend.close()
+        assert JournalSaveBackend(tmp_path).load() == make_state(health=71)
+
+    def test_torn_write_is_ignored(self, make_state, tmp_path):
+        """Test that a partial trailing record does not corrupt the save."""
+        backend = JournalSaveBackend(tmp_path, compact_after=1000)
+        backend.save(make_state(health=100))
+        backend.save(make_state(health=80))
+        backend.close()
+        journal = tmp_path / "journal.0.log"
+        data = journal.read_bytes()
+        journal.write_bytes(data[:-7])
+
+        recovered = JournalSaveBackend(tmp_path)
+        assert recovered.load() == make_state(health=100)
+        recovered.save(make_state(health=70))
+        recovered.close()
+        assert JournalSaveBackend(tmp_path).load() == make_state(health=70)
+
+    def test_delete(self, make_state, tmp_path):
+        """Test that deleting removes every save file."""
+        backend = JournalSaveBackend(tmp_path, compact_after=2, background=False)
+        for health in (100, 90, 80):
+            backend.save(make_state(health=health))
+        backend.delete()
+        assert backend.load() is None
+        backend.close()
+        assert JournalSaveBackend(tmp_path).load() is None
+
+    def test_module_functions_use_backend(self, make_state, tmp_path):
+        """Test the save_game API on top of the journal."""
+        set_save_backend(JournalSaveBackend(tmp_path))
+        try:
+            assert save_game(make_state(health=42)) is True
+            assert load_game() == make_state(health=42)
+            assert delete_save() is True
+            assert load_game() is None
+        finally:
+            set_save_backend(None)
+
+    def test_game_uses_backend(self, tmp_path):
+        """Test that Game saves and loads through its backend."""
+        game = Game(save_backend=JournalSaveBackend(tmp_path))
+        game.player = Character("TestHero", 100, 10, "Sword", 5)
+        game.bosses = [Boss("TestBoss", 50, 5)]
+        assert game.save_current_game() is True
+        game.save_backend.close()
+
+        loaded = Game(save_backend=JournalSaveBackend(tmp_path))
+        assert loaded.load_game() is True
+        assert loaded.player.name == "TestHero"
+        assert loaded.bosses[0].name == "TestBoss"
@@ -0,0 +1,99 @@
+"""
+Tests for the SQLite save store.
+"""
+import pytest
+
+from rpg_game.boss import Boss
+from rpg_game.character import Character
+from rpg_game.game import Game
+from rpg_game.save_game import delete_save, load_game, save_game, set_save_backend
+from rpg_game.save_sqlite import SQLiteSaveBackend, SQLiteSaveStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteSaveStore(str(tmp_path / "saves.db"))
+    yield store
+    store.close()
+
+
+class TestSQLiteSaveStore:
+    """Test cases for SQLiteSaveStore."""
+
+    def test_wal_mode(self, store):
+        """Test that the database uses write-ahead logging."""
+        assert store._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_slots(self, make_state, store):
+        """Test saving, overwriting, loading and deleting slots."""
+        store.save("a", make_state(health=100))
+        store.save("b", make_state(name="Zed"))
+        store.save("a", make_state(health=90))
+        assert store.count() == 2
+        assert store.load("a") == make_state(health=90)
+        assert store.load("missing") is None
+        assert store.delete("a") is True
+        assert store.delete("a") is False
+        assert store.count() == 1
+
+    def test_list_slots(self, make_state, store):
+        """Test filtering and ordering slot listings."""
+        store.save("one", make_state(name="Ann", bosses=2))
+        store.save("two", make_state(name="Bob", bosses=0))
+        store.save("three", make_state(name="Ann", bosses=1))
+        assert [
+            s.slot for s in store.list_slots(player_name="Ann", order_by="slot")
+        ] == ["one", "three"]
+        assert [s.slot for s in store.list_slots(order_by="progress")] == [
+            "two",
+            "three",
+            "one",
+        ]
+        assert [s.slot for s in store.list_slots(order_by="modified", limit=1)] == [
+            "three"
+        ]
+        with pytest.raises(ValueError):
+            store.list_slots(order_by="state")
+
+    def test_queries_use_indexes(self, store):
+        """Test that lookups are index searches rather than table scans."""
+        plan = " ".join(
+            str(row)
+            for row in store._conn.execute(
+                "EXPLAIN QUERY PLAN SELECT slot FROM saves WHERE player_name = ?",
+                ("Ann",),
+            )
+        )
+        assert "idx_saves_player" in plan
+
+    def test_bulk_import_export(self, make_state, store):
+        """Test importing and exporting many slots at once."""
+        saves = [(f"slot{i:04d}", make_state(name=f"P{i}")) for i in range(500)]
+        assert store.import_many(saves) == 500
+        assert store.count() == 500
+        assert list(store.export_all()) == saves
+
+    def test_backend_with_save_api(self, make_state, tmp_path):
+        """Test the module-level save API on top of a slot."""
+        set_save_backend(SQLiteSaveBackend(str(tmp_path / "saves.db"), slot="hero"))
+        try:
+            assert save_game(make_state()) is True
+            assert load_game() == make_state()
+            assert delete_save() is True
+            assert load_game() is None
+        finally:
+            set_save_backend(None)
+
+    def test_game_with_slots(self, store):
+        """Test two games saving to different slots of one store."""
+        first = Game(save_backend=SQLiteSaveBackend(store, "first"))
+        first.player = Character("First", 100, 10, "Sword", 5)
+        first.bosses = [Boss("TestBoss", 50, 5)]
+        second = Game(save_backend=SQLiteSaveBackend(store, "second"))
+        second.player = Character("Second", 80, 10)
+        assert first.save_current_game() and second.save_current_game()
+
+        loaded = Game(save_backend=SQLiteSaveBackend(store, "first"))
+        assert loaded.load_game() is True
+        assert loaded.player.name == "First"
+        assert len(loaded.bosses) == 1
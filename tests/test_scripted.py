@@ -0,0 +1,100 @@
+"""
+Tests for scripted playthroughs.
+"""
+import asyncio
+import io
+
+import pytest
+
+from rpg_game.__main__ import COMMANDS
+from rpg_game.benchmarks.playthroughs import campaign_transcript, measure
+from rpg_game.game import STATE_BATTLES, STATE_LOST, STATE_WON
+from rpg_game.save_game import MemoryBackend
+from rpg_game.scripted import (
+    CAPTURE,
+    EOF,
+    NULL,
+    QUIT,
+    ScriptedIO,
+    play,
+    run_transcripts,
+    script_main,
+)
+
+
+class TestPlay:
+    """Test cases for single playthroughs."""
+
+    def test_campaign(self):
+        """Test that the campaign transcript reaches the end screen and quits."""
+        result = play(campaign_transcript(), seed=1, sink=CAPTURE)
+        assert result.ending == QUIT
+        assert result.state in (STATE_WON, STATE_LOST)
+        assert "Enter your character's name: Scripted" in result.output
+        assert "Thank you for playing!" in result.output
+        assert result.fingerprint == play(campaign_transcript(), seed=1).fingerprint
+
+    def test_exhausted_transcript(self):
+        """Test that running out of input ends the playthrough with EOF."""
+        result = play(["1", "Hero", "1", ""], sink=NULL)
+        assert result.ending == EOF
+        assert result.state == STATE_BATTLES
+        assert result.lines_read == 4
+        assert result.fingerprint is None
+
+    def test_save_and_quit(self):
+        """Test the save-and-quit path."""
+        result = play(["1", "Hero", "2", "", "3"], sink=CAPTURE)
+        assert result.ending == QUIT
+        assert "Game saved. Goodbye!" in result.output
+
+    def test_any_text_stream_as_sink(self):
+        """Test that a plain text stream can take the output."""
+        stream = io.StringIO()
+        scripted = ScriptedIO(["Hero"], sink=stream)
+        assert not scripted.quiet
+        assert asyncio.run(scripted.read_line("Name: ")) == "Hero"
+        scripted.renderer.clear()
+        assert stream.getvalue().startswith("Name: Hero\n")
+
+
+class TestRunTranscripts:
+    """Test cases for batches of playthroughs."""
+
+    def test_fingerprints_do_not_depend_on_workers(self):
+        """Test that a process pool gives the same fingerprints as inline runs."""
+        transcripts = [campaign_transcript()] * 6
+        inline = run_transcripts(transcripts, seed=3, chunk_size=2)
+        pooled = run_transcripts(transcripts, seed=3, workers=2, chunk_size=2)
+        assert inline.fingerprints == pooled.fingerprints
+        assert inline.per_second > 0
+
+    def test_benchmark(self):
+        """Test the playthrough benchmark on a small run."""
+        results = measure(playthroughs=20, workers=1)
+        assert sum(results["null"]["final_states"].values()) == 20
+        assert results["hash"]["distinct_fingerprints"] >= 1
+
+    def test_script_command(self, tmp_path, capsys):
+        """Test the command line on a transcript file."""
+        path = tmp_path / "quit.txt"
+        path.write_text("3\n")
+        script_main([str(path), "--repeat", "2"])
+        out = capsys.readouterr().out
+        assert out.count(f"\t{QUIT}\t") == 2
+        assert "2 playthroughs" in out
+        assert COMMANDS["script"] == ("rpg_game.scripted", "script_main")
+
+
+class TestMemoryBackend:
+    """Test cases for the in-memory save backend."""
+
+    def test_round_trip(self):
+        """Test that saves are copied in and out."""
+        backend = MemoryBackend()
+        state = {"player": {"name": "Hero"}}
+        backend.save(state)
+        state["player"]["name"] = "Changed"
+        assert backend.load() == {"player": {"name": "Hero"}}
+        backend.delete()
+        assert backend.load() is None
@@ -0,0 +1,165 @@
+"""
+Tests for the multi-session game server.
+"""
+import asyncio
+import threading
+
+import pytest
+
+from rpg_game.__main__ import COMMANDS
+from rpg_game.benchmarks.server_load import run_load
+from rpg_game.game import Game, SessionEnded
+from rpg_game.save_sqlite import SQLiteSaveStore
+from rpg_game.server import GameServer, default_store_path
+
+
+async def start_server():
+    """Start a server on a free local port."""
+    server = GameServer(port=0)
+    await server.start()
+    return server
+
+
+class TestGameServer:
+    """Test cases for GameServer."""
+
+    def test_concurrent_sessions(self):
+        """Test that many sessions play at once and all end cleanly."""
+
+        async def scenario():
+            server = await start_server()
+            host, port = server.address[:2]
+            results = await run_load(
+                host, port, sessions=50, on_idle=lambda: server.active
+            )
+            await server.close()
+            return server, results
+
+        server, results = asyncio.run(scenario())
+        assert results["completed"] == 50
+        assert results["idle"] == 50
+        assert server.active == 0
+        assert server.completed == 50
+        assert server.store.count() == 50
+
+    def test_saves_run_off_the_event_loop(self):
+        """Test that session saves and loads are not run on the loop's thread."""
+
+        class RecordingStore(SQLiteSaveStore):
+            def save(self, slot, game_state):
+                threads.append(threading.get_ident())
+                super().save(slot, game_state)
+
+            def load(self, slot):
+                threads.append(threading.get_ident())
+                return super().load(slot)
+
+        threads = []
+
+        async def scenario():
+            server = GameServer(port=0, store=RecordingStore(":memory:"))
+            await server.start()
+            host, port = server.address[:2]
+            results = await run_load(host, port, sessions=5)
+            await server.close()
+            return results
+
+        results = asyncio.run(scenario())
+        assert results["completed"] == 5
+        assert threads
+        assert threading.get_ident() not in threads
+
+    def test_quit_ends_only_the_session(self):
+        """Test that quitting closes the connection and the server keeps serving."""
+
+        async def scenario():
+            server = await start_server()
+            host, port = server.address[:2]
+            outputs = []
+            for _ in range(2):
+                reader, writer = await asyncio.open_connection(host, port)
+                writer.write(b"Tester\n3\n")
+                outputs.append(await reader.read())
+                writer.close()
+            await server.close()
+            return outputs
+
+        for output in asyncio.run(scenario()):
+            assert b"Thank you for playing!" in output
+
+    def test_disconnect_and_long_lines(self):
+        """Test that dropped connections and oversized lines end their sessions."""
+
+        async def scenario():
+            server = await start_server()
+            host, port = server.address[:2]
+            reader, writer = await asyncio.open_connection(host, port)
+            await reader.readuntil(b"player name: ")
+            writer.close()
+            reader, writer = await asyncio.open_connection(host, port)
+            writer.write(b"x" * 10_000 + b"\n")
+            await reader.read()
+            writer.close()
+            for _ in range(100):
+                if server.active == 0:
+                    break
+                await asyncio.sleep(0.01)
+            await server.close()
+            return server
+
+        server = asyncio.run(scenario())
+        assert server.active == 0
+        assert server.completed == 2
+
+    def test_saves_are_kept_per_player(self):
+        """Test that a player reconnecting under the same name finds their save."""
+
+        async def session(host, port, script):
+            reader, writer = await asyncio.open_connection(host, port)
+            writer.write(script)
+            output = await reader.read()
+            writer.close()
+            return output
+
+        async def scenario():
+            server = await start_server()
+            host, port = server.address[:2]
+            # Blank names are asked again; new game, save and quit
+            await session(host, port, b"\nAlice\n1\nHero\n1\n\n3\n")
+            # A different player has no save
+            other = await session(host, port, b"Bob\n2\n\n3\n")
+            # Alice loads, reaching the battle menu, and quits from it
+            loaded = await session(host, port, b"Alice\n2\n\n3\n")
+            await server.close()
+            return server, other, loaded
+
+        server, other, loaded = asyncio.run(scenario())
+        assert server.store.count() == 1
+        assert server.store.load("Alice")["player"]["name"] == "Hero"
+        assert b"Game saved. Goodbye!" not in other
+        assert b"Game saved. Goodbye!" in loaded
+
+    def test_default_store_is_on_disk(self):
+        """Test that saves go to a database file in the save directory."""
+        server = GameServer(port=0)
+        assert server.store.path == default_store_path()
+        assert default_store_path().endswith("server_saves.db")
+
+    def test_serve_command(self):
+        """Test that the server is available as a subcommand."""
+        assert COMMANDS["serve"] == ("rpg_game.server", "serve_main")
+
+
+class TestSessionEnded:
+    """Test cases for quitting without exiting the process."""
+
+    def test_menu_quit_raises(self, mocker):
+        """Test that quitting from the menu raises SessionEnded, not SystemExit."""
+        mocker.patch("builtins.input", return_value="3")
+        with pytest.raises(SessionEnded):
+            Game().show_main_menu()
+
+    def test_run_returns(self, mocker):
+        """Test that run() returns normally when the player quits."""
+        mocker.patch("builtins.input", return_value="3")
+        assert Game().run() is None
@@ -0,0 +1,91 @@
+"""
+Tests for the headless combat simulator.
+"""
+import pytest
+
+from rpg_game.boss import Boss
+from rpg_game.character import Character
+from rpg_game.damage import DEFAULT_RULES, FIXED_RULES
+from rpg_game.rng import make_rng
+from rpg_game.sim import BOSS, PLAYER, CombatantSpec, boss_spec, run_duel, run_duels
+
+
+def play_with_entities(player, boss):
+    """Fight with the real entity classes, mirroring Game.combat."""
+    turns = 0
+    while player.health > 0 and boss.health > 0:
+        turns += 1
+        player.attack(boss)
+        if boss.health <= 0:
+            break
+        boss.attack(player)
+    return turns
+
+
+class TestSim:
+    """Test cases for the headless simulator."""
+
+    def test_spec_from_character(self):
+        """Test building specs from entities."""
+        player = Character("Hero", 110, 10, "Rock", 2)
+        assert CombatantSpec.from_character(player) == CombatantSpec("Hero", 110, 10, 2)
+        boss = Boss("Goblin King", 50, 8)
+        assert CombatantSpec.from_character(boss) == boss_spec("Goblin King", 50, 8)
+
+    def test_player_wins(self):
+        """Test a fight the player cannot lose."""
+        result = run_duel(
+            CombatantSpec("Hero", 100, 100),
+            boss_spec("Boss", 50, 1),
+            seed=1,
+            rules=FIXED_RULES,
+        )
+        assert result.winner == PLAYER
+        assert result.player_won
+        assert result.turns == 1
+        assert result.player_damage_dealt == 50
+        assert result.boss_damage_dealt == 0
+        assert result.boss_health == 0
+
+    def test_boss_wins(self):
+        """Test a fight the player cannot win."""
+        result = run_duel(
+            CombatantSpec("Hero", 10, 1),
+            boss_spec("Boss", 500, 20),
+            seed=1,
+            rules=FIXED_RULES,
+        )
+        assert result.winner == BOSS
+        assert result.turns == 1
+        assert result.boss_damage_dealt == 10
+        assert result.player_health == 0
+
+    @pytest.mark.parametrize("rules", [DEFAULT_RULES, FIXED_RULES])
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_entity_combat(self, seed, rules):
+        """Test that simulated fights match the entity classes for the same stream."""
+        # Both sides draw from one stream, as in Game
+        rng = make_rng(seed, stream_id=3)
+        player = Character("Hero", 110, 10, "Rock", 2, rng=rng, rules=rules)
+        boss = Boss("Dark Sorcerer", 160, 20, rng=rng, rules=rules)
+        expected = run_duel(player, boss, seed=seed, stream_id=3, rules=rules)
+
+        turns = play_with_entities(player, boss)
+
+        assert expected.turns == turns
+        assert expected.player_health == player.health
+        assert expected.boss_health == boss.health
+
+    def test_seed_is_reproducible(self):
+        """Test that a seed fully determines a sequence of fights."""
+        player = CombatantSpec("Hero", 110, 10, 2)
+        boss = boss_spec("Dark Sorcerer", 160, 20)
+        first = list(run_duels(player, boss, 50, seed=7))
+        second = list(run_duels(player, boss, 50, seed=7))
+        assert first == second
+        assert len(first) == 50
+
+    def test_never_ending_fight_raises(self):
+        """Test that fights where nobody deals damage are rejected."""
+        with pytest.raises(ValueError):
+            run_duel(CombatantSpec("Hero", 10, 0), CombatantSpec("Boss", 10, 0))
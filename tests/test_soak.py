@@ -0,0 +1,37 @@
+"""
+Tests for the iterative game loop and the soak benchmark.
+"""
+from rpg_game.benchmarks.soak import ReplayIO, measure
+from rpg_game.game import STATE_MENU, STATE_WON, Game
+from rpg_game.save_game import MemoryBackend
+
+
+class TestGameLoop:
+    """Test cases for the game loop state machine."""
+
+    def test_end_game_returns_for_replay(self, mocker):
+        """Test that playing again resets the game instead of recursing into run()."""
+        mocker.patch("builtins.input", return_value="y")
+        run = mocker.patch.object(Game, "run_async")
+        game = Game(save_backend=MemoryBackend())
+        game.player = object()
+        game.end_game(True)
+        assert game.player is None
+        run.assert_not_called()
+
+    def test_step_after_end_returns_to_menu(self):
+        """Test that the end screen leads back to the main menu."""
+        game = Game(io=ReplayIO(replays=2), save_backend=MemoryBackend())
+        assert game._run_sync(game._step(STATE_WON)) == STATE_MENU
+
+
+class TestSoak:
+    """Test cases for the soak benchmark."""
+
+    def test_replays_in_constant_stack_depth(self):
+        """Test that many replays run without the stack growing."""
+        results = measure(replays=2000, samples=10)
+        assert results["replays"] == 2000
+        assert results["stack_depth_min"] == results["stack_depth_max"]
+        # Memory depends on the allocator and platform, so it is only reported
+        assert "rss_growth_kb" in results
@@ -0,0 +1,104 @@
+"""
+Tests for the exact combat solver.
+"""
+import pytest
+
+from rpg_game.boss import Boss
+from rpg_game.character import Character
+from rpg_game.damage import FIXED_RULES, CombatRules, boss_table, player_table
+from rpg_game.sim import CombatantSpec, boss_spec, run_duels
+from rpg_game.solver import CombatSolver, clear_cache, solve, solver_for
+
+
+class TestSolver:
+    """Test cases for the combat solver."""
+
+    def setup_method(self):
+        clear_cache()
+
+    def test_known_matchup(self):
+        """Test a fight whose answer can be derived by hand."""
+        # The player needs 5 hits; any special among the boss's 4 replies kills
+        solution = solve(
+            CombatantSpec("Hero", 110, 10, 4),
+            boss_spec("Boss", 60, 20),
+            rules=FIXED_RULES,
+        )
+        assert solution.win_probability == pytest.approx(0.75**4)
+        assert solution.loss_probability == pytest.approx(1 - 0.75**4)
+        assert solution.health_distribution[10] == pytest.approx(0.75**4)
+        assert sum(solution.health_distribution.values()) == pytest.approx(1.0)
+
+    def test_accepts_entities(self):
+        """Test solving straight from Character and Boss objects."""
+        player = Character("Hero", 110, 10, "Rock", 2)
+        boss = Boss("Goblin King", 50, 8)
+        solution = solve(player, boss, rules=FIXED_RULES)
+        assert solution.win_probability == 1.0
+        assert solution.expected_turns == 5.0
+
+    def test_matches_simulation(self):
+        """Test that sampled fights agree with the exact answer."""
+        player = CombatantSpec("Hero", 110, 10, 2)
+        boss = boss_spec("Boss", 70, 12)
+        solution = solve(player, boss)
+        n = 50_000
+        duels = list(run_duels(player, boss, n, seed=1))
+        win_rate = sum(d.player_won for d in duels) / n
+        mean_turns = sum(d.turns for d in duels) / n
+        assert 0 < solution.win_probability < 1
+        assert win_rate == pytest.approx(solution.win_probability, abs=0.015)
+        assert mean_turns == pytest.approx(solution.expected_turns, abs=0.05)
+
+    def test_solutions_are_cached(self):
+        """Test that solvers and states are reused between queries."""
+        player = CombatantSpec("Hero", 110, 10, 2)
+        boss = boss_spec("Boss", 70, 12)
+        solver = solver_for(player, boss)
+        solve(player, boss)
+        states = solver.cache_size
+        assert states > 0
+        assert solver_for(player, boss) is solver
+        solve(player._replace(health=100), boss)
+        assert solver.cache_size >= states
+
+    def test_fight_already_over(self):
+        """Test states where Game.combat would not run a turn."""
+        solution = CombatSolver({10: 1.0}, {5: 0.75, 7: 0.25}).solve(0, 50)
+        assert solution.win_probability == 0.0
+        assert solution.expected_turns == 0.0
+
+    def test_never_ending_fight_raises(self):
+        """Test that fights where nobody deals damage are rejected."""
+        with pytest.raises(ValueError):
+            solve(CombatantSpec("Hero", 10, 0), CombatantSpec("Boss", 10, 0))
+
+    def test_certain_dodges_raise(self):
+        """Test that fights where both sides always dodge are rejected."""
+        with pytest.raises(ValueError):
+            CombatSolver({0: 1.0}, {-3: 1.0})
+        with pytest.raises(ValueError):
+            solve(
+                CombatantSpec("Hero", 10, 5),
+                CombatantSpec("Boss", 10, 5),
+                CombatRules(dodge_chance=1.0),
+            )
+
+    def test_dodges_only(self):
+        """Test that turns where both sides miss are accounted for exactly."""
+        # Each side misses half the time: the player's chance per exchange
+        # of landing the killing blow first is 0.5 / (1 - 0.25)
+        solver = CombatSolver({0: 0.5, 10: 0.5}, {0: 0.5, 10: 0.5})
+        solution = solver.solve(10, 10)
+        assert solution.win_probability == pytest.approx(2 / 3)
+        assert sum(solution.health_distribution.values()) == pytest.approx(1.0)
+
+    def test_uses_damage_tables(self):
+        """Test that solver_for builds its distributions from the damage tables."""
+        player = CombatantSpec("Hero", 110, 10, 2)
+        boss = boss_spec("Boss", 70, 12)
+        solver = solver_for(player, boss)
+        assert dict(solver.player_damage) == pytest.approx(
+            player_table(12).distribution()
+        )
+        assert dict(solver.boss_damage) == pytest.approx(boss_table(17).distribution())
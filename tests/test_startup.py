@@ -0,0 +1,84 @@
+"""
+Tests for lazy package loading and what a cold start loads.
+"""
+import multiprocessing
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import rpg_game
+from rpg_game.benchmarks.startup import worker_modules
+
+# Modules that starting and quitting the game must not load: optional heavy
+# dependencies and the tools behind the subcommands
+UNUSED_AT_STARTUP = (
+    "numpy",
+    "sqlite3",
+    "multiprocessing",
+    "rpg_game.arena",
+    "rpg_game.batch_sim",
+    "rpg_game.benchmarks",
+    "rpg_game.scripted",
+    "rpg_game.server",
+    "rpg_game.sim",
+    "rpg_game.solver",
+    "rpg_game.tournament",
+)
+
+
+class TestLazyPackage:
+    """Test cases for lazy loading of the package's public names."""
+
+    def test_import_loads_no_submodules(self):
+        """Test that a bare import does not load the game or asyncio."""
+        code = (
+            "import sys, rpg_game; "
+            "print(sorted(m for m in sys.modules"
+            " if m.startswith(('rpg_game', 'asyncio'))))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert out.strip() == "['rpg_game']"
+
+    def test_public_names_resolve(self):
+        """Test that every name in __all__ loads on access."""
+        for name in rpg_game.__all__:
+            assert getattr(rpg_game, name) is not None
+        assert rpg_game.Game.__module__ == "rpg_game.game"
+        # The submodule import must not replace the function of the same name
+        assert callable(rpg_game.save_game)
+        assert rpg_game.save_game.__module__ == "rpg_game.save_game"
+
+    def test_unknown_name(self):
+        """Test that unknown names still raise AttributeError."""
+        assert not hasattr(rpg_game, "no_such_name")
+
+
+class TestColdStart:
+    """Test cases for what starting the game and its workers loads."""
+
+    def test_main_loads_only_the_game(self):
+        """Test that starting and quitting from the menu skips unused modules."""
+        code = (
+            "import sys; from rpg_game.__main__ import main; main([]); "
+            "print(' '.join(sys.modules), file=sys.stderr)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            input="3\n",
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        modules = set(result.stderr.split())
+        assert "rpg_game.game" in modules
+        assert not modules & set(UNUSED_AT_STARTUP)
+
+    def test_spawned_worker(self):
+        """Test that spawned workers importing the package load only what they use."""
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            modules = executor.submit(worker_modules).result()
+        assert "rpg_game.game" not in modules
+        assert not any(name.startswith("asyncio") for name in modules)
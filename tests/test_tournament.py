@@ -0,0 +1,60 @@
+"""
+Tests for the tournament runner.
+"""
+import pytest
+
+from rpg_game.catalog import default_catalog
+from rpg_game.sim import CombatantSpec, boss_spec
+from rpg_game.solver import solve
+from rpg_game.tournament import (
+    default_matchups,
+    run_tournament,
+    shard_seed,
+    wilson_interval,
+)
+
+
+class TestTournament:
+    """Test cases for the tournament runner."""
+
+    def test_default_matchups_cover_all_pairs(self):
+        """Test that every weapon meets every boss."""
+        catalog = default_catalog()
+        weapons = catalog.starting_weapons()
+        roster = catalog.campaign()
+        matchups = default_matchups()
+        assert len(matchups) == len(weapons) * len(roster)
+        assert {(p.name, b.name) for p, b in matchups} == {
+            (w.name, b.name) for w in weapons for b in roster
+        }
+
+    def test_wilson_interval(self):
+        """Test the confidence interval bounds."""
+        low, high = wilson_interval(50, 100)
+        assert low < 0.5 < high
+        assert low == pytest.approx(0.4038, abs=1e-4)
+        assert high == pytest.approx(0.5962, abs=1e-4)
+        assert wilson_interval(0, 0) == (0.0, 1.0)
+
+    def test_shard_seeds_are_distinct(self):
+        """Test that shards get independent seeds."""
+        seeds = {shard_seed(1, m, s) for m in range(6) for s in range(100)}
+        assert len(seeds) == 600
+
+    def test_results_independent_of_worker_count(self):
+        """Test that the worker count does not change the results."""
+        player, boss = CombatantSpec("Scissors", 110, 10, 4), boss_spec("Boss", 60, 20)
+        matchups = [(player, boss)]
+        inline = run_tournament(
+            20_000, seed=5, workers=1, matchups=matchups, chunk_size=3_000
+        )
+        pooled = run_tournament(
+            20_000, seed=5, workers=2, matchups=matchups, chunk_size=3_000
+        )
+        assert inline == pooled
+        result = inline[0]
+        assert result.trials == 20_000
+        assert result.ci_low < result.win_rate < result.ci_high
+        assert result.win_rate == pytest.approx(
+            solve(player, boss).win_probability, abs=0.02
+        )